@@ -0,0 +1,63 @@
+"""seed fused response format prompt
+
+Revision ID: 20261016100000
+Revises: 3bbec4741886
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+from string import Formatter
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql import table, column
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261016100000'
+down_revision: Union[str, Sequence[str], None] = '3bbec4741886'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PROMPT_NAME = "FUSED_RESPONSE_FORMAT_PROMPT"
+PROMPT_CONTENT = """You are also responsible for the final presentation of your answer: it is returned directly to the user without a separate formatting pass.
+
+USER PREFERENCES (adapt formatting to match these learned preferences):
+- Response Length: {response_length} (short/medium/long)
+- Detail Level: {detail_level} (concise/balanced/comprehensive)
+- Formatting Style: {formatting_style} (structured/natural/bullet_points)
+- Include Key Insights: {include_key_insights}
+
+FORMATTING INSTRUCTIONS:
+- Write in a {style} style with a {tone} tone.
+- Keep all numbered citation markers (e.g., `[1]`, `[2]`) exactly as they appear in the provided context.
+- If user prefers structured responses or bullet points, organize content accordingly
+- Adjust level of detail based on the detail_level preference
+- Always provide 1-2 relevant follow-up questions, phrased as if the user is asking them."""
+
+
+def upgrade() -> None:
+    """Seed the formatting prompt used by the single-pass integrator+renderer mode."""
+    prompts_tbl = table(
+        "prompts",
+        column("name", sa.String(100)),
+        column("category", sa.String(100)),
+        column("description", sa.Text()),
+        column("content", sa.Text()),
+        column("variables", postgresql.JSONB),
+    )
+
+    variables = sorted({field for _, field, _, _ in Formatter().parse(PROMPT_CONTENT) if field})
+    op.bulk_insert(prompts_tbl, [{
+        "name": PROMPT_NAME,
+        "category": "Response",
+        "description": "Formatting instructions for single-pass integration and rendering",
+        "content": PROMPT_CONTENT,
+        "variables": variables,
+    }])
+
+
+def downgrade() -> None:
+    """Remove the fused response format prompt."""
+    op.execute(sa.text("DELETE FROM prompts WHERE name = :name").bindparams(name=PROMPT_NAME))
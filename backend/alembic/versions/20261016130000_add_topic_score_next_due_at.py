@@ -0,0 +1,30 @@
+"""add topic score next_due_at
+
+Revision ID: 20261016130000
+Revises: 20261016120000
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261016130000'
+down_revision: Union[str, Sequence[str], None] = '20261016120000'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('topic_scores', sa.Column('next_due_at', sa.Float(), nullable=True))
+    op.create_index('ix_topic_scores_active_due', 'topic_scores', ['is_active_research', 'next_due_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_topic_scores_active_due', table_name='topic_scores')
+    op.drop_column('topic_scores', 'next_due_at')
@@ -0,0 +1,61 @@
+"""add topic score engagement aggregates
+
+Revision ID: 20261016140000
+Revises: 20261016130000
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261016140000'
+down_revision: Union[str, Sequence[str], None] = '20261016130000'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('topic_scores', sa.Column('quality_sum', sa.Float(), server_default='0', nullable=False))
+    op.add_column('topic_scores', sa.Column('quality_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('topic_scores', sa.Column('last_read_at', sa.Float(), nullable=True))
+
+    # Backfill the counters from existing findings; they are maintained incrementally from now on
+    op.execute(
+        """
+        UPDATE topic_scores AS ts SET
+            total_findings = agg.total,
+            read_findings = agg.reads,
+            bookmarked_findings = agg.bookmarks,
+            integrated_findings = agg.integrations,
+            quality_sum = agg.quality_sum,
+            quality_count = agg.quality_count,
+            last_read_at = agg.last_read_at
+        FROM (
+            SELECT
+                user_id,
+                topic_id,
+                count(*) AS total,
+                count(*) FILTER (WHERE read) AS reads,
+                count(*) FILTER (WHERE bookmarked) AS bookmarks,
+                count(*) FILTER (WHERE integrated) AS integrations,
+                coalesce(sum(quality_score), 0) AS quality_sum,
+                count(quality_score) AS quality_count,
+                extract(epoch FROM max(updated_at) FILTER (WHERE read)) AS last_read_at
+            FROM research_findings
+            GROUP BY user_id, topic_id
+        ) AS agg
+        WHERE ts.user_id = agg.user_id AND ts.topic_id = agg.topic_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('topic_scores', 'last_read_at')
+    op.drop_column('topic_scores', 'quality_count')
+    op.drop_column('topic_scores', 'quality_sum')
@@ -0,0 +1,63 @@
+"""add topic depth and root id
+
+Revision ID: 20261016150000
+Revises: 20261016140000
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '20261016150000'
+down_revision: Union[str, Sequence[str], None] = '20261016140000'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table("research_topics") as batch_op:
+        batch_op.add_column(sa.Column("depth", sa.Integer(), nullable=False, server_default="0"))
+        batch_op.add_column(sa.Column("root_id", postgresql.UUID(as_uuid=True), nullable=True))
+        batch_op.create_foreign_key(
+            "fk_research_topics_root_id",
+            "research_topics",
+            ["root_id"],
+            ["id"],
+            ondelete="CASCADE"
+        )
+        batch_op.create_index("ix_research_topics_root_id", ["root_id"])
+
+    # Backfill existing expansion trees; new children get both values at creation time
+    op.execute(
+        """
+        WITH RECURSIVE tree AS (
+            SELECT id, id AS root, 0 AS depth
+            FROM research_topics
+            WHERE parent_id IS NULL
+            UNION ALL
+            SELECT child.id, tree.root, tree.depth + 1
+            FROM research_topics AS child
+            JOIN tree ON child.parent_id = tree.id
+        )
+        UPDATE research_topics AS rt SET
+            depth = tree.depth,
+            root_id = tree.root
+        FROM tree
+        WHERE rt.id = tree.id AND tree.depth > 0
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("research_topics") as batch_op:
+        batch_op.drop_index("ix_research_topics_root_id")
+        batch_op.drop_constraint("fk_research_topics_root_id", type_="foreignkey")
+        batch_op.drop_column("root_id")
+        batch_op.drop_column("depth")
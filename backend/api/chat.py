@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 import asyncio
+import functools
 
 from schemas.schemas import ChatRequest, ChatResponse
 from graph_builder import chat_graph
@@ -8,6 +9,7 @@ from dependencies import get_or_create_user_id, profile_manager, zep_manager
 from services.chat_service import extract_and_store_topics_async
 from services.logging_config import get_logger
 from services.status_manager import queue_status
+from services.zep_ingestion import ZepIngestion
 
 router = APIRouter()
 logger = get_logger(__name__)
@@ -59,30 +61,24 @@ async def chat(request: ChatRequest, user_id: str = Depends(get_or_create_user_i
         if len(request.messages) > 0:
             user_message = request.messages[-1].content
             
-            # Create async wrapper to properly handle errors in background task
-            async def _store_conversation_with_error_handling():
-                """Wrapper to ensure ZEP storage errors are logged."""
-                try:
-                    logger.debug(f"Starting ZEP storage for user {user_id}, thread {result.get('thread_id')}")
-                    success = await zep_manager.store_conversation_turn(
+            # Queue the Zep write; the ingestion workers retry it on failure
+            thread_id = result.get("thread_id")
+            try:
+                ZepIngestion.submit(
+                    key=thread_id or user_id,
+                    name=f"conversation turn for thread {thread_id}",
+                    write=functools.partial(
+                        zep_manager.store_conversation_turn,
                         user_id=user_id,
                         user_message=user_message,
                         ai_response=assistant_message.content,
-                        thread_id=result.get("thread_id"),
-                    )
-                    if not success:
-                        logger.warning(f"ZEP storage returned False for user {user_id}, thread {result.get('thread_id')}")
-                except Exception as e:
-                    logger.error(
-                        f"Failed to store conversation in Zep for user {user_id}: {str(e)}", 
-                        exc_info=True
-                    )
-            
-            # Create background task with error handling
-            try:
-                asyncio.create_task(_store_conversation_with_error_handling())
+                        thread_id=thread_id,
+                        # Shared by the retries so batches Zep already accepted are not re-sent
+                        progress={},
+                    ),
+                )
             except Exception as e:
-                logger.error(f"Failed to create ZEP storage task: {str(e)}", exc_info=True)
+                logger.error(f"Failed to queue ZEP storage: {str(e)}", exc_info=True)
 
         if result.get("thread_id") and len(request.messages) > 0:
             try:
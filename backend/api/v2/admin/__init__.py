@@ -5,6 +5,7 @@ from .user import router as user_router
 from .flow import router as flow_router
 from .prompt import router as prompt_router
 from .debug import router as debug_router
+from .router import router as intent_router_router
 
 router = APIRouter(prefix="/admin", tags=["v2/admin"], dependencies=[Depends(inject_admin_id)])
 
@@ -12,3 +13,4 @@ router.include_router(user_router)
 router.include_router(flow_router)
 router.include_router(prompt_router)
 router.include_router(debug_router)
+router.include_router(intent_router_router)
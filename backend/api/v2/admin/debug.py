@@ -8,6 +8,15 @@ from dependencies import (
 import config
 from schemas.schemas import MotivationConfigUpdate
 from services.autonomous_research_engine import initialize_autonomous_researcher
+from services.research_scheduler import ResearchScheduler
+from services.search_cache import SearchCache
+from services.single_flight import SingleFlight
+from services.upstream_budget import UpstreamBudgets
+from services.zep_ingestion import ZepIngestion
+from services.pubsub import PubSub
+from services.email_outbox import EmailOutbox
+from services import status_manager
+from utils import password
 from services.logging_config import get_logger
 
 router = APIRouter(prefix="/debug")
@@ -33,6 +42,65 @@ async def get_research_engine_status(
         raise HTTPException(status_code=500, detail=f"Error getting research status: {str(e)}")
 
 
+@router.get("/search-cache")
+async def get_search_cache_stats():
+    """Hit/miss counters for the shared search result cache."""
+
+    return SearchCache.get_stats()
+
+
+@router.get("/coalescing")
+async def get_coalescing_stats():
+    """How many search and LLM calls were shared with an identical in-flight call."""
+
+    return SingleFlight.get_all_stats()
+
+
+@router.get("/research-scheduler")
+async def get_research_scheduler_stats():
+    """Queue depth and throughput of the research cycle scheduler, plus upstream budget usage."""
+
+    return {
+        "scheduler": ResearchScheduler.get_stats(),
+        "upstream_budgets": UpstreamBudgets.get_stats(),
+    }
+
+
+@router.get("/zep-ingestion")
+async def get_zep_ingestion_stats():
+    """Queue depth and outcome counters of the background Zep write queue."""
+
+    return ZepIngestion.get_stats()
+
+
+@router.get("/pubsub")
+async def get_pubsub_stats():
+    """Backend and delivery counters of the status/notification fan-out."""
+
+    return PubSub.get_stats()
+
+
+@router.get("/status-channels")
+async def get_status_channel_stats():
+    """Live status channels, dropped updates and buffered bytes of the status streams."""
+
+    return status_manager.get_stats()
+
+
+@router.get("/email-outbox")
+async def get_email_outbox_stats():
+    """Sender state and delivery counters of the notification email outbox."""
+
+    return EmailOutbox.get_stats()
+
+
+@router.get("/password-hashing")
+async def get_password_hashing_stats():
+    """Load and rejection counters of the bcrypt worker pool."""
+
+    return password.get_stats()
+
+
 @router.post("/expand", deprecated=True, description="Deprecated: Zep integration disabled")
 async def debug_expand_topics():
     return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,75 @@
+from __future__ import annotations
+from typing import Annotated
+from uuid import UUID
+from fastapi import APIRouter, Request, Depends, HTTPException, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db import get_session
+from services.router_example import RouterExampleService
+from services.intent_prerouter import IntentPreRouter
+from schemas.admin import (
+    RouterExampleIn,
+    RouterExampleRecord,
+    RouterExampleListOut,
+    RouterStatsOut,
+)
+
+router = APIRouter(prefix="/router")
+
+
+@router.get("/stats", response_model=RouterStatsOut)
+async def get_router_stats():
+    return RouterStatsOut(**IntentPreRouter.get_stats())
+
+
+@router.get("/examples", response_model=RouterExampleListOut)
+async def get_router_examples(
+    session: Annotated[AsyncSession, Depends(get_session)]
+):
+    service = RouterExampleService()
+    examples = await service.get_all_examples(session)
+
+    return RouterExampleListOut(
+        total=len(examples),
+        examples=[
+            RouterExampleRecord(
+                id=e.id, text=e.text, intent=e.intent, sources=e.sources, created_at=e.created_at
+            )
+            for e in examples
+        ],
+    )
+
+
+@router.post("/examples", response_model=RouterExampleRecord)
+async def add_router_example(
+    request: Request,
+    session: Annotated[AsyncSession, Depends(get_session)],
+    body: RouterExampleIn,
+):
+    admin_id = request.state.user_id
+
+    if body.intent == "search" and not body.sources:
+        raise HTTPException(status_code=400, detail="Search examples must list at least one source")
+    sources = body.sources if body.intent == "search" else []
+
+    service = RouterExampleService()
+    example = await service.add_example(session, body.text, body.intent, sources, admin_id)
+
+    await IntentPreRouter.examples_changed()
+
+    return RouterExampleRecord(
+        id=example.id, text=example.text, intent=example.intent, sources=example.sources, created_at=example.created_at
+    )
+
+
+@router.delete("/examples/{example_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_router_example(
+    session: Annotated[AsyncSession, Depends(get_session)],
+    example_id: UUID,
+):
+    service = RouterExampleService()
+    await service.delete_example(session, example_id)
+
+    await IntentPreRouter.examples_changed()
+
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
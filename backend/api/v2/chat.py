@@ -1,7 +1,10 @@
 from uuid import UUID
-from typing import Annotated
+from typing import Annotated, Any
 import asyncio
+import json
+import re
 from fastapi import APIRouter, Request, Depends, Query
+from fastapi.responses import StreamingResponse
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -26,21 +29,78 @@ router = APIRouter(prefix="/chat", tags=["v2/chat"], dependencies=[Depends(injec
 logger = get_logger(__name__)
 
 
-@router.post("", response_model=ChatOut)
-async def chat(
-    request: Request,
-    session: Annotated[AsyncSession, Depends(get_session)],
-    body: ChatIn,
-) -> ChatOut:
-    user_id = str(request.state.user_id)
+# Graph nodes whose model tokens are forwarded to streaming clients. The renderer is a
+# structured-output call (its chunks are JSON) that re-states the integrator's answer, so
+# clients get the integrator's text as tokens and the rendered version in ``message``.
+# In fused mode the integrator itself answers in JSON; only its main_response is forwarded.
+STREAMED_NODES = ("integrator",)
 
-    user_message = body.messages[-1].content
 
-    chat_service = ChatService()
-    chat_id = await chat_service.get_or_create_chat_id(
-        session, user_id, user_message, body.session_id if body.session_id else None
-    )
+class _JsonStringField:
+    """Incrementally decodes one string field out of streamed JSON text.
+
+    The fused integrator answers through structured output, so its chunks are pieces of
+    ``{"main_response": "...", ...}``; ``feed`` returns the newly decoded text of the field.
+    """
+
+    def __init__(self, field: str) -> None:
+        self._start = re.compile(r'"%s"\s*:\s*"' % re.escape(field))
+        self._pending = ""
+        self._raw = ""
+        self._sent = 0
+        self._started = False
+        self._escaped = False
+        self._done = False
+
+    def feed(self, chunk: str) -> str:
+        if self._done:
+            return ""
+        if not self._started:
+            self._pending += chunk
+            match = self._start.search(self._pending)
+            if not match:
+                return ""
+            chunk, self._pending, self._started = self._pending[match.end():], "", True
+
+        for i, ch in enumerate(chunk):
+            if self._escaped:
+                self._escaped = False
+            elif ch == "\\":
+                self._escaped = True
+            elif ch == '"':
+                chunk, self._done = chunk[:i], True
+                break
+        self._raw += chunk
+        return self._flush()
+
+    def _flush(self) -> str:
+        raw = self._raw
+        if not self._done:
+            # Hold back an escape sequence that is still incomplete
+            if self._escaped:
+                raw = raw[:-1]
+            partial = re.search(r"\\u[0-9a-fA-F]{0,3}$", raw)
+            if partial and (len(raw[:partial.start()]) - len(raw[:partial.start()].rstrip("\\"))) % 2 == 0:
+                raw = raw[:partial.start()]
+        text = json.loads(f'"{raw}"')
+        if not self._done and text and "\ud800" <= text[-1] <= "\udbff":
+            # First half of a surrogate pair; wait for the second
+            text = text[:-1]
+        new, self._sent = text[self._sent:], len(text)
+        return new
 
+
+def _token_text(parsers: dict, run_id: Any, content: str) -> str:
+    """Text to forward for a model chunk: plain text as-is, structured JSON via ``main_response``."""
+    if run_id not in parsers:
+        if not content.strip():
+            return ""
+        parsers[run_id] = _JsonStringField("main_response") if content.lstrip().startswith("{") else None
+    parser = parsers[run_id]
+    return parser.feed(content) if parser else content
+
+
+def _build_state(body: ChatIn, user_id: str, chat_id: UUID) -> dict:
     messages_for_state = []
     for m in body.messages:
         if m.role == "user":
@@ -50,7 +110,7 @@ async def chat(
         elif m.role == "system":
             messages_for_state.append(SystemMessage(content=m.content))
 
-    state = {
+    return {
         "messages": messages_for_state,
         "model": body.model,
         "temperature": body.temperature,
@@ -61,23 +121,37 @@ async def chat(
         "workflow_context": {},
         "user_id": user_id,
         "thread_id": str(chat_id),
+        "render_mode": body.render_mode,
     }
 
+
+async def _prepare_chat(
+    request: Request,
+    session: AsyncSession,
+    body: ChatIn,
+) -> tuple[str, UUID, dict]:
+    user_id = str(request.state.user_id)
+    user_message = body.messages[-1].content
+
+    chat_service = ChatService()
+    chat_id = await chat_service.get_or_create_chat_id(
+        session, user_id, user_message, body.session_id if body.session_id else None
+    )
+
     if body.personality:
         user_service = UserService()
         await user_service.update_personality(session, user_id, body.personality.model_dump())
 
-    result = await chat_graph.ainvoke(state)
-
-    if "error" in result:
-        logger.error(f"Error in chat endpoint: {result['error']}")
+    return user_id, chat_id, _build_state(body, user_id, chat_id)
 
-        raise CommonError("Error in chat endpoint")
 
+async def _finish_chat(body: ChatIn, user_id: str, chat_id: UUID, result: dict) -> ChatOut:
+    """Persist history, schedule topic extraction and build the response for a finished graph run."""
+    user_message = body.messages[-1].content
     assistant_message = result["messages"][-1].content
 
     try:
-        await chat_service.save_history(chat_id, user_message, assistant_message)
+        await ChatService().save_history(chat_id, user_message, assistant_message)
     except CommonError as e:
         logger.warning("Chat memory save failed, returning response anyway: %s", e)
 
@@ -87,8 +161,7 @@ async def chat(
             user_id=user_id,
             chat_id=chat_id,
             state=result,
-            conversation_context=body.messages[-1].content[:200]
-            + ("..." if len(body.messages[-1].content) > 200 else ""),
+            conversation_context=user_message[:200] + ("..." if len(user_message) > 200 else ""),
         )
     )
 
@@ -109,6 +182,86 @@ async def chat(
     return response_obj
 
 
+def _sse(event: str, data: Any) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+@router.post("", response_model=ChatOut)
+async def chat(
+    request: Request,
+    session: Annotated[AsyncSession, Depends(get_session)],
+    body: ChatIn,
+) -> ChatOut:
+    user_id, chat_id, state = await _prepare_chat(request, session, body)
+
+    result = await chat_graph.ainvoke(state)
+
+    if "error" in result:
+        logger.error(f"Error in chat endpoint: {result['error']}")
+
+        raise CommonError("Error in chat endpoint")
+
+    return await _finish_chat(body, user_id, chat_id, result)
+
+
+@router.post("/stream")
+async def chat_stream(
+    request: Request,
+    session: Annotated[AsyncSession, Depends(get_session)],
+    body: ChatIn,
+) -> StreamingResponse:
+    """Stream a chat turn as server-sent events.
+
+    Emits ``start``, then ``token`` events as the integrator generates text, then a
+    ``message`` event with the final rendered response followed by trailing ``citations``
+    and ``follow_up`` events, and finally ``done``. Failures are reported as an ``error`` event.
+    """
+    user_id, chat_id, state = await _prepare_chat(request, session, body)
+
+    async def event_generator():
+        yield _sse("start", {"session_id": chat_id})
+
+        result = None
+        parsers: dict = {}
+        try:
+            async for event in chat_graph.astream_events(state, version="v2"):
+                kind = event["event"]
+                if kind == "on_chat_model_stream":
+                    node = event.get("metadata", {}).get("langgraph_node")
+                    content = getattr(event["data"].get("chunk"), "content", "")
+                    if node in STREAMED_NODES and isinstance(content, str) and content:
+                        text = _token_text(parsers, event.get("run_id"), content)
+                        if text:
+                            yield _sse("token", {"node": node, "content": text})
+                elif kind == "on_chain_end" and not event.get("parent_ids"):
+                    # Top-level graph run finished
+                    result = event["data"].get("output")
+        except Exception as e:
+            logger.error(f"Error in chat stream: {str(e)}", exc_info=True)
+            yield _sse("error", {"detail": "Error in chat endpoint"})
+            return
+
+        if not isinstance(result, dict) or "error" in result:
+            if isinstance(result, dict):
+                logger.error(f"Error in chat stream: {result['error']}")
+            yield _sse("error", {"detail": "Error in chat endpoint"})
+            return
+
+        response_obj = await _finish_chat(body, user_id, chat_id, result)
+        workflow_context = result.get("workflow_context", {})
+
+        yield _sse("message", response_obj.model_dump(mode="json"))
+        yield _sse("citations", {"citations": workflow_context.get("unified_citations", [])})
+        yield _sse("follow_up", {"questions": response_obj.follow_up_questions})
+        yield _sse("done", {})
+
+    return StreamingResponse(
+        event_generator(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("", response_model=list[ChatView])
 async def get_chats(
     request: Request,
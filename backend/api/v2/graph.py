@@ -4,8 +4,7 @@ Graph API endpoints for managing knowledge graphs.
 
 from fastapi import APIRouter, Request, Depends, HTTPException
 
-from dependencies import inject_user_id
-from storage.zep_manager import ZepManager
+from dependencies import inject_user_id, zep_manager
 from services.logging_config import get_logger
 from schemas.graph import GraphIn, GraphOut
 
@@ -22,8 +21,11 @@ async def fetch_graph_data(
     """
     Fetch graph data from Zep for visualization.
     
+    With ``center_node_uuid`` only the subgraph within ``hops`` of that node is
+    returned; ``limit``/``cursor`` page through the triplets.
+    
     Args:
-        body: GraphIn containing type and id
+        body: GraphIn containing type, id and optional subgraph/paging options
         
     Returns:
         GraphOut containing triplets for visualization
@@ -35,9 +37,6 @@ async def fetch_graph_data(
         # Log the body
         logger.info(f"Fetching graph data for {body.type}: {body.id}")
         
-        # Initialize ZepManager
-        zep_manager = ZepManager()
-        
         if not zep_manager.is_enabled():
             logger.warning("ZepManager is not enabled")
             return GraphOut(triplets=[])
@@ -58,29 +57,34 @@ async def fetch_graph_data(
                 detail="Only user graphs are currently supported"
             )
         
-        # Fetch all nodes and edges for the user using the proper API methods
-        logger.debug(f"Fetching nodes and edges for user {body.id}")
-        
-        # Use Promise.all equivalent - run both fetches concurrently
-        import asyncio
-        nodes_task = zep_manager.get_all_nodes_by_user_id(body.id)
-        edges_task = zep_manager.get_all_edges_by_user_id(body.id)
+        # Whole-graph snapshot, cached per user and invalidated when new content is stored
+        snapshot = await zep_manager.get_graph_snapshot(body.id)
         
-        nodes, edges = await asyncio.gather(nodes_task, edges_task)
-        
-        logger.debug(f"Retrieved {len(nodes)} nodes and {len(edges)} edges for user {body.id}")
+        logger.debug(f"Graph snapshot has {len(snapshot.nodes)} nodes and {len(snapshot.edges)} edges for user {body.id}")
         
         # Check if we got any data
-        if not nodes and not edges:
+        if not snapshot.nodes and not snapshot.edges:
             logger.info(f"No graph data found for user {body.id}")
-            return GraphOut(triplets=[])
+            return GraphOut(triplets=[], total=0)
+        
+        if body.center_node_uuid:
+            nodes, edges = snapshot.neighborhood(body.center_node_uuid, body.hops)
+            triplets = zep_manager.create_triplets(edges, nodes)
+        else:
+            triplets = snapshot.triplets
         
-        # Create triplets from nodes and edges
-        triplets = zep_manager.create_triplets(edges, nodes)
+        # Page through the triplets; the cursor is the offset of the next page
+        try:
+            offset = max(0, int(body.cursor)) if body.cursor else 0
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        end = offset + body.limit if body.limit else len(triplets)
+        page = triplets[offset:end]
+        next_cursor = str(end) if end < len(triplets) else None
         
-        logger.info(f"Successfully created {len(triplets)} triplets for user {body.id}")
+        logger.info(f"Returning {len(page)} of {len(triplets)} triplets for user {body.id}")
         
-        return GraphOut(triplets=triplets)
+        return GraphOut(triplets=page, total=len(triplets), next_cursor=next_cursor)
         
     except HTTPException:
         raise
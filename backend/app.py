@@ -17,6 +17,11 @@ from services.logging_config import configure_logging, get_logger
 
 # Import prompt cache
 from services.prompt_cache import PromptCache
+from services.http_client import HttpClientPool
+from services.intent_prerouter import IntentPreRouter
+from services.zep_ingestion import ZepIngestion
+from services.pubsub import PubSub
+from services.email_outbox import EmailOutbox
 
 # Configure application logging
 logger = configure_logging()
@@ -37,6 +42,15 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("🚀 Starting AI Chatbot API...")
 
+    # Status/notification fan-out across workers
+    try:
+        await PubSub.start()
+    except Exception as e:
+        logger.error(f"📣 Failed to start pub/sub backend: {e}")
+
+    # Background sender for queued notification emails
+    EmailOutbox.start()
+
     # Initialize prompts
     try:
         await PromptCache.refresh_all()
@@ -44,6 +58,12 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"🔬 Failed to load prompts: {e}")
 
+    # Load admin-provided pre-router examples
+    try:
+        await IntentPreRouter.refresh_examples()
+    except Exception as e:
+        logger.error(f"🧭 Failed to load router examples: {e}")
+
     # Initialize and start the autonomous researcher
     try:
         logger.info("🔬 Initializing Autonomous Research Engine...")
@@ -72,6 +92,16 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             logger.error(f"🔬 Error stopping Autonomous Research Engine: {str(e)}")
 
+    # Flush queued Zep writes
+    await ZepIngestion.drain()
+
+    await EmailOutbox.stop()
+
+    await PubSub.stop()
+
+    # Release pooled outbound HTTP connections
+    await HttpClientPool.aclose()
+
 
 app = FastAPI(title="AI Chatbot API", version="1.0.0", lifespan=lifespan)
 
@@ -60,6 +60,14 @@ def create_chat_graph():
         logger.debug(f"⚡ Flow: Full routing analysis: {state.get('routing_analysis', {})}")
         return intent
     
+    def integrator_router(state: ChatState) -> str:
+        """Skip the renderer when the integrator already produced the final formatted answer."""
+        if check_error(state) == END:
+            return END
+        if state.get("workflow_context", {}).get("render_mode") == "fused":
+            return END
+        return "continue"
+
     # Build the graph
     builder = StateGraph(ChatState)
     
@@ -126,10 +134,10 @@ def create_chat_graph():
     )
     builder.add_edge("analyzer", "integrator")
 
-    # Final: only integrator error → END; renderer always → END
+    # Final: integrator error → END; fused single-pass render → END; renderer always → END
     builder.add_conditional_edges(
         "integrator",
-        check_error,
+        integrator_router,
         {"continue": "response_renderer", END: END},
     )
     builder.add_edge("response_renderer", END)
@@ -15,6 +15,10 @@ CORS_ORIGINS = os.getenv("CORS_ORIGINS", "http://localhost:3000,https://yourapp.
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 DEFAULT_MODEL = os.getenv("DEFAULT_MODEL", "gpt-4o-mini")
 
+# Shared LLM client pool (see services/llm_gateway.py)
+LLM_REQUEST_TIMEOUT = float(os.getenv("LLM_REQUEST_TIMEOUT", "120"))
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "2"))
+
 # Router model - cheaper model for routing decisions
 ROUTER_MODEL = os.getenv("ROUTER_MODEL", "gpt-4o-mini")
 
@@ -26,8 +30,37 @@ PERPLEXITY_MODEL = os.getenv("PERPLEXITY_MODEL", "sonar")
 # PubMed API configuration (email recommended but not required)
 PUBMED_EMAIL = os.getenv("PUBMED_EMAIL", "researcher@example.com")
 
+# Outbound HTTP connection pooling (shared by all search services)
+HTTP_POOL_MAX_CONNECTIONS = int(os.getenv("HTTP_POOL_MAX_CONNECTIONS", "20"))   # Per upstream host
+HTTP_POOL_MAX_KEEPALIVE = int(os.getenv("HTTP_POOL_MAX_KEEPALIVE", "10"))       # Idle connections kept per host
+HTTP_POOL_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_POOL_KEEPALIVE_EXPIRY", "30"))  # Seconds before idle connections close
+HTTP_CLIENT_HTTP2 = os.getenv("HTTP_CLIENT_HTTP2", "true").lower() == "true"    # Requires the optional h2 package
+HTTP_CLIENT_TIMEOUT = float(os.getenv("HTTP_CLIENT_TIMEOUT", "30"))
+HTTP_CLIENT_CONNECT_TIMEOUT = float(os.getenv("HTTP_CLIENT_CONNECT_TIMEOUT", "10"))
+
+# Search result cache keyed on (source, normalized query, recency filter, search mode).
+# TTLs are per source in seconds; expired entries are still served for
+# TTL * SEARCH_CACHE_STALE_FACTOR while a background refresh runs (stale-while-revalidate).
+SEARCH_CACHE_ENABLED = os.getenv("SEARCH_CACHE_ENABLED", "true").lower() == "true"
+SEARCH_CACHE_MAX_ENTRIES = int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", "1000"))
+SEARCH_CACHE_STALE_FACTOR = float(os.getenv("SEARCH_CACHE_STALE_FACTOR", "1.0"))
+SEARCH_CACHE_TTL_WEB = int(os.getenv("SEARCH_CACHE_TTL_WEB", "900"))
+SEARCH_CACHE_TTL_ACADEMIC = int(os.getenv("SEARCH_CACHE_TTL_ACADEMIC", "86400"))
+SEARCH_CACHE_TTL_SOCIAL = int(os.getenv("SEARCH_CACHE_TTL_SOCIAL", "1800"))
+SEARCH_CACHE_TTL_MEDICAL = int(os.getenv("SEARCH_CACHE_TTL_MEDICAL", "86400"))
+# Optional Postgres tier shared across workers (search_cache table)
+SEARCH_CACHE_DB_ENABLED = os.getenv("SEARCH_CACHE_DB_ENABLED", "false").lower() == "true"
+
+# Coalesce identical concurrent searches and research-graph LLM calls into one upstream request
+SINGLE_FLIGHT_ENABLED = os.getenv("SINGLE_FLIGHT_ENABLED", "true").lower() == "true"
+
 # Semantic Scholar API key (optional, increases rate limits)
 # OpenAlex API doesn't require an API key
+# OpenAlex query strategy: "parallel" runs the title and abstract searches concurrently
+# (general search hedged after OPENALEX_HEDGE_DELAY seconds) or "sequential" runs them in turn
+OPENALEX_SEARCH_MODE = os.getenv("OPENALEX_SEARCH_MODE", "parallel").lower()
+OPENALEX_PARALLEL_GENERAL = os.getenv("OPENALEX_PARALLEL_GENERAL", "true").lower() == "true"
+OPENALEX_HEDGE_DELAY = float(os.getenv("OPENALEX_HEDGE_DELAY", "1.5"))
 
 # Zep configuration
 ZEP_API_KEY = os.getenv("ZEP_API_KEY")
@@ -83,6 +116,18 @@ EXPANSION_RETIRE_TTL_DAYS = 30              # Days before retiring inactive expa
 # Zep search configuration - operational defaults
 ZEP_SEARCH_TIMEOUT_SECONDS = 5              # Timeout for Zep API calls
 ZEP_SEARCH_RETRIES = 2                      # Number of retries for failed calls
+ZEP_SEARCH_CACHE_TTL_SECONDS = 60           # Reuse graph search results per (user, query); 0 disables
+ZEP_SEARCH_CACHE_MAX_ENTRIES = 512          # Bound on cached graph searches
+ZEP_GRAPH_SNAPSHOT_TTL_SECONDS = 300        # Per-user graph visualization snapshot; 0 disables
+ZEP_GRAPH_SNAPSHOT_MAX_USERS = 32           # Bound on cached graph snapshots
+ZEP_KNOWN_ENTITIES_MAX = 10000              # Users/threads remembered as existing in Zep
+ZEP_ADD_MESSAGES_BATCH_SIZE = 30            # Messages per thread.add_messages call (API maximum)
+
+# Background Zep ingestion queue (conversation turns are written off the request path)
+ZEP_INGEST_WORKERS = 2                      # Parallel writers; a thread's writes always share one worker
+ZEP_INGEST_QUEUE_MAX = 1000                 # Pending writes per worker before new ones are dropped
+ZEP_INGEST_MAX_RETRIES = 3                  # Retries for a failed write
+ZEP_INGEST_RETRY_BASE_SECONDS = 2.0         # Exponential backoff base between retries
 
 # Clamp similarity threshold
 EXPANSION_MIN_SIMILARITY = _clamp_float(EXPANSION_MIN_SIMILARITY, 0.0, 1.0)
@@ -128,6 +173,17 @@ def get_default_model():
     
     return default
 
+# Chat response rendering: "two_pass" (integrator then renderer), "fused" (single structured
+# generation for every chat turn) or "fused_chat" (single pass only for the plain chat intent)
+CHAT_RENDER_MODE = os.getenv("CHAT_RENDER_MODE", "two_pass").lower()
+
+# Local intent pre-router: answers high-confidence routing decisions (greetings, thanks,
+# explicit search requests) without calling ROUTER_MODEL; uncertain messages fall back to the LLM
+PREROUTER_ENABLED = os.getenv("PREROUTER_ENABLED", "true").lower() == "true"
+PREROUTER_MIN_SIMILARITY = _clamp_float(float(os.getenv("PREROUTER_MIN_SIMILARITY", "0.8")), 0.0, 1.0)
+PREROUTER_MIN_MARGIN = _clamp_float(float(os.getenv("PREROUTER_MIN_MARGIN", "0.1")), 0.0, 1.0)
+PREROUTER_MAX_WORDS = _clamp_int(int(os.getenv("PREROUTER_MAX_WORDS", "12")), 1, 100)
+
 # Message management configuration
 MAX_MESSAGES_IN_STATE = int(os.getenv("MAX_MESSAGES_IN_STATE", "4"))
 
@@ -145,19 +201,42 @@ RESEARCH_QUALITY_THRESHOLD = float(os.getenv("RESEARCH_QUALITY_THRESHOLD", "0.6"
 RESEARCH_MAX_TOPICS_PER_USER = int(os.getenv("RESEARCH_MAX_TOPICS_PER_USER", "3"))
 RESEARCH_FINDINGS_RETENTION_DAYS = int(os.getenv("RESEARCH_FINDINGS_RETENTION_DAYS", "30"))
 
+# Research cycle scheduler: topics are researched concurrently, round-robin across users
+RESEARCH_MAX_CONCURRENCY = _clamp_int(int(os.getenv("RESEARCH_MAX_CONCURRENCY", "4")), 1, 64)
+RESEARCH_MAX_CONCURRENCY_PER_USER = _clamp_int(int(os.getenv("RESEARCH_MAX_CONCURRENCY_PER_USER", "1")), 1, 16)
+
+# Upstream request budgets (requests per minute, 0 = unlimited) shared by chat and research
+UPSTREAM_RPM_PERPLEXITY = max(0, int(os.getenv("UPSTREAM_RPM_PERPLEXITY", "50")))
+UPSTREAM_RPM_OPENAI = max(0, int(os.getenv("UPSTREAM_RPM_OPENAI", "500")))
+UPSTREAM_RPM_OPENALEX = max(0, int(os.getenv("UPSTREAM_RPM_OPENALEX", "600")))
+UPSTREAM_RPM_PUBMED = max(0, int(os.getenv("UPSTREAM_RPM_PUBMED", "180")))
+
 # Maximum active research topics per user (includes both manual and expansion topics)
 MAX_ACTIVE_RESEARCH_TOPICS_PER_USER = _clamp_int(int(os.getenv("MAX_ACTIVE_RESEARCH_TOPICS_PER_USER", "5")), 1, 50)
 
 # Search Results Configuration
 SEARCH_RESULTS_LIMIT = 10  # Standard limit for all search API calls
 
+# Per-source review/summarization stages
+SOURCE_STAGE_MAX_CONCURRENCY = int(os.getenv("SOURCE_STAGE_MAX_CONCURRENCY", "3"))  # Concurrent per-source LLM calls
+# Pipelined mode: each source's summary starts as soon as its own review finishes
+SOURCE_STAGE_PIPELINED = os.getenv("SOURCE_STAGE_PIPELINED", "false").lower() == "true"
+
 # Deep Analysis Configuration - for analyzer_node
 DEEP_ANALYSIS_MAX_SUB_QUESTIONS = int(os.getenv("DEEP_ANALYSIS_MAX_SUB_QUESTIONS", "4"))
 DEEP_ANALYSIS_TEMPERATURE = float(os.getenv("DEEP_ANALYSIS_TEMPERATURE", "0.3"))
 DEEP_ANALYSIS_SYNTHESIS_TEMPERATURE = float(os.getenv("DEEP_ANALYSIS_SYNTHESIS_TEMPERATURE", "0.7"))
 
+# Status/notification fan-out: "memory" (single worker) or "postgres" (LISTEN/NOTIFY across workers)
+PUBSUB_BACKEND = os.getenv("PUBSUB_BACKEND", "memory").lower()
+PUBSUB_CHANNEL_PREFIX = os.getenv("PUBSUB_CHANNEL_PREFIX", "researcher")
+
 # Motivation system configuration
 MOTIVATION_CHECK_INTERVAL = int(os.getenv("MOTIVATION_CHECK_INTERVAL", "60"))
+# "interval": rescan all topics every MOTIVATION_CHECK_INTERVAL seconds
+# "due": sleep until the next topic's computed due time (full rescore every MOTIVATION_DUE_RESYNC_INTERVAL)
+MOTIVATION_SCHEDULING_MODE = os.getenv("MOTIVATION_SCHEDULING_MODE", "interval").lower()
+MOTIVATION_DUE_RESYNC_INTERVAL = max(60, int(os.getenv("MOTIVATION_DUE_RESYNC_INTERVAL", "900")))
 
 # Topic-level motivation parameters
 TOPIC_MOTIVATION_THRESHOLD = float(os.getenv("TOPIC_MOTIVATION_THRESHOLD", "0.5"))
@@ -184,6 +263,14 @@ RESEARCH_TOPIC_DELAY = 1.0                 # Delay between topics (seconds)
 RESEARCH_MANUAL_DELAY = 0.5                # Delay in manual research (seconds)
 RESEARCH_MAX_TOKENS = 2000                 # Max tokens for research LLM calls
 STATUS_MIN_INTERVAL = 0.3                  # Minimum seconds between status updates
+STATUS_CHANNEL_MAX_SIZE = 50              # Max buffered status updates per thread
+STATUS_CHANNEL_OVERFLOW = "drop_oldest"    # Full channel policy: "drop_oldest" or "coalesce" (replace newest)
+STATUS_CHANNEL_IDLE_TTL = 120.0            # Evict unstreamed channels idle this many seconds
+STATUS_OUTBOX_MAX_SIZE = 1000              # Max status updates awaiting publish before shedding
+PUBSUB_DELIVERY_TIMEOUT = 5.0              # Max seconds per subscriber call / per websocket send
+NOTIFICATION_SEND_QUEUE_MAX = 100          # Pending notifications per websocket before dropping oldest
+PASSWORD_HASH_WORKERS = 2                  # Threads dedicated to bcrypt hashing/verification
+PASSWORD_HASH_QUEUE_MAX = 32               # Max bcrypt jobs waiting for a thread before logins get 429
 
 # Admin interface configuration
 ADMIN_PASSWORD = os.getenv("ADMIN_PASSWORD", "admin123")  # Change this in production!
@@ -191,6 +278,9 @@ ADMIN_JWT_SECRET = os.getenv("ADMIN_JWT_SECRET", "your-secret-key-change-in-prod
 ADMIN_JWT_ALGORITHM = os.getenv("ADMIN_JWT_ALGORITHM", "HS256")
 ADMIN_JWT_EXPIRE_MINUTES = int(os.getenv("ADMIN_JWT_EXPIRE_MINUTES", "480"))  # 8 hours
 
+# Password hashing work factor; existing hashes are upgraded on the next login when it changes
+PASSWORD_BCRYPT_ROUNDS = _clamp_int(int(os.getenv("PASSWORD_BCRYPT_ROUNDS", "12")), 4, 31)  # bcrypt accepts 4-31
+
 # SMTP configuration (used if user has an email)
 SMTP_HOST = os.getenv("SMTP_HOST", "localhost")
 SMTP_PORT = int(os.getenv("SMTP_PORT", "587"))
@@ -199,6 +289,22 @@ SMTP_PASSWORD = os.getenv("SMTP_PASSWORD", "")
 SMTP_USE_TLS = os.getenv("SMTP_USE_TLS", "true").lower() == "true"
 SMTP_USE_SSL = os.getenv("SMTP_USE_SSL", "false").lower() == "true"
 EMAIL_FROM = os.getenv("EMAIL_FROM", "no-reply@researcher.local")
+# Per-operation socket timeout; keeps a hung server from holding the sender past its lease
+SMTP_TIMEOUT_SECONDS = _clamp_int(int(os.getenv("SMTP_TIMEOUT_SECONDS", "30")), 1, 120)
+# Email notifications are off unless SMTP_HOST is set explicitly (or this is set to true);
+# when off, nothing is queued and the outbox sender does not run
+EMAIL_NOTIFICATIONS_ENABLED = os.getenv(
+    "EMAIL_NOTIFICATIONS_ENABLED", "true" if os.getenv("SMTP_HOST") else "false"
+).lower() == "true"
+# Email outbox: notifications are queued in the DB and sent by a background sender
+EMAIL_DIGEST_WINDOW_SECONDS = int(os.getenv("EMAIL_DIGEST_WINDOW_SECONDS", "60"))  # Hold emails this long so bursts go out as one digest
+EMAIL_OUTBOX_POLL_SECONDS = 5.0            # Sender poll interval when not woken by a new email
+EMAIL_OUTBOX_BATCH_SIZE = 100              # Max outbox rows claimed per send pass
+EMAIL_OUTBOX_MAX_ATTEMPTS = 5              # Give up on an email after this many failed sends
+EMAIL_OUTBOX_RETRY_BASE_SECONDS = 30.0     # Retry backoff base (doubles per attempt)
+EMAIL_OUTBOX_CLAIM_SECONDS = 300           # Lease on claimed rows so a crashed sender's rows are retried
+EMAIL_OUTBOX_FAILED_RETENTION_DAYS = 7     # Keep given-up emails this long for inspection, then purge
+EMAIL_OUTBOX_PURGE_INTERVAL = 3600         # Seconds between retention purges
 
 # Frontend URL for deep-links in emails
 FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:3000")
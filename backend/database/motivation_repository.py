@@ -4,12 +4,14 @@ Motivation repository providing comprehensive CRUD operations for motivation sys
 
 import time
 import uuid
+from datetime import datetime, timezone
 from typing import List, Dict, Any, Optional, Union
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete, and_, or_, func
+from sqlalchemy import select, update, delete, and_, or_, func, case, distinct
 from sqlalchemy.orm import selectinload
 
 from models.motivation import TopicScore, MotivationConfig
+from models.research_finding import ResearchFinding
 from models.topic import ResearchTopic
 from .base_repository import BaseRepository
 from services.logging_config import get_logger
@@ -262,6 +264,148 @@ class MotivationRepository:
             integrated_findings=integrated_findings
         )
     
+    async def apply_finding_delta(
+        self,
+        user_id: uuid.UUID,
+        topic_id: uuid.UUID,
+        total: int = 0,
+        read: int = 0,
+        bookmarked: int = 0,
+        integrated: int = 0,
+        quality_sum: float = 0.0,
+        quality_count: int = 0,
+        last_read_at: Optional[float] = None,
+    ) -> None:
+        """Adjust a topic's engagement aggregates after a finding changed.
+
+        Runs in the caller's transaction (no commit) so the counters move together
+        with the finding row itself.
+        """
+        deltas = {
+            'total_findings': total,
+            'read_findings': read,
+            'bookmarked_findings': bookmarked,
+            'integrated_findings': integrated,
+            'quality_sum': quality_sum,
+            'quality_count': quality_count,
+        }
+        values: Dict[str, Any] = {
+            name: getattr(TopicScore, name) + delta for name, delta in deltas.items() if delta
+        }
+        if last_read_at is not None:
+            values['last_read_at'] = last_read_at
+        if not values:
+            return
+
+        await self.session.execute(
+            update(TopicScore)
+            .where(and_(TopicScore.user_id == user_id, TopicScore.topic_id == topic_id))
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def recompute_engagement_aggregates(self, topic_ids: Optional[List[uuid.UUID]] = None) -> None:
+        """Rebuild engagement aggregates from research_findings (after bulk deletes).
+
+        Limited to ``topic_ids`` when given. Runs in the caller's transaction.
+        """
+        if topic_ids is not None and not topic_ids:
+            return
+        topic_filter = [TopicScore.topic_id.in_(topic_ids)] if topic_ids is not None else []
+
+        await self.session.execute(
+            update(TopicScore)
+            .where(*topic_filter)
+            .values(
+                total_findings=0,
+                read_findings=0,
+                bookmarked_findings=0,
+                integrated_findings=0,
+                quality_sum=0.0,
+                quality_count=0,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+        agg = select(
+            ResearchFinding.user_id.label('user_id'),
+            ResearchFinding.topic_id.label('topic_id'),
+            func.count().label('total'),
+            func.count().filter(ResearchFinding.read.is_(True)).label('reads'),
+            func.count().filter(ResearchFinding.bookmarked.is_(True)).label('bookmarks'),
+            func.count().filter(ResearchFinding.integrated.is_(True)).label('integrations'),
+            func.coalesce(func.sum(ResearchFinding.quality_score), 0.0).label('quality_sum'),
+            func.count(ResearchFinding.quality_score).label('quality_count'),
+        ).group_by(ResearchFinding.user_id, ResearchFinding.topic_id)
+        if topic_ids is not None:
+            agg = agg.where(ResearchFinding.topic_id.in_(topic_ids))
+        agg = agg.subquery('findings_agg')
+
+        await self.session.execute(
+            update(TopicScore)
+            .where(and_(TopicScore.user_id == agg.c.user_id, TopicScore.topic_id == agg.c.topic_id))
+            .values(
+                total_findings=agg.c.total,
+                read_findings=agg.c.reads,
+                bookmarked_findings=agg.c.bookmarks,
+                integrated_findings=agg.c.integrations,
+                quality_sum=agg.c.quality_sum,
+                quality_count=agg.c.quality_count,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    async def get_finding_activity(
+        self,
+        user_id: uuid.UUID,
+        topic_ids: List[uuid.UUID],
+        window_start: float,
+        recent_start: float,
+    ) -> Dict[uuid.UUID, Dict[str, Any]]:
+        """Aggregate finding activity for several topics in one query.
+
+        Per topic: total/read/bookmarked/integrated counts, reads of findings created
+        since ``recent_start``, average quality of findings created since
+        ``window_start`` and whether any of those were read, bookmarked or integrated.
+        Only aggregates are selected, never the finding text columns.
+        """
+        if not topic_ids:
+            return {}
+
+        in_window = ResearchFinding.created_at >= datetime.fromtimestamp(window_start, tz=timezone.utc)
+        is_recent = ResearchFinding.created_at >= datetime.fromtimestamp(recent_start, tz=timezone.utc)
+        interacted = or_(
+            ResearchFinding.read.is_(True),
+            ResearchFinding.bookmarked.is_(True),
+            ResearchFinding.integrated.is_(True),
+        )
+
+        result = await self.session.execute(
+            select(
+                ResearchFinding.topic_id,
+                func.count().label('total'),
+                func.count().filter(ResearchFinding.read.is_(True)).label('reads'),
+                func.count().filter(and_(ResearchFinding.read.is_(True), is_recent)).label('recent_reads'),
+                func.count().filter(ResearchFinding.bookmarked.is_(True)).label('bookmarks'),
+                func.count().filter(ResearchFinding.integrated.is_(True)).label('integrations'),
+                func.avg(ResearchFinding.quality_score).filter(in_window).label('window_quality'),
+                func.count().filter(and_(interacted, in_window)).label('window_interactions'),
+            )
+            .where(and_(ResearchFinding.user_id == user_id, ResearchFinding.topic_id.in_(topic_ids)))
+            .group_by(ResearchFinding.topic_id)
+        )
+        return {row.topic_id: dict(row._mapping) for row in result.all()}
+
+    async def bulk_update_topic_meta(self, updates: Dict[uuid.UUID, Dict[str, Any]]) -> None:
+        """Write ``meta_data`` for several topic scores (keyed by TopicScore.id) in one statement."""
+        if not updates:
+            return
+        await self.session.execute(
+            update(TopicScore),
+            [{"id": score_id, "meta_data": meta} for score_id, meta in updates.items()],
+        )
+        await self.session.commit()
+
     async def delete_topic_score(self, user_id: uuid.UUID, topic_name: str) -> bool:
         """Delete topic score."""
         result = await self.session.execute(
@@ -449,4 +593,80 @@ class MotivationRepository:
         )
         return result.scalar() or 0
 
+    # Due-time scheduling (MOTIVATION_SCHEDULING_MODE=due)
+
+    async def refresh_due_times(
+        self,
+        threshold: float,
+        engagement_weight: float,
+        quality_weight: float,
+        staleness_scale: float,
+        never_due_at: float,
+        only_missing: bool = False,
+    ) -> int:
+        """Recompute ``next_due_at`` for active topics from their stored scores.
+
+        motivation = staleness_scale * coefficient * (now - last_researched)
+                     + engagement * engagement_weight + success_rate * quality_weight
+        reaches ``threshold`` at last_researched + (threshold - base) / (scale * coefficient).
+        Never-researched topics are due immediately; topics whose staleness never
+        grows are re-evaluated at ``never_due_at``.
+        """
+        base = TopicScore.engagement_score * engagement_weight + TopicScore.success_rate * quality_weight
+        growth = TopicScore.staleness_coefficient * staleness_scale
+        whens = [
+            (TopicScore.last_researched.is_(None), time.time()),
+            (base >= threshold, TopicScore.last_researched),
+        ]
+        if staleness_scale > 0:
+            whens.append((growth > 0, TopicScore.last_researched + (threshold - base) / growth))
+
+        conditions = [TopicScore.is_active_research == True]
+        if only_missing:
+            conditions.append(TopicScore.next_due_at.is_(None))
+
+        result = await self.session.execute(
+            update(TopicScore)
+            .where(and_(*conditions))
+            .values(next_due_at=case(*whens, else_=never_due_at))
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.commit()
+        return result.rowcount or 0
+
+    async def get_next_due_time(self) -> Optional[float]:
+        """Earliest due time over active topics (0 for topics not computed yet), or None."""
+        result = await self.session.execute(
+            select(func.min(func.coalesce(TopicScore.next_due_at, 0.0))).where(
+                TopicScore.is_active_research == True
+            )
+        )
+        return result.scalar()
+
+    async def get_users_with_due_topics(self, now: float) -> List[uuid.UUID]:
+        """Users with at least one active topic due at ``now``."""
+        result = await self.session.execute(
+            select(distinct(TopicScore.user_id)).where(
+                and_(
+                    TopicScore.is_active_research == True,
+                    or_(TopicScore.next_due_at.is_(None), TopicScore.next_due_at <= now),
+                )
+            )
+        )
+        return [row[0] for row in result.all()]
 
+    async def defer_overdue_topics(self, now: float, retry_at: float) -> int:
+        """Push topics that are still due after a cycle (failed or skipped research) to ``retry_at``."""
+        result = await self.session.execute(
+            update(TopicScore)
+            .where(
+                and_(
+                    TopicScore.is_active_research == True,
+                    or_(TopicScore.next_due_at.is_(None), TopicScore.next_due_at <= now),
+                )
+            )
+            .values(next_due_at=retry_at)
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.commit()
+        return result.rowcount or 0
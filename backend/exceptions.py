@@ -21,3 +21,8 @@ class NotFound(CommonError):
 
 class Forbidden(CommonError):
     status_code = status.HTTP_403_FORBIDDEN
+
+
+class Overloaded(CommonError):
+    status_code = status.HTTP_429_TOO_MANY_REQUESTS
+    headers = {"Retry-After": "1"}
@@ -5,6 +5,9 @@ from .motivation import TopicScore, MotivationConfig
 from .prompt import Prompt, PromptHistory
 from .chat import Chat
 from .topic import ResearchTopic
+from .router_example import RouterExample
+from .search_cache import SearchCacheEntry
+from .email_outbox import EmailOutboxEntry
 
 __all__ = (
     "User",
@@ -15,4 +18,7 @@ __all__ = (
     "PromptHistory",
     "Chat",
     "ResearchTopic",
+    "RouterExample",
+    "SearchCacheEntry",
+    "EmailOutboxEntry",
 )
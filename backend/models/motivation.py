@@ -34,6 +34,8 @@ class TopicScore(Base):
     # Topic metadata
     last_researched: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     staleness_coefficient: Mapped[float] = mapped_column(Float, nullable=False, default=1.0)
+    # Epoch time at which motivation_score reaches the threshold (NULL = not computed yet)
+    next_due_at: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     is_active_research: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
     
     # Research metadata
@@ -41,6 +43,10 @@ class TopicScore(Base):
     read_findings: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     bookmarked_findings: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     integrated_findings: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # Kept in step with research_findings by ResearchService (see MotivationRepository.apply_finding_delta)
+    quality_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0.0, server_default="0")
+    quality_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    last_read_at: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     
     # Quality metrics
     average_quality: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
@@ -54,6 +60,7 @@ class TopicScore(Base):
         Index('ix_topic_scores_user_active', 'user_id', 'is_active_research'),
         Index('ix_topic_scores_motivation', 'motivation_score'),
         Index('ix_topic_scores_last_researched', 'last_researched'),
+        Index('ix_topic_scores_active_due', 'is_active_research', 'next_due_at'),
     )
 
 
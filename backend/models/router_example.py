@@ -0,0 +1,28 @@
+import uuid
+from typing import List, Optional
+from sqlalchemy import ForeignKey, String, Text
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.ext.mutable import MutableList
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class RouterExample(Base):
+    """Labelled user message used by the local intent pre-router."""
+
+    __tablename__ = "router_examples"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+
+    text: Mapped[str] = mapped_column(Text, nullable=False)
+    intent: Mapped[str] = mapped_column(String(20), nullable=False)
+    sources: Mapped[List[str]] = mapped_column(
+        MutableList.as_mutable(JSONB), nullable=False, default=list
+    )
+
+    created_by_user_id: Mapped[Optional[uuid.UUID]] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True
+    )
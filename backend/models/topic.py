@@ -38,6 +38,15 @@ class ResearchTopic(Base):
         nullable=True,
         index=True
     )
+    # Materialized tree position, set once at creation: 0 for roots, parent depth + 1 for children;
+    # root_id is the top-level ancestor (NULL for root topics themselves)
+    depth: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    root_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("research_topics.id", ondelete="CASCADE"),
+        nullable=True,
+        index=True
+    )
     researched_once: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
 
     __table_args__ = (
@@ -293,6 +293,24 @@ FORMATTING INSTRUCTIONS:
 The raw response was generated by the {module_used} module of the assistant.
 """
 
+# Single-pass formatting instructions appended to the integrator prompt (fused render mode)
+FUSED_RESPONSE_FORMAT_PROMPT = """
+You are also responsible for the final presentation of your answer: it is returned directly to the user without a separate formatting pass.
+
+USER PREFERENCES (adapt formatting to match these learned preferences):
+- Response Length: {response_length} (short/medium/long)
+- Detail Level: {detail_level} (concise/balanced/comprehensive)
+- Formatting Style: {formatting_style} (structured/natural/bullet_points)
+- Include Key Insights: {include_key_insights}
+
+FORMATTING INSTRUCTIONS:
+- Write in a {style} style with a {tone} tone.
+- Keep all numbered citation markers (e.g., `[1]`, `[2]`) exactly as they appear in the provided context.
+- If user prefers structured responses or bullet points, organize content accordingly
+- Adjust level of detail based on the detail_level preference
+- Always provide 1-2 relevant follow-up questions, phrased as if the user is asking them.
+"""
+
 # Autonomous Research Engine prompts
 RESEARCH_QUERY_GENERATION_PROMPT = """Current date and time: {current_time}.
 You are an expert research query generator for autonomous research systems.
@@ -1,5 +1,5 @@
 from typing import Dict, Literal, Optional, List
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime
 from uuid import UUID
 
@@ -93,3 +93,38 @@ class PromptStatusOut(BaseModel):
     timestamp: datetime
     prompts_loaded: int
     categories: List[str]
+
+
+class RouterExampleIn(BaseModel):
+    """Input body for adding a labelled pre-router example."""
+    text: str = Field(min_length=1, max_length=500)
+    intent: Literal["chat", "search", "analysis"]
+    sources: List[Literal["search", "academic_search", "social_search", "medical_search"]] = Field(default_factory=list)
+
+
+class RouterExampleRecord(BaseModel):
+    """Labelled pre-router example."""
+    id: UUID
+    text: str
+    intent: str
+    sources: List[str]
+    created_at: datetime
+
+
+class RouterExampleListOut(BaseModel):
+    """Admin-provided pre-router examples."""
+    total: int
+    examples: List[RouterExampleRecord]
+
+
+class RouterStatsOut(BaseModel):
+    """Local pre-router hit-rate metrics."""
+    enabled: bool
+    requests: int
+    rule_hits: int
+    example_hits: int
+    fallbacks: int
+    hit_rate: float
+    hits_by_rule: Dict[str, int]
+    examples: int
+    custom_examples: int
@@ -1,7 +1,7 @@
 from uuid import UUID
 from datetime import datetime
 from pydantic import BaseModel, Field
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Literal, Optional
 
 from config import DEFAULT_MODEL
 from .user import PersonalityConfig
@@ -28,6 +28,9 @@ class ChatIn(BaseModel):
     max_tokens: int = 1000
     personality: Optional[PersonalityConfig] = None
     session_id: Optional[UUID] = None
+    render_mode: Optional[Literal["two_pass", "fused", "fused_chat"]] = Field(
+        default=None, description="Override CHAT_RENDER_MODE for this request"
+    )
 
 
 class ChatOut(BaseModel):
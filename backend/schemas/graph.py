@@ -1,13 +1,19 @@
-from pydantic import BaseModel
-from typing import Dict, Any, List
+from pydantic import BaseModel, Field
+from typing import Dict, Any, List, Optional
 
 
 class GraphIn(BaseModel):
     """Request model for graph data."""
     type: str  # "user" or "group"
     id: str    # user_id or group_id
+    center_node_uuid: Optional[str] = None  # Only return the subgraph around this node
+    hops: int = Field(default=1, ge=1, le=3)  # Subgraph radius around center_node_uuid
+    limit: Optional[int] = Field(default=None, ge=1, le=5000)  # Max triplets per page; all when omitted
+    cursor: Optional[str] = None  # next_cursor from the previous page
 
 
 class GraphOut(BaseModel):
     """Response model for graph data."""
     triplets: List[Dict[str, Any]]
+    total: Optional[int] = None  # Triplets available across all pages
+    next_cursor: Optional[str] = None
@@ -10,8 +10,9 @@ from exceptions import (
     CommonError,
     AlreadyExist,
     AuthError,
+    Overloaded,
 )
-from utils.password import hash_password, verify_password
+from utils.password import hash_password_async, rehash_if_needed, verify_password_async
 from utils.helpers import normalize_provider_user_id, generate_display_name_from_user_id
 from models.user import User
 from models.user import UserProfile
@@ -65,13 +66,22 @@ class AuthService:
         identity = await self._get_identity(session, PROVIDER_LOCAL, email)
         if not identity or not identity.password_hash:
             raise AuthError("Invalid credentials")
-        if not verify_password(password, identity.password_hash):
+        if not await verify_password_async(password, identity.password_hash):
             raise AuthError("Invalid credentials")
 
         user = await session.get(User, identity.user_id)
         if not user:
             raise AuthError("Invalid credentials")
 
+        # Upgrade the stored hash when PASSWORD_BCRYPT_ROUNDS changed; best effort
+        try:
+            new_hash = await rehash_if_needed(password, identity.password_hash)
+        except Overloaded:
+            new_hash = None
+        if new_hash:
+            identity.password_hash = new_hash
+            await session.commit()
+
         return user
 
     async def login_google(
@@ -157,7 +167,7 @@ class AuthService:
         if provider == PROVIDER_LOCAL:
             if not password_plain:
                 raise CommonError("Password is required for local provider")
-            password_hash = hash_password(password_plain)
+            password_hash = await hash_password_async(password_plain)
         else:
             if password_plain is not None:
                 raise CommonError("Password must not be provided for non-local providers")
@@ -5,6 +5,7 @@ Autonomous Research Engine using LangGraph for conducting background research on
 import asyncio
 import time
 import uuid
+from contextlib import asynccontextmanager
 from datetime import timezone
 from typing import Dict, List, Any, Optional
 
@@ -45,6 +46,8 @@ class AutonomousResearcher:
         # Topic expansion service is instantiated on-demand in process_expansions_for_root
         self.topic_service = TopicService()
         self.research_service = ResearchService()
+        self._creation_locks: Dict[str, asyncio.Lock] = {}
+        self._creation_lock_users: Dict[str, int] = {}
 
     async def get_recent_average_quality(self, user_id: str, topic_id: uuid.UUID, window_days: int) -> float:
         """Compute recent average quality over window for a topic."""
@@ -350,45 +353,33 @@ class AutonomousResearcher:
             return {"success": False, "error": str(e), "stored": False}
 
     async def _calculate_topic_depth(self, topic_id: str, user_id: str) -> int:
-        """Calculate topic depth by traversing parent chain. Returns 0 for root topics."""
+        """Read the topic's materialized expansion depth. Returns 0 for root topics."""
         try:
             topic_uuid = uuid.UUID(str(topic_id))
         except (ValueError, TypeError):
             return 0
-        
-        depth = 0
-        current_id = topic_uuid
-        visited = set()
-        
+
         try:
             async with SessionLocal() as session:
-                from sqlalchemy import select
-                from models.topic import ResearchTopic
-                
-                for _ in range(20):
-                    if current_id in visited:
-                        break
-                    visited.add(current_id)
-                    
-                    query = select(ResearchTopic).where(ResearchTopic.id == current_id)
-                    result = await session.execute(query)
-                    topic = result.scalar_one_or_none()
-                    
-                    if not topic or not topic.parent_id:
-                        break
-                    
-                    depth += 1
-                    current_id = topic.parent_id
-                
-                return depth
+                return await self.topic_service.get_topic_depth(session, topic_uuid)
         except Exception as e:
             logger.warning(f"Error calculating depth for topic {topic_id}: {e}")
             return 0
 
     # Reusable helper to generate and process expansions for a root topic (instance method)
-    async def process_expansions_for_root(self, user_id: str, root_topic: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Generate expansion candidates for a root topic, create child topics respecting breadth limits, and research active children."""
-        results: List[Dict[str, Any]] = []
+    async def process_expansions_for_root(
+        self,
+        user_id: str,
+        root_topic: Dict[str, Any],
+        semaphore: Optional[asyncio.Semaphore] = None,
+    ) -> List[Dict[str, Any]]:
+        """Generate expansion candidates for a root topic, create child topics respecting breadth limits, and research active children.
+
+        Each selected candidate is created and researched in its own task. With a
+        ``semaphore`` (MotivationSystem shares one built from EXPANSION_MAX_PARALLEL),
+        candidate generation and every child run hold a slot while working.
+        """
+        semaphore = semaphore or asyncio.Semaphore(max(1, config.EXPANSION_MAX_PARALLEL))
         try:
             # Initialize TopicExpansionService
             try:
@@ -414,119 +405,154 @@ class AutonomousResearcher:
                     f"⏹️ Skipping expansion for topic '{topic_name}': "
                     f"depth {parent_depth} >= max depth {max_depth}"
                 )
-                return results
+                return []
 
             # Generate candidates
-            candidates = await topic_expansion_service.generate_candidates(user_id, root_topic)
+            async with semaphore:
+                candidates = await topic_expansion_service.generate_candidates(user_id, root_topic)
             if not candidates:
-                return results
+                return []
 
             k = min(getattr(config, 'EXPLORATION_PER_ROOT_MAX', 2), len(candidates))
             selected = candidates[:k]
-            active_children: List[Dict[str, Any]] = []
 
-            for cand in selected:
-                # Build child metadata
-                child_depth = parent_depth + 1
-                desc = getattr(cand, 'description', None) or (
-                    f"Research into {cand.name.lower()} and its relationship to {root_topic.get('topic_name','').lower()}"
-                )
-                extra_meta = {
-                    "is_expansion": True,
-                    "origin": {
-                        "type": "expansion",
-                        "parent_topic": root_topic.get('topic_name'),
-                        "method": getattr(cand, 'source', None),
-                        "similarity": getattr(cand, 'similarity', None),
-                        "rationale": getattr(cand, 'rationale', None),
-                    },
-                    "expansion_depth": child_depth,
-                    "child_expansion_enabled": True,
-                    "expansion_status": "active",
-                    "last_evaluated_at": time.time(),
-                }
+            child_runs = await asyncio.gather(
+                *(self._expand_child(user_id, root_topic, cand, parent_depth + 1, semaphore) for cand in selected)
+            )
+            return [run for run in child_runs if run is not None]
+        except Exception as e:
+            logger.debug(f"process_expansions_for_root failed: {e}")
+            return []
+
+    async def _expand_child(
+        self,
+        user_id: str,
+        root_topic: Dict[str, Any],
+        cand: Any,
+        child_depth: int,
+        semaphore: asyncio.Semaphore,
+    ) -> Optional[Dict[str, Any]]:
+        """Create one expansion child topic and research it if it is active."""
+        async with semaphore:
+            child = await self._create_expansion_child(user_id, root_topic, cand, child_depth)
+            if not child or not child.get("is_active_research"):
+                return None
 
-                # Get parent topic ID from root_topic
-                parent_topic_id = None
-                root_topic_id = root_topic.get("topic_id")
-                if root_topic_id:
-                    try:
-                        parent_topic_id = uuid.UUID(str(root_topic_id))
-                    except (ValueError, TypeError):
-                        logger.warning(f"Invalid parent topic ID format: {root_topic_id}")
+            # Research active children immediately
+            try:
+                child_result = await self.run_langgraph_research(user_id, child)
+                return {"topic": child, "result": child_result}
+            except Exception as e:
+                logger.error(f"Error researching expansion child {child.get('topic_name')}: {e}")
+                return None
+
+    @asynccontextmanager
+    async def _creation_lock(self, user_id: str):
+        # Children are created one at a time per user so the active-topic limit check stays exact.
+        # The lock is dropped once nobody holds or waits for it, so the dict stays bounded.
+        lock = self._creation_locks.get(user_id)
+        if lock is None:
+            lock = self._creation_locks[user_id] = asyncio.Lock()
+        self._creation_lock_users[user_id] = self._creation_lock_users.get(user_id, 0) + 1
+        try:
+            async with lock:
+                yield
+        finally:
+            self._creation_lock_users[user_id] -= 1
+            if not self._creation_lock_users[user_id]:
+                del self._creation_lock_users[user_id]
+                del self._creation_locks[user_id]
+
+    async def _create_expansion_child(
+        self,
+        user_id: str,
+        root_topic: Dict[str, Any],
+        cand: Any,
+        child_depth: int,
+    ) -> Optional[Dict[str, Any]]:
+        """Create the child topic for an expansion candidate; returns its research payload."""
+        # Build child metadata
+        desc = getattr(cand, 'description', None) or (
+            f"Research into {cand.name.lower()} and its relationship to {root_topic.get('topic_name','').lower()}"
+        )
+        extra_meta = {
+            "is_expansion": True,
+            "origin": {
+                "type": "expansion",
+                "parent_topic": root_topic.get('topic_name'),
+                "method": getattr(cand, 'source', None),
+                "similarity": getattr(cand, 'similarity', None),
+                "rationale": getattr(cand, 'rationale', None),
+            },
+            "expansion_depth": child_depth,
+            "child_expansion_enabled": True,
+            "expansion_status": "active",
+            "last_evaluated_at": time.time(),
+        }
 
-                # Create topic in database using TopicService
-                try:
-                    # Try to create topic with research enabled - async_create_topic will check limit internally
-                    try:
-                        topic = await self.topic_service.async_create_topic(
-                            user_id=user_id,
-                            name=cand.name,
-                            description=desc,
-                            confidence_score=0.8,
-                            is_active_research=True,
-                            conversation_context="",
-                            strict=True,
-                            is_child=True,
-                            parent_id=parent_topic_id,
-                        )
-                        enable_research = True
-                    except CommonError:
-                        # Limit exceeded, create without research enabled
-                        topic = await self.topic_service.async_create_topic(
-                            user_id=user_id,
-                            name=cand.name,
-                            description=desc,
-                            confidence_score=0.8,
-                            is_active_research=False,
-                            conversation_context="",
-                            strict=True,
-                            is_child=True,
-                            parent_id=parent_topic_id,
-                        )
-                        enable_research = False
-                        extra_meta["expansion_status"] = "inactive"
-                    
-                    # Log successful child topic creation
-                    logger.info(
-                        f"✅ Created expansion child topic '{cand.name}' (ID: {topic.id}, is_child: {topic.is_child}, "
-                        f"parent_id: {topic.parent_id}, is_active_research: {topic.is_active_research}) "
-                        f"for user {user_id}"
-                    )
-                    
-                    # Convert ResearchTopic to dict format expected by run_langgraph_research
-                    topic_dict = {
-                        "topic_id": str(topic.id),
-                        "topic_name": topic.name,
-                        "description": topic.description,
-                        "is_active_research": topic.is_active_research,
-                        "expansion_depth": child_depth,
-                        "expansion_status": extra_meta["expansion_status"],
-                        **extra_meta  # Include all expansion metadata
-                    }
-                    if topic.is_active_research:
-                        active_children.append(topic_dict)
-                except CommonError as e:
-                    logger.warning(f"Cannot create expansion topic {cand.name} for user {user_id}: {e}")
-                    enable_research = False
-                    continue
-                except Exception as e:
-                    logger.error(f"Error creating expansion topic {cand.name} for user {user_id}: {e}")
-                    continue
+        # Get parent topic ID from root_topic
+        parent_topic_id = None
+        root_topic_id = root_topic.get("topic_id")
+        if root_topic_id:
+            try:
+                parent_topic_id = uuid.UUID(str(root_topic_id))
+            except (ValueError, TypeError):
+                logger.warning(f"Invalid parent topic ID format: {root_topic_id}")
 
-            # Research active children immediately
-            for child in active_children:
+        # Create topic in database using TopicService
+        try:
+            async with self._creation_lock(user_id):
+                # Try to create topic with research enabled - async_create_topic will check limit internally
                 try:
-                    child_result = await self.run_langgraph_research(user_id, child)
-                    results.append({"topic": child, "result": child_result})
-                except Exception as e:
-                    logger.error(f"Error researching expansion child {child.get('topic_name')}: {e}")
-                    continue
-
-            return results
+                    topic = await self.topic_service.async_create_topic(
+                        user_id=user_id,
+                        name=cand.name,
+                        description=desc,
+                        confidence_score=0.8,
+                        is_active_research=True,
+                        conversation_context="",
+                        strict=True,
+                        is_child=True,
+                        parent_id=parent_topic_id,
+                    )
+                except CommonError:
+                    # Limit exceeded, create without research enabled
+                    topic = await self.topic_service.async_create_topic(
+                        user_id=user_id,
+                        name=cand.name,
+                        description=desc,
+                        confidence_score=0.8,
+                        is_active_research=False,
+                        conversation_context="",
+                        strict=True,
+                        is_child=True,
+                        parent_id=parent_topic_id,
+                    )
+                    extra_meta["expansion_status"] = "inactive"
+            
+            # Log successful child topic creation
+            logger.info(
+                f"✅ Created expansion child topic '{cand.name}' (ID: {topic.id}, is_child: {topic.is_child}, "
+                f"parent_id: {topic.parent_id}, is_active_research: {topic.is_active_research}) "
+                f"for user {user_id}"
+            )
+            
+            # Convert ResearchTopic to dict format expected by run_langgraph_research
+            return {
+                "topic_id": str(topic.id),
+                "topic_name": topic.name,
+                "description": topic.description,
+                "is_active_research": topic.is_active_research,
+                "expansion_depth": child_depth,
+                "expansion_status": extra_meta["expansion_status"],
+                **extra_meta  # Include all expansion metadata
+            }
+        except CommonError as e:
+            logger.warning(f"Cannot create expansion topic {cand.name} for user {user_id}: {e}")
+            return None
         except Exception as e:
-            logger.debug(f"process_expansions_for_root failed: {e}")
-            return results
+            logger.error(f"Error creating expansion topic {cand.name} for user {user_id}: {e}")
+            return None
 
 
 # Global instance
@@ -0,0 +1,252 @@
+"""
+Durable outbox for notification emails.
+
+Notifications used to call the blocking ``smtplib`` client directly on the event loop,
+one connection per email. ``EmailOutbox.enqueue`` now only inserts an ``email_outbox``
+row; a background sender claims due rows, merges several emails for the same recipient
+into one digest, sends the batch over a single SMTP connection in a worker thread and
+retries failures with exponential backoff.
+
+Emails are held for ``EMAIL_DIGEST_WINDOW_SECONDS`` so a burst of findings from one
+research cycle reaches the user as a single digest. Claimed rows are leased for
+``EMAIL_OUTBOX_CLAIM_SECONDS`` so rows of a crashed sender are picked up again.
+Sent rows are deleted; rows that were given up on are kept for
+``EMAIL_OUTBOX_FAILED_RETENTION_DAYS`` and then purged by the sender, so the table
+only holds work in progress and recent failures.
+
+Nothing is queued, and the sender does not run, unless ``EMAIL_NOTIFICATIONS_ENABLED``.
+"""
+
+import asyncio
+import html
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import and_, delete, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import config
+from db import SessionLocal
+from models.email_outbox import EmailOutboxEntry
+from services.email_service import OutgoingEmail, email_service
+from services.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def build_digest(entries: List[EmailOutboxEntry]) -> OutgoingEmail:
+    """Merge the queued emails of one recipient into a single message."""
+    if len(entries) == 1:
+        entry = entries[0]
+        return entry.to_address, entry.subject, entry.text_body, entry.html_body
+
+    subject = f"{len(entries)} research updates"
+    text_body = f"Hello,\n\nYou have {len(entries)} new research updates.\n\n" + "\n\n---\n\n".join(
+        entry.text_body for entry in entries
+    )
+    html_body = "<hr style=\"border: none; border-top: 1px solid #e5e7eb; margin: 16px 0;\">".join(
+        entry.html_body or f"<pre>{html.escape(entry.text_body)}</pre>" for entry in entries
+    )
+    return entries[0].to_address, subject, text_body, html_body
+
+
+class EmailOutbox:
+    """Process-wide background sender for the ``email_outbox`` table."""
+
+    _task: Optional[asyncio.Task] = None
+    _wake: Optional[asyncio.Event] = None
+    _counters: Dict[str, int] = {}
+
+    @classmethod
+    async def enqueue(
+        cls,
+        session: AsyncSession,
+        *,
+        to_address: str,
+        kind: str,
+        subject: str,
+        text_body: str,
+        html_body: Optional[str] = None,
+        user_id: Optional[uuid.UUID] = None,
+    ) -> None:
+        """Queue an email; it is sent by the background sender, never inline."""
+        if not config.EMAIL_NOTIFICATIONS_ENABLED:
+            return
+        session.add(
+            EmailOutboxEntry(
+                user_id=user_id,
+                to_address=to_address,
+                kind=kind,
+                subject=subject,
+                text_body=text_body,
+                html_body=html_body,
+                next_attempt_at=_utcnow() + timedelta(seconds=config.EMAIL_DIGEST_WINDOW_SECONDS),
+            )
+        )
+        await session.commit()
+        cls._count("queued")
+        if config.EMAIL_DIGEST_WINDOW_SECONDS <= 0 and cls._wake is not None:
+            cls._wake.set()
+
+    @classmethod
+    async def _claim_due(cls) -> List[EmailOutboxEntry]:
+        """Lease due rows, plus every other pending row for the same recipients."""
+        now = _utcnow()
+        window_end = now + timedelta(seconds=config.EMAIL_DIGEST_WINDOW_SECONDS)
+        due_recipients = (
+            select(EmailOutboxEntry.to_address)
+            .where(EmailOutboxEntry.status == "pending", EmailOutboxEntry.next_attempt_at <= now)
+            .limit(config.EMAIL_OUTBOX_BATCH_SIZE)
+        )
+        async with SessionLocal() as session:
+            result = await session.execute(
+                select(EmailOutboxEntry)
+                .where(
+                    EmailOutboxEntry.status == "pending",
+                    EmailOutboxEntry.to_address.in_(due_recipients),
+                    # Fresh emails still inside their digest window ride along (leased rows sit past
+                    # it); retries keep their backoff
+                    or_(
+                        EmailOutboxEntry.next_attempt_at <= now,
+                        and_(EmailOutboxEntry.attempts == 0, EmailOutboxEntry.next_attempt_at <= window_end),
+                    ),
+                )
+                .order_by(EmailOutboxEntry.created_at)
+                .limit(config.EMAIL_OUTBOX_BATCH_SIZE)
+                .with_for_update(skip_locked=True)
+            )
+            rows = list(result.scalars().all())
+            lease = now + timedelta(seconds=max(config.EMAIL_OUTBOX_CLAIM_SECONDS, config.EMAIL_DIGEST_WINDOW_SECONDS + 1))
+            for row in rows:
+                row.next_attempt_at = lease
+            await session.commit()
+        return rows
+
+    @classmethod
+    async def _record(cls, sent: List[uuid.UUID], failed: List[Tuple[EmailOutboxEntry, str]]) -> None:
+        now = _utcnow()
+        async with SessionLocal() as session:
+            if sent:
+                await session.execute(delete(EmailOutboxEntry).where(EmailOutboxEntry.id.in_(sent)))
+            for row, error in failed:
+                attempts = row.attempts + 1
+                values: Dict[str, Any] = {"attempts": attempts, "last_error": error[:2000]}
+                if attempts >= config.EMAIL_OUTBOX_MAX_ATTEMPTS:
+                    values["status"] = "failed"
+                    logger.error(f"📧 Email outbox: Giving up on {row.kind} email to {row.to_address}: {error}")
+                else:
+                    delay = config.EMAIL_OUTBOX_RETRY_BASE_SECONDS * 2 ** (attempts - 1)
+                    values["next_attempt_at"] = now + timedelta(seconds=delay)
+                await session.execute(
+                    update(EmailOutboxEntry).where(EmailOutboxEntry.id == row.id).values(**values)
+                )
+            await session.commit()
+
+    @classmethod
+    async def process_due(cls) -> int:
+        """Send everything currently due; returns the number of outbox rows handled."""
+        rows = await cls._claim_due()
+        if not rows:
+            return 0
+
+        groups: "OrderedDict[str, List[EmailOutboxEntry]]" = OrderedDict()
+        for row in rows:
+            groups.setdefault(row.to_address, []).append(row)
+        emails = [build_digest(entries) for entries in groups.values()]
+
+        # smtplib is blocking: keep it off the event loop
+        errors = await asyncio.to_thread(email_service.send_batch, emails)
+
+        sent: List[uuid.UUID] = []
+        failed: List[Tuple[EmailOutboxEntry, str]] = []
+        for entries, error in zip(groups.values(), errors):
+            if error is None:
+                sent.extend(entry.id for entry in entries)
+            else:
+                failed.extend((entry, error) for entry in entries)
+        await cls._record(sent, failed)
+
+        cls._count("sent", len(sent))
+        cls._count("failed_attempts", len(failed))
+        sent_emails = len(emails) - sum(1 for error in errors if error is not None)
+        cls._count("emails", sent_emails)
+        logger.info(f"📧 Email outbox: Sent {sent_emails} emails for {len(sent)} notifications ({len(failed)} failed)")
+        return len(rows)
+
+    @classmethod
+    async def purge_failed(cls) -> int:
+        """Delete given-up emails older than the retention period."""
+        cutoff = _utcnow() - timedelta(days=config.EMAIL_OUTBOX_FAILED_RETENTION_DAYS)
+        async with SessionLocal() as session:
+            result = await session.execute(
+                delete(EmailOutboxEntry).where(
+                    EmailOutboxEntry.status == "failed", EmailOutboxEntry.updated_at < cutoff
+                )
+            )
+            await session.commit()
+        if result.rowcount:
+            cls._count("purged", result.rowcount)
+            logger.info(f"📧 Email outbox: Purged {result.rowcount} failed emails")
+        return result.rowcount or 0
+
+    @classmethod
+    async def _run(cls) -> None:
+        last_purge = 0.0
+        while True:
+            try:
+                if time.monotonic() - last_purge >= config.EMAIL_OUTBOX_PURGE_INTERVAL:
+                    last_purge = time.monotonic()
+                    await cls.purge_failed()
+                handled = await cls.process_due()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"📧 Email outbox: Send pass failed: {e}")
+                handled = 0
+            if handled >= config.EMAIL_OUTBOX_BATCH_SIZE:
+                continue
+            cls._wake.clear()
+            try:
+                await asyncio.wait_for(cls._wake.wait(), timeout=config.EMAIL_OUTBOX_POLL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+
+    @classmethod
+    def start(cls) -> None:
+        if not config.EMAIL_NOTIFICATIONS_ENABLED:
+            logger.info("📧 Email outbox: Email notifications disabled; sender not started")
+            return
+        if cls._task is not None and not cls._task.done():
+            return
+        cls._wake = asyncio.Event()
+        cls._task = asyncio.create_task(cls._run())
+        logger.info("📧 Email outbox: Sender started")
+
+    @classmethod
+    async def stop(cls) -> None:
+        task, cls._task = cls._task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    @classmethod
+    def _count(cls, name: str, amount: int = 1) -> None:
+        cls._counters[name] = cls._counters.get(name, 0) + amount
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, Any]:
+        return {
+            "running": cls._task is not None and not cls._task.done(),
+            **{name: cls._counters.get(name, 0) for name in ("queued", "sent", "emails", "failed_attempts", "purged")},
+        }
+
+    @classmethod
+    def reset_stats(cls) -> None:
+        cls._counters = {}
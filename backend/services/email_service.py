@@ -7,7 +7,7 @@ import smtplib
 import ssl
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-from typing import Optional
+from typing import List, Optional, Sequence, Tuple
 
 import config
 from services.logging_config import get_logger
@@ -15,6 +15,9 @@ from services.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# (to_address, subject, text_body, html_body)
+OutgoingEmail = Tuple[str, str, str, Optional[str]]
+
 
 class EmailService:
     def __init__(self) -> None:
@@ -25,6 +28,7 @@ class EmailService:
         self.from_address = config.EMAIL_FROM
         self.use_tls = config.SMTP_USE_TLS
         self.use_ssl = config.SMTP_USE_SSL
+        self.timeout = config.SMTP_TIMEOUT_SECONDS
 
     def _build_message(self, to_address: str, subject: str, text_body: str, html_body: Optional[str] = None) -> MIMEMultipart:
         message = MIMEMultipart("alternative")
@@ -36,37 +40,71 @@ class EmailService:
             message.attach(MIMEText(html_body, "html"))
         return message
 
-    def send_email(self, to_address: str, subject: str, text_body: str, html_body: Optional[str] = None) -> bool:
-        if not to_address:
-            logger.info("✉️ EmailService: Missing recipient address; skipping send")
-            return False
+    def _connect(self) -> smtplib.SMTP:
+        # SSL or STARTTLS
+        if self.use_ssl:
+            server = smtplib.SMTP_SSL(
+                self.smtp_host, self.smtp_port, timeout=self.timeout, context=ssl.create_default_context()
+            )
+        else:
+            server = smtplib.SMTP(self.smtp_host, self.smtp_port, timeout=self.timeout)
+        try:
+            if self.use_tls and not self.use_ssl:
+                server.starttls(context=ssl.create_default_context())
+            if self.smtp_user and self.smtp_pass:
+                server.login(self.smtp_user, self.smtp_pass)
+        except Exception:
+            # Don't leak the socket when the handshake or login fails
+            server.close()
+            raise
+        return server
+
+    def send_batch(self, emails: Sequence[OutgoingEmail]) -> List[Optional[str]]:
+        """Send several emails over one SMTP connection.
+
+        Blocking; call from a worker thread. Returns one entry per email: None when
+        it was sent, otherwise the error message.
+        """
+        if not emails:
+            return []
         if not self.smtp_host:
             logger.warning("✉️ EmailService: SMTP host not configured; skipping send")
-            return False
+            return ["SMTP host not configured"] * len(emails)
 
+        results: List[Optional[str]] = []
         try:
-            message = self._build_message(to_address, subject, text_body, html_body)
-
-            # SSL or STARTTLS
-            if self.use_ssl:
-                context = ssl.create_default_context()
-                with smtplib.SMTP_SSL(self.smtp_host, self.smtp_port, context=context) as server:
-                    if self.smtp_user and self.smtp_pass:
-                        server.login(self.smtp_user, self.smtp_pass)
-                    server.sendmail(self.from_address, [to_address], message.as_string())
-            else:
-                with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
-                    if self.use_tls:
-                        server.starttls(context=ssl.create_default_context())
-                    if self.smtp_user and self.smtp_pass:
-                        server.login(self.smtp_user, self.smtp_pass)
+            server = self._connect()
+        except Exception as exc:
+            logger.error(f"✉️ EmailService: Failed to connect to {self.smtp_host}:{self.smtp_port}: {exc}")
+            return [str(exc)] * len(emails)
+
+        try:
+            for to_address, subject, text_body, html_body in emails:
+                try:
+                    message = self._build_message(to_address, subject, text_body, html_body)
                     server.sendmail(self.from_address, [to_address], message.as_string())
+                    results.append(None)
+                    logger.info(f"✉️ EmailService: Sent email to {to_address} with subject '{subject}'")
+                except smtplib.SMTPServerDisconnected as exc:
+                    # Connection is gone; everything not yet sent fails and is retried later
+                    logger.error(f"✉️ EmailService: Server disconnected mid-batch: {exc}")
+                    results.extend([str(exc)] * (len(emails) - len(results)))
+                    break
+                except Exception as exc:
+                    logger.error(f"✉️ EmailService: Failed to send email to {to_address}: {exc}")
+                    results.append(str(exc))
+        finally:
+            try:
+                server.quit()
+            except Exception:
+                pass
+        return results
 
-            logger.info(f"✉️ EmailService: Sent email to {to_address} with subject '{subject}'")
-            return True
-        except Exception as exc:
-            logger.error(f"✉️ EmailService: Failed to send email to {to_address}: {exc}")
+    def send_email(self, to_address: str, subject: str, text_body: str, html_body: Optional[str] = None) -> bool:
+        if not to_address:
+            logger.info("✉️ EmailService: Missing recipient address; skipping send")
             return False
+        return self.send_batch([(to_address, subject, text_body, html_body)])[0] is None
 
 
 email_service = EmailService()
@@ -0,0 +1,103 @@
+"""
+Shared async HTTP transport for outbound API calls.
+
+Search services talk to a handful of upstream hosts (Perplexity, OpenAlex,
+HN Algolia, PubMed). Each host gets its own long-lived ``httpx.AsyncClient``
+so keep-alive connections are reused across requests and a slow upstream
+cannot exhaust the connection pool of the others.
+"""
+
+import asyncio
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+import config
+from services.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+def _http2_available() -> bool:
+    """HTTP/2 needs the optional ``h2`` package; fall back to HTTP/1.1 without it."""
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class HttpClientPool:
+    """Per-host registry of pooled ``httpx.AsyncClient`` instances."""
+
+    _clients: Dict[str, httpx.AsyncClient] = {}
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+    _http2: Optional[bool] = None
+
+    @classmethod
+    def _limits(cls) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=config.HTTP_POOL_MAX_CONNECTIONS,
+            max_keepalive_connections=config.HTTP_POOL_MAX_KEEPALIVE,
+            keepalive_expiry=config.HTTP_POOL_KEEPALIVE_EXPIRY,
+        )
+
+    @classmethod
+    def _use_http2(cls) -> bool:
+        if cls._http2 is None:
+            cls._http2 = config.HTTP_CLIENT_HTTP2 and _http2_available()
+            if config.HTTP_CLIENT_HTTP2 and not cls._http2:
+                logger.info("🌐 HTTP: h2 package not installed, using HTTP/1.1")
+        return cls._http2
+
+    @classmethod
+    def get(cls, url: str, timeout: Optional[float] = None) -> httpx.AsyncClient:
+        """Return the shared client for the host of ``url``, creating it on first use.
+
+        ``timeout`` only applies when the client is first created; callers can still
+        pass a per-request timeout.
+        """
+        loop = asyncio.get_running_loop()
+        if cls._loop is not loop:
+            # Clients are bound to the loop they were created on; start fresh on a new loop
+            cls._clients = {}
+            cls._loop = loop
+
+        parts = urlsplit(url)
+        origin = f"{parts.scheme}://{parts.netloc}"
+        client = cls._clients.get(origin)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                http2=cls._use_http2(),
+                limits=cls._limits(),
+                timeout=httpx.Timeout(
+                    timeout if timeout is not None else config.HTTP_CLIENT_TIMEOUT,
+                    connect=config.HTTP_CLIENT_CONNECT_TIMEOUT,
+                ),
+            )
+            cls._clients[origin] = client
+            logger.debug(f"🌐 HTTP: Opened connection pool for {origin}")
+        return client
+
+    @classmethod
+    async def aclose(cls) -> None:
+        """Close all pooled clients (called on application shutdown)."""
+        clients = list(cls._clients.values())
+        cls._clients = {}
+        cls._loop = None
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.debug(f"🌐 HTTP: Error closing client: {e}")
+
+
+async def http_get(url: str, **kwargs) -> httpx.Response:
+    """GET through the shared pool for the target host."""
+    return await HttpClientPool.get(url).get(url, **kwargs)
+
+
+async def http_post(url: str, **kwargs) -> httpx.Response:
+    """POST through the shared pool for the target host."""
+    return await HttpClientPool.get(url).post(url, **kwargs)
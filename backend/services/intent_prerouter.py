@@ -0,0 +1,319 @@
+"""
+Local intent pre-router for the multi-source analyzer.
+
+Most chat turns are greetings, thanks or short follow-ups whose routing is obvious,
+yet every message used to pay a full ``ROUTER_MODEL`` round-trip. The pre-router
+answers those turns locally with a keyword/regex rule table and a nearest-neighbour
+lookup over labelled example messages, and returns ``None`` whenever it is unsure
+so the analyzer falls back to the LLM.
+
+Built-in examples live in this module; admins can extend them through the
+``router_examples`` table (``/v2/admin/router/examples``). Changes are broadcast on
+``ROUTER_EXAMPLES_TOPIC`` so every worker reloads its index, not just the one that
+handled the admin request.
+"""
+
+import asyncio
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Pattern, Tuple
+
+import config
+from db import SessionLocal
+from services.logging_config import get_logger
+from services.pubsub import PubSub, ROUTER_EXAMPLES_TOPIC
+from services.router_example import RouterExampleService
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class PreRouteDecision:
+    intent: str
+    sources: List[str]
+    reason: str
+    method: str  # 'rule' | 'example'
+    confidence: float
+
+
+@dataclass
+class _Rule:
+    name: str
+    pattern: Pattern
+    intent: str
+    sources: List[str] = field(default_factory=list)
+
+
+def _rule(name: str, pattern: str, intent: str, sources: Optional[List[str]] = None) -> _Rule:
+    return _Rule(name, re.compile(pattern, re.IGNORECASE), intent, sources or [])
+
+
+# Rules match the whole (normalized) message or an explicit leading instruction, so
+# anything that merely mentions these words still goes to the LLM.
+RULES: List[_Rule] = [
+    _rule(
+        "greeting",
+        r"^(hi|hello|hey|hiya|yo|greetings|good (morning|afternoon|evening))( there| again| all)?"
+        r"( how are you( doing)?( today)?)?$",
+        "chat",
+    ),
+    _rule(
+        "thanks",
+        r"^((ok(ay)?|great|cool|nice|perfect|awesome) )?(thanks|thank you|thx|ty|cheers)"
+        r"( (so|very) much| a lot| again)?( that (helps|helped|was helpful))?$",
+        "chat",
+    ),
+    _rule(
+        "acknowledgement",
+        r"^(ok(ay)?|got it|i see|makes sense|understood|great|cool|nice|perfect|awesome|sounds good)$",
+        "chat",
+    ),
+    _rule("farewell", r"^(bye|goodbye|see you( later)?|good night|talk (to you )?later)$", "chat"),
+    _rule(
+        "rephrase",
+        r"^(can you |could you |please )?(explain (that|this|it) (again|more simply|in simpler terms)"
+        r"|summari[sz]e (that|this|it)|make (that|this|it) (shorter|simpler)|say (that|it) differently)$",
+        "chat",
+    ),
+    _rule(
+        "medical_search",
+        r"^(search|look up|find)( for)? .*\b(pubmed|clinical trials?|medical (studies|literature))\b",
+        "search",
+        ["medical_search"],
+    ),
+    _rule(
+        "academic_search",
+        r"^(search|look up|find)( for)?( recent| the latest| some)? (academic |scientific |research )?"
+        r"(papers|studies|publications|literature) (on|about|regarding) ",
+        "search",
+        ["academic_search"],
+    ),
+    _rule(
+        "social_search",
+        r"^(search|check|look up|find)( on)? .*\bhacker ?news\b",
+        "search",
+        ["social_search"],
+    ),
+    _rule(
+        "web_search",
+        r"^(search (the web|online|the internet|google)|google|look up online)( for)? ",
+        "search",
+        ["search"],
+    ),
+]
+
+
+# (text, intent, sources) seed examples for the nearest-neighbour lookup
+DEFAULT_EXAMPLES: List[Tuple[str, str, List[str]]] = [
+    ("hi how is it going", "chat", []),
+    ("hello nice to meet you", "chat", []),
+    ("hey what's up", "chat", []),
+    ("good morning how are you", "chat", []),
+    ("thank you that was really helpful", "chat", []),
+    ("thanks for the explanation", "chat", []),
+    ("thanks for your help", "chat", []),
+    ("that makes a lot of sense thanks", "chat", []),
+    ("ok that's clear now", "chat", []),
+    ("who are you", "chat", []),
+    ("what can you do", "chat", []),
+    ("what can you help me with", "chat", []),
+    ("tell me a joke", "chat", []),
+    ("can you explain that in simpler terms", "chat", []),
+    ("can you give me an example of that", "chat", []),
+    ("can you shorten your last answer", "chat", []),
+    ("what did you mean by that", "chat", []),
+    ("what's the latest news today", "search", ["search"]),
+    ("what are today's top headlines", "search", ["search"]),
+    ("what is the weather like today", "search", ["search"]),
+    ("what is trending on hacker news", "search", ["social_search"]),
+    ("find recent research papers on this topic", "search", ["academic_search"]),
+    ("are there any clinical trials for this", "search", ["medical_search"]),
+]
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+def _normalize(text: str) -> str:
+    """Lowercase, drop apostrophes ("what's" -> "whats") and punctuation."""
+    return " ".join(_WORD_RE.findall(re.sub(r"['’]", "", text.lower())))
+
+
+def _features(text: str) -> Counter:
+    """Bag of word unigrams and bigrams."""
+    words = text.split()
+    feats = Counter(words)
+    feats.update(f"{a} {b}" for a, b in zip(words, words[1:]))
+    return feats
+
+
+def _norm(vec: Counter) -> float:
+    return math.sqrt(sum(v * v for v in vec.values()))
+
+
+def _cosine(a: Counter, a_norm: float, b: Counter, b_norm: float) -> float:
+    if not a_norm or not b_norm:
+        return 0.0
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(v * b.get(k, 0) for k, v in a.items()) / (a_norm * b_norm)
+
+
+class IntentPreRouter:
+    """Process-wide rule table, labelled-example index and hit-rate counters."""
+
+    _examples: List[Tuple[Counter, float, str, List[str]]] = []
+    _custom: List[Tuple[str, str, List[str]]] = []
+    _counters: Dict[str, int] = {}
+    _by_rule: Dict[str, int] = {}
+    _lock = asyncio.Lock()
+    _refresh_task: Optional[asyncio.Task] = None
+    _refresh_again = False
+
+    @classmethod
+    def _index(cls) -> List[Tuple[Counter, float, str, List[str]]]:
+        if not cls._examples:
+            cls._rebuild()
+        return cls._examples
+
+    @classmethod
+    def _rebuild(cls) -> None:
+        examples = []
+        for text, intent, sources in DEFAULT_EXAMPLES + cls._custom:
+            vec = _features(_normalize(text))
+            examples.append((vec, _norm(vec), intent, list(sources)))
+        cls._examples = examples
+
+    @classmethod
+    def set_custom_examples(cls, examples: List[Tuple[str, str, List[str]]]) -> None:
+        """Replace the admin-provided examples and rebuild the index."""
+        cls._custom = [(text, intent, list(sources or [])) for text, intent, sources in examples]
+        cls._rebuild()
+
+    @classmethod
+    async def refresh_examples(cls) -> None:
+        """Reload admin-provided examples from the database."""
+        service = RouterExampleService()
+
+        async with SessionLocal() as session:
+            rows = await service.get_all_examples(session)
+
+        async with cls._lock:
+            cls.set_custom_examples([(r.text, r.intent, r.sources) for r in rows])
+        logger.info(f"🧭 Pre-router: Loaded {len(rows)} custom examples")
+
+    @classmethod
+    async def examples_changed(cls) -> None:
+        """Reload examples here after an admin change and tell the other workers to reload."""
+        await cls.refresh_examples()
+        await PubSub.publish(ROUTER_EXAMPLES_TOPIC, {})
+
+    @classmethod
+    async def _on_examples_changed(cls, message: Dict[str, Any]) -> None:
+        """PubSub handler: reload in the background when another worker changed the examples."""
+        if PubSub.is_local(message):
+            return
+        # Coalesce bursts of changes into one reload after the one in progress
+        if cls._refresh_task is not None and not cls._refresh_task.done():
+            cls._refresh_again = True
+            return
+        cls._refresh_task = asyncio.create_task(cls._refresh_until_current())
+
+    @classmethod
+    async def _refresh_until_current(cls) -> None:
+        while True:
+            cls._refresh_again = False
+            try:
+                await cls.refresh_examples()
+            except Exception as e:
+                logger.error(f"🧭 Pre-router: Failed to reload custom examples: {e}")
+            if not cls._refresh_again:
+                return
+
+    @classmethod
+    def _count(cls, key: str) -> None:
+        cls._counters[key] = cls._counters.get(key, 0) + 1
+
+    @classmethod
+    def route(cls, message: str) -> Optional[PreRouteDecision]:
+        """Return a local routing decision, or ``None`` when the LLM router should decide."""
+        if not config.PREROUTER_ENABLED:
+            return None
+
+        cls._count("requests")
+        text = _normalize(message or "")
+        if not text or len(text.split()) > config.PREROUTER_MAX_WORDS:
+            cls._count("fallbacks")
+            return None
+
+        for rule in RULES:
+            if rule.pattern.search(text):
+                cls._count("rule_hits")
+                cls._by_rule[rule.name] = cls._by_rule.get(rule.name, 0) + 1
+                return PreRouteDecision(
+                    intent=rule.intent,
+                    sources=list(rule.sources),
+                    reason=f"Matched local rule '{rule.name}'",
+                    method="rule",
+                    confidence=1.0,
+                )
+
+        decision = cls._nearest_example(text)
+        if decision:
+            cls._count("example_hits")
+            return decision
+
+        cls._count("fallbacks")
+        return None
+
+    @classmethod
+    def _nearest_example(cls, text: str) -> Optional[PreRouteDecision]:
+        vec = _features(text)
+        vec_norm = _norm(vec)
+
+        # Best similarity per (intent, sources) label
+        scores: Dict[Tuple[str, Tuple[str, ...]], float] = {}
+        for ex_vec, ex_norm, intent, sources in cls._index():
+            label = (intent, tuple(sources))
+            scores[label] = max(scores.get(label, 0.0), _cosine(vec, vec_norm, ex_vec, ex_norm))
+
+        if not scores:
+            return None
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        (intent, sources), score = ranked[0]
+        runner_up = ranked[1][1] if len(ranked) > 1 else 0.0
+        if score < config.PREROUTER_MIN_SIMILARITY or score - runner_up < config.PREROUTER_MIN_MARGIN:
+            return None
+
+        return PreRouteDecision(
+            intent=intent,
+            sources=list(sources),
+            reason=f"Nearest labelled example (similarity {score:.2f})",
+            method="example",
+            confidence=round(score, 3),
+        )
+
+    @classmethod
+    def get_stats(cls) -> Dict:
+        requests = cls._counters.get("requests", 0)
+        hits = cls._counters.get("rule_hits", 0) + cls._counters.get("example_hits", 0)
+        return {
+            "enabled": config.PREROUTER_ENABLED,
+            "requests": requests,
+            "rule_hits": cls._counters.get("rule_hits", 0),
+            "example_hits": cls._counters.get("example_hits", 0),
+            "fallbacks": cls._counters.get("fallbacks", 0),
+            "hit_rate": round(hits / requests, 4) if requests else 0.0,
+            "hits_by_rule": dict(cls._by_rule),
+            "examples": len(cls._index()),
+            "custom_examples": len(cls._custom),
+        }
+
+    @classmethod
+    def reset_stats(cls) -> None:
+        cls._counters = {}
+        cls._by_rule = {}
+
+
+PubSub.subscribe(ROUTER_EXAMPLES_TOPIC, IntentPreRouter._on_examples_changed)
@@ -0,0 +1,151 @@
+"""
+Central gateway for OpenAI chat model calls made by graph nodes.
+
+Nodes used to build a fresh ``ChatOpenAI`` per call and invoke it synchronously
+inside ``async def`` functions, which blocked the event loop for the full model
+latency. The gateway keeps one client per (model, temperature, max_tokens),
+routes all of them through a single pooled HTTP connection to the OpenAI API
+and only exposes async calls.
+
+``ainvoke_llm`` / ``ainvoke_structured`` (used by the research graph nodes) also
+coalesce identical concurrent prompts into a single API call and charge the
+OpenAI request budget (``UPSTREAM_RPM_OPENAI``).
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+import httpx
+from langchain_core.messages import BaseMessage
+from langchain_openai import ChatOpenAI
+from pydantic import BaseModel
+
+import config
+from services.http_client import HttpClientPool
+from services.logging_config import get_logger
+from services.single_flight import SingleFlight
+from services.upstream_budget import OPENAI, UpstreamBudgets
+
+logger = get_logger(__name__)
+
+OPENAI_API_URL = "https://api.openai.com"
+
+ClientKey = Tuple[str, float, Optional[int]]
+
+llm_flight = SingleFlight("llm")
+
+
+class LLMGateway:
+    """Cache of ``ChatOpenAI`` clients sharing one connection pool."""
+
+    _clients: Dict[ClientKey, ChatOpenAI] = {}
+    _structured: Dict[Tuple[ClientKey, type], Any] = {}
+    _http_client: Optional[httpx.AsyncClient] = None
+
+    @classmethod
+    def _shared_http_client(cls) -> httpx.AsyncClient:
+        http_client = HttpClientPool.get(OPENAI_API_URL, timeout=config.LLM_REQUEST_TIMEOUT)
+        if http_client is not cls._http_client:
+            # Pool was recreated (new event loop or shutdown); drop clients bound to the old one
+            cls._clients = {}
+            cls._structured = {}
+            cls._http_client = http_client
+        return http_client
+
+    @classmethod
+    def get(cls, model: str, temperature: float = 0.0, max_tokens: Optional[int] = None) -> ChatOpenAI:
+        """Return the shared client for the given model settings."""
+        http_client = cls._shared_http_client()
+        key = (model, float(temperature), max_tokens)
+        llm = cls._clients.get(key)
+        if llm is None:
+            llm = ChatOpenAI(
+                model=model,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                api_key=config.OPENAI_API_KEY,
+                http_async_client=http_client,
+                max_retries=config.LLM_MAX_RETRIES,
+            )
+            cls._clients[key] = llm
+            logger.debug(f"🤖 LLM Gateway: Created client for {key}")
+        return llm
+
+    @classmethod
+    def get_structured(
+        cls,
+        schema: Type[BaseModel],
+        model: str,
+        temperature: float = 0.0,
+        max_tokens: Optional[int] = None,
+    ):
+        """Return the shared structured-output runnable for ``schema``."""
+        llm = cls.get(model, temperature, max_tokens)
+        key = ((model, float(temperature), max_tokens), schema)
+        runnable = cls._structured.get(key)
+        if runnable is None:
+            runnable = llm.with_structured_output(schema)
+            cls._structured[key] = runnable
+        return runnable
+
+
+def _prompt_key(
+    messages: List[BaseMessage],
+    model: str,
+    temperature: float,
+    max_tokens: Optional[int],
+    schema: Optional[type] = None,
+) -> str:
+    """Stable hash of everything that determines the completion."""
+    raw = json.dumps(
+        [
+            model,
+            float(temperature),
+            max_tokens,
+            f"{schema.__module__}.{schema.__qualname__}" if schema else None,
+            [(m.type, m.content) for m in messages],
+        ],
+        default=str,
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+async def ainvoke_llm(
+    messages: List[BaseMessage],
+    model: str,
+    temperature: float = 0.0,
+    max_tokens: Optional[int] = None,
+):
+    """Run a plain chat completion without blocking the event loop.
+
+    Identical concurrent prompts share one API call.
+    """
+    async def call():
+        await UpstreamBudgets.acquire(OPENAI)
+        return await LLMGateway.get(model, temperature, max_tokens).ainvoke(messages)
+
+    return await llm_flight.do(_prompt_key(messages, model, temperature, max_tokens), call)
+
+
+async def ainvoke_structured(
+    schema: Type[BaseModel],
+    messages: List[BaseMessage],
+    model: str,
+    temperature: float = 0.0,
+    max_tokens: Optional[int] = None,
+):
+    """Run a structured-output completion without blocking the event loop.
+
+    Identical concurrent prompts share one API call; each caller gets its own copy
+    of the parsed result.
+    """
+    async def call():
+        await UpstreamBudgets.acquire(OPENAI)
+        return await LLMGateway.get_structured(schema, model, temperature, max_tokens).ainvoke(messages)
+
+    return await llm_flight.do(
+        _prompt_key(messages, model, temperature, max_tokens, schema),
+        call,
+        share=lambda result: result.model_copy(deep=True) if isinstance(result, BaseModel) else result,
+    )
@@ -3,6 +3,7 @@ Motivation System with database persistence and main research loop.
 """
 
 import asyncio
+import functools
 import time
 import uuid
 from typing import List, Dict, Any, Optional, Union
@@ -17,12 +18,28 @@ from database.motivation_repository import MotivationRepository
 from services.topic_expansion_service import TopicExpansionService
 from services.topic import TopicService
 from services.research import ResearchService
+from services.research_scheduler import ResearchJob, ResearchScheduler
 from models.motivation import TopicScore
-from models.research_finding import ResearchFinding
 import config
 
 logger = get_logger(__name__)
 
+# Reads of findings created within this window earn the recent-read bonus
+ENGAGEMENT_RECENT_WINDOW = 7 * 24 * 3600
+
+
+def _engagement_score(total: int, reads: int, recent_reads: int, bookmarks: int, integrations: int) -> float:
+    """Engagement score from finding interaction counts (capped at ENGAGEMENT_SCORE_MAX)."""
+    if total <= 0:
+        return 0.0
+    read_percentage = reads / total
+    recent_bonus = min(recent_reads * config.ENGAGEMENT_RECENT_BONUS_RATE, config.ENGAGEMENT_RECENT_BONUS_MAX)
+    volume_bonus = min(total * config.ENGAGEMENT_VOLUME_BONUS_RATE, config.ENGAGEMENT_VOLUME_BONUS_MAX)
+    bookmark_bonus = min(bookmarks * config.ENGAGEMENT_BOOKMARK_BONUS_RATE, config.ENGAGEMENT_BOOKMARK_BONUS_MAX)
+    integration_bonus = min(integrations * config.ENGAGEMENT_INTEGRATION_BONUS_RATE, config.ENGAGEMENT_INTEGRATION_BONUS_MAX)
+    total_score = read_percentage + recent_bonus + volume_bonus + bookmark_bonus + integration_bonus
+    return min(total_score, config.ENGAGEMENT_SCORE_MAX)
+
 
 class MotivationSystem:
     """
@@ -35,6 +52,9 @@ class MotivationSystem:
     - Engagement-based motivation tracking
     """
 
+    # Set while a due-time loop is running; see notify_topics_changed()
+    _wakeup: Optional[asyncio.Event] = None
+
     def __init__(
         self, 
         session: AsyncSession,
@@ -119,6 +139,10 @@ class MotivationSystem:
 
     async def _motivation_research_loop(self) -> None:
         """Main motivation-driven research loop."""
+        if config.MOTIVATION_SCHEDULING_MODE == "due":
+            await self._due_research_loop()
+            return
+
         while self.is_running:
             try:
                 await asyncio.sleep(self.check_interval)
@@ -154,6 +178,109 @@ class MotivationSystem:
                 logger.error(f"🎯 Error in motivation research loop: {str(e)}", exc_info=True)
                 await asyncio.sleep(config.RESEARCH_CYCLE_SLEEP_INTERVAL)
 
+    @classmethod
+    def notify_topics_changed(cls) -> None:
+        """Wake a due-time research loop, e.g. after a topic was (re)activated."""
+        if cls._wakeup is not None:
+            cls._wakeup.set()
+
+    async def refresh_due_times(self, only_missing: bool = False) -> None:
+        """Recompute next due times of active topics from their stored scores."""
+        if not self._config:
+            return
+        try:
+            updated = await self.db_service.refresh_due_times(
+                threshold=self._config.topic_threshold,
+                engagement_weight=self._config.engagement_weight,
+                quality_weight=self._config.quality_weight,
+                staleness_scale=self._config.staleness_scale,
+                never_due_at=time.time() + config.MOTIVATION_DUE_RESYNC_INTERVAL,
+                only_missing=only_missing,
+            )
+            logger.debug(f"🎯 Refreshed due times for {updated} topics")
+        except Exception as e:
+            try:
+                await self.session.rollback()
+            except Exception:
+                pass
+            logger.error(f"Error refreshing topic due times: {str(e)}")
+
+    async def _due_research_loop(self) -> None:
+        """Research loop driven by per-topic due times instead of periodic full scans.
+
+        Each active TopicScore carries ``next_due_at``, the moment its motivation
+        score reaches the threshold. The loop sleeps until the earliest due time
+        (or a wake-up from ``notify_topics_changed``), researches only users with
+        due topics, and rescores everything once per MOTIVATION_DUE_RESYNC_INTERVAL
+        to pick up engagement changes.
+        """
+        MotivationSystem._wakeup = asyncio.Event()
+        last_resync = 0.0
+        logger.info("🎯 Using due-time research scheduling")
+
+        while self.is_running:
+            try:
+                now = time.time()
+                if now - last_resync >= config.MOTIVATION_DUE_RESYNC_INTERVAL:
+                    await self.update_scores()
+                    await self.refresh_due_times()
+                    last_resync = now
+
+                next_due = await self.db_service.get_next_due_time()
+                now = time.time()
+                if next_due is not None and next_due <= now:
+                    await self._conduct_due_cycle(now)
+                    continue
+
+                timeout = last_resync + config.MOTIVATION_DUE_RESYNC_INTERVAL - now
+                if next_due is not None:
+                    timeout = min(timeout, next_due - now)
+                logger.debug(f"🎯 Next topic due in {timeout:.0f}s")
+
+                try:
+                    await asyncio.wait_for(MotivationSystem._wakeup.wait(), timeout=max(timeout, 0.0))
+                except asyncio.TimeoutError:
+                    continue
+                MotivationSystem._wakeup.clear()
+                # Topics (re)activated since the last refresh have no due time yet
+                await self.refresh_due_times(only_missing=True)
+
+            except asyncio.CancelledError:
+                logger.info("🎯 Motivation research loop cancelled")
+                break
+            except Exception as e:
+                logger.error(f"🎯 Error in due-time research loop: {str(e)}", exc_info=True)
+                await asyncio.sleep(config.RESEARCH_CYCLE_SLEEP_INTERVAL)
+
+        MotivationSystem._wakeup = None
+
+    async def _conduct_due_cycle(self, now: float) -> Dict[str, Any]:
+        """Research the users whose topics are due, then reschedule their topics."""
+        user_ids = await self.db_service.get_users_with_due_topics(now)
+        logger.info(f"🎯 Starting research cycle for {len(user_ids)} users with due topics")
+
+        await self.update_scores()
+        result = await self._conduct_research_cycle(user_ids=user_ids)
+
+        # Researched topics move forward; ones still due (failed or skipped) retry later
+        await self.refresh_due_times()
+        retry_now = time.time()
+        try:
+            deferred = await self.db_service.defer_overdue_topics(retry_now, retry_now + self.check_interval)
+            if deferred:
+                logger.info(f"🎯 Deferred {deferred} topics still due after the cycle by {self.check_interval}s")
+        except Exception as e:
+            try:
+                await self.session.rollback()
+            except Exception:
+                pass
+            logger.error(f"Error deferring overdue topics: {str(e)}")
+
+        topics_researched = result.get("topics_researched", 0)
+        if topics_researched > 0:
+            await self._on_research_completed(result.get("average_quality", 0.0))
+        return result
+
     async def update_scores(self) -> None:
         """
         Update motivation scores for all active topics using optimized bulk query.
@@ -171,39 +298,22 @@ class MotivationSystem:
             
             logger.debug(f"🎯 Starting score update with config: threshold={self._config.topic_threshold}, engagement_weight={self._config.engagement_weight}, quality_weight={self._config.quality_weight}, staleness_scale={self._config.staleness_scale}")
             
-            # Optimized: Single query to update all topic scores at once
-            
-            # Compute engagement and success via DB aggregates from research_findings
+            # Engagement inputs are the per-topic aggregates on topic_scores, kept up to date
+            # by ResearchService as findings change, so this is a single O(active topics)
+            # UPDATE without scanning research_findings.
             now_epoch = func.extract('epoch', func.now())
-
-            # Build a CTE that aggregates findings per user/topic
-            findings_agg = (
-                select(
-                    ResearchFinding.user_id.label('user_id'),
-                    ResearchFinding.topic_name.label('topic_name'),
-                    func.avg(func.cast(ResearchFinding.read, sa.Integer)).label('engagement_reads'),
-                    func.avg(ResearchFinding.quality_score).label('avg_quality'),
-                    func.sum(func.cast(ResearchFinding.bookmarked, sa.Integer)).label('bookmarks'),
-                    func.sum(func.cast(ResearchFinding.integrated, sa.Integer)).label('integrations'),
-                    func.count().label('total'),
-                )
-                .group_by(ResearchFinding.user_id, ResearchFinding.topic_name)
-                .cte('findings_agg')
-            )
-
-            # Derive engagement and success on the DB side using the CTE
             staleness = (now_epoch - func.coalesce(TopicScore.last_researched, 0.0))
-            reads_pct = func.coalesce(findings_agg.c.engagement_reads, 0.0)
+            reads_pct = TopicScore.read_findings / func.cast(TopicScore.total_findings, sa.Float)
             volume_bonus = func.least(
-                findings_agg.c.total * config.ENGAGEMENT_VOLUME_BONUS_RATE,
+                TopicScore.total_findings * config.ENGAGEMENT_VOLUME_BONUS_RATE,
                 config.ENGAGEMENT_VOLUME_BONUS_MAX,
             )
             bookmark_bonus = func.least(
-                findings_agg.c.bookmarks * config.ENGAGEMENT_BOOKMARK_BONUS_RATE,
+                TopicScore.bookmarked_findings * config.ENGAGEMENT_BOOKMARK_BONUS_RATE,
                 config.ENGAGEMENT_BOOKMARK_BONUS_MAX,
             )
             integration_bonus = func.least(
-                findings_agg.c.integrations * config.ENGAGEMENT_INTEGRATION_BONUS_RATE,
+                TopicScore.integrated_findings * config.ENGAGEMENT_INTEGRATION_BONUS_RATE,
                 config.ENGAGEMENT_INTEGRATION_BONUS_MAX,
             )
             engagement_expr = func.least(
@@ -211,22 +321,25 @@ class MotivationSystem:
                 config.ENGAGEMENT_SCORE_MAX,
             )
             success_expr = 0.3 + engagement_expr * 0.4
+            avg_quality = TopicScore.quality_sum / func.nullif(TopicScore.quality_count, 0)
 
             result = await self.session.execute(
                 update(TopicScore)
                 .where(TopicScore.is_active_research == True)
+                # Topics without findings keep their seeded score (see TopicService.update_active_research)
+                .where(TopicScore.total_findings > 0)
                 .values(
                     staleness_pressure=(staleness * TopicScore.staleness_coefficient * self._config.staleness_scale),
                     engagement_score=engagement_expr,
-                    success_rate=func.coalesce(findings_agg.c.avg_quality, success_expr),
+                    success_rate=func.coalesce(avg_quality, success_expr),
+                    average_quality=avg_quality,
                     motivation_score=(
                         staleness * TopicScore.staleness_coefficient * self._config.staleness_scale +
                         engagement_expr * self._config.engagement_weight +
-                        func.coalesce(findings_agg.c.avg_quality, success_expr) * self._config.quality_weight
+                        func.coalesce(avg_quality, success_expr) * self._config.quality_weight
                     ),
                 )
-                .where(TopicScore.user_id == findings_agg.c.user_id)
-                .where(TopicScore.topic_name == findings_agg.c.topic_name)
+                .execution_options(synchronize_session=False)
             )
 
             await self.session.commit()  # Ensure changes are saved
@@ -367,36 +480,20 @@ class MotivationSystem:
             bookmarked_findings = sum(1 for f in all_findings if f.bookmarked)
             integrated_findings = sum(1 for f in all_findings if f.integrated)
             
-            # Base engagement: percentage of findings read
-            read_percentage = read_findings / total_findings if total_findings > 0 else 0.0
-            
             # Bonus for recent reads (findings read in last 7 days get extra weight)
-            recent_threshold = time.time() - (7 * 24 * 3600)  # 7 days ago
+            recent_threshold = time.time() - ENGAGEMENT_RECENT_WINDOW
             recent_reads = sum(1 for f in all_findings 
                              if f.read and 
                              f.created_at and f.created_at.timestamp() > recent_threshold)
             
-            recent_bonus = min(recent_reads * config.ENGAGEMENT_RECENT_BONUS_RATE, config.ENGAGEMENT_RECENT_BONUS_MAX)
-            
-            # Total findings bonus (more findings = more research value demonstrated)
-            volume_bonus = min(total_findings * config.ENGAGEMENT_VOLUME_BONUS_RATE, config.ENGAGEMENT_VOLUME_BONUS_MAX)
-            
-            # Bookmarks indicate strong interest in a topic
-            bookmark_bonus = min(bookmarked_findings * config.ENGAGEMENT_BOOKMARK_BONUS_RATE, config.ENGAGEMENT_BOOKMARK_BONUS_MAX)
-            # Integrations are a strong signal of value
-            integration_bonus = min(integrated_findings * config.ENGAGEMENT_INTEGRATION_BONUS_RATE, config.ENGAGEMENT_INTEGRATION_BONUS_MAX)
-
-            total_score = read_percentage + recent_bonus + volume_bonus + bookmark_bonus + integration_bonus
-            final_score = min(total_score, config.ENGAGEMENT_SCORE_MAX)
+            final_score = _engagement_score(
+                total_findings, read_findings, recent_reads, bookmarked_findings, integrated_findings
+            )
             
             logger.debug(
-                f"🎯 Topic {topic_id} engagement breakdown:\n"
-                f"   - Findings: {total_findings} total, {read_findings} read ({read_percentage:.2%})\n"
-                f"   - Recent reads (7d): {recent_reads} → bonus={recent_bonus:.4f}\n"
-                f"   - Volume bonus: {total_findings} * {config.ENGAGEMENT_VOLUME_BONUS_RATE} = {volume_bonus:.4f}\n"
-                f"   - Bookmarks: {bookmarked_findings} → bonus={bookmark_bonus:.4f}\n"
-                f"   - Integrations: {integrated_findings} → bonus={integration_bonus:.4f}\n"
-                f"   - TOTAL ENGAGEMENT: {final_score:.4f} (capped at {config.ENGAGEMENT_SCORE_MAX})"
+                f"🎯 Topic {topic_id} engagement: {total_findings} findings, {read_findings} read, "
+                f"{recent_reads} recent reads, {bookmarked_findings} bookmarks, {integrated_findings} integrations "
+                f"→ {final_score:.4f} (capped at {config.ENGAGEMENT_SCORE_MAX})"
             )
             
             return final_score
@@ -418,14 +515,15 @@ class MotivationSystem:
             logger.debug(f"Error getting success rate for topic {topic_id}: {str(e)}")
             return 0.5
 
-    async def _conduct_research_cycle(self) -> Dict[str, Any]:
-        """Conduct a complete research cycle for all users with motivated topics."""
+    async def _conduct_research_cycle(self, user_ids: Optional[List[uuid.UUID]] = None) -> Dict[str, Any]:
+        """Conduct a research cycle for all users with motivated topics (or only ``user_ids``)."""
         try:
-            # Get all unique users from TopicScore table
-            user_ids_result = await self.session.execute(
-                select(distinct(TopicScore.user_id)).where(TopicScore.is_active_research == True)
-            )
-            user_ids = [row[0] for row in user_ids_result.all()]
+            if user_ids is None:
+                # Get all unique users from TopicScore table
+                user_ids_result = await self.session.execute(
+                    select(distinct(TopicScore.user_id)).where(TopicScore.is_active_research == True)
+                )
+                user_ids = [row[0] for row in user_ids_result.all()]
             
             if not user_ids:
                 logger.info("🎯 No users with active research topics found")
@@ -452,6 +550,9 @@ class MotivationSystem:
             total_findings_stored = 0
             quality_scores: List[float] = []
             
+            # Collect this cycle's research jobs; the scheduler runs them concurrently
+            jobs: List[ResearchJob] = []
+            expansions: List[asyncio.Task] = []
             for user_uuid in user_ids:
                 try:
                     user_id = str(user_uuid)
@@ -480,170 +581,39 @@ class MotivationSystem:
                     topic_lookup = {t.name: t for t in topics}
                     
                     for topic_score in topics_needing_research:
-                        try:
-                            topic_name = topic_score.topic_name
-                            
-                            logger.debug(f"🎯 Processing topic '{topic_name}' with motivation={topic_score.motivation_score:.4f}")
-                            
-                            # Get full topic data from lookup map
-                            topic = topic_lookup.get(topic_name)
-                            if not topic:
-                                logger.debug(f"Topic '{topic_name}' missing from active topics lookup; skipping")
-                                continue
-                            
-                            # Re-check if topic is still active (user may have deactivated it during research cycle)
-                            async with SessionLocal() as check_session:
-                                from models.topic import ResearchTopic
-                                check_query = select(ResearchTopic).where(
-                                    and_(
-                                        ResearchTopic.id == topic.id,
-                                        ResearchTopic.user_id == user_uuid,
-                                        ResearchTopic.is_active_research.is_(True)
-                                    )
-                                )
-                                check_result = await check_session.execute(check_query)
-                                active_topic = check_result.scalar_one_or_none()
-                                
-                                if not active_topic:
-                                    logger.info(f"🎯 Topic '{topic_name}' was deactivated during research cycle; skipping")
-                                    continue
-                                
-                                # Update topic with fresh data
-                                topic = active_topic
-                            
-                            # Log current state before research
-                            last_researched_str = topic.last_researched.astimezone(timezone.utc).strftime("%Y-%m-%d %H:%M:%S") if topic.last_researched else "NEVER"
-                            logger.info(f"🎯 STARTING RESEARCH for '{topic_name}' (user={user_id})")
-                            logger.info(f"🎯   - Last researched: {last_researched_str}")
-                            logger.info(f"🎯   - Current motivation: {topic_score.motivation_score:.4f}")
-                            logger.info(f"🎯   - Staleness pressure: {topic_score.staleness_pressure:.4f}")
-                            logger.info(f"🎯   - Engagement score: {topic_score.engagement_score:.4f}")
-                            logger.info(f"🎯   - Success rate: {topic_score.success_rate:.4f}")
-                            
-                            topic_data = {
-                                "topic_id": str(topic.id),
-                                "topic_name": topic.name,
-                                "description": topic.description,
-                                "last_researched": topic.last_researched.astimezone(timezone.utc).strftime("%Y-%m-%d") if topic.last_researched else None,
-                                "is_active_research": topic.is_active_research,
-                            }
-                            
-                            # Research the topic via research engine instance
-                            result = await researcher.run_langgraph_research(user_id, topic_data)
-                            
-                            total_topics_researched += 1
-                            if result and result.get("stored", False):
-                                total_findings_stored += 1
-                            if result and result.get("quality_score"):
-                                quality_scores.append(result.get("quality_score"))
-
-                            # Only update last_researched when research succeeded
-                            if result and result.get("success"):
-                                new_timestamp = time.time()
-                                logger.info(
-                                    f"🎯 COMPLETED RESEARCH for '{topic_name}' - updating last_researched to {new_timestamp}"
-                                )
-                                await self.db_service.create_or_update_topic_score(
-                                    user_id=user_uuid,
-                                    topic_id=topic.id,
-                                    topic_name=topic_name,
-                                    last_researched=new_timestamp,
-                                )
-                            else:
-                                logger.info(
-                                    f"🎯 SKIPPING last_researched update for '{topic_name}' "
-                                    f"due to failed or aborted research: {result}"
-                                )
-
-                            # --- Topic expansion wiring ---
-                            try:
-                                child_runs = await researcher.process_expansions_for_root(user_id, topic_data)
-                                if child_runs:
-                                    for cr in child_runs:
-                                        child = cr.get("topic", {})
-                                        child_res = cr.get("result", {})
-                                        child_name = child.get('topic_name')
-                                        if not child_name:
-                                            continue
-                                        logger.info(f"🎯 Researched expansion topic: {child_name} for user {user_id}")
-                                        total_topics_researched += 1
-                                        if child_res and child_res.get("stored", False):
-                                            total_findings_stored += 1
-                                        if child_res and child_res.get("quality_score"):
-                                            quality_scores.append(child_res.get("quality_score"))
-
-                                        # Update last_researched and lifecycle for child
-                                        # Only treat the child as researched when its own research succeeded
-                                        if child_res and child_res.get("success"):
-                                            # Auto-deactivate only child topics that haven't been researched before
-                                            # If user manually activated a previously auto-deactivated child topic, keep it active
-                                            child_topic_id = child.get("topic_id")
-                                            if child_topic_id:
-                                                child_topic_uuid = uuid.UUID(str(child_topic_id))
-
-                                                from models.topic import ResearchTopic
-
-                                                # Get the child topic
-                                                topic_query = select(ResearchTopic).where(
-                                                    ResearchTopic.id == child_topic_uuid
-                                                )
-                                                topic_result = await self.session.execute(topic_query)
-                                                child_topic = topic_result.scalar_one_or_none()
-
-                                                # Get TopicScore
-                                                topic_score_query = select(TopicScore).where(
-                                                    and_(
-                                                        TopicScore.topic_id == child_topic_uuid,
-                                                        TopicScore.user_id == user_uuid,
-                                                    )
-                                                )
-                                                score_result = await self.session.execute(topic_score_query)
-                                                child_score = score_result.scalar_one_or_none()
-
-                                                # Update last_researched timestamp for child
-                                                if child_score:
-                                                    child_score.last_researched = time.time()
-                                                    self.session.add(child_score)
-
-                                                # Mark as researched_once and auto-deactivate if this is the first research
-                                                # This prevents auto-deactivating child topics that users manually reactivated
-                                                if child_topic:
-                                                    # Check if this is the first research (researched_once is False)
-                                                    if not child_topic.researched_once:
-                                                        # Mark as researched
-                                                        child_topic.researched_once = True
-                                                        self.session.add(child_topic)
-
-                                                        # Auto-deactivate after first research
-                                                        child_topic.is_active_research = False
-                                                        if child_score:
-                                                            child_score.is_active_research = False
-                                                        logger.info(
-                                                            f"🔄 Auto-deactivated child topic '{child_name}' after first expansion research "
-                                                            f"(can be manually reactivated if desired)"
-                                                        )
-                                                    else:
-                                                        logger.info(
-                                                            f"ℹ️ Child topic '{child_name}' has been researched before; keeping current active state"
-                                                        )
-
-                                                # Commit updates
-                                                await self.session.commit()
-
-                            except Exception as ex:
-                                logger.debug(f"Expansion wiring failed for {topic_name}: {ex}")
-                            
-                            # Small delay between topics
-                            await asyncio.sleep(config.RESEARCH_TOPIC_DELAY)
-                            
-                        except Exception as e:
-                            logger.error(f"🎯 Error researching topic {topic_name}: {str(e)}")
+                        topic = topic_lookup.get(topic_score.topic_name)
+                        if not topic:
+                            logger.debug(f"Topic '{topic_score.topic_name}' missing from active topics lookup; skipping")
                             continue
+                        jobs.append(
+                            ResearchJob(
+                                user_id=user_id,
+                                name=topic_score.topic_name,
+                                run=functools.partial(
+                                    self._research_topic, researcher, user_uuid, topic_score, topic, expansions
+                                ),
+                            )
+                        )
                             
                 except Exception as e:
                     logger.error(f"🎯 Error processing user {user_id}: {str(e)}")
                     continue
             
+            scheduler = ResearchScheduler(job_delay=config.RESEARCH_TOPIC_DELAY)
+            try:
+                outcomes = await scheduler.run(jobs)
+                outcomes += await asyncio.gather(*expansions, return_exceptions=True)
+            except asyncio.CancelledError:
+                for task in expansions:
+                    task.cancel()
+                raise
+            for outcome in outcomes:
+                if not isinstance(outcome, dict):
+                    continue
+                total_topics_researched += outcome["topics_researched"]
+                total_findings_stored += outcome["findings_stored"]
+                quality_scores.extend(outcome["quality_scores"])
+            
             avg_quality = sum(quality_scores) / len(quality_scores) if quality_scores else 0.0
             
             logger.info(f"🎯 Research cycle completed: {total_topics_researched} topics, {total_findings_stored} findings, avg quality: {avg_quality:.2f}")
@@ -682,6 +652,202 @@ class MotivationSystem:
                 "average_quality": 0.0,
             }
 
+    async def _research_topic(
+        self,
+        researcher,
+        user_uuid: uuid.UUID,
+        topic_score: TopicScore,
+        topic,
+        expansions: List[asyncio.Task],
+    ) -> Optional[Dict[str, Any]]:
+        """Research one motivated topic as a scheduler job.
+
+        Jobs run concurrently, so each one uses its own database sessions rather
+        than the shared ``self.session``. Expansion work for the topic is started
+        as a task appended to ``expansions``. Returns the job's contribution to the
+        cycle totals, or ``None`` when the topic was skipped or failed.
+        """
+        user_id = str(user_uuid)
+        topic_name = topic_score.topic_name
+        outcome: Dict[str, Any] = {"topics_researched": 0, "findings_stored": 0, "quality_scores": []}
+        try:
+            logger.debug(f"🎯 Processing topic '{topic_name}' with motivation={topic_score.motivation_score:.4f}")
+            
+            # Re-check if topic is still active (user may have deactivated it during research cycle)
+            async with SessionLocal() as check_session:
+                from models.topic import ResearchTopic
+                check_query = select(ResearchTopic).where(
+                    and_(
+                        ResearchTopic.id == topic.id,
+                        ResearchTopic.user_id == user_uuid,
+                        ResearchTopic.is_active_research.is_(True)
+                    )
+                )
+                check_result = await check_session.execute(check_query)
+                active_topic = check_result.scalar_one_or_none()
+                
+                if not active_topic:
+                    logger.info(f"🎯 Topic '{topic_name}' was deactivated during research cycle; skipping")
+                    return None
+                
+                # Update topic with fresh data
+                topic = active_topic
+            
+            # Log current state before research
+            last_researched_str = topic.last_researched.astimezone(timezone.utc).strftime("%Y-%m-%d %H:%M:%S") if topic.last_researched else "NEVER"
+            logger.info(f"🎯 STARTING RESEARCH for '{topic_name}' (user={user_id})")
+            logger.info(f"🎯   - Last researched: {last_researched_str}")
+            logger.info(f"🎯   - Current motivation: {topic_score.motivation_score:.4f}")
+            logger.info(f"🎯   - Staleness pressure: {topic_score.staleness_pressure:.4f}")
+            logger.info(f"🎯   - Engagement score: {topic_score.engagement_score:.4f}")
+            logger.info(f"🎯   - Success rate: {topic_score.success_rate:.4f}")
+            
+            topic_data = {
+                "topic_id": str(topic.id),
+                "topic_name": topic.name,
+                "description": topic.description,
+                "last_researched": topic.last_researched.astimezone(timezone.utc).strftime("%Y-%m-%d") if topic.last_researched else None,
+                "is_active_research": topic.is_active_research,
+                "expansion_depth": topic.depth,
+            }
+            
+            # Research the topic via research engine instance
+            result = await researcher.run_langgraph_research(user_id, topic_data)
+            
+            outcome["topics_researched"] += 1
+            if result and result.get("stored", False):
+                outcome["findings_stored"] += 1
+            if result and result.get("quality_score"):
+                outcome["quality_scores"].append(result.get("quality_score"))
+
+            # Only update last_researched when research succeeded
+            if result and result.get("success"):
+                new_timestamp = time.time()
+                logger.info(
+                    f"🎯 COMPLETED RESEARCH for '{topic_name}' - updating last_researched to {new_timestamp}"
+                )
+                async with SessionLocal() as score_session:
+                    await MotivationRepository(score_session).create_or_update_topic_score(
+                        user_id=user_uuid,
+                        topic_id=topic.id,
+                        topic_name=topic_name,
+                        last_researched=new_timestamp,
+                    )
+            else:
+                logger.info(
+                    f"🎯 SKIPPING last_researched update for '{topic_name}' "
+                    f"due to failed or aborted research: {result}"
+                )
+
+            # --- Topic expansion wiring ---
+            # Runs in the background so this worker can move on to the next root topic;
+            # the cycle awaits all expansion tasks before it finishes.
+            expansions.append(
+                asyncio.create_task(self._expand_topic(researcher, user_uuid, topic_name, topic_data))
+            )
+
+            return outcome
+            
+        except Exception as e:
+            logger.error(f"🎯 Error researching topic {topic_name}: {str(e)}")
+            return outcome if outcome["topics_researched"] else None
+
+    async def _expand_topic(
+        self,
+        researcher,
+        user_uuid: uuid.UUID,
+        topic_name: str,
+        topic_data: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Generate, create and research expansion children of a researched root topic.
+
+        Candidate generation and child runs share ``_expansion_semaphore``
+        (EXPANSION_MAX_PARALLEL) across all roots of the cycle.
+        """
+        user_id = str(user_uuid)
+        outcome: Dict[str, Any] = {"topics_researched": 0, "findings_stored": 0, "quality_scores": []}
+        try:
+            child_runs = await researcher.process_expansions_for_root(
+                user_id, topic_data, semaphore=self._expansion_semaphore
+            )
+            if child_runs:
+                async with SessionLocal() as session:
+                    for cr in child_runs:
+                        child = cr.get("topic", {})
+                        child_res = cr.get("result", {})
+                        child_name = child.get('topic_name')
+                        if not child_name:
+                            continue
+                        logger.info(f"🎯 Researched expansion topic: {child_name} for user {user_id}")
+                        outcome["topics_researched"] += 1
+                        if child_res and child_res.get("stored", False):
+                            outcome["findings_stored"] += 1
+                        if child_res and child_res.get("quality_score"):
+                            outcome["quality_scores"].append(child_res.get("quality_score"))
+
+                        # Update last_researched and lifecycle for child
+                        # Only treat the child as researched when its own research succeeded
+                        if child_res and child_res.get("success"):
+                            # Auto-deactivate only child topics that haven't been researched before
+                            # If user manually activated a previously auto-deactivated child topic, keep it active
+                            child_topic_id = child.get("topic_id")
+                            if child_topic_id:
+                                child_topic_uuid = uuid.UUID(str(child_topic_id))
+
+                                from models.topic import ResearchTopic
+
+                                # Get the child topic
+                                topic_query = select(ResearchTopic).where(
+                                    ResearchTopic.id == child_topic_uuid
+                                )
+                                topic_result = await session.execute(topic_query)
+                                child_topic = topic_result.scalar_one_or_none()
+
+                                # Get TopicScore
+                                topic_score_query = select(TopicScore).where(
+                                    and_(
+                                        TopicScore.topic_id == child_topic_uuid,
+                                        TopicScore.user_id == user_uuid,
+                                    )
+                                )
+                                score_result = await session.execute(topic_score_query)
+                                child_score = score_result.scalar_one_or_none()
+
+                                # Update last_researched timestamp for child
+                                if child_score:
+                                    child_score.last_researched = time.time()
+                                    session.add(child_score)
+
+                                # Mark as researched_once and auto-deactivate if this is the first research
+                                # This prevents auto-deactivating child topics that users manually reactivated
+                                if child_topic:
+                                    # Check if this is the first research (researched_once is False)
+                                    if not child_topic.researched_once:
+                                        # Mark as researched
+                                        child_topic.researched_once = True
+                                        session.add(child_topic)
+
+                                        # Auto-deactivate after first research
+                                        child_topic.is_active_research = False
+                                        if child_score:
+                                            child_score.is_active_research = False
+                                        logger.info(
+                                            f"🔄 Auto-deactivated child topic '{child_name}' after first expansion research "
+                                            f"(can be manually reactivated if desired)"
+                                        )
+                                    else:
+                                        logger.info(
+                                            f"ℹ️ Child topic '{child_name}' has been researched before; keeping current active state"
+                                        )
+
+                                # Commit updates
+                                await session.commit()
+
+        except Exception as ex:
+            logger.debug(f"Expansion wiring failed for {topic_name}: {ex}")
+
+        return outcome
+
     async def get_recent_average_quality(self, user_id: str, topic_id: uuid.UUID, window_days: int) -> float:
         """Compute recent average quality over window for a topic."""
         try:
@@ -698,11 +864,15 @@ class MotivationSystem:
             return 0.0
 
     async def _update_expansion_lifecycle(self, user_id: str) -> None:
-        """Evaluate and update lifecycle state for expansion topics for a user."""
+        """Evaluate and update lifecycle state for expansion topics for a user.
+
+        Engagement, windowed quality and recent interactions for all of the user's
+        expansion topics come from one aggregate query, and every decision is
+        written back in one batched update.
+        """
         try:
             now_ts = time.time()
             promoted = paused = retired = 0
-            changed = False
             window_days = config.EXPANSION_ENGAGEMENT_WINDOW_DAYS
             promote_thr = config.EXPANSION_PROMOTE_ENGAGEMENT
             retire_thr = config.EXPANSION_RETIRE_ENGAGEMENT
@@ -713,25 +883,36 @@ class MotivationSystem:
             user_uuid = uuid.UUID(user_id)
             # Fetch topic scores for this user and filter to expansion topics using meta_data
             topic_scores = await self.db_service.get_user_topic_scores(user_uuid, active_only=False, limit=None, order_by_motivation=False)
+            expansion_scores = [ts for ts in topic_scores if (ts.meta_data or {}).get('is_expansion', False)]
+            if not expansion_scores:
+                return
 
-            for ts in topic_scores:
-                meta = ts.meta_data or {}
-                if not meta.get('is_expansion', False):
-                    continue
+            activity = await self.db_service.get_finding_activity(
+                user_uuid,
+                [ts.topic_id for ts in expansion_scores],
+                window_start=now_ts - window_days * 24 * 3600,
+                recent_start=now_ts - ENGAGEMENT_RECENT_WINDOW,
+            )
+
+            updates: Dict[uuid.UUID, Dict[str, Any]] = {}
+            for ts in expansion_scores:
+                meta = dict(ts.meta_data or {})
                 name = ts.topic_name
                 depth = int(meta.get('expansion_depth', 0) or 0)
-                
-                # Compute engagement and recent average quality from DB-backed findings
-                engagement = 0.0
-                try:
-                    engagement = await self._get_topic_engagement_score(user_id, ts.topic_id)
-                except Exception:
-                    engagement = 0.0
-                avg_quality = await self.get_recent_average_quality(user_id, ts.topic_id, window_days)
+
+                stats = activity.get(ts.topic_id) or {}
+                engagement = _engagement_score(
+                    stats.get('total', 0),
+                    stats.get('reads', 0),
+                    stats.get('recent_reads', 0),
+                    stats.get('bookmarks', 0),
+                    stats.get('integrations', 0),
+                )
+                avg_quality = float(stats.get('window_quality') or 0.0)
+                any_interaction = bool(stats.get('window_interactions', 0))
 
                 status = meta.get('expansion_status', 'active')
                 last_eval = float(meta.get('last_evaluated_at', 0) or 0)
-                backoff_until = float(meta.get('last_backoff_until', 0) or 0)
 
                 decision_debug = f"topic='{name}' depth={depth} engagement={engagement:.2f} avg_q={avg_quality:.2f} status={status}"
 
@@ -740,44 +921,20 @@ class MotivationSystem:
                     if not meta.get('child_expansion_enabled', False) or status != 'active':
                         meta['child_expansion_enabled'] = True
                         meta['expansion_status'] = 'active'
-                        changed = True
+                        meta['last_evaluated_at'] = now_ts
+                        updates[ts.id] = meta
                         promoted += 1
                         logger.debug(f"Lifecycle promote: {decision_debug}")
-                    meta['last_evaluated_at'] = now_ts
-                    if changed:
-                        await self.db_service.update_topic_score(
-                            user_uuid,
-                            ts.topic_name,
-                            meta_data=meta,
-                        )
                     continue
 
-                # Assess interactions in window via findings read/bookmark/integration
-                any_interaction = False
-                try:
-                    success, findings = await self.research_service.async_get_findings(user_id, str(ts.topic_id))
-                    if success:
-                        window_start = now_ts - window_days * 24 * 3600
-                        any_interaction = any(
-                            (f.read or f.bookmarked or f.integrated) and f.created_at and f.created_at.timestamp() >= window_start
-                            for f in findings
-                        )
-                except Exception:
-                    any_interaction = False
-
                 # Retire after TTL if still cold (check before pausing again)
                 if status == 'paused' and last_eval and (now_ts - last_eval) >= retire_ttl_days * 24 * 3600:
                     if engagement < retire_thr and not any_interaction:
                         meta['expansion_status'] = 'retired'
                         meta['last_evaluated_at'] = now_ts
-                        changed = True
+                        updates[ts.id] = meta
                         retired += 1
                         logger.debug(f"Lifecycle retire: {decision_debug}")
-                        await self.db_service.update_topic_score(
-                            user_uuid,
-                            ts.topic_name,
-                            meta_data=meta,
-                        )
                         continue
 
                 # Pause on cold engagement and no interactions in window
@@ -787,22 +944,19 @@ class MotivationSystem:
                     meta['expansion_status'] = 'paused'
                     meta['last_backoff_until'] = now_ts + backoff_days * 24 * 3600
                     meta['last_evaluated_at'] = now_ts
-                    changed = True
+                    updates[ts.id] = meta
                     paused += 1
                     logger.debug(f"Lifecycle pause: {decision_debug}")
-                    await self.db_service.update_topic_score(
-                        user_uuid,
-                        ts.topic_name,
-                        meta_data=meta,
-                    )
-                    continue
 
-                # No action
-                meta['last_evaluated_at'] = now_ts
+            await self.db_service.bulk_update_topic_meta(updates)
 
             logger.info(f"Lifecycle update for {user_id}: promoted={promoted}, paused={paused}, retired={retired}")
 
         except Exception as e:
+            try:
+                await self.session.rollback()
+            except Exception:
+                pass
             logger.error(f"Error updating expansion lifecycle for user {user_id}: {str(e)}")
 
     # NOTE: Research execution lives in Research Engine now
@@ -835,14 +989,17 @@ class MotivationSystem:
         return {
             "running": self.is_running,
             "check_interval": self.check_interval,
+            "scheduling_mode": config.MOTIVATION_SCHEDULING_MODE,
             "quality_threshold": self.quality_threshold,
             "system_type": "MotivationSystem",
             "features": [
                 "database_persistence",
                 "per_topic_scoring",
                 "integrated_research_loop",
-                "engagement_based_motivation"
-            ]
+                "engagement_based_motivation",
+                "concurrent_research_scheduler"
+            ],
+            "scheduler": ResearchScheduler.get_stats(),
         }
     
     async def _log_topic_scores_detail(self) -> None:
@@ -2,7 +2,6 @@
 Analysis refiner node for transforming user requests into structured analysis tasks.
 """
 
-from langchain_openai import ChatOpenAI
 from langchain_core.messages import SystemMessage
 
 import config
@@ -11,13 +10,14 @@ from utils.helpers import get_current_datetime_str, get_last_user_message
 from utils.error_handling import handle_node_error
 from llm_models import AnalysisTask
 from services.prompt_cache import PromptCache
+from services.llm_gateway import LLMGateway
 from services.status_manager import queue_status  # noqa: F401
 from services.logging_config import get_logger
 
 logger = get_logger(__name__)
 
 
-def analysis_task_refiner_node(state: ChatState) -> ChatState:
+async def analysis_task_refiner_node(state: ChatState) -> ChatState:
     """Refines the user's request into a detailed task for the analysis engine, considering conversation context."""
     logger.info("🧩 Analysis Refiner: Refining user request into analysis task")
     queue_status(state.get("thread_id"), "Refining analysis task...")
@@ -64,16 +64,13 @@ def analysis_task_refiner_node(state: ChatState) -> ChatState:
         return state
 
     # Initialize the optimizer LLM
-    optimizer_llm = ChatOpenAI(
-        model=config.ROUTER_MODEL, temperature=0.0, max_tokens=300, api_key=config.OPENAI_API_KEY
+    structured_refiner = LLMGateway.get_structured(
+        AnalysisTask, model=config.ROUTER_MODEL, temperature=0.0, max_tokens=300
     )
 
-    # Create structured output model
-    structured_refiner = optimizer_llm.with_structured_output(AnalysisTask)
-
     try:
         # Invoke the structured refiner
-        analysis_task = structured_refiner.invoke(context_messages_for_llm)
+        analysis_task = await structured_refiner.ainvoke(context_messages_for_llm)
 
         # Combine the structured fields into a comprehensive task description
         refined_task = f"""ANALYSIS OBJECTIVE: {analysis_task.objective}
@@ -15,7 +15,6 @@ optimal results quality and citation management.
 import asyncio
 from typing import Dict, Any, List, Optional
 from pydantic import BaseModel, Field
-from langchain_openai import ChatOpenAI
 from langchain_core.messages import SystemMessage
 
 import config
@@ -25,6 +24,7 @@ from .search_results_reviewer import search_results_reviewer_node
 from .evidence_summarizer import evidence_summarizer_node
 from utils.helpers import get_current_datetime_str, get_last_user_message
 from utils.error_handling import handle_node_error
+from services.llm_gateway import LLMGateway
 from services.status_manager import queue_status  # noqa: F401
 from services.logging_config import get_logger
 
@@ -236,15 +236,13 @@ DECOMPOSITION PRINCIPLES:
 
 Your decomposition should enable comprehensive understanding of the topic."""
 
-    llm = ChatOpenAI(
-        model=config.DEFAULT_MODEL,
-        temperature=DEEP_ANALYSIS_TEMPERATURE,
-        max_tokens=500,
-        api_key=config.OPENAI_API_KEY
-    )
-
     try:
-        structured_llm = llm.with_structured_output(QueryDecomposition)
+        structured_llm = LLMGateway.get_structured(
+            QueryDecomposition,
+            model=config.DEFAULT_MODEL,
+            temperature=DEEP_ANALYSIS_TEMPERATURE,
+            max_tokens=500,
+        )
         response = await structured_llm.ainvoke([SystemMessage(content=prompt)])
 
         reasoning_preview = (
@@ -304,15 +302,10 @@ Provide a research plan for EACH sub-question with selected sources and brief ra
 
 Return format: Array of objects with sub_question, sources (array), and rationale (string)."""
 
-    llm = ChatOpenAI(
-        model=config.ROUTER_MODEL,
-        temperature=0.2,
-        max_tokens=800,
-        api_key=config.OPENAI_API_KEY
-    )
-
     try:
-        structured_llm = llm.with_structured_output(SubQuestionResearchPlan)
+        structured_llm = LLMGateway.get_structured(
+            SubQuestionResearchPlan, model=config.ROUTER_MODEL, temperature=0.2, max_tokens=800
+        )
         response = await structured_llm.ainvoke([SystemMessage(content=prompt)])
 
         # Validate and clean plans
@@ -568,12 +561,7 @@ Your synthesis: "Research indicates X[1][2], which relates to Y[3]"
 
 Your response should feel like a thorough, well-researched explanation that a knowledgeable colleague would provide, complete with proper citations."""
 
-    llm = ChatOpenAI(
-        model=config.DEFAULT_MODEL,
-        temperature=DEEP_ANALYSIS_SYNTHESIS_TEMPERATURE,
-        max_tokens=2000,
-        api_key=config.OPENAI_API_KEY
-    )
+    llm = LLMGateway.get(config.DEFAULT_MODEL, temperature=DEEP_ANALYSIS_SYNTHESIS_TEMPERATURE, max_tokens=2000)
 
     try:
         response = await llm.ainvoke([SystemMessage(content=prompt)])
@@ -41,3 +41,4 @@ class ChatState(TypedDict):
     selected_sources: Annotated[Optional[List[str]], "Selected sources for search intent"]
     error: Annotated[Optional[str], "Error message if the pipeline failed"]
     error_llm: Annotated[Optional[str], "LLM/API error in research flow; routes to END when set"]
+    render_mode: Annotated[Optional[str], "Per-request override of CHAT_RENDER_MODE (two_pass or fused)"]
@@ -41,19 +41,14 @@ async def initializer_node(state: ChatState) -> ChatState:
         logger.error(f"🧠 Initializer: ❌ Missing thread_id")
     else:
         logger.info(f"🧠 Initializer: Using provided thread ID: {thread_id}")
-        # Ensure the thread exists in ZEP when a thread ID is provided externally (e.g., new session from UI)
-        if zep_manager.is_enabled():
-            try:
-                await zep_manager.create_thread(thread_id, user_id)
-            except Exception as e:
-                logger.warning(f"Failed to ensure provided thread exists in ZEP: {str(e)}")
-
-    # Retrieve memory context from Zep if available
+
+    # Retrieve memory context from Zep if available; this also ensures the thread exists
+    # (e.g., new session from UI) with a single Zep call once the thread is known
     memory_context = None
-    if zep_manager.is_enabled():
+    if zep_manager.is_enabled() and thread_id:
         try:
             logger.info(f"🧠 Initializer: Retrieving memory context for thread {thread_id}")
-            memory_context = await zep_manager.get_memory_context(thread_id)
+            memory_context = await zep_manager.ensure_thread_and_get_context(thread_id, user_id)
 
             if memory_context:
                 logger.info(f"🧠 Initializer: ✅ Retrieved memory context from ZEP.")
@@ -66,7 +61,7 @@ async def initializer_node(state: ChatState) -> ChatState:
         except Exception as e:
             logger.error(f"🧠 Initializer: ❌ Error retrieving memory context: {str(e)}")
             state["workflow_context"]["memory_context_error"] = str(e)
-    else:
+    elif not zep_manager.is_enabled():
         logger.info("🧠 Initializer: ⚠️ Zep is not enabled, skipping memory context retrieval")
 
     # Store memory context in state (will be None if not available)
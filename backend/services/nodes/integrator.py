@@ -4,14 +4,17 @@ Integrator node that combines all available information to generate a coherent r
 
 import asyncio
 import re
-from langchain_openai import ChatOpenAI
 from langchain_core.messages import SystemMessage
 
 import config
 from .base import ChatState
+from .response_renderer import finalize_response, get_format_settings
 from utils.helpers import get_current_datetime_str, get_last_user_message
 from utils.error_handling import handle_node_error
+from llm_models import FormattedResponse
+from prompts import FUSED_RESPONSE_FORMAT_PROMPT
 from services.prompt_cache import PromptCache
+from services.llm_gateway import LLMGateway
 from services.status_manager import queue_status  # noqa: F401
 from services.logging_config import get_logger
 
@@ -365,8 +368,14 @@ When synthesizing, cross-reference information between sources and highlight are
         current_time=current_time_str, memory_context_section=memory_context_section, context_section=context_section
     )
 
-    # Initialize the model
-    llm = ChatOpenAI(model=model, temperature=temperature, max_tokens=max_tokens, api_key=config.OPENAI_API_KEY)
+    fused = use_fused_render(state)
+    if fused:
+        # Single-pass mode: fold the renderer's formatting instructions into this generation
+        format_settings = await get_format_settings(state)
+        format_section = PromptCache.get("FUSED_RESPONSE_FORMAT_PROMPT", FUSED_RESPONSE_FORMAT_PROMPT).format(
+            **format_settings
+        )
+        system_message_content = f"{system_message_content}\n\n{format_section}"
 
     # Get the messages and add system message
     messages_for_llm = [SystemMessage(content=system_message_content)]
@@ -380,21 +389,46 @@ When synthesizing, cross-reference information between sources and highlight are
 
     try:
         logger.debug(f"Sending {len(messages_for_llm)} messages to Integrator")
-        # Create a chat model with specified parameters
-        response = llm.invoke(messages_for_llm)
-        logger.debug(f"Received response from Integrator: {response}")
+        if fused:
+            structured = LLMGateway.get_structured(FormattedResponse, model, temperature, max_tokens)
+            formatted = await structured.ainvoke(messages_for_llm)
+            response_content = formatted.main_response
+        else:
+            # Shared client for the requested model settings
+            response = await LLMGateway.get(model, temperature, max_tokens).ainvoke(messages_for_llm)
+            logger.debug(f"Received response from Integrator: {response}")
+            response_content = response.content
 
         # Log the response for traceability
-        display_response = response.content[:75] + "..." if len(response.content) > 75 else response.content
+        display_response = response_content[:75] + "..." if len(response_content) > 75 else response_content
         logger.info(f'🧠 Integrator: ✅ Generated response: "{display_response}"')
 
         # Store the Integrator's response in the workflow context for the renderer
-        state["workflow_context"]["integrator_response"] = response.content
+        state["workflow_context"]["integrator_response"] = response_content
 
         # Also store in module_results for consistency
-        state["module_results"]["integrator"] = response.content
+        state["module_results"]["integrator"] = response_content
+
+        if fused:
+            finalize_response(state, response_content, formatted.follow_up_questions)
+            state["workflow_context"]["render_mode"] = "fused"
+            logger.info("🧠 Integrator: ✅ Rendered in single pass (fused mode)")
 
     except Exception as e:
         return handle_node_error(e, state, "integrator_node")
 
     return state
+
+
+def use_fused_render(state: ChatState) -> bool:
+    """Return True if this turn should be integrated and rendered in one structured generation."""
+    # The research graph always renders in a separate pass
+    if state.get("workflow_context", {}).get("research_metadata"):
+        return False
+
+    mode = (state.get("render_mode") or config.CHAT_RENDER_MODE or "two_pass").lower()
+    if mode == "fused":
+        return True
+    if mode == "fused_chat":
+        return (state.get("intent") or "chat") == "chat"
+    return False
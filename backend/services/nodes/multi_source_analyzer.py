@@ -3,7 +3,6 @@ Multi-source analyzer node for determining which search sources to use.
 """
 
 import asyncio
-from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage, SystemMessage
 
 import config
@@ -11,6 +10,8 @@ from .base import ChatState
 from utils.helpers import get_current_datetime_str, get_last_user_message
 from llm_models import MultiSourceAnalysis
 from services.prompt_cache import PromptCache
+from services.llm_gateway import LLMGateway
+from services.intent_prerouter import IntentPreRouter
 from services.status_manager import queue_status  # noqa: F401
 from services.logging_config import get_logger
 
@@ -38,17 +39,32 @@ async def multi_source_analyzer_node(state: ChatState) -> ChatState:
     display_msg = last_message[:75] + "..." if len(last_message) > 75 else last_message
     logger.info(f'🔍 Multi-Source Analyzer: Analyzing query: "{display_msg}"')
 
-    # Initialize the model for analysis
-    analyzer_llm = ChatOpenAI(
+    # High-confidence turns (greetings, thanks, explicit search requests) are routed locally
+    decision = IntentPreRouter.route(last_message)
+    if decision:
+        state["intent"] = decision.intent
+        state["selected_sources"] = decision.sources
+        state["routing_analysis"] = {
+            "intent": decision.intent,
+            "reason": decision.reason,
+            "sources": decision.sources,
+            "model_used": f"local_{decision.method}",
+            "confidence": decision.confidence,
+        }
+        logger.info(
+            f"🔍 Multi-Source Analyzer: Pre-routed locally ({decision.method}) to '{decision.intent}' "
+            f"with sources: {decision.sources}"
+        )
+        return state
+
+    # Shared structured analyzer for the router model
+    structured_analyzer = LLMGateway.get_structured(
+        MultiSourceAnalysis,
         model=config.ROUTER_MODEL,  # Use same model as router
         temperature=0.0,  # Keep deterministic
         max_tokens=200,  # Slightly longer for source selection
-        api_key=config.OPENAI_API_KEY,
     )
 
-    # Create a structured output model
-    structured_analyzer = analyzer_llm.with_structured_output(MultiSourceAnalysis)
-
     try:
         history_messages = state.get("messages", [])
 
@@ -78,7 +94,7 @@ async def multi_source_analyzer_node(state: ChatState) -> ChatState:
         logger.debug(f"Multi-source analyzer using {len(analyzer_messages)-1} context messages")
 
         # Invoke the structured analyzer
-        analysis_result = structured_analyzer.invoke(analyzer_messages)
+        analysis_result = await structured_analyzer.ainvoke(analyzer_messages)
 
         # Extract results
         intent = analysis_result.intent.lower()
@@ -2,7 +2,6 @@
 Research deduplication node for checking if findings are duplicates of existing research.
 """
 
-from langchain_openai import ChatOpenAI
 from langchain_core.messages import SystemMessage
 
 import config
@@ -13,6 +12,7 @@ from .base import (
 from utils.helpers import get_current_datetime_str
 from llm_models import ResearchDeduplicationResult
 from services.prompt_cache import PromptCache
+from services.llm_gateway import ainvoke_structured
 from services.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -89,21 +89,16 @@ async def research_deduplication_node(state: ChatState) -> ChatState:
             new_findings=new_findings[:1500]  # Limit length
         )
         
-        # Initialize the LLM for deduplication check with structured output
-        llm = ChatOpenAI(
+        # Get deduplication assessment
+        messages = [SystemMessage(content=prompt)]
+        dedup_result = await ainvoke_structured(
+            ResearchDeduplicationResult,
+            messages,
             model=config.RESEARCH_MODEL,
             temperature=0.1,  # Low temperature for consistent assessment
             max_tokens=300,
-            api_key=config.OPENAI_API_KEY
         )
         
-        # Create structured output model
-        structured_llm = llm.with_structured_output(ResearchDeduplicationResult)
-        
-        # Get deduplication assessment
-        messages = [SystemMessage(content=prompt)]
-        dedup_result = structured_llm.invoke(messages)
-        
         is_duplicate = dedup_result.is_duplicate
         similarity_score = dedup_result.similarity_score
         
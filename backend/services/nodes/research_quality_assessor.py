@@ -3,19 +3,19 @@ Research quality assessor node for evaluating the quality of research findings.
 """
 
 from langchain_core.messages import SystemMessage
-from langchain_openai import ChatOpenAI
 
 import config
 from .base import ChatState
 from utils.helpers import get_current_datetime_str
 from llm_models import ResearchQualityAssessment
 from services.prompt_cache import PromptCache
+from services.llm_gateway import ainvoke_structured
 from services.logging_config import get_logger
 
 logger = get_logger(__name__)
 
 
-def research_quality_assessor_node(state: ChatState) -> ChatState:
+async def research_quality_assessor_node(state: ChatState) -> ChatState:
     """Assess the quality of research findings and provide scores."""
     logger.info("🎯 Research Quality Assessor: Evaluating research findings quality")
     
@@ -55,21 +55,16 @@ def research_quality_assessor_node(state: ChatState) -> ChatState:
             research_results=research_results_content[:2000]  # Limit length
         )
         
-        # Initialize the LLM for quality assessment with structured output
-        llm = ChatOpenAI(
+        # Get quality assessment
+        messages = [SystemMessage(content=prompt)]
+        assessment_result = await ainvoke_structured(
+            ResearchQualityAssessment,
+            messages,
             model=config.RESEARCH_MODEL,
             temperature=0.1,  # Low temperature for consistent assessment
             max_tokens=800,
-            api_key=config.OPENAI_API_KEY
         )
         
-        # Create structured output model
-        structured_llm = llm.with_structured_output(ResearchQualityAssessment)
-        
-        # Get quality assessment
-        messages = [SystemMessage(content=prompt)]
-        assessment_result = structured_llm.invoke(messages)
-        
         overall_quality = assessment_result.overall_quality_score
         logger.info(f"🎯 Research Quality Assessor: ✅ Quality assessment completed - Overall score: {overall_quality:.2f}")
         
@@ -4,19 +4,19 @@ Research query generator node for creating optimized research queries for autono
 
 from datetime import datetime
 from langchain_core.messages import SystemMessage
-from langchain_openai import ChatOpenAI
 
 import config
 from .base import ChatState
 from utils.helpers import get_current_datetime_str
 from utils.error_handling import is_llm_error
 from services.prompt_cache import PromptCache
+from services.llm_gateway import ainvoke_llm
 from services.logging_config import get_logger
 
 logger = get_logger(__name__)
 
 
-def research_query_generator_node(state: ChatState) -> ChatState:
+async def research_query_generator_node(state: ChatState) -> ChatState:
     """Generate an optimized research query based on topic metadata."""
     logger.info("🔍 Research Query Generator: Creating optimized research query")
     
@@ -46,17 +46,9 @@ def research_query_generator_node(state: ChatState) -> ChatState:
             last_research_time=last_research_time
         )
         
-        # Initialize the LLM for query generation
-        llm = ChatOpenAI(
-            model=config.RESEARCH_MODEL,
-            temperature=0.3,
-            max_tokens=150,
-            api_key=config.OPENAI_API_KEY
-        )
-        
         # Generate the research query
         messages = [SystemMessage(content=prompt)]
-        response = llm.invoke(messages)
+        response = await ainvoke_llm(messages, model=config.RESEARCH_MODEL, temperature=0.3, max_tokens=150)
         research_query = response.content.strip()
         
         if not research_query:
@@ -3,13 +3,13 @@ Research source selector node for autonomous research workflow.
 Determines which sources are most relevant for a research topic.
 """
 
-from langchain_openai import ChatOpenAI
 from langchain_core.messages import SystemMessage
 
 import config
 from .base import ChatState
 from llm_models import MultiSourceAnalysis
 from services.prompt_cache import PromptCache
+from services.llm_gateway import ainvoke_structured
 from utils.error_handling import is_llm_error
 from services.logging_config import get_logger
 
@@ -45,18 +45,16 @@ async def research_source_selector_node(state: ChatState) -> ChatState:
         )
         
         # Initialize LLM for source selection
-        llm = ChatOpenAI(
+        # Get structured source selection
+        messages = [SystemMessage(content=prompt)]
+        analysis = await ainvoke_structured(
+            MultiSourceAnalysis,
+            messages,
             model=config.ROUTER_MODEL,  # Use router model for source selection decisions
             temperature=0.1,
             max_tokens=300,
-            api_key=config.OPENAI_API_KEY
         )
         
-        # Get structured source selection
-        messages = [SystemMessage(content=prompt)]
-        structured_llm = llm.with_structured_output(MultiSourceAnalysis)
-        analysis = structured_llm.invoke(messages)
-        
         # Validate and process source selection
         valid_sources = ["search", "academic_search", "social_search", "medical_search"]
         selected_sources = []
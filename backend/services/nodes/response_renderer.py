@@ -3,7 +3,8 @@ Response renderer node that formats and enhances the raw response.
 """
 
 import asyncio
-from langchain_openai import ChatOpenAI
+from typing import Any, Dict, List
+
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
 
 import config
@@ -15,6 +16,7 @@ from utils.helpers import get_current_datetime_str
 from utils.error_handling import handle_node_error
 from llm_models import FormattedResponse
 from services.prompt_cache import PromptCache
+from services.llm_gateway import LLMGateway
 from services.status_manager import queue_status  # noqa: F401
 from services.citation_processor import citation_processor
 from services.logging_config import get_logger
@@ -41,69 +43,24 @@ async def response_renderer_node(state: ChatState) -> ChatState:
         )
         return state
 
-    # Retrieve enhanced citation and source data from the workflow context
-    unified_citations = state.get("workflow_context", {}).get("unified_citations", [])
-    citations = state.get("workflow_context", {}).get("citations", [])  # Fallback for Perplexity
-    search_sources = state.get("workflow_context", {}).get("search_sources", [])
-    successful_sources = state.get("workflow_context", {}).get("successful_sources", [])
-    source_failures = state.get("workflow_context", {}).get("source_failures", [])
-    failure_note = state.get("workflow_context", {}).get("failure_note", "")
-    
-
-
     # Log the raw response
     display_raw = raw_response[:75] + "..." if len(raw_response) > 75 else raw_response
     logger.info(f'✨ Renderer: Processing raw response: "{display_raw}"')
 
-    # Get personality settings to apply to the response
-    personality = state.get("personality") or {}
-    style = personality.get("style", "helpful")
-    tone = personality.get("tone", "friendly")
-    
-    # Get personalization context for user preferences
-    user_id = state.get("user_id")
-    personalization_context = {}
-    if user_id:
-        try:
-            logger.info(f"✨ Renderer: Retrieving personalization context for user {user_id}")
+    format_settings = await get_format_settings(state)
 
-            _, personalization_context = await user_service.async_get_personalization_context(user_id)
-
-            logger.debug(f"✨ Renderer: ✅ Personalization context retrieved for user {user_id}")
-        except Exception as e:
-            logger.warning(f"✨ Renderer: ⚠️ Could not retrieve personalization context for user {user_id}: {str(e)}")
-    else:
-        logger.info("✨ Renderer: No user_id found, using default formatting preferences")
-
-    # Get the active module that was used to handle the query
-    module_used = state.get("current_module", "chat")
-
-    # Initialize LLM for response rendering
-    renderer_llm = ChatOpenAI(
+    # Shared structured renderer
+    structured_renderer = LLMGateway.get_structured(
+        FormattedResponse,
         model=config.DEFAULT_MODEL,
         temperature=0.3,  # Low temperature for more consistent formatting
         max_tokens=1500,  # Allow for extra tokens for formatting and follow-ups
-        api_key=config.OPENAI_API_KEY,
     )
 
-    # Extract format preferences from personalization context
-    format_prefs = personalization_context.get("format_preferences", {})
-    response_length = format_prefs.get("response_length", "medium")
-    detail_level = format_prefs.get("detail_level", "balanced")
-    formatting_style = format_prefs.get("formatting_style", "structured")
-    include_key_insights = format_prefs.get("include_key_insights", True)
-    
     # Create a system prompt for the renderer with personalization
     system_message = SystemMessage(
         content=PromptCache.get("RESPONSE_RENDERER_SYSTEM_PROMPT").format(
-            current_time=current_time_str, 
-            style=style, 
-            tone=tone, 
-            module_used=module_used,
-            response_length=response_length,
-            detail_level=detail_level,
-            formatting_style=formatting_style,
-            include_key_insights=include_key_insights
+            current_time=current_time_str, **format_settings
         )
     )
 
@@ -133,44 +90,82 @@ async def response_renderer_node(state: ChatState) -> ChatState:
     )
 
     try:
-        # Create structured output model
-        structured_renderer = renderer_llm.with_structured_output(FormattedResponse)
-
         # Process the response with the renderer
-        llm_response = structured_renderer.invoke(renderer_messages)
-        stylized_response = llm_response.main_response
-        follow_up_questions = llm_response.follow_up_questions
-
-        # Process citations using external citation processor
-        final_response = citation_processor.process_citations(
-            text=stylized_response,
-            unified_citations=unified_citations,
-            fallback_citations=citations,
-            search_sources=search_sources,
-            successful_sources=successful_sources,
-            failure_note=failure_note
-        )
-
-        # Add follow-up questions to the workflow context to be used in the API response
-        if follow_up_questions:
-            state["workflow_context"]["follow_up_questions"] = follow_up_questions
-
-        # Log the formatted response with source info
-        display_formatted = final_response[:75] + "..." if len(final_response) > 75 else final_response
-        source_info = f" (from {len(successful_sources)} sources)" if successful_sources else ""
-        logger.info(f'✨ Renderer: Produced formatted response: "{display_formatted}"{source_info}')
+        llm_response = await structured_renderer.ainvoke(renderer_messages)
+        final_response = finalize_response(state, llm_response.main_response, llm_response.follow_up_questions)
 
         logger.debug(
             f"Renderer processed response. Original length: {len(raw_response)}, Formatted length: {len(final_response)}"
         )
 
-        # Create the final assistant message
-        assistant_message = AIMessage(content=final_response)
-
-        # Add the rendered response to the messages in state
-        state["messages"].append(assistant_message)
-
     except Exception as e:
         return handle_node_error(e, state, "response_renderer_node")
 
     return state
+
+
+async def get_format_settings(state: ChatState) -> Dict[str, Any]:
+    """Collect personality and learned format preferences used to style the final response."""
+    # Get personality settings to apply to the response
+    personality = state.get("personality") or {}
+    style = personality.get("style", "helpful")
+    tone = personality.get("tone", "friendly")
+
+    # Get personalization context for user preferences
+    user_id = state.get("user_id")
+    personalization_context = {}
+    if user_id:
+        try:
+            logger.info(f"✨ Renderer: Retrieving personalization context for user {user_id}")
+
+            _, personalization_context = await user_service.async_get_personalization_context(user_id)
+
+            logger.debug(f"✨ Renderer: ✅ Personalization context retrieved for user {user_id}")
+        except Exception as e:
+            logger.warning(f"✨ Renderer: ⚠️ Could not retrieve personalization context for user {user_id}: {str(e)}")
+    else:
+        logger.info("✨ Renderer: No user_id found, using default formatting preferences")
+
+    # Extract format preferences from personalization context
+    format_prefs = personalization_context.get("format_preferences", {})
+
+    return {
+        "style": style,
+        "tone": tone,
+        # Get the active module that was used to handle the query
+        "module_used": state.get("current_module", "chat"),
+        "response_length": format_prefs.get("response_length", "medium"),
+        "detail_level": format_prefs.get("detail_level", "balanced"),
+        "formatting_style": format_prefs.get("formatting_style", "structured"),
+        "include_key_insights": format_prefs.get("include_key_insights", True),
+    }
+
+
+def finalize_response(state: ChatState, stylized_response: str, follow_up_questions: List[str]) -> str:
+    """Apply citation post-processing, record follow-ups and append the final assistant message."""
+    # Retrieve enhanced citation and source data from the workflow context
+    workflow_context = state.get("workflow_context", {})
+    successful_sources = workflow_context.get("successful_sources", [])
+
+    # Process citations using external citation processor
+    final_response = citation_processor.process_citations(
+        text=stylized_response,
+        unified_citations=workflow_context.get("unified_citations", []),
+        fallback_citations=workflow_context.get("citations", []),  # Fallback for Perplexity
+        search_sources=workflow_context.get("search_sources", []),
+        successful_sources=successful_sources,
+        failure_note=workflow_context.get("failure_note", ""),
+    )
+
+    # Add follow-up questions to the workflow context to be used in the API response
+    if follow_up_questions:
+        state["workflow_context"]["follow_up_questions"] = follow_up_questions
+
+    # Log the formatted response with source info
+    display_formatted = final_response[:75] + "..." if len(final_response) > 75 else final_response
+    source_info = f" (from {len(successful_sources)} sources)" if successful_sources else ""
+    logger.info(f'✨ Renderer: Produced formatted response: "{display_formatted}"{source_info}')
+
+    # Add the rendered response to the messages in state
+    state["messages"].append(AIMessage(content=final_response))
+    return final_response
@@ -2,7 +2,6 @@
 Search optimizer node for refining user queries into more effective search queries.
 """
 
-from langchain_openai import ChatOpenAI
 from langchain_core.messages import SystemMessage
 
 import config
@@ -11,13 +10,14 @@ from utils.helpers import get_current_datetime_str, get_last_user_message
 from utils.error_handling import handle_node_error, is_llm_error
 from llm_models import SearchOptimization
 from services.prompt_cache import PromptCache
+from services.llm_gateway import LLMGateway
 from services.status_manager import queue_status  # noqa: F401
 from services.logging_config import get_logger
 
 logger = get_logger(__name__)
 
 
-def search_prompt_optimizer_node(state: ChatState) -> ChatState:
+async def search_prompt_optimizer_node(state: ChatState) -> ChatState:
     """Refines the user's query into an optimized search query using an LLM, considering conversation context."""
     logger.info("🔬 Search Optimizer: Refining user query for search")
     queue_status(state.get("thread_id"), "Optimizing search query...")
@@ -89,13 +89,13 @@ def search_prompt_optimizer_node(state: ChatState) -> ChatState:
     context_messages_for_llm = [system_message] + history_messages
 
     # Initialize the optimizer LLM with structured output
-    optimizer_llm = ChatOpenAI(
-        model=config.ROUTER_MODEL, temperature=0.0, max_tokens=150, api_key=config.OPENAI_API_KEY
-    ).with_structured_output(SearchOptimization)
+    optimizer_llm = LLMGateway.get_structured(
+        SearchOptimization, model=config.ROUTER_MODEL, temperature=0.0, max_tokens=150
+    )
 
     try:
         # Invoke the optimizer to get structured search optimization
-        search_optimization = optimizer_llm.invoke(context_messages_for_llm)
+        search_optimization = await optimizer_llm.ainvoke(context_messages_for_llm)
         
         refined_query = search_optimization.query
         social_query = search_optimization.social_query
@@ -2,7 +2,6 @@
 Topic extractor node that analyzes conversations to identify research-worthy topics.
 """
 
-from langchain_openai import ChatOpenAI
 from langchain_core.messages import SystemMessage
 
 import config
@@ -13,6 +12,7 @@ from .base import (
 from utils.helpers import get_current_datetime_str
 from llm_models import TopicSuggestions
 from services.prompt_cache import PromptCache
+from services.llm_gateway import LLMGateway
 from services.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -102,17 +102,14 @@ async def topic_extractor_node(state: ChatState) -> ChatState:
     
     system_message_content = full_prompt
     
-    # Initialize the model for topic extraction
-    llm = ChatOpenAI(
+    # Shared structured extractor for the topic model
+    structured_extractor = LLMGateway.get_structured(
+        TopicSuggestions,
         model=topic_model,
         temperature=temperature,
         max_tokens=max_tokens,
-        api_key=config.OPENAI_API_KEY
     )
     
-    # Create structured output model
-    structured_extractor = llm.with_structured_output(TopicSuggestions)
-    
     # Prepare messages for the LLM - DO NOT include memory context to avoid confusion
     # Topic extraction should focus ONLY on the current conversation content
     messages_for_llm = [SystemMessage(content=system_message_content)]
@@ -134,7 +131,7 @@ async def topic_extractor_node(state: ChatState) -> ChatState:
         logger.debug(f"🔍 Topic Extractor: Recent conversation context: {'; '.join(recent_messages)}")
         
         # Get structured response from LLM
-        topic_suggestions = structured_extractor.invoke(messages_for_llm)
+        topic_suggestions = await structured_extractor.ainvoke(messages_for_llm)
         
         # Convert Pydantic models to dictionaries for storage
         valid_topics = []
@@ -11,18 +11,28 @@ from fastapi import WebSocket, WebSocketDisconnect
 from datetime import datetime, timezone
 from db import SessionLocal
 from services.user import UserService
-from services.email_service import email_service
+from services.email_outbox import EmailOutbox
+from services.pubsub import PubSub, NOTIFICATION_TOPIC
 import config
 
 logger = logging.getLogger(__name__)
 
 
 class ConnectionManager:
-    """Manages WebSocket connections for notifications."""
+    """Manages WebSocket connections for notifications.
+
+    Each connection has its own bounded send queue drained by its own sender task, and
+    every send is bounded by ``PUBSUB_DELIVERY_TIMEOUT``; the pub/sub handler only
+    enqueues, so a stalled socket cannot delay delivery to any other connection.
+    """
     
     def __init__(self):
-        # Store active connections by user_id
+        # Store active connections by user_id (connections of this worker only)
         self.active_connections: Dict[str, Set[WebSocket]] = {}
+        self._queues: Dict[WebSocket, asyncio.Queue] = {}
+        self._senders: Dict[WebSocket, asyncio.Task] = {}
+        # Notifications are published to every worker and delivered where the user is connected
+        PubSub.subscribe(NOTIFICATION_TOPIC, self._deliver)
     
     async def connect(self, websocket: WebSocket, user_id: str):
         """Accept a WebSocket connection for a user."""
@@ -32,6 +42,8 @@ class ConnectionManager:
             self.active_connections[user_id] = set()
         
         self.active_connections[user_id].add(websocket)
+        queue = self._queues[websocket] = asyncio.Queue(maxsize=max(1, config.NOTIFICATION_SEND_QUEUE_MAX))
+        self._senders[websocket] = asyncio.create_task(self._sender(websocket, user_id, queue))
         logger.info(f"🔌 User {user_id} connected to notifications (total connections: {len(self.active_connections[user_id])})")
     
     def disconnect(self, websocket: WebSocket, user_id: str):
@@ -40,35 +52,61 @@ class ConnectionManager:
             self.active_connections[user_id].discard(websocket)
             if not self.active_connections[user_id]:
                 del self.active_connections[user_id]
+        self._queues.pop(websocket, None)
+        sender = self._senders.pop(websocket, None)
+        if sender is not None and sender is not asyncio.current_task():
+            sender.cancel()
         
         logger.info(f"🔌 User {user_id} disconnected from notifications")
     
     async def send_to_user(self, user_id: str, message: dict):
-        """Send a notification to all connections for a specific user."""
+        """Send a notification to all connections for a specific user, on any worker."""
+        await PubSub.publish(NOTIFICATION_TOPIC, {"user_id": user_id, "message": message})
+    
+    async def broadcast_to_all(self, message: dict):
+        """Send a notification to all connected users, on any worker."""
+        await PubSub.publish(NOTIFICATION_TOPIC, {"user_id": None, "message": message})
+
+    async def _deliver(self, payload: dict):
+        """PubSub handler: queue a published notification for this worker's connections."""
+        user_id = payload.get("user_id")
+        message = payload.get("message") or {}
+        if user_id is None:
+            for connected_user_id in list(self.active_connections.keys()):
+                self._send_local(connected_user_id, message)
+        else:
+            self._send_local(user_id, message)
+
+    def _send_local(self, user_id: str, message: dict):
+        """Queue a notification on each of this worker's connections for a user."""
         if user_id not in self.active_connections:
-            logger.info(f"📡 No active connections for user {user_id} (total users: {len(self.active_connections)})")
+            logger.debug(f"📡 No active connections for user {user_id} on this worker (total users: {len(self.active_connections)})")
             return
         
-        # Create a copy of the set to avoid modification during iteration
-        connections = self.active_connections[user_id].copy()
-        disconnected_connections = []
-        
-        for connection in connections:
+        text = json.dumps(message)
+        for connection in self.active_connections[user_id]:
+            queue = self._queues.get(connection)
+            if queue is None:
+                continue
+            if queue.full():
+                # The client is not keeping up; drop its oldest pending notification
+                queue.get_nowait()
+                logger.warning(f"📡 Notification queue full for user {user_id}; dropped oldest")
+            queue.put_nowait(text)
+
+    async def _sender(self, websocket: WebSocket, user_id: str, queue: asyncio.Queue):
+        """Drain one connection's queue; a send that fails or stalls drops the connection."""
+        while True:
+            text = await queue.get()
             try:
-                await connection.send_text(json.dumps(message))
-                logger.debug(f"📡 Sent notification to user {user_id}: {message.get('type', 'unknown')}")
+                await asyncio.wait_for(websocket.send_text(text), timeout=config.PUBSUB_DELIVERY_TIMEOUT)
+                logger.debug(f"📡 Sent notification to user {user_id}")
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
-                logger.warning(f"📡 Failed to send notification to user {user_id}: {e}")
-                disconnected_connections.append(connection)
-        
-        # Clean up disconnected connections
-        for connection in disconnected_connections:
-            self.disconnect(connection, user_id)
-    
-    async def broadcast_to_all(self, message: dict):
-        """Send a notification to all connected users."""
-        for user_id in list(self.active_connections.keys()):
-            await self.send_to_user(user_id, message)
+                logger.warning(f"📡 Failed to send notification to user {user_id}: {e!r}")
+                self.disconnect(websocket, user_id)
+                return
     
     def get_connection_count(self, user_id: Optional[str] = None) -> int:
         """Get the number of active connections."""
@@ -89,6 +127,29 @@ class NotificationService:
     external channels (email/SMS) and is not applied here.
     """
     
+    @staticmethod
+    async def _queue_email(user_id: str, kind: str, subject: str, text_body: str, html_body: str) -> None:
+        """Queue an email for the user's address, if they have one; sending happens in the background."""
+        if not config.EMAIL_NOTIFICATIONS_ENABLED:
+            return
+        async with SessionLocal() as session:
+            try:
+                user = await UserService().get_user(session, uuid.UUID(user_id), with_profile=True)
+                email = user.profile.meta_data.get("email") if user.profile and user.profile.meta_data else None
+            except Exception:
+                email = None
+            if not email:
+                return
+            await EmailOutbox.enqueue(
+                session,
+                user_id=user.id,
+                to_address=email,
+                kind=kind,
+                subject=subject,
+                text_body=text_body,
+                html_body=html_body,
+            )
+
     @staticmethod
     async def notify_new_research(user_id: str, topic_id: str, result_id: str, topic_name: str = None):
         """Notify user about new research results."""
@@ -104,44 +165,35 @@ class NotificationService:
         logger.info(f"📡 NotificationService: Sending new research notification to user {user_id}")
         await connection_manager.send_to_user(user_id, message)
 
-        # Also send email notification if the user has an email
+        # Also queue an email notification if the user has an email
         try:
-            async with SessionLocal() as session:
-                user_service = UserService()
-                try:
-                    user = await user_service.get_user(session, uuid.UUID(user_id), with_profile=True)
-                    email = user.profile.meta_data.get("email") if user.profile and user.profile.meta_data else None
-                except Exception:
-                    email = None
-            
-            if email:
-                subject = "New research finding available"
-                topic_part = f" on '{topic_name}'" if topic_name else ""
-                link = f"{config.FRONTEND_URL}/research-results?user={user_id}&topic={topic_id}"
-                text_body = (
-                    f"Hello,\n\nA new background research finding{topic_part} is available.\n"
-                    f"Finding ID: {result_id}\n"
-                    f"Open the app to review: {link}\n\n"
-                    f"— AI Research Assistant"
-                )
-                html_body = (
-                    f"<div style=\"font-family: -apple-system, Segoe UI, Roboto, Arial, sans-serif; color: #111827;\">"
-                    f"  <div style=\"max-width: 600px; margin: 0 auto; background: #ffffff; border-radius: 12px; border: 1px solid #e5e7eb; overflow: hidden;\">"
-                    f"    <div style=\"padding: 20px 24px; background: linear-gradient(135deg,#f0f7ff,#eefdf5); border-bottom: 1px solid #e5e7eb;\">"
-                    f"      <h2 style=\"margin: 0; font-size: 18px; color: #111827;\">New research finding{topic_part}</h2>"
-                    f"      <p style=\"margin: 4px 0 0; color: #6b7280; font-size: 14px;\">Your background research just finished processing.</p>"
-                    f"    </div>"
-                    f"    <div style=\"padding: 20px 24px;\">"
-                    f"      <p style=\"margin: 0 0 12px;\"><strong>Finding ID:</strong> {result_id}</p>"
-                    f"      <a href=\"{link}\" style=\"display: inline-block; padding: 10px 14px; background: #4f46e5; color: white; text-decoration: none; border-radius: 8px;\">Open research</a>"
-                    f"    </div>"
-                    f"    <div style=\"padding: 12px 24px; border-top: 1px solid #e5e7eb; color: #6b7280; font-size: 12px;\">"
-                    f"      <p style=\"margin: 0;\">You received this because you initiated background research.</p>"
-                    f"    </div>"
-                    f"  </div>"
-                    f"</div>"
-                )
-                email_service.send_email(email, subject, text_body, html_body)
+            subject = "New research finding available"
+            topic_part = f" on '{topic_name}'" if topic_name else ""
+            link = f"{config.FRONTEND_URL}/research-results?user={user_id}&topic={topic_id}"
+            text_body = (
+                f"Hello,\n\nA new background research finding{topic_part} is available.\n"
+                f"Finding ID: {result_id}\n"
+                f"Open the app to review: {link}\n\n"
+                f"— AI Research Assistant"
+            )
+            html_body = (
+                f"<div style=\"font-family: -apple-system, Segoe UI, Roboto, Arial, sans-serif; color: #111827;\">"
+                f"  <div style=\"max-width: 600px; margin: 0 auto; background: #ffffff; border-radius: 12px; border: 1px solid #e5e7eb; overflow: hidden;\">"
+                f"    <div style=\"padding: 20px 24px; background: linear-gradient(135deg,#f0f7ff,#eefdf5); border-bottom: 1px solid #e5e7eb;\">"
+                f"      <h2 style=\"margin: 0; font-size: 18px; color: #111827;\">New research finding{topic_part}</h2>"
+                f"      <p style=\"margin: 4px 0 0; color: #6b7280; font-size: 14px;\">Your background research just finished processing.</p>"
+                f"    </div>"
+                f"    <div style=\"padding: 20px 24px;\">"
+                f"      <p style=\"margin: 0 0 12px;\"><strong>Finding ID:</strong> {result_id}</p>"
+                f"      <a href=\"{link}\" style=\"display: inline-block; padding: 10px 14px; background: #4f46e5; color: white; text-decoration: none; border-radius: 8px;\">Open research</a>"
+                f"    </div>"
+                f"    <div style=\"padding: 12px 24px; border-top: 1px solid #e5e7eb; color: #6b7280; font-size: 12px;\">"
+                f"      <p style=\"margin: 0;\">You received this because you initiated background research.</p>"
+                f"    </div>"
+                f"  </div>"
+                f"</div>"
+            )
+            await NotificationService._queue_email(user_id, "new_research", subject, text_body, html_body)
         except Exception as exc:
             logger.warning(f"📧 Skipping email notification for new research due to error: {exc}")
     
@@ -159,44 +211,35 @@ class NotificationService:
         }
         await connection_manager.send_to_user(user_id, message)
 
-        # Also send email notification if the user has an email
+        # Also queue an email notification if the user has an email
         try:
-            async with SessionLocal() as session:
-                user_service = UserService()
-                try:
-                    user = await user_service.get_user(session, uuid.UUID(user_id), with_profile=True)
-                    email = user.profile.meta_data.get("email") if user.profile and user.profile.meta_data else None
-                except Exception:
-                    email = None
-            
-            if email:
-                subject = "Research update completed"
-                topic_part = f" for '{topic_name}'" if topic_name else ""
-                link = f"{config.FRONTEND_URL}/research-results?user={user_id}"
-                text_body = (
-                    f"Hello,\n\nYour background research{topic_part} has completed.\n"
-                    f"New findings: {results_count}.\n"
-                    f"Open the app to review: {link}\n\n"
-                    f"— AI Research Assistant"
-                )
-                html_body = (
-                    f"<div style=\"font-family: -apple-system, Segoe UI, Roboto, Arial, sans-serif; color: #111827;\">"
-                    f"  <div style=\"max-width: 600px; margin: 0 auto; background: #ffffff; border-radius: 12px; border: 1px solid #e5e7eb; overflow: hidden;\">"
-                    f"    <div style=\"padding: 20px 24px; background: linear-gradient(135deg,#f0f7ff,#eefdf5); border-bottom: 1px solid #e5e7eb;\">"
-                    f"      <h2 style=\"margin: 0; font-size: 18px; color: #111827;\">Research completed{topic_part}</h2>"
-                    f"      <p style=\"margin: 4px 0 0; color: #6b7280; font-size: 14px;\">We saved your latest findings.</p>"
-                    f"    </div>"
-                    f"    <div style=\"padding: 20px 24px;\">"
-                    f"      <p style=\"margin: 0 0 12px;\"><strong>New findings:</strong> {results_count}</p>"
-                    f"      <a href=\"{link}\" style=\"display: inline-block; padding: 10px 14px; background: #4f46e5; color: white; text-decoration: none; border-radius: 8px;\">Open research</a>"
-                    f"    </div>"
-                    f"    <div style=\"padding: 12px 24px; border-top: 1px solid #e5e7eb; color: #6b7280; font-size: 12px;\">"
-                    f"      <p style=\"margin: 0;\">You received this because you initiated background research.</p>"
-                    f"    </div>"
-                    f"  </div>"
-                    f"</div>"
-                )
-                email_service.send_email(email, subject, text_body, html_body)
+            subject = "Research update completed"
+            topic_part = f" for '{topic_name}'" if topic_name else ""
+            link = f"{config.FRONTEND_URL}/research-results?user={user_id}"
+            text_body = (
+                f"Hello,\n\nYour background research{topic_part} has completed.\n"
+                f"New findings: {results_count}.\n"
+                f"Open the app to review: {link}\n\n"
+                f"— AI Research Assistant"
+            )
+            html_body = (
+                f"<div style=\"font-family: -apple-system, Segoe UI, Roboto, Arial, sans-serif; color: #111827;\">"
+                f"  <div style=\"max-width: 600px; margin: 0 auto; background: #ffffff; border-radius: 12px; border: 1px solid #e5e7eb; overflow: hidden;\">"
+                f"    <div style=\"padding: 20px 24px; background: linear-gradient(135deg,#f0f7ff,#eefdf5); border-bottom: 1px solid #e5e7eb;\">"
+                f"      <h2 style=\"margin: 0; font-size: 18px; color: #111827;\">Research completed{topic_part}</h2>"
+                f"      <p style=\"margin: 4px 0 0; color: #6b7280; font-size: 14px;\">We saved your latest findings.</p>"
+                f"    </div>"
+                f"    <div style=\"padding: 20px 24px;\">"
+                f"      <p style=\"margin: 0 0 12px;\"><strong>New findings:</strong> {results_count}</p>"
+                f"      <a href=\"{link}\" style=\"display: inline-block; padding: 10px 14px; background: #4f46e5; color: white; text-decoration: none; border-radius: 8px;\">Open research</a>"
+                f"    </div>"
+                f"    <div style=\"padding: 12px 24px; border-top: 1px solid #e5e7eb; color: #6b7280; font-size: 12px;\">"
+                f"      <p style=\"margin: 0;\">You received this because you initiated background research.</p>"
+                f"    </div>"
+                f"  </div>"
+                f"</div>"
+            )
+            await NotificationService._queue_email(user_id, "research_complete", subject, text_body, html_body)
         except Exception as exc:
             logger.warning(f"📧 Skipping email notification due to error: {exc}")
     
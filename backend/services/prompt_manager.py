@@ -85,6 +85,7 @@ class PromptManager:
             'PERPLEXITY_SYSTEM_PROMPT': 'System prompt for web search functionality',
             'INTEGRATOR_SYSTEM_PROMPT': 'Integrates information from multiple sources into coherent responses',
             'RESPONSE_RENDERER_SYSTEM_PROMPT': 'Formats and styles responses according to user preferences',
+            'FUSED_RESPONSE_FORMAT_PROMPT': 'Formatting instructions for single-pass integration and rendering',
             'TOPIC_EXTRACTOR_SYSTEM_PROMPT': 'Extracts research-worthy topics from conversations',
             'RESEARCH_QUERY_GENERATION_PROMPT': 'Generates optimized queries for autonomous research',
             'RESEARCH_FINDINGS_QUALITY_ASSESSMENT_PROMPT': 'Assesses quality of research findings'
@@ -233,7 +234,7 @@ class PromptManager:
                     'SEARCH_CONTEXT_TEMPLATE', 'ANALYSIS_CONTEXT_TEMPLATE', 
                     'MEMORY_CONTEXT_TEMPLATE', 'EXISTING_TOPICS_TEMPLATE'
                 ],
-                'Response renderer prompts': ['RESPONSE_RENDERER_SYSTEM_PROMPT'],
+                'Response renderer prompts': ['RESPONSE_RENDERER_SYSTEM_PROMPT', 'FUSED_RESPONSE_FORMAT_PROMPT'],
                 'Autonomous Research Engine prompts': [
                     'RESEARCH_QUERY_GENERATION_PROMPT', 'RESEARCH_FINDINGS_QUALITY_ASSESSMENT_PROMPT',
                     'RESEARCH_FINDINGS_DEDUPLICATION_PROMPT'
@@ -0,0 +1,229 @@
+"""
+Cross-worker publish/subscribe for status streams and notifications.
+
+Status queues and notification websockets live in the worker process that accepted
+the client connection, while the chat request or research job producing the update
+may run in another worker. Producers call ``PubSub.publish(topic, message)``; every
+worker's handlers registered with ``PubSub.subscribe(topic, handler)`` receive it and
+deliver to their local connections.
+
+Backends (``PUBSUB_BACKEND``):
+
+- ``memory``: dispatches in-process; single-worker deployments and tests.
+- ``postgres``: ``pg_notify`` on publish and one ``LISTEN`` connection per worker,
+  so any worker can reach clients connected to any other worker.
+
+Handlers for a message run concurrently, each bounded by ``PUBSUB_DELIVERY_TIMEOUT``.
+Handlers only hand messages to per-connection buffers (status channels, per-socket
+notification queues) and never wait on a client, so one slow client cannot hold up
+delivery to the others, including on the serial Postgres delivery loop.
+"""
+
+import asyncio
+import json
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import config
+from services.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+STATUS_TOPIC = "status"
+NOTIFICATION_TOPIC = "notifications"
+ROUTER_EXAMPLES_TOPIC = "router_examples"
+
+# pg_notify payloads must stay below 8000 bytes
+MAX_NOTIFY_PAYLOAD = 7900
+# Delay before re-establishing a dropped LISTEN connection
+RECONNECT_DELAY_SECONDS = 2.0
+
+Handler = Callable[[Dict[str, Any]], Awaitable[None]]
+Dispatch = Callable[[str, Dict[str, Any]], Awaitable[None]]
+
+
+class InMemoryBackend:
+    """Delivers messages to the handlers of this process only."""
+
+    name = "memory"
+
+    def __init__(self) -> None:
+        self._dispatch: Optional[Dispatch] = None
+
+    async def start(self, dispatch: Dispatch) -> None:
+        self._dispatch = dispatch
+
+    async def publish(self, topic: str, message: Dict[str, Any]) -> None:
+        await self._dispatch(topic, message)
+
+    async def stop(self) -> None:
+        self._dispatch = None
+
+
+class PostgresBackend:
+    """Fans messages out to every worker through Postgres LISTEN/NOTIFY."""
+
+    name = "postgres"
+
+    def __init__(self, topics: List[str]) -> None:
+        self.topics = topics
+        self._dispatch: Optional[Dispatch] = None
+        self._inbox: asyncio.Queue = asyncio.Queue()
+        self._tasks: List[asyncio.Task] = []
+
+    def channel(self, topic: str) -> str:
+        return f"{config.PUBSUB_CHANNEL_PREFIX}_{topic}"
+
+    async def start(self, dispatch: Dispatch) -> None:
+        self._dispatch = dispatch
+        self._tasks = [
+            asyncio.create_task(self._listen_forever()),
+            asyncio.create_task(self._deliver_forever()),
+        ]
+
+    async def publish(self, topic: str, message: Dict[str, Any]) -> None:
+        from sqlalchemy import func, select
+        from db import engine
+
+        payload = json.dumps(message, default=str)
+        if len(payload.encode()) > MAX_NOTIFY_PAYLOAD:
+            logger.error(f"📣 PubSub: Dropped oversized {topic} message ({len(payload)} chars)")
+            return
+        async with engine.connect() as conn:
+            await conn.execute(select(func.pg_notify(self.channel(topic), payload)))
+            await conn.commit()
+
+    def _on_notify(self, connection, pid, channel: str, payload: str) -> None:
+        # asyncpg callback; hand off to the delivery task so messages stay in order
+        self._inbox.put_nowait((channel, payload))
+
+    async def _deliver_forever(self) -> None:
+        topics = {self.channel(topic): topic for topic in self.topics}
+        while True:
+            channel, payload = await self._inbox.get()
+            topic = topics.get(channel)
+            if topic is None:
+                continue
+            try:
+                message = json.loads(payload)
+            except ValueError:
+                logger.warning(f"📣 PubSub: Ignoring malformed payload on {channel}")
+                continue
+            await self._dispatch(topic, message)
+
+    async def _listen_forever(self) -> None:
+        from db import engine
+
+        while True:
+            closed = asyncio.Event()
+            try:
+                async with engine.connect() as conn:
+                    raw = await conn.get_raw_connection()
+                    listener = raw.driver_connection
+                    listener.add_termination_listener(lambda _: closed.set())
+                    for topic in self.topics:
+                        await listener.add_listener(self.channel(topic), self._on_notify)
+                    logger.info(f"📣 PubSub: Listening on {', '.join(self.channel(t) for t in self.topics)}")
+                    await closed.wait()
+                logger.warning("📣 PubSub: LISTEN connection closed; reconnecting")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"📣 PubSub: LISTEN connection failed: {e}")
+            await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+
+class PubSub:
+    """Process-wide topic registry in front of the configured backend."""
+
+    # Identifies this worker in published messages
+    worker_id = uuid.uuid4().hex
+    _handlers: Dict[str, List[Handler]] = {}
+    _backend: Optional[Any] = None
+    _counters: Dict[str, int] = {}
+
+    @classmethod
+    def subscribe(cls, topic: str, handler: Handler) -> Callable[[], None]:
+        """Register a local handler for a topic; returns a function that removes it."""
+        cls._handlers.setdefault(topic, []).append(handler)
+
+        def unsubscribe() -> None:
+            handlers = cls._handlers.get(topic, [])
+            if handler in handlers:
+                handlers.remove(handler)
+
+        return unsubscribe
+
+    @classmethod
+    async def start(cls) -> None:
+        if cls._backend is not None:
+            return
+        if config.PUBSUB_BACKEND == "postgres":
+            backend = PostgresBackend([STATUS_TOPIC, NOTIFICATION_TOPIC, ROUTER_EXAMPLES_TOPIC])
+        else:
+            backend = InMemoryBackend()
+        cls._backend = backend
+        await backend.start(cls._dispatch)
+        logger.info(f"📣 PubSub: Using {backend.name} backend (worker {cls.worker_id[:8]})")
+
+    @classmethod
+    async def stop(cls) -> None:
+        backend, cls._backend = cls._backend, None
+        if backend is not None:
+            await backend.stop()
+
+    @classmethod
+    async def publish(cls, topic: str, message: Dict[str, Any]) -> None:
+        """Publish a JSON-serializable message to every worker's handlers for ``topic``."""
+        if cls._backend is None:
+            await cls.start()
+        message = {**message, "origin": cls.worker_id}
+        cls._count("published")
+        try:
+            await cls._backend.publish(topic, message)
+        except Exception as e:
+            cls._count("publish_errors")
+            logger.error(f"📣 PubSub: Failed to publish {topic} message: {e}")
+
+    @classmethod
+    async def _dispatch(cls, topic: str, message: Dict[str, Any]) -> None:
+        handlers = list(cls._handlers.get(topic, []))
+        await asyncio.gather(*(cls._call(topic, handler, message) for handler in handlers))
+
+    @classmethod
+    async def _call(cls, topic: str, handler: Handler, message: Dict[str, Any]) -> None:
+        cls._count("delivered")
+        try:
+            await asyncio.wait_for(handler(message), timeout=config.PUBSUB_DELIVERY_TIMEOUT)
+        except asyncio.TimeoutError:
+            cls._count("delivery_timeouts")
+            logger.warning(f"📣 PubSub: {topic} handler exceeded {config.PUBSUB_DELIVERY_TIMEOUT}s")
+        except Exception as e:
+            cls._count("delivery_errors")
+            logger.error(f"📣 PubSub: {topic} handler failed: {e}")
+
+    @classmethod
+    def is_local(cls, message: Dict[str, Any]) -> bool:
+        """Whether the message was published by this worker."""
+        return message.get("origin") == cls.worker_id
+
+    @classmethod
+    def _count(cls, name: str) -> None:
+        cls._counters[name] = cls._counters.get(name, 0) + 1
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, Any]:
+        return {
+            "backend": cls._backend.name if cls._backend else None,
+            "worker_id": cls.worker_id,
+            "subscriptions": {topic: len(handlers) for topic, handlers in cls._handlers.items()},
+            **{name: cls._counters.get(name, 0) for name in (
+                "published", "publish_errors", "delivered", "delivery_timeouts", "delivery_errors"
+            )},
+        }
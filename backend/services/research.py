@@ -1,9 +1,11 @@
+import time
 import uuid
 from typing import TypedDict, Optional, Any
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_, delete, func, exists
 
 from db import SessionLocal
+from database.motivation_repository import MotivationRepository
 from services.logging_config import get_logger
 from exceptions import NotFound, AlreadyExist
 from models import ResearchFinding, ResearchTopic
@@ -104,6 +106,15 @@ class ResearchService:
                 session.add(finding)
                 await session.flush()
 
+                quality_score = finding_data.get("quality_score")
+                await MotivationRepository(session).apply_finding_delta(
+                    uuid.UUID(str(user_id)),
+                    uuid.UUID(str(topic_id)),
+                    total=1,
+                    quality_sum=quality_score or 0.0,
+                    quality_count=1 if quality_score is not None else 0,
+                )
+
             return True, finding.id
         except Exception as e:
             logger.error(f"Error storing research finding for user {user_id}, topic '{topic_name}': {str(e)}")
@@ -146,6 +157,8 @@ class ResearchService:
 
                     deleted_topics = res.rowcount
 
+                    await MotivationRepository(session).recompute_engagement_aggregates(list(touched_topic_ids))
+
             logger.info(
                 f"Cleanup done. Deleted findings: {deleted_findings}, deleted topics: {deleted_topics}, touched topics: {len(touched_topic_ids)}",
             )
@@ -178,6 +191,9 @@ class ResearchService:
             raise AlreadyExist("Research finding is already in this state")
 
         finding.read = True
+        await MotivationRepository(session).apply_finding_delta(
+            user_id, finding.topic_id, read=1, last_read_at=time.time()
+        )
 
         await session.commit()
 
@@ -203,6 +219,9 @@ class ResearchService:
             raise AlreadyExist("Research finding is already in this state")
 
         finding.bookmarked = bookmarked
+        await MotivationRepository(session).apply_finding_delta(
+            user_id, finding.topic_id, bookmarked=1 if bookmarked else -1
+        )
 
         await session.commit()
 
@@ -217,16 +236,33 @@ class ResearchService:
         query = (
             delete(ResearchFinding)
             .where(and_(ResearchFinding.id == finding_id, ResearchFinding.user_id == user_id))
-            .returning(ResearchFinding.id)
+            .returning(
+                ResearchFinding.topic_id,
+                ResearchFinding.read,
+                ResearchFinding.bookmarked,
+                ResearchFinding.integrated,
+                ResearchFinding.quality_score,
+            )
         )
 
         res = await session.execute(query)
 
-        deleted_id = res.scalar_one_or_none()
+        deleted = res.one_or_none()
 
-        if deleted_id is None:
+        if deleted is None:
             raise NotFound("Research finding not found")
 
+        await MotivationRepository(session).apply_finding_delta(
+            user_id,
+            deleted.topic_id,
+            total=-1,
+            read=-int(deleted.read),
+            bookmarked=-int(deleted.bookmarked),
+            integrated=-int(deleted.integrated),
+            quality_sum=-(deleted.quality_score or 0.0),
+            quality_count=-1 if deleted.quality_score is not None else 0,
+        )
+
         await session.commit()
 
     async def delete_all_topic_findings(
@@ -243,9 +279,11 @@ class ResearchService:
 
         res = await session.execute(query)
 
-        deleted_id = res.scalar_one_or_none()
+        deleted_ids = res.scalars().all()
 
-        if deleted_id is None:
+        if not deleted_ids:
             raise NotFound("Research finding not found")
 
+        await MotivationRepository(session).recompute_engagement_aggregates([topic_id])
+
         await session.commit()
@@ -0,0 +1,177 @@
+"""
+Concurrent scheduler for the motivation research cycle.
+
+The cycle used to research one topic at a time, user after user, so a few hundred
+users with active topics took hours per cycle. ``ResearchScheduler.run`` executes
+the cycle's research jobs on a bounded pool of workers:
+
+- at most ``RESEARCH_MAX_CONCURRENCY`` jobs run at once;
+- jobs are dispatched round-robin across users, and one user never has more than
+  ``RESEARCH_MAX_CONCURRENCY_PER_USER`` jobs running, so a user with many topics
+  cannot starve the others;
+- upstream request rates are bounded separately by ``services.upstream_budget``.
+
+Queue depth and throughput counters are exposed through ``get_stats``.
+"""
+
+import asyncio
+import time
+from collections import Counter, OrderedDict, deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+import config
+from services.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class ResearchJob:
+    user_id: str
+    name: str
+    run: Callable[[], Awaitable[Any]]
+
+
+class ResearchScheduler:
+    """Runs a batch of research jobs with a global and a per-user concurrency limit."""
+
+    _queued = 0
+    _running = 0
+    _totals: Dict[str, float] = {}
+    _last_cycle: Dict[str, Any] = {}
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        max_per_user: Optional[int] = None,
+        job_delay: float = 0.0,
+    ):
+        self.max_concurrency = max(1, max_concurrency or config.RESEARCH_MAX_CONCURRENCY)
+        self.max_per_user = max(1, max_per_user or config.RESEARCH_MAX_CONCURRENCY_PER_USER)
+        # Pause a worker takes after each job before picking up the next one
+        self.job_delay = job_delay
+
+    async def run(self, jobs: List[ResearchJob]) -> List[Any]:
+        """Run all jobs and return their results in job order.
+
+        A job that raises yields its exception in place of a result.
+        """
+        results: List[Any] = [None] * len(jobs)
+        if not jobs:
+            return results
+
+        queues: "OrderedDict[str, Deque[Tuple[int, ResearchJob, float]]]" = OrderedDict()
+        enqueued_at = time.monotonic()
+        for index, job in enumerate(jobs):
+            queues.setdefault(job.user_id, deque()).append((index, job, enqueued_at))
+        rotation: Deque[str] = deque(queues.keys())
+        running: Counter = Counter()
+        remaining = [len(jobs)]
+        changed = asyncio.Condition()
+        cycle = {"completed": 0, "failed": 0, "queue_wait": 0.0}
+
+        ResearchScheduler._queued += len(jobs)
+
+        def next_job() -> Optional[Tuple[int, ResearchJob, float]]:
+            # Next user in rotation with queued work and a free per-user slot
+            for _ in range(len(rotation)):
+                user_id = rotation[0]
+                rotation.rotate(-1)
+                queue = queues[user_id]
+                if queue and running[user_id] < self.max_per_user:
+                    item = queue.popleft()
+                    if not queue:
+                        rotation.pop()
+                    return item
+            return None
+
+        async def worker() -> None:
+            while True:
+                async with changed:
+                    while True:
+                        if remaining[0] == 0:
+                            return
+                        item = next_job()
+                        if item is not None:
+                            break
+                        await changed.wait()
+                    remaining[0] -= 1
+
+                index, job, queued_since = item
+                running[job.user_id] += 1
+                ResearchScheduler._queued -= 1
+                ResearchScheduler._running += 1
+                cycle["queue_wait"] += time.monotonic() - queued_since
+                try:
+                    results[index] = await job.run()
+                    cycle["completed"] += 1
+                except Exception as e:
+                    logger.error(f"🗓️ Research scheduler: Job '{job.name}' for user {job.user_id} failed: {e}")
+                    results[index] = e
+                    cycle["failed"] += 1
+                finally:
+                    running[job.user_id] -= 1
+                    ResearchScheduler._running -= 1
+                    async with changed:
+                        changed.notify_all()
+
+                if self.job_delay > 0:
+                    await asyncio.sleep(self.job_delay)
+
+        workers = min(self.max_concurrency, len(jobs))
+        logger.info(
+            f"🗓️ Research scheduler: {len(jobs)} jobs for {len(queues)} users on {workers} workers "
+            f"(max {self.max_per_user} per user)"
+        )
+        started = time.monotonic()
+        try:
+            await asyncio.gather(*(worker() for _ in range(workers)))
+        finally:
+            # Jobs never started (cancelled cycle) no longer count as queued
+            ResearchScheduler._queued -= remaining[0]
+            self._record_cycle(len(jobs), len(queues), workers, time.monotonic() - started, cycle)
+
+        return results
+
+    @classmethod
+    def _record_cycle(cls, jobs: int, users: int, workers: int, duration: float, cycle: Dict[str, Any]) -> None:
+        done = cycle["completed"] + cycle["failed"]
+        cls._last_cycle = {
+            "jobs": jobs,
+            "users": users,
+            "workers": workers,
+            "completed": cycle["completed"],
+            "failed": cycle["failed"],
+            "duration_seconds": round(duration, 2),
+            "throughput_per_minute": round(done / duration * 60, 2) if duration > 0 else 0.0,
+            "avg_queue_wait_seconds": round(cycle["queue_wait"] / done, 2) if done else 0.0,
+            "finished_at": time.time(),
+        }
+        totals = cls._totals
+        totals["cycles"] = totals.get("cycles", 0) + 1
+        totals["completed"] = totals.get("completed", 0) + cycle["completed"]
+        totals["failed"] = totals.get("failed", 0) + cycle["failed"]
+        totals["busy_seconds"] = totals.get("busy_seconds", 0.0) + duration
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, Any]:
+        totals = cls._totals
+        done = totals.get("completed", 0) + totals.get("failed", 0)
+        busy = totals.get("busy_seconds", 0.0)
+        return {
+            "max_concurrency": config.RESEARCH_MAX_CONCURRENCY,
+            "max_per_user": config.RESEARCH_MAX_CONCURRENCY_PER_USER,
+            "queue_depth": cls._queued,
+            "running": cls._running,
+            "cycles": int(totals.get("cycles", 0)),
+            "completed": int(totals.get("completed", 0)),
+            "failed": int(totals.get("failed", 0)),
+            "throughput_per_minute": round(done / busy * 60, 2) if busy > 0 else 0.0,
+            "last_cycle": dict(cls._last_cycle),
+        }
+
+    @classmethod
+    def reset_stats(cls) -> None:
+        cls._totals = {}
+        cls._last_cycle = {}
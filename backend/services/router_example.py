@@ -0,0 +1,38 @@
+from __future__ import annotations
+from typing import List, Optional
+from uuid import UUID
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.router_example import RouterExample
+from exceptions import NotFound
+
+
+class RouterExampleService:
+    async def get_all_examples(self, session: AsyncSession) -> List[RouterExample]:
+        res = await session.execute(select(RouterExample).order_by(RouterExample.created_at))
+        return list(res.scalars().all())
+
+    async def add_example(
+        self,
+        session: AsyncSession,
+        text: str,
+        intent: str,
+        sources: List[str],
+        admin_user_id: Optional[UUID] = None,
+    ) -> RouterExample:
+        example = RouterExample(text=text, intent=intent, sources=sources, created_by_user_id=admin_user_id)
+        session.add(example)
+        await session.commit()
+        await session.refresh(example)
+
+        return example
+
+    async def delete_example(self, session: AsyncSession, example_id: UUID) -> None:
+        example = await session.get(RouterExample, example_id)
+
+        if not example:
+            raise NotFound(f"Router example '{example_id}' not found")
+
+        await session.delete(example)
+        await session.commit()
@@ -2,24 +2,37 @@
 Search service classes for handling different search sources.
 """
 
+import asyncio
+import copy
 from abc import ABC, abstractmethod
 from typing import Dict, Any, List, Optional
-import requests
+import httpx
 
 import config
 from utils.helpers import get_last_user_message, get_current_datetime_str
+from utils.openalex import reconstruct_abstract
 from services.prompt_cache import PromptCache
 from services.user import UserService
+from services.http_client import http_get, http_post
+from services.search_cache import SearchCache, SearchFetch
+from services.single_flight import SingleFlight
+from services.upstream_budget import UpstreamBudgets, OPENALEX, PERPLEXITY, PUBMED
 from services.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Identical concurrent searches (same cache key) share one upstream request
+search_flight = SingleFlight("search")
+
 
 class BaseSearchService(ABC):
     """Base class for all search services."""
     
-    def __init__(self, source_name: str):
+    def __init__(self, source_name: str, cache_ttl: int = 0, upstream: Optional[str] = None):
         self.source_name = source_name
+        self.cache_ttl = cache_ttl
+        # Request budget (services.upstream_budget) charged for each upstream fetch
+        self.upstream = upstream
     
     @abstractmethod
     async def search(self, state: Dict[str, Any]) -> Dict[str, Any]:
@@ -50,6 +63,35 @@ class BaseSearchService(ABC):
         original_query = get_last_user_message(state.get("messages", []))
         return original_query
     
+    async def _cached_search(
+        self,
+        query: str,
+        fetch: SearchFetch,
+        recency_filter: Optional[str] = None,
+        search_mode: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Serve ``fetch()`` through the shared search cache, coalescing identical in-flight searches."""
+        key = SearchCache.make_key(self.source_name, query, recency_filter, search_mode)
+        if self.upstream:
+            fetch = self._budgeted(fetch)
+        return await search_flight.do(
+            key,
+            lambda: SearchCache.get_or_fetch(
+                self.source_name, query, fetch, self.cache_ttl, recency_filter=recency_filter, search_mode=search_mode
+            ),
+            # Downstream nodes filter results in place, so each waiter gets its own copy
+            share=copy.deepcopy,
+        )
+
+    def _budgeted(self, fetch: SearchFetch) -> SearchFetch:
+        """Wrap ``fetch`` so that only real upstream calls (not cache hits) use the budget."""
+
+        async def run() -> Dict[str, Any]:
+            await UpstreamBudgets.acquire(self.upstream)
+            return await fetch()
+
+        return run
+
     def _log_search_start(self, query: str):
         """Log the start of a search operation."""
         display_msg = query[:75] + "..." if len(query) > 75 else query
@@ -60,7 +102,7 @@ class PerplexitySearchService(BaseSearchService):
     """Service for Perplexity web search."""
     
     def __init__(self):
-        super().__init__("Search")
+        super().__init__("Search", cache_ttl=config.SEARCH_CACHE_TTL_WEB, upstream=PERPLEXITY)
         self.user_service = UserService()
     
     def validate_config(self) -> bool:
@@ -108,12 +150,6 @@ class PerplexitySearchService(BaseSearchService):
             
             search_recency_filter = source_preferences.get("recency_preference")
             
-            # Build request
-            headers = {
-                "Authorization": f"Bearer {config.PERPLEXITY_API_KEY}",
-                "Content-Type": "application/json"
-            }
-            
             web_search_options = {}
             research_depth = content_preferences.get("research_depth", "moderate")
             if research_depth == "comprehensive":
@@ -121,58 +157,14 @@ class PerplexitySearchService(BaseSearchService):
                 web_search_options["return_images"] = False
                 web_search_options["return_citations"] = True
             
-            perplexity_system_prompt = PromptCache.get("PERPLEXITY_SYSTEM_PROMPT").format(current_time=get_current_datetime_str())
-            perplexity_messages = [
-                {"role": "system", "content": perplexity_system_prompt},
-                {"role": "user", "content": query},
-            ]
-
-            payload = {
-                "model": config.PERPLEXITY_MODEL, 
-                "messages": perplexity_messages, 
-                "stream": False,
-                "search_mode": search_mode,
-                "web_search_options": web_search_options
-            }
-            
-            if search_recency_filter:
-                payload["search_recency_filter"] = search_recency_filter
-
-            # Make API request
-            response = requests.post("https://api.perplexity.ai/chat/completions", 
-                                   headers=headers, json=payload, timeout=30)
+            # Recency filter and related-question options change the answer, so they are part of the key
+            return await self._cached_search(
+                query,
+                lambda: self._fetch(query, search_mode, search_recency_filter, web_search_options),
+                recency_filter=search_recency_filter,
+                search_mode=f"{search_mode}+related" if web_search_options else search_mode,
+            )
 
-            if response.status_code == 200:
-                response_data = response.json()
-                search_result = response_data["choices"][0]["message"]["content"]
-                citations = response_data.get("citations", [])
-                search_results = response_data.get("search_results", [])
-
-                # Log results
-                display_result = search_result[:75] + "..." if len(search_result) > 75 else search_result
-                logger.info(f'🔍 {self.source_name}: ✅ Result received: "{display_result}"')
-                if citations:
-                    logger.info(f"🔍 {self.source_name}: ✅ Found {len(citations)} citations")
-                if search_results:
-                    logger.info(f"🔍 {self.source_name}: ✅ Found {len(search_results)} search result sources")
-
-                return {
-                    "success": True,
-                    "result": search_result,
-                    "query_used": query,
-                    "citations": citations,
-                    "search_results": search_results,
-                    "source": self.source_name
-                }
-            else:
-                error_message = f"Perplexity API request failed with status code {response.status_code}: {response.text}"
-                logger.error(f"🔍 {self.source_name}: ❌ {error_message}")
-                return {
-                    "success": False,
-                    "error": error_message,
-                    "source": self.source_name
-                }
-                
         except Exception as e:
             error_message = f"Perplexity search error: {str(e)}"
             logger.error(f"🔍 {self.source_name}: ❌ Exception: {error_message}")
@@ -182,6 +174,72 @@ class PerplexitySearchService(BaseSearchService):
                 "source": self.source_name
             }
     
+    async def _fetch(
+        self,
+        query: str,
+        search_mode: str,
+        search_recency_filter: Optional[str],
+        web_search_options: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Call the Perplexity API for a single query."""
+        # Build request
+        headers = {
+            "Authorization": f"Bearer {config.PERPLEXITY_API_KEY}",
+            "Content-Type": "application/json"
+        }
+        
+        perplexity_system_prompt = PromptCache.get("PERPLEXITY_SYSTEM_PROMPT").format(current_time=get_current_datetime_str())
+        perplexity_messages = [
+            {"role": "system", "content": perplexity_system_prompt},
+            {"role": "user", "content": query},
+        ]
+
+        payload = {
+            "model": config.PERPLEXITY_MODEL, 
+            "messages": perplexity_messages, 
+            "stream": False,
+            "search_mode": search_mode,
+            "web_search_options": web_search_options
+        }
+        
+        if search_recency_filter:
+            payload["search_recency_filter"] = search_recency_filter
+
+        # Make API request
+        response = await http_post("https://api.perplexity.ai/chat/completions",
+                                   headers=headers, json=payload, timeout=30)
+
+        if response.status_code == 200:
+            response_data = response.json()
+            search_result = response_data["choices"][0]["message"]["content"]
+            citations = response_data.get("citations", [])
+            search_results = response_data.get("search_results", [])
+
+            # Log results
+            display_result = search_result[:75] + "..." if len(search_result) > 75 else search_result
+            logger.info(f'🔍 {self.source_name}: ✅ Result received: "{display_result}"')
+            if citations:
+                logger.info(f"🔍 {self.source_name}: ✅ Found {len(citations)} citations")
+            if search_results:
+                logger.info(f"🔍 {self.source_name}: ✅ Found {len(search_results)} search result sources")
+
+            return {
+                "success": True,
+                "result": search_result,
+                "query_used": query,
+                "citations": citations,
+                "search_results": search_results,
+                "source": self.source_name
+            }
+        else:
+            error_message = f"Perplexity API request failed with status code {response.status_code}: {response.text}"
+            logger.error(f"🔍 {self.source_name}: ❌ {error_message}")
+            return {
+                "success": False,
+                "error": error_message,
+                "source": self.source_name
+            }
+
     async def _get_source_preferences(self, user_id: str) -> dict:
         """Get user's source preferences from personalization context."""
         if not user_id:
@@ -215,7 +273,7 @@ class OpenAlexSearchService(BaseSearchService):
     """Service for OpenAlex academic search."""
     
     def __init__(self):
-        super().__init__("Academic Search")
+        super().__init__("Academic Search", cache_ttl=config.SEARCH_CACHE_TTL_ACADEMIC, upstream=OPENALEX)
         self.base_url = "https://api.openalex.org"
         self.headers = {
             "User-Agent": "ResearcherPrototype/1.0 (mailto:researcher@example.com)"
@@ -244,6 +302,10 @@ class OpenAlexSearchService(BaseSearchService):
         
         self._log_search_start(query)
         
+        return await self._cached_search(query, lambda: self._fetch(query))
+
+    async def _fetch(self, query: str) -> Dict[str, Any]:
+        """Run the OpenAlex search and format the results."""
         try:
             search_results = await self._search_openalex(query, limit=10)
             
@@ -290,101 +352,15 @@ class OpenAlexSearchService(BaseSearchService):
                 "error": error_message,
                 "source": self.source_name
             }
-    
+
     async def _search_openalex(self, query: str, limit: int = 10) -> Dict[str, Any]:
         """Execute OpenAlex search with smart query strategy."""
         try:
-            # Improved search strategy matching the working node version
-            # 1. Try title search for high precision
-            title_params = {
-                "filter": f"title.search:{query},type:article,is_retracted:false",
-                "per-page": min(limit, 200),
-                "sort": "relevance_score:desc",
-                "select": "id,title,display_name,publication_year,publication_date,doi,cited_by_count,abstract_inverted_index,authorships,primary_location,open_access,type"
-            }
-            
-            title_response = requests.get(f"{self.base_url}/works", 
-                                        params=title_params, 
-                                        headers=self.headers, 
-                                        timeout=30)
-            
-            if title_response.status_code == 200:
-                title_data = title_response.json()
-                title_results = title_data.get("results", [])
-                
-                # If title search yields insufficient results, supplement with abstract search
-                if len(title_results) < limit // 2 and len(title_results) < 10:
-                    abstract_params = {
-                        "filter": f"abstract.search:{query},type:article,is_retracted:false",
-                        "per-page": min(limit - len(title_results), 200),
-                        "sort": "relevance_score:desc",
-                        "select": "id,title,display_name,publication_year,publication_date,doi,cited_by_count,abstract_inverted_index,authorships,primary_location,open_access,type"
-                    }
-                    
-                    try:
-                        abstract_response = requests.get(f"{self.base_url}/works", 
-                                                       params=abstract_params, 
-                                                       headers=self.headers, 
-                                                       timeout=30)
-                        
-                        if abstract_response.status_code == 200:
-                            abstract_data = abstract_response.json()
-                            abstract_results = abstract_data.get("results", [])
-                            
-                            # Deduplicate by ID and combine results
-                            title_ids = {work.get("id") for work in title_results if work is not None and work.get("id")}
-                            unique_abstract_works = [work for work in abstract_results if work is not None and work.get("id") not in title_ids]
-                            
-                            title_results = title_results + unique_abstract_works
-                    except Exception:
-                        # Keep title results only on any error
-                        pass
-                
-                # If still insufficient results, try general search as final fallback
-                if len(title_results) < limit // 3 and len(title_results) < 5:
-                    general_params = {
-                        "search": query,
-                        "filter": "type:article,is_retracted:false",
-                        "per-page": min(limit - len(title_results), 200),
-                        "sort": "relevance_score:desc",
-                        "select": "id,title,display_name,publication_year,publication_date,doi,cited_by_count,abstract_inverted_index,authorships,primary_location,open_access,type"
-                    }
-                    
-                    try:
-                        general_response = requests.get(f"{self.base_url}/works", 
-                                                      params=general_params, 
-                                                      headers=self.headers, 
-                                                      timeout=30)
-                        
-                        if general_response.status_code == 200:
-                            general_data = general_response.json()
-                            general_results = general_data.get("results", [])
-                            
-                            # Deduplicate and combine with existing results
-                            existing_ids = {work.get("id") for work in title_results if work is not None and work.get("id")}
-                            unique_general_works = [work for work in general_results if work is not None and work.get("id") not in existing_ids]
-                            
-                            title_results = title_results + unique_general_works
-                    except Exception:
-                        # Keep existing results on any error
-                        pass
-                
-                # Reconstruct and store abstracts in results for downstream use
-                for work in title_results:
-                    if work is not None:
-                        abstract_inverted = work.get("abstract_inverted_index", {})
-                        if abstract_inverted:
-                            reconstructed_abstract = self._reconstruct_abstract(abstract_inverted)
-                            if reconstructed_abstract:
-                                work["abstract"] = reconstructed_abstract
-                
-                return {
-                    "success": True,
-                    "results": title_results[:limit],
-                    "search_strategy": "enhanced_multi_stage"
-                }
-                
-        except requests.exceptions.Timeout:
+            if config.OPENALEX_SEARCH_MODE == "parallel":
+                search_results = await self._search_parallel(query, limit)
+            else:
+                search_results = await self._search_sequential(query, limit)
+        except httpx.TimeoutException:
             return {
                 "success": False,
                 "error": "OpenAlex API request timed out"
@@ -394,28 +370,186 @@ class OpenAlexSearchService(BaseSearchService):
                 "success": False,
                 "error": f"Error searching OpenAlex: {str(e)}"
             }
-    
-    def _reconstruct_abstract(self, abstract_inverted_index: Dict[str, Any]) -> str:
-        """Reconstruct abstract text from OpenAlex inverted index format."""
-        if not abstract_inverted_index:
-            return ""
-        
+
+        if search_results.get("success"):
+            # Reconstruct abstracts only for the works that survived the limit
+            for work in search_results["results"]:
+                abstract_inverted = work.get("abstract_inverted_index", {})
+                if abstract_inverted:
+                    reconstructed_abstract = self._reconstruct_abstract(abstract_inverted, work.get("id"))
+                    if reconstructed_abstract:
+                        work["abstract"] = reconstructed_abstract
+        return search_results
+
+    def _works_params(self, stage: str, query: str, per_page: int) -> Dict[str, Any]:
+        """Query parameters for one stage of the title → abstract → general strategy."""
+        params = {
+            "per-page": min(per_page, 200),
+            "sort": "relevance_score:desc",
+            "select": "id,title,display_name,publication_year,publication_date,doi,cited_by_count,abstract_inverted_index,authorships,primary_location,open_access,type"
+        }
+        if stage == "general":
+            params["search"] = query
+            params["filter"] = "type:article,is_retracted:false"
+        else:
+            params["filter"] = f"{stage}.search:{query},type:article,is_retracted:false"
+        return params
+
+    async def _fetch_works(self, stage: str, query: str, per_page: int) -> Optional[List[Dict[str, Any]]]:
+        """Run one stage query; returns None when OpenAlex answers with an error status."""
+        response = await http_get(f"{self.base_url}/works",
+                                  params=self._works_params(stage, query, per_page),
+                                  headers=self.headers,
+                                  timeout=30)
+        if response.status_code != 200:
+            logger.debug(f"🔍 {self.source_name}: {stage} query failed with status {response.status_code}")
+            return None
+        return [work for work in response.json().get("results", []) if work is not None]
+
+    @staticmethod
+    def _merge_works(*stages: Optional[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """Concatenate stage results in priority order, dropping works already seen by id."""
+        merged = []
+        seen_ids = set()
+        for works in stages:
+            for work in works or []:
+                work_id = work.get("id")
+                if work_id and work_id in seen_ids:
+                    continue
+                if work_id:
+                    seen_ids.add(work_id)
+                merged.append(work)
+        return merged
+
+    @staticmethod
+    def _needs_abstract_stage(count: int, limit: int) -> bool:
+        return count < limit // 2 and count < 10
+
+    @staticmethod
+    def _needs_general_stage(count: int, limit: int) -> bool:
+        return count < limit // 3 and count < 5
+
+    async def _search_sequential(self, query: str, limit: int) -> Dict[str, Any]:
+        """Title search, then abstract and general searches only while results are insufficient."""
+        # 1. Try title search for high precision
+        title_results = await self._fetch_works("title", query, limit)
+        if title_results is None:
+            return {"success": False, "error": "OpenAlex API request failed"}
+
+        # If title search yields insufficient results, supplement with abstract search
+        if self._needs_abstract_stage(len(title_results), limit):
+            try:
+                abstract_results = await self._fetch_works("abstract", query, limit - len(title_results))
+                title_results = self._merge_works(title_results, abstract_results)
+            except Exception:
+                # Keep title results only on any error
+                pass
+
+        # If still insufficient results, try general search as final fallback
+        if self._needs_general_stage(len(title_results), limit):
+            try:
+                general_results = await self._fetch_works("general", query, limit - len(title_results))
+                title_results = self._merge_works(title_results, general_results)
+            except Exception:
+                # Keep existing results on any error
+                pass
+
+        return {
+            "success": True,
+            "results": title_results[:limit],
+            "search_strategy": "enhanced_multi_stage"
+        }
+
+    async def _search_parallel(self, query: str, limit: int) -> Dict[str, Any]:
+        """Run the title and abstract queries concurrently, hedged by a delayed general query.
+
+        Results are merged in the same title → abstract → general priority as the
+        sequential strategy, and outstanding queries are cancelled as soon as the
+        higher-priority stages already provide enough works.
+        """
+        loop = asyncio.get_running_loop()
+        tasks: Dict[str, asyncio.Task] = {
+            stage: asyncio.create_task(self._fetch_works(stage, query, limit))
+            for stage in ("title", "abstract")
+        }
+        stage_results: Dict[str, Optional[List[Dict[str, Any]]]] = {}
+        errors: List[Exception] = []
+        hedge_at = loop.time() + config.OPENALEX_HEDGE_DELAY
+
+        def start_general():
+            if config.OPENALEX_PARALLEL_GENERAL and "general" not in tasks:
+                tasks["general"] = asyncio.create_task(self._fetch_works("general", query, limit))
+
         try:
-            # Create list of (position, word) pairs
-            word_positions = []
-            for word, positions in abstract_inverted_index.items():
-                if positions:  # Make sure positions is not None/empty
-                    for pos in positions:
-                        if pos is not None:
-                            word_positions.append((pos, word))
-            
-            # Sort by position and reconstruct text
-            word_positions.sort()
-            reconstructed_text = " ".join([word for _, word in word_positions])
-            return reconstructed_text
-            
-        except Exception:
-            return ""
+            while True:
+                merged = self._decide_parallel(stage_results, limit)
+                if merged is not None:
+                    break
+
+                # Title and abstract are in but still too few works: the general query is needed now
+                if "title" in stage_results and "abstract" in stage_results:
+                    start_general()
+                elif loop.time() >= hedge_at:
+                    start_general()
+
+                pending = [task for task in tasks.values() if not task.done()]
+                if not pending:
+                    merged = self._merge_works(*(stage_results.get(s) for s in ("title", "abstract", "general")))
+                    break
+
+                timeout = None
+                if config.OPENALEX_PARALLEL_GENERAL and "general" not in tasks:
+                    timeout = max(0.0, hedge_at - loop.time())
+                await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+
+                for stage, task in tasks.items():
+                    if task.done() and stage not in stage_results:
+                        try:
+                            stage_results[stage] = task.result()
+                        except Exception as e:
+                            errors.append(e)
+                            stage_results[stage] = None
+        finally:
+            cancelled = [stage for stage, task in tasks.items() if not task.done()]
+            for stage in cancelled:
+                tasks[stage].cancel()
+            if cancelled:
+                logger.debug(f"🔍 {self.source_name}: Cancelled {cancelled} queries after enough results")
+
+        if not merged and all(stage_results.get(stage) is None for stage in tasks):
+            if any(isinstance(e, httpx.TimeoutException) for e in errors):
+                raise httpx.TimeoutException("All OpenAlex queries timed out")
+            return {"success": False, "error": "OpenAlex API request failed"}
+
+        return {
+            "success": True,
+            "results": merged[:limit],
+            "search_strategy": "parallel_multi_stage"
+        }
+
+    def _decide_parallel(
+        self, stage_results: Dict[str, Optional[List[Dict[str, Any]]]], limit: int
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Return the merged works once the completed stages are sufficient, else None."""
+        if "title" not in stage_results:
+            return None
+        title = stage_results["title"] or []
+        if not self._needs_abstract_stage(len(title), limit):
+            return title
+
+        if "abstract" not in stage_results:
+            return None
+        merged = self._merge_works(title, stage_results["abstract"])
+        if not self._needs_general_stage(len(merged), limit) or not config.OPENALEX_PARALLEL_GENERAL:
+            return merged
+
+        if "general" not in stage_results:
+            return None
+        return self._merge_works(merged, stage_results["general"])
+
+    def _reconstruct_abstract(self, abstract_inverted_index: Dict[str, Any], work_id: Optional[str] = None) -> str:
+        """Reconstruct abstract text from OpenAlex inverted index format."""
+        return reconstruct_abstract(abstract_inverted_index, work_id=work_id)
     
     def _format_results(self, search_results: Dict[str, Any]) -> str:
         """Format OpenAlex results for LLM context."""
@@ -453,24 +587,10 @@ class OpenAlexSearchService(BaseSearchService):
             # Get citation count
             cited_by_count = item.get("cited_by_count", 0)
             
-            # Get abstract snippet
-            abstract_index = item.get("abstract_inverted_index", {})
-            abstract_text = ""
-            if abstract_index:
-                # Reconstruct first part of abstract
-                word_positions = []
-                for word, positions in abstract_index.items():
-                    if positions:  # Make sure positions is not None/empty
-                        for pos in positions[:1]:  # Just first occurrence
-                            if pos is not None:
-                                word_positions.append((pos, word))
-                
-                # Sort by position and take first 50 words
-                word_positions.sort()
-                abstract_words = [word for _, word in word_positions[:50]]
-                abstract_text = " ".join(abstract_words)
-                if len(word_positions) > 50:
-                    abstract_text += "..."
+            # Get abstract snippet (first 50 words)
+            abstract_text = reconstruct_abstract(
+                item.get("abstract_inverted_index", {}), work_id=item.get("id"), max_words=50
+            )
             
             # Format entry
             lines.append(f"{i}. **{title}** ({year})")
@@ -495,7 +615,7 @@ class HackerNewsSearchService(BaseSearchService):
     """Service for Hacker News social search."""
     
     def __init__(self):
-        super().__init__("Social Search")
+        super().__init__("Social Search", cache_ttl=config.SEARCH_CACHE_TTL_SOCIAL)
         self.search_url = "https://hn.algolia.com/api/v1/search"
     
     def validate_config(self) -> bool:
@@ -523,6 +643,10 @@ class HackerNewsSearchService(BaseSearchService):
         
         self._log_search_start(query)
         
+        return await self._cached_search(query, lambda: self._fetch(query))
+
+    async def _fetch(self, query: str) -> Dict[str, Any]:
+        """Query the HN Algolia API and format the results."""
         try:
             params = {
                 "query": query,
@@ -532,7 +656,7 @@ class HackerNewsSearchService(BaseSearchService):
                 "restrictSearchableAttributes": "title,comment_text,url"
             }
 
-            response = requests.get(self.search_url, params=params, timeout=20)
+            response = await http_get(self.search_url, params=params, timeout=20)
             
             if response.status_code == 200:
                 data = response.json()
@@ -567,7 +691,7 @@ class HackerNewsSearchService(BaseSearchService):
                     "source": self.source_name
                 }
                 
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             return {
                 "success": False,
                 "error": "Hacker News API request timed out",
@@ -581,7 +705,7 @@ class HackerNewsSearchService(BaseSearchService):
                 "error": error_message,
                 "source": self.source_name
             }
-    
+
     def _format_results(self, search_results: Dict[str, Any]) -> str:
         """Format Hacker News results for LLM context."""
         items = search_results.get("hits", [])
@@ -631,7 +755,7 @@ class PubMedSearchService(BaseSearchService):
     """Service for PubMed medical search."""
     
     def __init__(self):
-        super().__init__("Medical Search")
+        super().__init__("Medical Search", cache_ttl=config.SEARCH_CACHE_TTL_MEDICAL, upstream=PUBMED)
         self.base_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
         self.email = config.PUBMED_EMAIL
     
@@ -660,6 +784,10 @@ class PubMedSearchService(BaseSearchService):
         
         self._log_search_start(query)
         
+        return await self._cached_search(query, lambda: self._fetch(query))
+
+    async def _fetch(self, query: str) -> Dict[str, Any]:
+        """Search PubMed for article IDs and fetch their details."""
         try:
             # Step 1: Search for article IDs
             search_params = {
@@ -672,9 +800,9 @@ class PubMedSearchService(BaseSearchService):
                 "email": self.email
             }
             
-            search_response = requests.get(f"{self.base_url}/esearch.fcgi", 
-                                         params=search_params, 
-                                         timeout=20)
+            search_response = await http_get(f"{self.base_url}/esearch.fcgi", 
+                                           params=search_params, 
+                                           timeout=20)
             
             if search_response.status_code != 200:
                 return {
@@ -706,9 +834,9 @@ class PubMedSearchService(BaseSearchService):
                 "email": self.email
             }
             
-            fetch_response = requests.get(f"{self.base_url}/efetch.fcgi", 
-                                        params=fetch_params, 
-                                        timeout=20)
+            fetch_response = await http_get(f"{self.base_url}/efetch.fcgi", 
+                                          params=fetch_params, 
+                                          timeout=20)
             
             if fetch_response.status_code != 200:
                 return {
@@ -731,7 +859,7 @@ class PubMedSearchService(BaseSearchService):
                 "result_count": len(articles)
             }
             
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             return {
                 "success": False,
                 "error": "PubMed API request timed out",
@@ -745,7 +873,7 @@ class PubMedSearchService(BaseSearchService):
                 "error": error_message,
                 "source": self.source_name
             }
-    
+
     def _parse_pubmed_xml(self, xml_content: str) -> List[Dict[str, Any]]:
         """Parse PubMed XML response into structured data."""
         # Simple XML parsing - in production you'd use xml.etree.ElementTree
@@ -0,0 +1,229 @@
+"""
+Search result cache shared by the search services.
+
+Refined queries repeat a lot: several users ask about the same news, and autonomous
+research cycles for overlapping topics issue near-identical searches. Results are
+cached per (source, normalized query, recency filter, search mode) with a per-source
+TTL in an in-process LRU, optionally backed by the ``search_cache`` table so all
+workers share paid upstream calls (Perplexity in particular).
+
+Expired entries are still served for ``TTL * SEARCH_CACHE_STALE_FACTOR`` while a
+single background refresh fetches a fresh copy (stale-while-revalidate). Only
+successful results are cached.
+"""
+
+import asyncio
+import copy
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+
+import config
+from db import SessionLocal
+from models.search_cache import SearchCacheEntry
+from services.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+SearchFetch = Callable[[], Awaitable[Dict[str, Any]]]
+
+# Purge expired Postgres rows after this many writes
+DB_PURGE_EVERY = 200
+
+
+def normalize_query(query: str) -> str:
+    """Case- and whitespace-insensitive form of a search query."""
+    return " ".join((query or "").lower().split()).strip(" ?.!")
+
+
+@dataclass
+class _Entry:
+    payload: Dict[str, Any]
+    fetched_at: float
+    ttl: int
+
+    def age(self) -> float:
+        return time.time() - self.fetched_at
+
+
+class SearchCache:
+    """Process-wide LRU of search results with an optional Postgres tier."""
+
+    _entries: "OrderedDict[str, _Entry]" = OrderedDict()
+    _counters: Dict[str, Dict[str, int]] = {}
+    _refreshing: Set[str] = set()
+    _tasks: Set[asyncio.Task] = set()
+    _db_writes = 0
+
+    @staticmethod
+    def make_key(
+        source: str, query: str, recency_filter: Optional[str] = None, search_mode: Optional[str] = None
+    ) -> str:
+        raw = json.dumps([source, normalize_query(query), recency_filter or "", search_mode or ""])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    @classmethod
+    async def get_or_fetch(
+        cls,
+        source: str,
+        query: str,
+        fetch: SearchFetch,
+        ttl: int,
+        recency_filter: Optional[str] = None,
+        search_mode: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Return a cached result for the key, calling ``fetch`` on a miss."""
+        if not config.SEARCH_CACHE_ENABLED or ttl <= 0:
+            return await fetch()
+
+        key = cls.make_key(source, query, recency_filter, search_mode)
+        entry = cls._entries.get(key)
+        if entry is not None:
+            cls._entries.move_to_end(key)
+        elif config.SEARCH_CACHE_DB_ENABLED:
+            entry = await cls._load_db(key)
+            if entry is not None:
+                cls._count(source, "db_hits")
+                cls._remember(key, entry)
+
+        if entry is not None:
+            age = entry.age()
+            if age < entry.ttl:
+                cls._count(source, "hits")
+                logger.debug(f"🗄️ Search cache: Hit for {source} ({age:.0f}s old)")
+                return copy.deepcopy(entry.payload)
+            if age < entry.ttl * (1 + config.SEARCH_CACHE_STALE_FACTOR):
+                cls._count(source, "stale_hits")
+                logger.debug(f"🗄️ Search cache: Serving stale {source} result while revalidating")
+                cls._schedule_refresh(key, source, query, fetch, ttl)
+                return copy.deepcopy(entry.payload)
+
+        cls._count(source, "misses")
+        result = await fetch()
+        await cls._store(key, source, query, result, ttl)
+        return result
+
+    @classmethod
+    def _schedule_refresh(cls, key: str, source: str, query: str, fetch: SearchFetch, ttl: int) -> None:
+        if key in cls._refreshing:
+            return
+        cls._refreshing.add(key)
+        task = asyncio.create_task(cls._revalidate(key, source, query, fetch, ttl))
+        cls._tasks.add(task)
+        task.add_done_callback(cls._tasks.discard)
+
+    @classmethod
+    async def _revalidate(cls, key: str, source: str, query: str, fetch: SearchFetch, ttl: int) -> None:
+        try:
+            result = await fetch()
+            await cls._store(key, source, query, result, ttl)
+            cls._count(source, "revalidations")
+        except Exception as e:
+            logger.warning(f"🗄️ Search cache: Background refresh for {source} failed: {e}")
+        finally:
+            cls._refreshing.discard(key)
+
+    @classmethod
+    async def _store(cls, key: str, source: str, query: str, result: Dict[str, Any], ttl: int) -> None:
+        if not isinstance(result, dict) or not result.get("success"):
+            return
+        entry = _Entry(payload=copy.deepcopy(result), fetched_at=time.time(), ttl=ttl)
+        cls._remember(key, entry)
+        if config.SEARCH_CACHE_DB_ENABLED:
+            await cls._save_db(key, source, query, entry)
+
+    @classmethod
+    def _remember(cls, key: str, entry: _Entry) -> None:
+        cls._entries[key] = entry
+        cls._entries.move_to_end(key)
+        while len(cls._entries) > max(1, config.SEARCH_CACHE_MAX_ENTRIES):
+            cls._entries.popitem(last=False)
+
+    @classmethod
+    async def _load_db(cls, key: str) -> Optional[_Entry]:
+        try:
+            async with SessionLocal() as session:
+                row = await session.scalar(select(SearchCacheEntry).where(SearchCacheEntry.key == key))
+        except Exception as e:
+            logger.warning(f"🗄️ Search cache: Database lookup failed: {e}")
+            return None
+        if row is None:
+            return None
+        return _Entry(payload=row.payload, fetched_at=row.fetched_at.timestamp(), ttl=row.ttl_seconds)
+
+    @classmethod
+    async def _save_db(cls, key: str, source: str, query: str, entry: _Entry) -> None:
+        values = {
+            "key": key,
+            "source": source,
+            "query": normalize_query(query),
+            "payload": entry.payload,
+            "ttl_seconds": entry.ttl,
+            "fetched_at": datetime.fromtimestamp(entry.fetched_at, tz=timezone.utc),
+        }
+        stmt = insert(SearchCacheEntry).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[SearchCacheEntry.key],
+            set_={
+                "payload": stmt.excluded.payload,
+                "ttl_seconds": stmt.excluded.ttl_seconds,
+                "fetched_at": stmt.excluded.fetched_at,
+                "updated_at": func.now(),
+            },
+        )
+        try:
+            async with SessionLocal() as session:
+                await session.execute(stmt)
+                cls._db_writes += 1
+                if cls._db_writes % DB_PURGE_EVERY == 0:
+                    await cls._purge_db(session)
+                await session.commit()
+        except Exception as e:
+            logger.warning(f"🗄️ Search cache: Database write failed: {e}")
+
+    @classmethod
+    async def _purge_db(cls, session) -> None:
+        """Delete rows that are past their stale window."""
+        max_age = func.make_interval(
+            0, 0, 0, 0, 0, 0, SearchCacheEntry.ttl_seconds * (1 + config.SEARCH_CACHE_STALE_FACTOR)
+        )
+        await session.execute(delete(SearchCacheEntry).where(SearchCacheEntry.fetched_at < func.now() - max_age))
+
+    @classmethod
+    def _count(cls, source: str, name: str) -> None:
+        counters = cls._counters.setdefault(source, {})
+        counters[name] = counters.get(name, 0) + 1
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, Any]:
+        totals: Dict[str, int] = {}
+        for counters in cls._counters.values():
+            for name, value in counters.items():
+                totals[name] = totals.get(name, 0) + value
+        served = totals.get("hits", 0) + totals.get("stale_hits", 0)
+        lookups = served + totals.get("misses", 0)
+        return {
+            "enabled": config.SEARCH_CACHE_ENABLED,
+            "db_enabled": config.SEARCH_CACHE_DB_ENABLED,
+            "entries": len(cls._entries),
+            "hits": totals.get("hits", 0),
+            "stale_hits": totals.get("stale_hits", 0),
+            "misses": totals.get("misses", 0),
+            "db_hits": totals.get("db_hits", 0),
+            "revalidations": totals.get("revalidations", 0),
+            "hit_rate": round(served / lookups, 4) if lookups else 0.0,
+            "by_source": {source: dict(counters) for source, counters in cls._counters.items()},
+        }
+
+    @classmethod
+    def clear(cls) -> None:
+        cls._entries = OrderedDict()
+        cls._counters = {}
+        cls._refreshing = set()
@@ -0,0 +1,88 @@
+"""
+Single-flight request coalescing.
+
+Sibling expansion topics researched in the same motivation cycle, or several users
+asking about the same trending item, produce identical upstream searches and
+identical LLM prompts at the same moment. ``SingleFlight.do`` runs the work once
+per key; every concurrent caller with the same key awaits the same task and gets
+its result (or exception).
+
+The shared work runs in its own task, so a caller that is cancelled (e.g. a closed
+SSE stream) does not cancel the call for the others still waiting on it.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+import config
+from services.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class SingleFlight:
+    """Deduplicates concurrent in-flight calls by key."""
+
+    _registry: Dict[str, "SingleFlight"] = {}
+
+    def __init__(self, name: str):
+        self.name = name
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+        SingleFlight._registry[name] = self
+
+    async def do(
+        self,
+        key: Hashable,
+        fn: Callable[[], Awaitable[Any]],
+        share: Optional[Callable[[Any], Any]] = None,
+    ) -> Any:
+        """Run ``fn()`` once for all concurrent callers of ``key``.
+
+        ``share`` is applied to the result handed to every caller, the one that started
+        the call included, e.g. a deep copy when callers mutate what they receive. The
+        task's own result is never handed out, so it stays pristine for later copies.
+        """
+        if not config.SINGLE_FLIGHT_ENABLED:
+            return await fn()
+
+        self.calls += 1
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            logger.debug(f"🔗 {self.name}: Coalesced onto in-flight call ({len(self._inflight)} in flight)")
+            result = await asyncio.shield(task)
+            return share(result) if share else result
+
+        self.executions += 1
+        task = asyncio.ensure_future(fn())
+        self._inflight[key] = task
+        task.add_done_callback(lambda t: self._finished(key, t))
+        result = await asyncio.shield(task)
+        return share(result) if share else result
+
+    def _finished(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the exception retrieved even if every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._inflight),
+        }
+
+    @classmethod
+    def get_all_stats(cls) -> Dict[str, Dict[str, Any]]:
+        return {name: flight.get_stats() for name, flight in cls._registry.items()}
+
+    def reset_stats(self) -> None:
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
@@ -1,47 +1,161 @@
+"""
+Per-thread status channels for the ``/v2/status/{thread_id}`` SSE stream.
+
+Chat nodes call ``queue_status`` freely, whether or not a client ever opens the
+stream. To keep memory flat on long-running workers every channel is bounded
+(``STATUS_CHANNEL_MAX_SIZE``; overflow drops the oldest update or, with
+``STATUS_CHANNEL_OVERFLOW=coalesce``, replaces the newest), and a reaper evicts
+channels nobody is streaming once they have been idle for ``STATUS_CHANNEL_IDLE_TTL``.
+Updates are handed to a single bounded publisher task instead of one task each.
+``get_stats`` reports live channels, dropped updates and buffered bytes.
+"""
+
 import asyncio
-from typing import Dict, AsyncGenerator
 import time
-from config import STATUS_MIN_INTERVAL
+from collections import deque
+from typing import Any, AsyncGenerator, Deque, Dict, Optional
+
+import config
+from services.logging_config import get_logger
+from services.pubsub import PubSub, STATUS_TOPIC
+
+logger = get_logger(__name__)
+
+
+class _StatusChannel:
+    """Bounded buffer of status messages for one thread."""
+
+    def __init__(self) -> None:
+        self.messages: Deque[str] = deque()
+        self.ready = asyncio.Event()
+        self.subscribers = 0
+        self.last_activity = time.monotonic()
+
+    def push(self, message: str) -> bool:
+        """Buffer a message; returns False when an older/newer update had to be dropped."""
+        self.last_activity = time.monotonic()
+        dropped = len(self.messages) >= max(1, config.STATUS_CHANNEL_MAX_SIZE)
+        if dropped:
+            if config.STATUS_CHANNEL_OVERFLOW == "coalesce":
+                self.messages.pop()
+            else:
+                self.messages.popleft()
+        self.messages.append(message)
+        self.ready.set()
+        return not dropped
+
+    def idle_for(self, now: float) -> float:
+        return now - self.last_activity
+
+
+_channels: Dict[str, _StatusChannel] = {}
+_outbox: Optional[asyncio.Queue] = None
+_tasks: Dict[str, asyncio.Task] = {}
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_counters: Dict[str, int] = {"dropped": 0, "evicted": 0, "outbox_dropped": 0}
+
+
+def _get_channel(thread_id: str) -> _StatusChannel:
+    """Get or create the channel for the given thread."""
+    channel = _channels.get(thread_id)
+    if channel is None:
+        channel = _channels[thread_id] = _StatusChannel()
+        _ensure_background_tasks()
+    return channel
+
+
+def _ensure_background_tasks() -> None:
+    """Start the publisher and reaper for the running loop (once per loop)."""
+    global _outbox, _loop
+    loop = asyncio.get_running_loop()
+    if _loop is loop and all(not task.done() for task in _tasks.values()) and _tasks:
+        return
+    for task in _tasks.values():
+        try:
+            task.cancel()
+        except RuntimeError:
+            # Task belonged to an event loop that is already closed
+            pass
+    _loop = loop
+    _outbox = asyncio.Queue(maxsize=max(1, config.STATUS_OUTBOX_MAX_SIZE))
+    _tasks["publisher"] = loop.create_task(_publisher())
+    _tasks["reaper"] = loop.create_task(_reaper())
+
+
+async def _publisher() -> None:
+    while True:
+        thread_id, message = await _outbox.get()
+        await publish_status(thread_id, message)
+
 
-_status_queues: Dict[str, asyncio.Queue] = {}
-_last_status_time: Dict[str, float] = {}
+async def _reaper() -> None:
+    ttl = config.STATUS_CHANNEL_IDLE_TTL
+    while True:
+        await asyncio.sleep(max(1.0, ttl / 2))
+        reap_idle_channels()
 
 
-def _get_queue(thread_id: str) -> asyncio.Queue:
-    """Get or create a queue for the given thread."""
-    if thread_id not in _status_queues:
-        _status_queues[thread_id] = asyncio.Queue()
-    return _status_queues[thread_id]
+def reap_idle_channels(now: Optional[float] = None) -> int:
+    """Evict channels without an open stream that have been idle past the TTL."""
+    now = time.monotonic() if now is None else now
+    ttl = config.STATUS_CHANNEL_IDLE_TTL
+    expired = [
+        thread_id
+        for thread_id, channel in _channels.items()
+        if channel.subscribers == 0 and channel.idle_for(now) >= ttl
+    ]
+    for thread_id in expired:
+        del _channels[thread_id]
+    if expired:
+        _counters["evicted"] += len(expired)
+        logger.debug(f"📶 Status channels: Evicted {len(expired)} idle channels ({len(_channels)} live)")
+    return len(expired)
+
+
+async def _deliver_status(payload: Dict[str, Any]) -> None:
+    """PubSub handler: buffer a status published by any worker for local streams."""
+    thread_id = payload.get("thread_id")
+    if not thread_id:
+        return
+    # Other workers' statuses only matter to a stream connected here; our own are
+    # buffered so a stream that connects slightly late still sees them
+    if thread_id in _channels or PubSub.is_local(payload):
+        if not _get_channel(thread_id).push(payload.get("message")):
+            _counters["dropped"] += 1
+
+
+PubSub.subscribe(STATUS_TOPIC, _deliver_status)
 
 
 async def publish_status(thread_id: str, message: str) -> None:
-    """Publish a status message for the thread with throttling."""
-    queue = _get_queue(thread_id)
-    
-    # Add throttling to prevent status updates from being too rapid
-    current_time = time.time()
-    last_time = _last_status_time.get(thread_id, 0)
-    
-    if current_time - last_time < STATUS_MIN_INTERVAL:
-        # Wait a bit to space out the status updates
-        await asyncio.sleep(STATUS_MIN_INTERVAL - (current_time - last_time))
-    
-    _last_status_time[thread_id] = time.time()
-    await queue.put(message)
+    """Publish a status message for the thread."""
+    await PubSub.publish(STATUS_TOPIC, {"thread_id": thread_id, "message": message})
 
 
 async def status_events(thread_id: str) -> AsyncGenerator[str, None]:
     """Yield status messages for streaming to the client."""
-    queue = _get_queue(thread_id)
+    channel = _get_channel(thread_id)
+    channel.subscribers += 1
+    last_sent = 0.0
     try:
         while True:
-            message = await queue.get()
+            if not channel.messages:
+                channel.ready.clear()
+                await channel.ready.wait()
+                continue
+            # Space out updates; with coalescing, bursts collapse while we wait
+            wait = config.STATUS_MIN_INTERVAL - (time.monotonic() - last_sent)
+            if wait > 0:
+                await asyncio.sleep(wait)
+            message = channel.messages.popleft()
+            channel.last_activity = last_sent = time.monotonic()
             yield message
     except asyncio.CancelledError:
         pass
     finally:
-        _status_queues.pop(thread_id, None)
-        _last_status_time.pop(thread_id, None)
+        channel.subscribers -= 1
+        if channel.subscribers <= 0 and _channels.get(thread_id) is channel:
+            del _channels[thread_id]
 
 
 def queue_status(thread_id: str, message: str) -> None:
@@ -52,4 +166,35 @@ def queue_status(thread_id: str, message: str) -> None:
         asyncio.get_running_loop()
     except RuntimeError:
         return
-    asyncio.create_task(publish_status(thread_id, message))
+    _ensure_background_tasks()
+    try:
+        _outbox.put_nowait((thread_id, message))
+    except asyncio.QueueFull:
+        # Backpressure: the publisher is behind, so shed this update
+        _counters["outbox_dropped"] += 1
+
+
+def get_stats() -> Dict[str, Any]:
+    """Live channel, drop and memory counters for the status streams."""
+    buffered = sum(len(channel.messages) for channel in _channels.values())
+    buffered_bytes = sum(
+        len(message.encode()) for channel in _channels.values() for message in channel.messages if message
+    )
+    return {
+        "live_channels": len(_channels),
+        "streaming_channels": sum(1 for channel in _channels.values() if channel.subscribers),
+        "buffered_messages": buffered,
+        "buffered_bytes": buffered_bytes,
+        "outbox_depth": _outbox.qsize() if _outbox is not None else 0,
+        "dropped_updates": _counters["dropped"],
+        "outbox_dropped": _counters["outbox_dropped"],
+        "evicted_channels": _counters["evicted"],
+        "max_size": config.STATUS_CHANNEL_MAX_SIZE,
+        "idle_ttl_seconds": config.STATUS_CHANNEL_IDLE_TTL,
+        "overflow": config.STATUS_CHANNEL_OVERFLOW,
+    }
+
+
+def reset_stats() -> None:
+    for name in _counters:
+        _counters[name] = 0
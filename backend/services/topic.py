@@ -2,13 +2,13 @@ import uuid
 from datetime import datetime, timezone
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, func, distinct, delete, update
+from sqlalchemy import select, and_, func, distinct, delete, update, literal
 from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import aliased
 
 from db import SessionLocal
 from config import DEFAULT_MODEL, MAX_ACTIVE_RESEARCH_TOPICS_PER_USER
 from services.logging_config import get_logger
-from nodes.topic_extractor_node import topic_extractor_node
 from exceptions import CommonError, NotFound, AlreadyExist
 from models import ResearchTopic
 
@@ -253,6 +253,9 @@ class TopicService:
             existing_score.is_active_research = enable
             if motivation_score is not None:
                 existing_score.motivation_score = motivation_score
+            if enable:
+                # Let the due-time scheduler recompute when this topic is due
+                existing_score.next_due_at = None
             session.add(existing_score)
             logger.info(f"📊 Updated TopicScore for '{topic.name}': is_active_research={enable}")
         else:
@@ -276,9 +279,16 @@ class TopicService:
                 meta_data={}
             )
             session.add(new_score)
+            await session.flush()
+            # Findings may predate the score row; seed its engagement aggregates from them
+            await motivation_repo.recompute_engagement_aggregates([topic_id])
             logger.info(f"📊 Created TopicScore for '{topic.name}': is_active_research={enable}")
 
         await session.commit()
+
+        if enable:
+            from services.motivation import MotivationSystem
+            MotivationSystem.notify_topics_changed()
         
         # Refresh topic to ensure we have latest state
         await session.refresh(topic)
@@ -415,8 +425,11 @@ class TopicService:
 
             logger.debug(f"🔍 Background: Using clean state with {len(clean_state['messages'])} messages")
 
+            # Imported here: services.nodes.base imports this module
+            from services.nodes.topic_extractor import topic_extractor_node
+
             # Run topic extraction on the clean conversation state
-            updated_state = topic_extractor_node(clean_state)
+            updated_state = await topic_extractor_node(clean_state)
 
             # Check if topic extraction was successful
             topic_results = updated_state.get("module_results", {}).get("topic_extractor", {})
@@ -471,6 +484,14 @@ class TopicService:
     ) -> Optional[ResearchTopic]:
         norm_name = name.strip()
 
+        depth = 0
+        root_id = None
+        if parent_id is not None:
+            # Derive the child's tree position from its parent inside the INSERT itself
+            parent = aliased(ResearchTopic)
+            depth = select(parent.depth + 1).where(parent.id == parent_id).scalar_subquery()
+            root_id = select(func.coalesce(parent.root_id, parent.id)).where(parent.id == parent_id).scalar_subquery()
+
         query = insert(ResearchTopic).values(
             user_id=user_id,
             chat_id=chat_id,
@@ -481,6 +502,8 @@ class TopicService:
             is_active_research=is_active_research,
             is_child=is_child,
             parent_id=parent_id,
+            depth=depth,
+            root_id=root_id,
         ).on_conflict_do_nothing(
             constraint="uq_research_topics_user_name"
         ).returning(ResearchTopic)
@@ -539,25 +562,56 @@ class TopicService:
         topic_id: uuid.UUID,
     ) -> Optional[ResearchTopic]:
         """Get the parent topic for a given child topic."""
-        # First get the topic to find its parent_id
-        topic_query = select(ResearchTopic).where(
+        child = aliased(ResearchTopic)
+        query = select(ResearchTopic).join(child, child.parent_id == ResearchTopic.id).where(
             and_(
-                ResearchTopic.id == topic_id,
+                child.id == topic_id,
+                child.user_id == user_id,
                 ResearchTopic.user_id == user_id
             )
         )
-        topic_res = await session.execute(topic_query)
-        topic = topic_res.scalar_one_or_none()
+        res = await session.execute(query)
+        return res.scalar_one_or_none()
 
-        if not topic or not topic.parent_id:
-            return None
+    async def get_topic_depth(
+        self,
+        session: AsyncSession,
+        topic_id: uuid.UUID,
+    ) -> int:
+        """Get the expansion depth of a topic (0 for root topics or unknown ids)."""
+        query = select(ResearchTopic.depth).where(ResearchTopic.id == topic_id)
+
+        res = await session.execute(query)
+        return int(res.scalar_one_or_none() or 0)
 
-        # Get the parent topic
-        parent_query = select(ResearchTopic).where(
+    async def get_subtree(
+        self,
+        session: AsyncSession,
+        user_id: uuid.UUID,
+        topic_id: uuid.UUID,
+        max_levels: int | None = None,
+    ) -> list[ResearchTopic]:
+        """Get a topic and all of its expansion descendants in one recursive query.
+
+        Topics are ordered by depth, then creation time. ``max_levels`` limits how many
+        levels below ``topic_id`` are included.
+        """
+        tree = select(ResearchTopic.id, literal(0).label("level")).where(
             and_(
-                ResearchTopic.id == topic.parent_id,
+                ResearchTopic.id == topic_id,
                 ResearchTopic.user_id == user_id
             )
+        ).cte("topic_subtree", recursive=True)
+
+        child = aliased(ResearchTopic)
+        step = select(child.id, (tree.c.level + 1).label("level")).where(child.parent_id == tree.c.id)
+        if max_levels is not None:
+            step = step.where(tree.c.level < max_levels)
+        tree = tree.union_all(step)
+
+        query = select(ResearchTopic).join(tree, ResearchTopic.id == tree.c.id).order_by(
+            tree.c.level.asc(), ResearchTopic.created_at.asc()
         )
-        parent_res = await session.execute(parent_query)
-        return parent_res.scalar_one_or_none()
+
+        res = await session.execute(query)
+        return list(res.scalars().all())
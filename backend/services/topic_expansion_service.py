@@ -1,12 +1,11 @@
-import asyncio
 import json
 import re
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
 from langchain_core.messages import SystemMessage
-from langchain_openai import ChatOpenAI
 
+from services.llm_gateway import ainvoke_structured
 from services.logging_config import get_logger
 import config
 from storage.zep_manager import ZepManager
@@ -57,14 +56,12 @@ class TopicExpansionService:
             logger.info(f"🔎 Expansion skipped for '{topic_name}': Zep is disabled (required for candidate generation and validation)")
             return []
 
-        # Concurrent Zep searches
+        # One unified Zep search returns both nodes and edges
         reranker = config.ZEP_SEARCH_RERANKER
         limit = config.ZEP_SEARCH_LIMIT
 
-        nodes_task = self.zep.search_graph(user_id, query, scope="nodes", reranker=reranker, limit=limit)
-        edges_task = self.zep.search_graph(user_id, query, scope="edges", reranker=reranker, limit=limit)
-
-        nodes_res, edges_res = await asyncio.gather(nodes_task, edges_task)
+        graph_res = await self.zep.search_graph_all(user_id, query, reranker=reranker, limit=limit)
+        nodes_res, edges_res = graph_res["nodes"], graph_res["edges"]
         self.metrics["expansion_candidates_total"] += (len(nodes_res) + len(edges_res))
 
         logger.debug(
@@ -160,19 +157,18 @@ class TopicExpansionService:
                 suggestion_limit=config.EXPANSION_LLM_SUGGESTION_LIMIT,
             )
 
-            llm = ChatOpenAI(
-                model=config.EXPANSION_LLM_MODEL,
-                temperature=config.EXPANSION_LLM_TEMPERATURE,
-                max_tokens=config.EXPANSION_LLM_MAX_TOKENS,
-                api_key=config.OPENAI_API_KEY,
-            )
-            structured = llm.with_structured_output(ExpansionSelection)
             messages = [SystemMessage(content=prompt)]
             logger.debug("🧩 About to invoke structured LLM for expansion")
             
             try:
-                # Use direct async call instead of to_thread for better performance
-                selection: ExpansionSelection = await structured.ainvoke(messages)
+                # Shared client, coalescing and OpenAI budget like the other research-path calls
+                selection: ExpansionSelection = await ainvoke_structured(
+                    ExpansionSelection,
+                    messages,
+                    model=config.EXPANSION_LLM_MODEL,
+                    temperature=config.EXPANSION_LLM_TEMPERATURE,
+                    max_tokens=config.EXPANSION_LLM_MAX_TOKENS,
+                )
                 logger.debug(f"🧩 LLM returned {len(selection.topics)} topics")
             except Exception as parse_error:
                 logger.error(f"🧩 LLM structured output failed: {str(parse_error)}", exc_info=True)
@@ -0,0 +1,115 @@
+"""
+Per-upstream request budgets.
+
+Running research topics concurrently multiplies the request rate against the paid
+and rate-limited upstreams. Each upstream gets a token bucket sized from its
+``UPSTREAM_RPM_*`` setting; callers ``await UpstreamBudgets.acquire(name)`` right
+before the request and are delayed (never rejected) when the budget is spent.
+The buckets are process-wide, so chat and autonomous research share one budget.
+"""
+
+import asyncio
+import time
+from typing import Any, Dict
+
+import config
+from services.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+PERPLEXITY = "perplexity"
+OPENAI = "openai"
+OPENALEX = "openalex"
+PUBMED = "pubmed"
+
+# Seconds of budget that may be spent in one burst
+BURST_SECONDS = 10
+
+
+def _configured_rpm(upstream: str) -> int:
+    return {
+        PERPLEXITY: config.UPSTREAM_RPM_PERPLEXITY,
+        OPENAI: config.UPSTREAM_RPM_OPENAI,
+        OPENALEX: config.UPSTREAM_RPM_OPENALEX,
+        PUBMED: config.UPSTREAM_RPM_PUBMED,
+    }.get(upstream, 0)
+
+
+class TokenBucket:
+    """Token bucket refilled at ``rpm / 60`` tokens per second."""
+
+    def __init__(self, rpm: int):
+        self.rpm = rpm
+        self.rate = rpm / 60.0
+        self.capacity = max(1.0, self.rate * BURST_SECONDS)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self) -> float:
+        """Take one token, sleeping until one is available. Returns the seconds waited."""
+        waited = 0.0
+        while True:
+            self._refill()
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return waited
+            delay = (1 - self.tokens) / self.rate
+            waited += delay
+            await asyncio.sleep(delay)
+
+
+class UpstreamBudgets:
+    """Process-wide token buckets keyed by upstream name."""
+
+    _buckets: Dict[str, TokenBucket] = {}
+    _counters: Dict[str, Dict[str, float]] = {}
+
+    @classmethod
+    def _bucket(cls, upstream: str):
+        rpm = _configured_rpm(upstream)
+        if rpm <= 0:
+            return None
+        bucket = cls._buckets.get(upstream)
+        if bucket is None or bucket.rpm != rpm:
+            bucket = TokenBucket(rpm)
+            cls._buckets[upstream] = bucket
+        return bucket
+
+    @classmethod
+    async def acquire(cls, upstream: str) -> None:
+        """Wait until the upstream's budget allows one more request."""
+        counters = cls._counters.setdefault(upstream, {"requests": 0, "throttled": 0, "waited_seconds": 0.0})
+        counters["requests"] += 1
+        bucket = cls._bucket(upstream)
+        if bucket is None:
+            return
+        waited = await bucket.acquire()
+        if waited:
+            counters["throttled"] += 1
+            counters["waited_seconds"] += waited
+            logger.debug(f"⏳ Upstream budget: Delayed {upstream} request by {waited:.2f}s")
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, Any]:
+        stats = {}
+        for upstream in (PERPLEXITY, OPENAI, OPENALEX, PUBMED):
+            counters = cls._counters.get(upstream, {})
+            bucket = cls._buckets.get(upstream)
+            stats[upstream] = {
+                "rpm": _configured_rpm(upstream),
+                "requests": int(counters.get("requests", 0)),
+                "throttled": int(counters.get("throttled", 0)),
+                "waited_seconds": round(counters.get("waited_seconds", 0.0), 2),
+                "available": round(bucket.tokens, 2) if bucket else None,
+            }
+        return stats
+
+    @classmethod
+    def reset(cls) -> None:
+        cls._buckets = {}
+        cls._counters = {}
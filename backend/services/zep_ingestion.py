@@ -0,0 +1,184 @@
+"""
+Background queue for Zep writes.
+
+Storing a conversation turn in Zep used to run as a fire-and-forget task per chat
+response with no retry, so a Zep hiccup silently lost the turn. ``ZepIngestion.submit``
+queues the write and returns immediately; a small pool of workers performs it and
+retries failures with exponential backoff.
+
+Writes are sharded by key (the thread id), so one thread's messages are always sent
+by the same worker, in submission order. A failed write does not hold its worker
+through the backoff: its key is parked, later writes for that key wait behind it,
+and a timer resumes the key while the worker carries on with other threads. Workers
+start lazily on the first submit; ``drain`` flushes the queues on shutdown.
+"""
+
+import asyncio
+import time
+import zlib
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Set
+
+import config
+from services.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# A write returns True on success; False or an exception is retried
+ZepWrite = Callable[[], Awaitable[bool]]
+
+
+@dataclass
+class _Job:
+    key: str
+    name: str
+    write: ZepWrite
+    attempts: int = 0
+
+
+class ZepIngestion:
+    """Process-wide sharded queue of Zep writes with retry."""
+
+    _queues: List[asyncio.Queue] = []
+    _workers: List[asyncio.Task] = []
+    _loop: Optional[asyncio.AbstractEventLoop] = None
+    # Keys waiting out a retry backoff, with their pending writes in order
+    _parked: Dict[str, Deque[_Job]] = {}
+    _timers: Dict[str, asyncio.TimerHandle] = {}
+    _resumers: Set[asyncio.Task] = set()
+    _counters: Dict[str, int] = {}
+
+    @classmethod
+    def _ensure_started(cls) -> None:
+        loop = asyncio.get_running_loop()
+        if cls._loop is loop and cls._workers and not any(worker.done() for worker in cls._workers):
+            return
+        cls._stop_workers()
+        cls._loop = loop
+        count = max(1, config.ZEP_INGEST_WORKERS)
+        cls._queues = [asyncio.Queue(maxsize=config.ZEP_INGEST_QUEUE_MAX) for _ in range(count)]
+        cls._workers = [asyncio.create_task(cls._worker(queue)) for queue in cls._queues]
+        logger.info(f"📥 Zep ingestion: Started {count} workers")
+
+    @classmethod
+    def submit(cls, key: str, name: str, write: ZepWrite) -> bool:
+        """Queue a write; returns False when it had to be dropped because the queue is full."""
+        cls._ensure_started()
+        queue = cls._queues[zlib.crc32(key.encode()) % len(cls._queues)]
+        try:
+            queue.put_nowait(_Job(key=key, name=name, write=write))
+        except asyncio.QueueFull:
+            cls._count("dropped")
+            logger.error(f"📥 Zep ingestion: Queue full, dropped {name}")
+            return False
+        cls._count("submitted")
+        return True
+
+    @classmethod
+    async def _worker(cls, queue: asyncio.Queue) -> None:
+        while True:
+            job: _Job = await queue.get()
+            try:
+                if job.key in cls._parked:
+                    # Keep this thread's order: wait behind its retrying write
+                    cls._parked[job.key].append(job)
+                else:
+                    await cls._attempt(job)
+            finally:
+                queue.task_done()
+
+    @classmethod
+    async def _attempt(cls, job: _Job) -> bool:
+        """Run a write once; returns False when it was parked for a retry."""
+        job.attempts += 1
+        error: Optional[str] = None
+        try:
+            if await job.write():
+                cls._count("succeeded")
+                return True
+            error = "write returned False"
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            error = str(e)
+
+        if job.attempts > config.ZEP_INGEST_MAX_RETRIES:
+            cls._count("failed")
+            logger.error(f"📥 Zep ingestion: Giving up on {job.name} after {job.attempts} attempts: {error}")
+            return True
+
+        cls._count("retried")
+        delay = config.ZEP_INGEST_RETRY_BASE_SECONDS * 2 ** (job.attempts - 1)
+        logger.warning(f"📥 Zep ingestion: {job.name} failed ({error}); retrying in {delay:.1f}s")
+        cls._parked.setdefault(job.key, deque()).appendleft(job)
+        cls._timers[job.key] = cls._loop.call_later(delay, cls._resume, job.key)
+        return False
+
+    @classmethod
+    def _resume(cls, key: str) -> None:
+        cls._timers.pop(key, None)
+        task = asyncio.ensure_future(cls._run_parked(key))
+        cls._resumers.add(task)
+        task.add_done_callback(cls._resumers.discard)
+
+    @classmethod
+    async def _run_parked(cls, key: str) -> None:
+        parked = cls._parked.get(key)
+        while parked:
+            if not await cls._attempt(parked.popleft()):
+                # Parked again at the head with a new timer
+                return
+        cls._parked.pop(key, None)
+
+    @classmethod
+    async def drain(cls, timeout: float = 10.0) -> None:
+        """Wait (bounded) for queued and retrying writes to finish, then stop the workers."""
+        deadline = time.monotonic() + timeout
+        if cls._queues:
+            try:
+                await asyncio.wait_for(asyncio.gather(*(queue.join() for queue in cls._queues)), timeout)
+            except asyncio.TimeoutError:
+                pass
+            while cls._parked and time.monotonic() < deadline:
+                await asyncio.sleep(0.05)
+            pending = sum(queue.qsize() for queue in cls._queues) + sum(len(p) for p in cls._parked.values())
+            if pending:
+                logger.warning(f"📥 Zep ingestion: Shutting down with {pending} writes still queued")
+        cls._stop_workers()
+
+    @classmethod
+    def _stop_workers(cls) -> None:
+        for task in [*cls._workers, *cls._resumers, *cls._timers.values()]:
+            try:
+                task.cancel()
+            except RuntimeError:
+                # Belonged to an event loop that is already closed
+                pass
+        cls._workers = []
+        cls._queues = []
+        cls._parked = {}
+        cls._timers = {}
+        cls._resumers = set()
+
+    @classmethod
+    def _count(cls, name: str) -> None:
+        cls._counters[name] = cls._counters.get(name, 0) + 1
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, Any]:
+        return {
+            "workers": len(cls._workers),
+            "queued": sum(queue.qsize() for queue in cls._queues),
+            "parked_threads": len(cls._parked),
+            "parked": sum(len(parked) for parked in cls._parked.values()),
+            "submitted": cls._counters.get("submitted", 0),
+            "succeeded": cls._counters.get("succeeded", 0),
+            "retried": cls._counters.get("retried", 0),
+            "failed": cls._counters.get("failed", 0),
+            "dropped": cls._counters.get("dropped", 0),
+        }
+
+    @classmethod
+    def reset_stats(cls) -> None:
+        cls._counters = {}
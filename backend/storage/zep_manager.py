@@ -4,7 +4,9 @@ Zep Memory Manager for storing chat interactions in knowledge graph.
 
 import uuid
 import asyncio
-from typing import Optional, List, Dict, Any
+import time
+from collections import OrderedDict
+from typing import Optional, List, Dict, Any, Tuple
 from zep_cloud.client import AsyncZep
 from zep_cloud import Message
 
@@ -13,6 +15,49 @@ from services.logging_config import get_logger
 logger = get_logger(__name__)
 
 import config
+from services.single_flight import SingleFlight
+
+_graph_search_flight = SingleFlight("zep_graph_search")
+_graph_snapshot_flight = SingleFlight("zep_graph_snapshot")
+
+
+class GraphSnapshot:
+    """A user's knowledge graph with its triplets, indexed for paging and subgraph queries."""
+
+    def __init__(self, nodes: List[Dict[str, Any]], edges: List[Dict[str, Any]], triplets: List[Dict[str, Any]]):
+        self.nodes = nodes
+        self.edges = edges
+        self.triplets = triplets
+        self.nodes_by_uuid = {node["uuid"]: node for node in nodes}
+        # node uuid -> edges touching it
+        self.adjacency: Dict[str, List[Dict[str, Any]]] = {}
+        for edge in edges:
+            self.adjacency.setdefault(edge["source_node_uuid"], []).append(edge)
+            if edge["target_node_uuid"] != edge["source_node_uuid"]:
+                self.adjacency.setdefault(edge["target_node_uuid"], []).append(edge)
+
+    def neighborhood(self, center_uuid: str, hops: int = 1) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Nodes and edges within ``hops`` edges of ``center_uuid``."""
+        if center_uuid not in self.nodes_by_uuid:
+            return [], []
+        visited = {center_uuid}
+        edge_ids = set()
+        edges: List[Dict[str, Any]] = []
+        frontier = [center_uuid]
+        for _ in range(hops):
+            next_frontier = []
+            for node_uuid in frontier:
+                for edge in self.adjacency.get(node_uuid, []):
+                    if edge["uuid"] not in edge_ids:
+                        edge_ids.add(edge["uuid"])
+                        edges.append(edge)
+                    for other in (edge["source_node_uuid"], edge["target_node_uuid"]):
+                        if other not in visited and other in self.nodes_by_uuid:
+                            visited.add(other)
+                            next_frontier.append(other)
+            frontier = next_frontier
+        nodes = [self.nodes_by_uuid[node_uuid] for node_uuid in visited]
+        return nodes, edges
 
 class ZepManager:
     """
@@ -22,6 +67,10 @@ class ZepManager:
     
     _instance = None
     _initialized = False
+    # user_id -> (expires_at, GraphSnapshot), shared by every handle on the manager
+    _graph_snapshots: "OrderedDict[str, Tuple[float, GraphSnapshot]]" = OrderedDict()
+    # user_id -> invalidation count, only while that user's snapshot is being fetched
+    _graph_generations: Dict[str, int] = {}
     
     def __new__(cls):
         """Implement singleton pattern to ensure only one instance exists."""
@@ -36,6 +85,11 @@ class ZepManager:
             
         self.enabled = config.ZEP_ENABLED
         self.client = None
+        # (user_id, query, limit) -> (expires_at, {"nodes": [...], "edges": [...]})
+        self._search_cache: "OrderedDict[Tuple[str, str, int], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        # Users and threads known to exist in Zep, so existence probes run once per process
+        self._known_users: "OrderedDict[str, None]" = OrderedDict()
+        self._known_threads: "OrderedDict[str, None]" = OrderedDict()
         
         if self.enabled and config.ZEP_API_KEY:
             try:
@@ -67,6 +121,9 @@ class ZepManager:
         if not self.is_enabled():
             return False
 
+        if user_id in self._known_users:
+            return True
+
         try:
             # Parse display name or generate from user_id
             first_name, last_name = self._parse_user_name(user_id, display_name)
@@ -75,6 +132,7 @@ class ZepManager:
             try:
                 await self.client.user.get(user_id)
                 logger.debug(f"User {user_id} already exists in Zep")
+                self._remember(self._known_users, user_id)
                 return True
             except Exception:
                 # User doesn't exist, create them
@@ -89,6 +147,7 @@ class ZepManager:
             )
             
             logger.info(f"Created ZEP user: {user_id} ({first_name} {last_name})")
+            self._remember(self._known_users, user_id)
             return True
             
         except Exception as e:
@@ -122,10 +181,47 @@ class ZepManager:
             logger.error(f"Invalid graph search scope: {scope}")
             return []
 
+        results = await self.search_graph_all(user_id, query, reranker=reranker, limit=limit)
+        return results[scope]
+
+    async def search_graph_all(
+        self,
+        user_id: str,
+        query: str,
+        reranker: Optional[str] = "cross_encoder",
+        limit: int = 10,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Search Zep knowledge graph once and return both nodes and edges.
+
+        The v3 unified API returns nodes and edges in a single response, so callers
+        needing both should use this instead of two scoped ``search_graph`` calls.
+        Successful results are cached per (user, query, limit) for
+        ZEP_SEARCH_CACHE_TTL_SECONDS, and identical concurrent searches share one request.
+
+        Returns:
+            {"nodes": [...], "edges": [...]} with the same item shapes as ``search_graph``.
+        """
+        if not self.is_enabled():
+            return {"nodes": [], "edges": []}
+
+        key = (user_id, query, limit)
+        cached = self._search_cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            self._search_cache.move_to_end(key)
+            results = cached[1]
+        else:
+            results = await _graph_search_flight.do(key, lambda: self._fetch_graph_search(user_id, query, limit))
+
+        # Copies, so callers cannot mutate the cached lists
+        return {"nodes": list(results["nodes"]), "edges": list(results["edges"])}
+
+    async def _fetch_graph_search(self, user_id: str, query: str, limit: int) -> Dict[str, List[Dict[str, Any]]]:
+        """Run one unified graph search with retries and normalize the results."""
+        empty: Dict[str, List[Dict[str, Any]]] = {"nodes": [], "edges": []}
         timeout = getattr(config, "ZEP_SEARCH_TIMEOUT_SECONDS", 5)
         retries = getattr(config, "ZEP_SEARCH_RETRIES", 2)
         attempt = 0
-        last_exc: Optional[Exception] = None
+        results = None
         
         while attempt <= retries:
             try:
@@ -139,27 +235,20 @@ class ZepManager:
                     ),
                     timeout=timeout,
                 )
-                last_exc = None
                 break
             except Exception as e:
-                last_exc = e
                 attempt += 1
                 if attempt > retries:
-                    logger.error(
-                        f"Zep graph.search failed after {attempt} attempts (scope={scope}): {str(e)}"
-                    )
-                    results = None
-                    break
+                    logger.error(f"Zep graph.search failed after {attempt} attempts: {str(e)}")
+                    return empty
                 # Jittered backoff
                 import random
                 wait_s = 0.1 + random.random() * 0.3
-                logger.debug(
-                    f"Zep graph.search attempt {attempt} failed (scope={scope}): {str(e)}; retrying in {wait_s:.2f}s"
-                )
+                logger.debug(f"Zep graph.search attempt {attempt} failed: {str(e)}; retrying in {wait_s:.2f}s")
                 await asyncio.sleep(wait_s)
 
         if not results:
-            return []
+            return empty
 
         # Extract nodes and edges from unified results
         node_results = []
@@ -173,52 +262,68 @@ class ZepManager:
                     edge_results.extend(result_items)
         except Exception as e:
             logger.error(f"Failed to parse Zep v3 search results: {str(e)}")
-            return []
+            return empty
+
+        nodes: List[Dict[str, Any]] = []
+        for node_item in node_results:
+            try:
+                name = getattr(node_item, 'name', None)
+                labels = getattr(node_item, 'labels', []) or []
+                uuid_val = getattr(node_item, 'uuid_', None) or getattr(node_item, 'uuid', None)
+                similarity = getattr(node_item, 'score', None)
+                
+                nodes.append({
+                    "name": name or (labels[0] if labels else None),
+                    "labels": labels if isinstance(labels, list) else [],
+                    "uuid": uuid_val,
+                    "similarity": similarity,
+                })
+            except Exception as e:
+                logger.debug(f"Failed to process node item: {str(e)}")
+                continue
+
+        edges: List[Dict[str, Any]] = []
+        for edge_item in edge_results:
+            try:
+                fact = getattr(edge_item, 'fact', None)
+                name = getattr(edge_item, 'name', None)
+                source_uuid = getattr(edge_item, 'source_node_uuid', None)
+                target_uuid = getattr(edge_item, 'target_node_uuid', None)
+                uuid_val = getattr(edge_item, 'uuid_', None) or getattr(edge_item, 'uuid', None)
+                similarity = getattr(edge_item, 'score', None)
+                
+                edges.append({
+                    "fact": fact,
+                    "name": fact or name,
+                    "source_node_uuid": source_uuid,
+                    "target_node_uuid": target_uuid,
+                    "uuid": uuid_val,
+                    "similarity": similarity,
+                })
+            except Exception as e:
+                logger.debug(f"Failed to process edge item: {str(e)}")
+                continue
 
-        # Filter and normalize based on requested scope
-        normalized: List[Dict[str, Any]] = []
-
-        if scope == "nodes":
-            for node_item in node_results:
-                try:
-                    name = getattr(node_item, 'name', None)
-                    labels = getattr(node_item, 'labels', []) or []
-                    uuid_val = getattr(node_item, 'uuid_', None) or getattr(node_item, 'uuid', None)
-                    similarity = getattr(node_item, 'score', None)
-                    
-                    normalized.append({
-                        "name": name or (labels[0] if labels else None),
-                        "labels": labels if isinstance(labels, list) else [],
-                        "uuid": uuid_val,
-                        "similarity": similarity,
-                    })
-                except Exception as e:
-                    logger.debug(f"Failed to process node item: {str(e)}")
-                    continue
-                    
-        elif scope == "edges":
-            for edge_item in edge_results:
-                try:
-                    fact = getattr(edge_item, 'fact', None)
-                    name = getattr(edge_item, 'name', None)
-                    source_uuid = getattr(edge_item, 'source_node_uuid', None)
-                    target_uuid = getattr(edge_item, 'target_node_uuid', None)
-                    uuid_val = getattr(edge_item, 'uuid_', None) or getattr(edge_item, 'uuid', None)
-                    similarity = getattr(edge_item, 'score', None)
-                    
-                    normalized.append({
-                        "fact": fact,
-                        "name": fact or name,
-                        "source_node_uuid": source_uuid,
-                        "target_node_uuid": target_uuid,
-                        "uuid": uuid_val,
-                        "similarity": similarity,
-                    })
-                except Exception as e:
-                    logger.debug(f"Failed to process edge item: {str(e)}")
-                    continue
-
-        return [n for n in normalized if n.get("name")]
+        normalized = {
+            "nodes": [n for n in nodes if n.get("name")],
+            "edges": [e for e in edges if e.get("name")],
+        }
+        self._cache_search(user_id, query, limit, normalized)
+        return normalized
+
+    def _cache_search(self, user_id: str, query: str, limit: int, results: Dict[str, List[Dict[str, Any]]]) -> None:
+        ttl = config.ZEP_SEARCH_CACHE_TTL_SECONDS
+        if ttl <= 0:
+            return
+        key = (user_id, query, limit)
+        self._search_cache[key] = (time.monotonic() + ttl, results)
+        self._search_cache.move_to_end(key)
+        while len(self._search_cache) > config.ZEP_SEARCH_CACHE_MAX_ENTRIES:
+            self._search_cache.popitem(last=False)
+
+    def clear_search_cache(self) -> None:
+        """Drop cached graph search results."""
+        self._search_cache.clear()
     
     async def create_thread(self, thread_id: str, user_id: str) -> bool:
         """
@@ -233,33 +338,95 @@ class ZepManager:
         """
         if not self.is_enabled():
             return False
+
+        if thread_id in self._known_threads:
+            return True
         
         try:
             # Check if thread already exists
             try:
                 await self.client.thread.get_user_context(thread_id=thread_id, mode="basic")
                 logger.debug(f"Thread {thread_id} already exists in Zep")
+                self._remember_thread(thread_id, user_id)
                 return True
             except Exception:
                 # Thread doesn't exist, create it
                 pass
             
-            # Try to create thread - this will fail if user doesn't exist
-            # so we'll create the user first if needed
-            await self.create_user(user_id)
-            
-            # Create thread
-            thread = await self.client.thread.create(
-                thread_id=thread_id,
-                user_id=user_id,
-            )
-            
-            logger.info(f"Created ZEP thread: {thread_id} for user {user_id}")
+            await self._add_thread(thread_id, user_id)
             return True
             
         except Exception as e:
             logger.error(f"Failed to create ZEP thread {thread_id}: {str(e)}")
             return False
+
+    async def _add_thread(self, thread_id: str, user_id: str) -> None:
+        # Try to create thread - this will fail if user doesn't exist
+        # so we'll create the user first if needed
+        await self.create_user(user_id)
+        
+        # Create thread
+        await self.client.thread.create(
+            thread_id=thread_id,
+            user_id=user_id,
+        )
+        
+        logger.info(f"Created ZEP thread: {thread_id} for user {user_id}")
+        self._remember_thread(thread_id, user_id)
+
+    async def ensure_thread_and_get_context(self, thread_id: str, user_id: str) -> Optional[str]:
+        """
+        Make sure the thread exists and return its memory context.
+        
+        For a thread already known to exist this is a single ``get_user_context`` call.
+        Otherwise the context fetch doubles as the existence probe, and the thread (and
+        user, if needed) is only created when it fails.
+        
+        Args:
+            thread_id: The thread ID
+            user_id: The user ID that owns this thread
+            
+        Returns:
+            Memory context string or None if not available
+        """
+        if not self.is_enabled():
+            return None
+
+        known = thread_id in self._known_threads
+        try:
+            memory = await self.client.thread.get_user_context(thread_id=thread_id)
+            self._remember_thread(thread_id, user_id)
+            return memory.context if memory else None
+        except Exception as e:
+            if known:
+                # Possibly deleted on the Zep side; probe again next time
+                self._known_threads.pop(thread_id, None)
+                logger.debug(f"No memory context found for thread {thread_id}: {str(e)}")
+                return None
+
+        # New thread: nothing to remember yet
+        try:
+            await self._add_thread(thread_id, user_id)
+        except Exception as e:
+            logger.error(f"Failed to create ZEP thread {thread_id}: {str(e)}")
+        return None
+
+    def _remember(self, registry: "OrderedDict[str, None]", key: str) -> None:
+        registry[key] = None
+        registry.move_to_end(key)
+        while len(registry) > config.ZEP_KNOWN_ENTITIES_MAX:
+            registry.popitem(last=False)
+
+    def _remember_thread(self, thread_id: str, user_id: str) -> None:
+        # A thread can only exist for an existing user
+        self._remember(self._known_threads, thread_id)
+        if user_id:
+            self._remember(self._known_users, user_id)
+
+    def forget_known_entities(self) -> None:
+        """Drop the registry of users and threads known to exist in Zep."""
+        self._known_users.clear()
+        self._known_threads.clear()
     
     def _parse_user_name(self, user_id: str, display_name: str = None) -> tuple[str, str]:
         """
@@ -303,7 +470,8 @@ class ZepManager:
         user_id: str, 
         user_message: str, 
         ai_response: str,
-        thread_id: str
+        thread_id: str,
+        progress: Optional[Dict[str, int]] = None,
     ) -> bool:
         """
         Store a conversation turn (user message + AI response) in Zep.
@@ -313,6 +481,7 @@ class ZepManager:
             user_message: The user's message content
             ai_response: The AI's response content
             thread_id: The thread ID (must be provided)
+            progress: Passed to ``add_messages`` so a retried turn skips batches already sent
             
         Returns:
             True if successful, False otherwise
@@ -332,20 +501,14 @@ class ZepManager:
             logger.debug(f"Ensuring thread {thread_id} exists...")
             await self.create_thread(thread_id, user_id)
 
-            # Add user message
-            logger.debug(f"Adding user message ({len(user_message)} chars)...")
-            user_success = await self.add_message(thread_id, user_message, "user")
-            if not user_success:
-                logger.error(f"Failed to add user message to thread {thread_id}")
-                return False
-            
-            # Add assistant response
-            logger.debug(f"Adding assistant message ({len(ai_response)} chars)...")
-            assistant_success = await self.add_message(thread_id, ai_response, "assistant")
-            if not assistant_success:
-                logger.error(f"Failed to add assistant message to thread {thread_id}")
+            # Add user message and assistant response together
+            logger.debug(f"Adding user ({len(user_message)} chars) and assistant ({len(ai_response)} chars) messages...")
+            turn = [("user", user_message), ("assistant", ai_response)]
+            if not await self.add_messages(thread_id, turn, progress=progress):
+                logger.error(f"Failed to add conversation turn to thread {thread_id}")
                 return False
             
+            self.invalidate_graph_snapshot(user_id)
             logger.info(f"💾 Stored conversation turn for user {user_id} in thread {thread_id}")
             return True
             
@@ -427,75 +590,73 @@ class ZepManager:
         Returns:
             True if successful, False otherwise
         """
-        if not self.is_enabled():
-            return False
+        return await self.add_messages(thread_id, [(role, content)])
+
+    async def add_messages(
+        self,
+        thread_id: str,
+        messages: List[Tuple[str, str]],
+        progress: Optional[Dict[str, int]] = None,
+    ) -> bool:
+        """
+        Add several messages to a thread in as few ``add_messages`` calls as possible.
         
-        # Check content length and handle accordingly
-        if len(content) <= 2400:  # Direct send (keeping 100 char buffer)
-            return await self._send_single_message(thread_id, content, role)
-        elif len(content) <= 9500:  # Use graph.add API (keeping 500 char buffer)  
-            return await self._send_via_graph_api(thread_id, content, role)
-        else:  # Chunk into multiple messages
-            return await self._send_chunked_messages(thread_id, content, role)
-    
-    async def _send_single_message(self, thread_id: str, content: str, role: str) -> bool:
-        """Send a single message via thread.add_messages API."""
-        try:
-            message = Message(role=role, content=content)
-            
-            logger.debug(f"Sending {role} message to thread {thread_id} ({len(content)} chars)...")
-            
-            await self.client.thread.add_messages(
-                thread_id=thread_id,
-                messages=[message]
-            )
-            
-            logger.info(f"✅ Added {role} message to thread {thread_id} ({len(content)} chars)")
-            return True
+        Messages over the per-message size limit are split into ``[Part i/n]`` chunks;
+        all resulting messages are sent in order, up to ZEP_ADD_MESSAGES_BATCH_SIZE per call.
+        
+        Args:
+            thread_id: The thread ID
+            messages: (role, content) pairs in conversation order
+            progress: Optional dict reused across retries of the same write; its "sent"
+                count records accepted messages so a retry only sends the rest
             
-        except Exception as e:
-            logger.error(f"❌ Failed to add {role} message to thread {thread_id}: {str(e)}", exc_info=True)
+        Returns:
+            True if every message was added, False otherwise
+        """
+        if not self.is_enabled():
             return False
-    
-    async def _send_via_graph_api(self, thread_id: str, content: str, role: str) -> bool:
-        """Send message via graph.add API for medium-sized messages."""
-        # Note: This would require implementing the graph.add API integration
-        # For now, fall back to chunking
-        logger.info(f"Message too large for thread API ({len(content)} chars), chunking instead")
-        return await self._send_chunked_messages(thread_id, content, role)
-    
-    async def _send_chunked_messages(self, thread_id: str, content: str, role: str) -> bool:
-        """Send large message as multiple chunks."""
+
         try:
-            chunks = self._smart_chunk_content(content)
-            total_chunks = len(chunks)
-            
-            if total_chunks == 1:
-                # Single chunk, send normally
-                return await self._send_single_message(thread_id, chunks[0], role)
-            
-            # Send multiple chunks with sequence metadata
-            success_count = 0
-            for i, chunk in enumerate(chunks, 1):
-                chunk_header = f"[Part {i}/{total_chunks}]"
-                chunk_content = f"{chunk_header}\n\n{chunk}"
-                
-                if await self._send_single_message(thread_id, chunk_content, role):
-                    success_count += 1
-                else:
-                    logger.error(f"Failed to send chunk {i}/{total_chunks}")
-            
-            success = success_count == total_chunks
-            if success:
-                logger.info(f"Successfully sent large {role} message as {total_chunks} chunks ({len(content)} chars total)")
-            else:
-                logger.error(f"Only {success_count}/{total_chunks} chunks sent successfully")
-            
-            return success
-            
+            outgoing: List[Message] = []
+            for role, content in messages:
+                for chunk in self._message_chunks(content):
+                    outgoing.append(Message(role=role, content=chunk))
         except Exception as e:
-            logger.error(f"Failed to send chunked message: {str(e)}")
+            logger.error(f"Failed to prepare messages for thread {thread_id}: {str(e)}")
             return False
+
+        progress = {} if progress is None else progress
+        already_sent = progress.get("sent", 0)
+        batch_size = max(1, config.ZEP_ADD_MESSAGES_BATCH_SIZE)
+        total_chars = sum(len(m.content) for m in outgoing[already_sent:])
+        for start in range(already_sent, len(outgoing), batch_size):
+            batch = outgoing[start:start + batch_size]
+            try:
+                logger.debug(f"Sending {len(batch)} messages to thread {thread_id}...")
+                await self.client.thread.add_messages(thread_id=thread_id, messages=batch)
+                progress["sent"] = start + len(batch)
+            except Exception as e:
+                logger.error(
+                    f"❌ Failed to add messages {start + 1}-{start + len(batch)} of {len(outgoing)} "
+                    f"to thread {thread_id}: {str(e)}",
+                    exc_info=True,
+                )
+                return False
+
+        calls = (len(outgoing) - already_sent + batch_size - 1) // batch_size
+        logger.info(
+            f"✅ Added {len(outgoing) - already_sent} messages to thread {thread_id} in {calls} call(s) ({total_chars} chars)"
+        )
+        return True
+
+    def _message_chunks(self, content: str) -> List[str]:
+        """Split one message's content into chunks that fit the per-message limit."""
+        if len(content) <= 2400:  # Direct send (keeping 100 char buffer)
+            return [content]
+        chunks = self._smart_chunk_content(content)
+        if len(chunks) == 1:
+            return chunks
+        return [f"[Part {i}/{len(chunks)}]\n\n{chunk}" for i, chunk in enumerate(chunks, 1)]
     
     def _smart_chunk_content(self, content: str, max_chunk_size: int = 2300) -> List[str]:
         """
@@ -739,6 +900,8 @@ class ZepManager:
         """
         Create triplets from nodes and edges.
         
+        Nodes are indexed by uuid once, so this is O(E + N) rather than a node scan per edge.
+        
         Args:
             edges: List of edge dictionaries
             nodes: List of node dictionaries
@@ -746,21 +909,16 @@ class ZepManager:
         Returns:
             List of triplet dictionaries
         """
+        nodes_by_uuid = {node["uuid"]: node for node in nodes}
+
         # Create a Set of node UUIDs that are connected by edges
         connected_node_ids = set()
         
         # Create triplets from edges
         edge_triplets = []
         for edge in edges:
-            source_node = None
-            target_node = None
-            
-            # Find source and target nodes
-            for node in nodes:
-                if node["uuid"] == edge["source_node_uuid"]:
-                    source_node = node
-                if node["uuid"] == edge["target_node_uuid"]:
-                    target_node = node
+            source_node = nodes_by_uuid.get(edge["source_node_uuid"])
+            target_node = nodes_by_uuid.get(edge["target_node_uuid"])
             
             if source_node and target_node:
                 # Add source and target node IDs to connected set
@@ -804,6 +962,56 @@ class ZepManager:
         logger.debug(f"Created {len(all_triplets)} triplets ({len(edge_triplets)} from edges, {len(isolated_triplets)} from isolated nodes)")
         return all_triplets
 
+    async def get_graph_snapshot(self, user_id: str) -> "GraphSnapshot":
+        """
+        Get the user's whole graph with its triplets, served from a per-user cache.
+        
+        Snapshots live for ZEP_GRAPH_SNAPSHOT_TTL_SECONDS and are dropped as soon as new
+        content is stored for the user; concurrent misses for one user share one fetch.
+        
+        Args:
+            user_id: The user ID
+            
+        Returns:
+            GraphSnapshot for the user (empty when Zep is disabled)
+        """
+        if not self.is_enabled():
+            return GraphSnapshot([], [], [])
+
+        cached = self._graph_snapshots.get(user_id)
+        if cached is not None and cached[0] > time.monotonic():
+            self._graph_snapshots.move_to_end(user_id)
+            return cached[1]
+
+        return await _graph_snapshot_flight.do(user_id, lambda: self._build_graph_snapshot(user_id))
+
+    async def _build_graph_snapshot(self, user_id: str) -> "GraphSnapshot":
+        # The single-flight key guarantees one fetch per user, so the counter is ours
+        self._graph_generations[user_id] = 0
+        try:
+            nodes, edges = await asyncio.gather(
+                self.get_all_nodes_by_user_id(user_id),
+                self.get_all_edges_by_user_id(user_id),
+            )
+            snapshot = GraphSnapshot(nodes, edges, self.create_triplets(edges, nodes))
+
+            # Don't cache a snapshot whose fetch overlapped new content being stored
+            ttl = config.ZEP_GRAPH_SNAPSHOT_TTL_SECONDS
+            if ttl > 0 and self._graph_generations.get(user_id) == 0:
+                self._graph_snapshots[user_id] = (time.monotonic() + ttl, snapshot)
+                self._graph_snapshots.move_to_end(user_id)
+                while len(self._graph_snapshots) > config.ZEP_GRAPH_SNAPSHOT_MAX_USERS:
+                    self._graph_snapshots.popitem(last=False)
+            return snapshot
+        finally:
+            self._graph_generations.pop(user_id, None)
+
+    def invalidate_graph_snapshot(self, user_id: str) -> None:
+        """Drop the user's cached graph snapshot, e.g. after new facts were added."""
+        if user_id in self._graph_generations:
+            self._graph_generations[user_id] += 1
+        self._graph_snapshots.pop(user_id, None)
+
     async def store_research_finding(
         self, 
         user_id: str, 
@@ -866,6 +1074,7 @@ class ZepManager:
             success = await self.add_message(thread_id, research_content, "system")
             
             if success:
+                self.invalidate_graph_snapshot(user_id)
                 logger.info(f"💡 Stored research finding for topic '{topic_name}' in Zep (thread: {thread_id})")
             else:
                 logger.error(f"Failed to store research finding for topic '{topic_name}'")
@@ -9,6 +9,8 @@ os.environ.setdefault("DB_PORT", "5432")
 os.environ.setdefault("DB_NAME", "qwestor_test")
 os.environ.setdefault("DB_USER", "qwestor")
 os.environ.setdefault("DB_PASSWORD", "qwestor")
+# Keep search results from leaking between tests; cache tests enable it explicitly
+os.environ.setdefault("SEARCH_CACHE_ENABLED", "false")
 
 import pytest
 import asyncio
@@ -0,0 +1,175 @@
+"""
+Tests for the streaming v2 chat endpoint.
+"""
+import json
+import uuid
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from fastapi import Request
+from fastapi.testclient import TestClient
+from langchain_core.messages import AIMessage, AIMessageChunk
+
+from app import app
+from api.v2.chat import _JsonStringField
+from db import get_session
+from dependencies import inject_user_id
+
+USER_ID = uuid.uuid4()
+CHAT_ID = uuid.uuid4()
+
+
+async def _fake_user(request: Request):
+    request.state.user_id = USER_ID
+
+
+async def _fake_session():
+    yield MagicMock()
+
+
+def _parse_sse(text):
+    events = []
+    for block in text.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.split("\n"))
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+class FakeGraph:
+    def __init__(self, events):
+        self._events = events
+        self.state = None
+
+    async def astream_events(self, state, version):
+        self.state = state
+        for event in self._events:
+            yield event
+
+
+def _token(node, text, run_id="run-1"):
+    return {
+        "event": "on_chat_model_stream",
+        "run_id": run_id,
+        "metadata": {"langgraph_node": node},
+        "data": {"chunk": AIMessageChunk(content=text)},
+        "parent_ids": ["root"],
+    }
+
+
+@pytest.fixture
+def client():
+    app.dependency_overrides[inject_user_id] = _fake_user
+    app.dependency_overrides[get_session] = _fake_session
+    with patch("api.v2.chat.ChatService") as chat_service_cls, patch("api.v2.chat.TopicService") as topic_cls:
+        chat_service = chat_service_cls.return_value
+        chat_service.get_or_create_chat_id = AsyncMock(return_value=CHAT_ID)
+        chat_service.save_history = AsyncMock()
+        topic_cls.return_value.async_extract_and_store_topics = AsyncMock(return_value=True)
+        yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def test_stream_emits_tokens_then_trailing_events(client):
+    final_state = {
+        "messages": [AIMessage(content="Hello there [1]")],
+        "thread_id": str(CHAT_ID),
+        "current_module": "chat",
+        "workflow_context": {
+            "unified_citations": [{"url": "https://example.com", "title": "Example"}],
+            "follow_up_questions": ["Want more?"],
+        },
+    }
+    graph = FakeGraph(
+        [
+            {"event": "on_chain_start", "data": {}, "parent_ids": []},
+            _token("multi_source_analyzer", '{"intent":'),
+            _token("integrator", "Hello"),
+            _token("integrator", " there"),
+            {"event": "on_chain_end", "data": {"output": final_state}, "parent_ids": []},
+        ]
+    )
+
+    with patch("api.v2.chat.chat_graph", graph):
+        resp = client.post("/v2/chat/stream", json={"messages": [{"role": "user", "content": "hi"}]})
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/event-stream")
+    events = _parse_sse(resp.text)
+    names = [name for name, _ in events]
+
+    assert names == ["start", "token", "token", "message", "citations", "follow_up", "done"]
+    assert [data["content"] for name, data in events if name == "token"] == ["Hello", " there"]
+    assert events[3][1]["response"] == "Hello there [1]"
+    assert events[4][1]["citations"][0]["url"] == "https://example.com"
+    assert events[5][1]["questions"] == ["Want more?"]
+    assert graph.state["thread_id"] == str(CHAT_ID)
+
+
+def test_stream_skips_renderer_json_chunks(client):
+    final_state = {
+        "messages": [AIMessage(content="Hello")],
+        "thread_id": str(CHAT_ID),
+        "workflow_context": {},
+    }
+    graph = FakeGraph(
+        [
+            _token("integrator", "Hello"),
+            _token("response_renderer", '{"main_r'),
+            _token("response_renderer", 'esponse"'),
+            _token("response_renderer", ': "Hello"}'),
+            {"event": "on_chain_end", "data": {"output": final_state}, "parent_ids": []},
+        ]
+    )
+
+    with patch("api.v2.chat.chat_graph", graph):
+        resp = client.post("/v2/chat/stream", json={"messages": [{"role": "user", "content": "hi"}]})
+
+    tokens = [data["content"] for name, data in _parse_sse(resp.text) if name == "token"]
+    assert tokens == ["Hello"]
+
+
+def test_stream_fused_integrator_forwards_only_main_response(client):
+    final_state = {
+        "messages": [AIMessage(content="Hello \"you\"")],
+        "thread_id": str(CHAT_ID),
+        "workflow_context": {},
+    }
+    graph = FakeGraph(
+        [
+            _token("integrator", '{"main_r'),
+            _token("integrator", 'esponse": "Hel'),
+            _token("integrator", 'lo \\"you'),
+            _token("integrator", '\\"", "follow_up_questions": ["More?"]}'),
+            {"event": "on_chain_end", "data": {"output": final_state}, "parent_ids": []},
+        ]
+    )
+
+    with patch("api.v2.chat.chat_graph", graph):
+        resp = client.post(
+            "/v2/chat/stream",
+            json={"messages": [{"role": "user", "content": "hi"}], "render_mode": "fused"},
+        )
+
+    tokens = [data["content"] for name, data in _parse_sse(resp.text) if name == "token"]
+    assert "".join(tokens) == 'Hello "you"'
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7])
+def test_json_string_field_decodes_across_chunk_boundaries(size):
+    text = 'Line "one"\n\\ caf\u00e9 \U0001F600 end'
+    doc = json.dumps({"main_response": text, "follow_up_questions": ["x"]})
+    parser = _JsonStringField("main_response")
+
+    out = "".join(parser.feed(doc[i:i + size]) for i in range(0, len(doc), size))
+
+    assert out == text
+
+
+def test_stream_reports_graph_error(client):
+    graph = FakeGraph([{"event": "on_chain_end", "data": {"output": {"error": "boom"}}, "parent_ids": []}])
+
+    with patch("api.v2.chat.chat_graph", graph):
+        resp = client.post("/v2/chat/stream", json={"messages": [{"role": "user", "content": "hi"}]})
+
+    events = _parse_sse(resp.text)
+    assert [name for name, _ in events] == ["start", "error"]
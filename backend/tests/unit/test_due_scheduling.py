@@ -0,0 +1,99 @@
+"""
+Tests for due-time research scheduling (MOTIVATION_SCHEDULING_MODE=due).
+"""
+import asyncio
+import time
+import uuid
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database.motivation_repository import MotivationRepository
+from services.motivation import MotivationSystem
+
+
+@pytest.fixture
+def motivation_system():
+    system = MotivationSystem(session=AsyncMock(spec=AsyncSession))
+    system._config = MagicMock(topic_threshold=0.5, engagement_weight=0.3, quality_weight=0.2, staleness_scale=0.0001)
+    system.is_running = True
+    return system
+
+
+async def test_refresh_due_times_solves_threshold_crossing():
+    session = AsyncMock(spec=AsyncSession)
+    session.execute.return_value = MagicMock(rowcount=3)
+    repo = MotivationRepository(session)
+
+    updated = await repo.refresh_due_times(
+        threshold=0.5, engagement_weight=0.3, quality_weight=0.2, staleness_scale=0.0001, never_due_at=123.0
+    )
+
+    assert updated == 3
+    stmt = session.execute.call_args.args[0]
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "UPDATE topic_scores SET next_due_at=CASE" in sql
+    assert "topic_scores.last_researched IS NULL" in sql
+    session.commit.assert_awaited_once()
+
+
+async def test_due_loop_sleeps_until_next_due_time(motivation_system):
+    due_at = time.time() + 0.1
+    next_due = AsyncMock(side_effect=[due_at, 0.0])
+
+    async def cycle(now):
+        motivation_system.is_running = False
+        return {"topics_researched": 1}
+
+    with patch.object(motivation_system, "update_scores", AsyncMock()), \
+         patch.object(motivation_system, "refresh_due_times", AsyncMock()), \
+         patch.object(motivation_system.db_service, "get_next_due_time", next_due), \
+         patch.object(motivation_system, "_conduct_due_cycle", AsyncMock(side_effect=cycle)) as due_cycle:
+        started = time.monotonic()
+        await motivation_system._due_research_loop()
+
+    assert time.monotonic() - started >= 0.08
+    due_cycle.assert_awaited_once()
+    assert MotivationSystem._wakeup is None
+
+
+async def test_due_loop_wakes_on_topic_change(motivation_system):
+    refresh = AsyncMock()
+
+    async def stop_after_missing_refresh(only_missing=False):
+        if only_missing:
+            motivation_system.is_running = False
+
+    refresh.side_effect = stop_after_missing_refresh
+
+    with patch.object(motivation_system, "update_scores", AsyncMock()), \
+         patch.object(motivation_system, "refresh_due_times", refresh), \
+         patch.object(motivation_system.db_service, "get_next_due_time", AsyncMock(return_value=None)):
+        loop_task = asyncio.create_task(motivation_system._due_research_loop())
+        await asyncio.sleep(0.05)
+        MotivationSystem.notify_topics_changed()
+        await asyncio.wait_for(loop_task, timeout=1)
+
+    refresh.assert_any_await(only_missing=True)
+
+
+async def test_due_cycle_researches_due_users_and_defers_leftovers(motivation_system):
+    user_id = uuid.uuid4()
+    motivation_system.db_service.get_users_with_due_topics = AsyncMock(return_value=[user_id])
+    motivation_system.db_service.defer_overdue_topics = AsyncMock(return_value=1)
+
+    with patch.object(motivation_system, "update_scores", AsyncMock()), \
+         patch.object(motivation_system, "refresh_due_times", AsyncMock()) as refresh, \
+         patch.object(
+             motivation_system,
+             "_conduct_research_cycle",
+             AsyncMock(return_value={"topics_researched": 0, "average_quality": 0.0}),
+         ) as cycle:
+        await motivation_system._conduct_due_cycle(time.time())
+
+    cycle.assert_awaited_once_with(user_ids=[user_id])
+    refresh.assert_awaited_once()
+    now, retry_at = motivation_system.db_service.defer_overdue_topics.call_args.args
+    assert retry_at - now == motivation_system.check_interval
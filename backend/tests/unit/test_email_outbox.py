@@ -0,0 +1,204 @@
+"""
+Tests for the notification email outbox, sent through a local debugging SMTP server.
+"""
+import smtplib
+import socket
+import socketserver
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from models.email_outbox import EmailOutboxEntry
+from services.email_outbox import EmailOutbox, build_digest
+from services.email_service import email_service
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    """Just enough SMTP to accept mail and record it."""
+
+    def reply(self, line):
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self):
+        server = self.server
+        server.connections += 1
+        self.reply("220 localhost debugging server")
+        message = {}
+        while True:
+            line = self.rfile.readline().decode().rstrip("\r\n")
+            if not line:
+                return
+            command = line.split(" ", 1)[0].upper()
+            if command in ("EHLO", "HELO"):
+                self.reply("250 localhost")
+            elif command == "MAIL":
+                message = {"from": line, "rcpt": []}
+                self.reply("250 OK")
+            elif command == "RCPT":
+                if server.reject:
+                    self.reply("550 mailbox unavailable")
+                    continue
+                message["rcpt"].append(line.split(":", 1)[1].strip("<> "))
+                self.reply("250 OK")
+            elif command == "DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                body = []
+                while True:
+                    data = self.rfile.readline().decode().rstrip("\r\n")
+                    if data == ".":
+                        break
+                    body.append(data)
+                message["data"] = "\n".join(body)
+                server.messages.append(message)
+                self.reply("250 OK")
+            elif command == "QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("250 OK")
+
+
+@pytest.fixture
+def smtp_server():
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), _SMTPHandler)
+    server.daemon_threads = True
+    server.connections = 0
+    server.messages = []
+    server.reject = False
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    with patch.multiple(
+        email_service,
+        smtp_host="127.0.0.1",
+        smtp_port=server.server_address[1],
+        use_tls=False,
+        use_ssl=False,
+        smtp_user="",
+        smtp_pass="",
+    ):
+        yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _entry(to_address, subject, attempts=0):
+    return EmailOutboxEntry(
+        id=uuid.uuid4(),
+        to_address=to_address,
+        kind="new_research",
+        subject=subject,
+        text_body=f"Body of {subject}",
+        html_body=None,
+        attempts=attempts,
+        next_attempt_at=datetime.now(timezone.utc),
+    )
+
+
+def test_build_digest_merges_entries_for_one_recipient():
+    to_address, subject, text_body, html_body = build_digest(
+        [_entry("a@example.com", "First"), _entry("a@example.com", "Second")]
+    )
+
+    assert to_address == "a@example.com"
+    assert subject == "2 research updates"
+    assert "Body of First" in text_body and "Body of Second" in text_body
+    assert "<pre>Body of Second</pre>" in html_body
+
+
+async def test_due_emails_sent_as_digests_over_one_connection(smtp_server):
+    rows = [
+        _entry("a@example.com", "Finding 1"),
+        _entry("b@example.com", "Finding 2"),
+        _entry("a@example.com", "Finding 3"),
+    ]
+    record = AsyncMock()
+
+    with patch.object(EmailOutbox, "_claim_due", AsyncMock(return_value=rows)), \
+         patch.object(EmailOutbox, "_record", record):
+        handled = await EmailOutbox.process_due()
+
+    assert handled == 3
+    assert smtp_server.connections == 1
+    assert sorted(m["rcpt"][0] for m in smtp_server.messages) == ["a@example.com", "b@example.com"]
+    sent, failed = record.await_args.args
+    assert set(sent) == {row.id for row in rows}
+    assert failed == []
+
+
+async def test_rejected_emails_are_retried_with_backoff(smtp_server):
+    smtp_server.reject = True
+    rows = [_entry("a@example.com", "Finding 1"), _entry("b@example.com", "Finding 2", attempts=2)]
+    record = AsyncMock()
+
+    with patch.object(EmailOutbox, "_claim_due", AsyncMock(return_value=rows)), \
+         patch.object(EmailOutbox, "_record", record):
+        await EmailOutbox.process_due()
+
+    sent, failed = record.await_args.args
+    assert sent == []
+    assert [row.id for row, _ in failed] == [row.id for row in rows]
+    assert all("550" in error for _, error in failed)
+
+
+def test_send_batch_reports_connection_failure_for_every_email():
+    with patch.multiple(email_service, smtp_host="127.0.0.1", smtp_port=1, use_tls=False, use_ssl=False):
+        errors = email_service.send_batch([("a@example.com", "s", "t", None), ("b@example.com", "s", "t", None)])
+
+    assert len(errors) == 2 and all(errors)
+
+
+def test_send_batch_times_out_on_hung_server():
+    # Accepts the connection but never sends the SMTP greeting
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen(1)
+    try:
+        with patch.multiple(
+            email_service, smtp_host="127.0.0.1", smtp_port=listener.getsockname()[1],
+            use_tls=False, use_ssl=False, timeout=0.2,
+        ):
+            started = time.monotonic()
+            errors = email_service.send_batch([("a@example.com", "s", "t", None)])
+    finally:
+        listener.close()
+
+    assert errors[0] and time.monotonic() - started < 5
+
+
+def test_connection_closed_when_login_fails(smtp_server):
+    close = MagicMock(wraps=smtplib.SMTP.close)
+
+    with patch.multiple(email_service, smtp_user="user", smtp_pass="secret"), \
+         patch.object(smtplib.SMTP, "close", lambda self: close(self)):
+        errors = email_service.send_batch([("a@example.com", "s", "t", None)])
+
+    # The fake server doesn't advertise AUTH, so login fails after connecting
+    assert errors[0]
+    assert close.call_count >= 1
+    assert smtp_server.messages == []
+
+
+async def test_enqueue_is_noop_when_email_disabled():
+    session = MagicMock(commit=AsyncMock())
+
+    with patch("config.EMAIL_NOTIFICATIONS_ENABLED", False):
+        await EmailOutbox.enqueue(session, to_address="a@example.com", kind="k", subject="s", text_body="t")
+
+    session.add.assert_not_called()
+    session.commit.assert_not_awaited()
+
+
+async def test_sent_rows_are_deleted():
+    statements = []
+    session = MagicMock(commit=AsyncMock())
+    session.execute = AsyncMock(side_effect=lambda stmt: statements.append(stmt))
+    session_cm = MagicMock(__aenter__=AsyncMock(return_value=session), __aexit__=AsyncMock(return_value=False))
+
+    with patch("services.email_outbox.SessionLocal", MagicMock(return_value=session_cm)):
+        await EmailOutbox._record([uuid.uuid4()], [])
+
+    assert [str(stmt).split()[0] for stmt in statements] == ["DELETE"]
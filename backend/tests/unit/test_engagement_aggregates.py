@@ -0,0 +1,90 @@
+"""
+Tests for incrementally maintained engagement aggregates on topic_scores.
+"""
+import uuid
+
+from unittest.mock import AsyncMock, MagicMock, patch
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database.motivation_repository import MotivationRepository
+from services.motivation import MotivationSystem
+from services.research import ResearchService
+
+
+def _sql(stmt):
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+async def test_apply_finding_delta_increments_counters():
+    session = AsyncMock(spec=AsyncSession)
+
+    await MotivationRepository(session).apply_finding_delta(
+        uuid.uuid4(), uuid.uuid4(), total=1, quality_sum=0.8, quality_count=1
+    )
+
+    sql = _sql(session.execute.call_args.args[0])
+    assert "total_findings=(topic_scores.total_findings +" in sql
+    assert "quality_sum=(topic_scores.quality_sum +" in sql
+    assert "read_findings" not in sql
+    session.commit.assert_not_called()
+
+
+async def test_apply_finding_delta_without_changes_is_a_noop():
+    session = AsyncMock(spec=AsyncSession)
+
+    await MotivationRepository(session).apply_finding_delta(uuid.uuid4(), uuid.uuid4())
+
+    session.execute.assert_not_called()
+
+
+async def test_mark_read_updates_aggregates_in_same_transaction():
+    session = AsyncMock(spec=AsyncSession)
+    finding = MagicMock(read=False, topic_id=uuid.uuid4())
+    session.execute.return_value = MagicMock(scalar_one_or_none=MagicMock(return_value=finding))
+    user_id = uuid.uuid4()
+
+    with patch("services.research.MotivationRepository") as repo_cls:
+        repo_cls.return_value.apply_finding_delta = AsyncMock()
+        await ResearchService().mark_finding_as_read(session, user_id, uuid.uuid4())
+
+    assert finding.read is True
+    kwargs = repo_cls.return_value.apply_finding_delta.call_args.kwargs
+    assert kwargs["read"] == 1
+    assert kwargs["last_read_at"] > 0
+    session.commit.assert_awaited_once()
+
+
+async def test_delete_finding_subtracts_its_contribution():
+    session = AsyncMock(spec=AsyncSession)
+    topic_id = uuid.uuid4()
+    deleted = MagicMock(topic_id=topic_id, read=True, bookmarked=False, integrated=False, quality_score=0.5)
+    session.execute.return_value = MagicMock(one_or_none=MagicMock(return_value=deleted))
+
+    with patch("services.research.MotivationRepository") as repo_cls:
+        repo_cls.return_value.apply_finding_delta = AsyncMock()
+        await ResearchService().delete_research_finding(session, uuid.uuid4(), uuid.uuid4())
+
+    kwargs = repo_cls.return_value.apply_finding_delta.call_args.kwargs
+    assert kwargs == {
+        "total": -1,
+        "read": -1,
+        "bookmarked": 0,
+        "integrated": 0,
+        "quality_sum": -0.5,
+        "quality_count": -1,
+    }
+
+
+async def test_update_scores_does_not_scan_findings():
+    session = AsyncMock(spec=AsyncSession)
+    system = MotivationSystem(session=session)
+    system._config = MagicMock(staleness_scale=0.0001, engagement_weight=0.3, quality_weight=0.2, topic_threshold=0.5)
+
+    with patch.object(system, "_log_topic_scores_detail", AsyncMock()):
+        await system.update_scores()
+
+    sql = _sql(session.execute.call_args_list[0].args[0])
+    assert sql.startswith("UPDATE topic_scores SET")
+    assert "research_findings" not in sql
+    assert "topic_scores.quality_sum" in sql
@@ -28,6 +28,7 @@ async def motivation_system(mock_session):
 def _mk_topic_score(name, is_exp=True, depth=1, status='active', enabled=False, last_eval=0, backoff_until=0):
     """Create a mock TopicScore object."""
     ts = MagicMock()
+    ts.id = uuid.uuid4()
     ts.topic_name = name
     ts.topic_id = uuid.uuid4()
     ts.user_id = uuid.uuid4()
@@ -43,46 +44,61 @@ def _mk_topic_score(name, is_exp=True, depth=1, status='active', enabled=False,
     return ts
 
 
+def _activity(total=0, reads=0, recent_reads=0, bookmarks=0, integrations=0, window_quality=None, window_interactions=0):
+    """Aggregated finding activity row as returned by get_finding_activity."""
+    return {
+        "total": total,
+        "reads": reads,
+        "recent_reads": recent_reads,
+        "bookmarks": bookmarks,
+        "integrations": integrations,
+        "window_quality": window_quality,
+        "window_interactions": window_interactions,
+    }
+
+
+def _run_lifecycle(motivation_system, topic_scores, activity):
+    """Patch the aggregate query and batched write around one lifecycle evaluation."""
+    db = motivation_system.db_service
+    return (
+        patch.object(db, 'get_user_topic_scores', AsyncMock(return_value=topic_scores)),
+        patch.object(db, 'get_finding_activity', AsyncMock(return_value=activity)),
+        patch.object(db, 'bulk_update_topic_meta', AsyncMock()),
+    )
+
+
 @pytest.mark.asyncio
-async def test_lifecycle_promote_children(motivation_system):
+async def test_lifecycle_promote_children(monkeypatch, motivation_system):
     """Test that topics with high engagement get promoted."""
+    monkeypatch.setattr(app_config, "EXPANSION_PROMOTE_ENGAGEMENT", 0.35, raising=False)
+    monkeypatch.setattr(app_config, "EXPANSION_MIN_QUALITY", 0.6, raising=False)
     user_id = str(uuid.uuid4())
-
-    # Create topic score
     topic_score = _mk_topic_score("T1", enabled=False)
+    activity = {topic_score.topic_id: _activity(total=2, reads=2, window_quality=0.8, window_interactions=2)}
 
-    # Mock db_service to return topic scores
-    with patch.object(motivation_system.db_service, 'get_user_topic_scores', return_value=[topic_score]):
-        # Mock engagement calculation to return high engagement
-        with patch.object(motivation_system, '_get_topic_engagement_score', return_value=0.5):
-            with patch.object(motivation_system, 'get_recent_average_quality', return_value=0.8):
-                with patch.object(motivation_system.db_service, 'update_topic_score') as mock_update:
-                    await motivation_system._update_expansion_lifecycle(user_id)
+    scores_p, activity_p, bulk_p = _run_lifecycle(motivation_system, [topic_score], activity)
+    with scores_p, activity_p, bulk_p as bulk:
+        await motivation_system._update_expansion_lifecycle(user_id)
 
-                    # Should have attempted update
-                    # (actual assertion depends on the promote threshold being met)
+    updates = bulk.call_args.args[0]
+    assert updates[topic_score.id]["child_expansion_enabled"] is True
+    assert updates[topic_score.id]["expansion_status"] == "active"
 
 
 @pytest.mark.asyncio
 async def test_lifecycle_pause_on_cold_engagement(motivation_system):
     """Test that topics with cold engagement get paused."""
     user_id = str(uuid.uuid4())
-
-    # Create topic score with active status
     topic_score = _mk_topic_score("Cold", enabled=False, status='active')
 
-    # Mock db_service to return topic scores
-    with patch.object(motivation_system.db_service, 'get_user_topic_scores', return_value=[topic_score]):
-        # Mock zero engagement
-        with patch.object(motivation_system, '_get_topic_engagement_score', return_value=0.0):
-            with patch.object(motivation_system, 'get_recent_average_quality', return_value=0.3):
-                # Mock no interactions
-                with patch.object(motivation_system.research_service, 'async_get_findings', return_value=(True, [])):
-                    with patch.object(motivation_system.db_service, 'update_topic_score') as mock_update:
-                        await motivation_system._update_expansion_lifecycle(user_id)
+    scores_p, activity_p, bulk_p = _run_lifecycle(motivation_system, [topic_score], {})
+    with scores_p, activity_p, bulk_p as bulk:
+        await motivation_system._update_expansion_lifecycle(user_id)
 
-                        # Verify update was called (may be pausing the topic)
-                        # The exact behavior depends on threshold values
+    meta = bulk.call_args.args[0][topic_score.id]
+    assert meta["expansion_status"] == "paused"
+    assert meta["child_expansion_enabled"] is False
+    assert meta["last_backoff_until"] > time.time()
 
 
 @pytest.mark.asyncio
@@ -94,18 +110,43 @@ async def test_lifecycle_retire_after_ttl(monkeypatch, motivation_system):
     old = time.time() - (2 * 24 * 3600)
     topic_score = _mk_topic_score("OldPaused", status='paused', last_eval=old)
 
-    with patch.object(motivation_system.db_service, 'get_user_topic_scores', return_value=[topic_score]):
-        with patch.object(motivation_system, '_get_topic_engagement_score', return_value=0.0):
-            with patch.object(motivation_system, 'get_recent_average_quality', return_value=0.0):
-                with patch.object(motivation_system.research_service, 'async_get_findings', return_value=(True, [])):
-                    with patch.object(motivation_system.db_service, 'update_topic_score') as mock_update:
-                        await motivation_system._update_expansion_lifecycle(user_id)
+    scores_p, activity_p, bulk_p = _run_lifecycle(motivation_system, [topic_score], {})
+    with scores_p, activity_p, bulk_p as bulk:
+        await motivation_system._update_expansion_lifecycle(user_id)
+
+    assert bulk.call_args.args[0][topic_score.id]["expansion_status"] == "retired"
+
+
+@pytest.mark.asyncio
+async def test_interaction_in_window_prevents_pause(motivation_system):
+    """A recent read/bookmark keeps a low-engagement topic active."""
+    user_id = str(uuid.uuid4())
+    topic_score = _mk_topic_score("Warm", status='active')
+    activity = {topic_score.topic_id: _activity(total=20, window_interactions=1)}
+
+    scores_p, activity_p, bulk_p = _run_lifecycle(motivation_system, [topic_score], activity)
+    with scores_p, activity_p, bulk_p as bulk:
+        await motivation_system._update_expansion_lifecycle(user_id)
+
+    assert bulk.call_args.args[0] == {}
+
+
+@pytest.mark.asyncio
+async def test_lifecycle_uses_one_aggregate_query_for_all_topics(motivation_system):
+    """All expansion topics of a user are evaluated from a single aggregate query and one write."""
+    user_id = str(uuid.uuid4())
+    topic_scores = [_mk_topic_score(f"T{i}") for i in range(5)]
+
+    scores_p, activity_p, bulk_p = _run_lifecycle(motivation_system, topic_scores, {})
+    with scores_p, activity_p as activity, bulk_p as bulk, \
+         patch.object(motivation_system.research_service, 'async_get_findings') as get_findings:
+        await motivation_system._update_expansion_lifecycle(user_id)
 
-                        # Should have called update to retire the topic
-                        if mock_update.called:
-                            call_args = mock_update.call_args
-                            if call_args and call_args.kwargs.get('meta_data'):
-                                assert call_args.kwargs['meta_data'].get('expansion_status') == 'retired'
+    activity.assert_awaited_once()
+    assert activity.call_args.args[1] == [ts.topic_id for ts in topic_scores]
+    bulk.assert_awaited_once()
+    assert len(bulk.call_args.args[0]) == 5
+    get_findings.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -116,15 +157,15 @@ async def test_depth_and_backoff_gate(monkeypatch, motivation_system):
 
     # Topic at max depth
     topic_score = _mk_topic_score("Parent", depth=1, enabled=False)
+    activity = {topic_score.topic_id: _activity(total=2, reads=2, window_quality=0.7, window_interactions=2)}
 
-    with patch.object(motivation_system.db_service, 'get_user_topic_scores', return_value=[topic_score]):
-        with patch.object(motivation_system, '_get_topic_engagement_score', return_value=0.5):
-            with patch.object(motivation_system, 'get_recent_average_quality', return_value=0.7):
-                with patch.object(motivation_system.db_service, 'update_topic_score') as mock_update:
-                    await motivation_system._update_expansion_lifecycle(user_id)
+    scores_p, activity_p, bulk_p = _run_lifecycle(motivation_system, [topic_score], activity)
+    with scores_p, activity_p, bulk_p as bulk:
+        await motivation_system._update_expansion_lifecycle(user_id)
 
-                    # Lifecycle should still process, depth gating is for expansions
-                    # not for lifecycle updates
+    # Lifecycle should still process, depth gating is for expansions
+    # not for lifecycle updates
+    bulk.assert_awaited_once()
 
 
 @pytest.mark.asyncio
@@ -135,10 +176,10 @@ async def test_gating_only_affects_expansions(motivation_system):
     # Non-expansion topic
     topic_score = _mk_topic_score("Root", is_exp=False)
 
-    with patch.object(motivation_system.db_service, 'get_user_topic_scores', return_value=[topic_score]):
-        with patch.object(motivation_system, '_get_topic_engagement_score', return_value=0.5):
-            with patch.object(motivation_system.db_service, 'update_topic_score') as mock_update:
-                await motivation_system._update_expansion_lifecycle(user_id)
+    scores_p, activity_p, bulk_p = _run_lifecycle(motivation_system, [topic_score], {})
+    with scores_p, activity_p as activity, bulk_p as bulk:
+        await motivation_system._update_expansion_lifecycle(user_id)
 
-                # Non-expansion topics should be skipped
-                mock_update.assert_not_called()
+    # Non-expansion topics should be skipped
+    activity.assert_not_called()
+    bulk.assert_not_called()
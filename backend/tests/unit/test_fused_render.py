@@ -0,0 +1,79 @@
+"""
+Tests for the single-pass (fused) integrator + renderer mode.
+"""
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from langchain_core.messages import AIMessage, HumanMessage
+
+from builders.chat import create_chat_graph
+from llm_models import FormattedResponse
+from services.nodes.integrator import integrator_node, use_fused_render
+
+
+def _state(**overrides):
+    state = {
+        "messages": [HumanMessage(content="What is caffeine?")],
+        "module_results": {},
+        "workflow_context": {},
+        "intent": "chat",
+        "thread_id": None,
+    }
+    state.update(overrides)
+    return state
+
+
+def test_use_fused_render_modes():
+    with patch("services.nodes.integrator.config.CHAT_RENDER_MODE", "two_pass"):
+        assert use_fused_render(_state()) is False
+        assert use_fused_render(_state(render_mode="fused")) is True
+    with patch("services.nodes.integrator.config.CHAT_RENDER_MODE", "fused_chat"):
+        assert use_fused_render(_state()) is True
+        assert use_fused_render(_state(intent="search")) is False
+    with patch("services.nodes.integrator.config.CHAT_RENDER_MODE", "fused"):
+        assert use_fused_render(_state(workflow_context={"research_metadata": {"topic": "x"}})) is False
+
+
+async def test_fused_integrator_renders_in_one_call():
+    structured = MagicMock()
+    structured.ainvoke = AsyncMock(
+        return_value=FormattedResponse(main_response="Caffeine is a stimulant.", follow_up_questions=["How much is safe?"])
+    )
+
+    with patch("services.nodes.integrator.LLMGateway.get_structured", return_value=structured) as get_structured, \
+         patch("services.nodes.integrator.LLMGateway.get", side_effect=AssertionError("plain call not expected")):
+        result = await integrator_node(_state(render_mode="fused"))
+
+    get_structured.assert_called_once()
+    structured.ainvoke.assert_awaited_once()
+    system_prompt = structured.ainvoke.await_args.args[0][0].content
+    assert "follow-up questions" in system_prompt
+    assert result["workflow_context"]["render_mode"] == "fused"
+    assert result["workflow_context"]["follow_up_questions"] == ["How much is safe?"]
+    assert isinstance(result["messages"][-1], AIMessage)
+    assert result["messages"][-1].content == "Caffeine is a stimulant."
+
+
+async def test_chat_graph_skips_renderer_in_fused_mode():
+    async def fake_integrator(state):
+        state["workflow_context"]["render_mode"] = "fused"
+        state["messages"].append(AIMessage(content="done"))
+        return state
+
+    renderer = AsyncMock(side_effect=AssertionError("renderer should be skipped"))
+
+    async def passthrough(state):
+        return state
+
+    async def analyzer(state):
+        state["intent"] = "chat"
+        return state
+
+    with patch("builders.chat.initializer_node", passthrough), \
+         patch("builders.chat.multi_source_analyzer_node", analyzer), \
+         patch("builders.chat.integrator_node", fake_integrator), \
+         patch("builders.chat.response_renderer_node", renderer):
+        graph = create_chat_graph()
+        result = await graph.ainvoke(_state(render_mode="fused"))
+
+    renderer.assert_not_called()
+    assert result["messages"][-1].content == "done"
@@ -0,0 +1,130 @@
+"""
+Tests for the local intent pre-router used by the multi-source analyzer.
+"""
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from langchain_core.messages import HumanMessage
+
+from services.intent_prerouter import IntentPreRouter
+from services.pubsub import PubSub, ROUTER_EXAMPLES_TOPIC
+
+
+@pytest.fixture(autouse=True)
+def reset_router():
+    IntentPreRouter.reset_stats()
+    IntentPreRouter.set_custom_examples([])
+    yield
+    IntentPreRouter.reset_stats()
+    IntentPreRouter.set_custom_examples([])
+
+
+@pytest.mark.parametrize("message", ["Hi there!", "hello", "Thanks so much, that helps", "ok", "Got it.", "bye"])
+def test_trivial_messages_routed_to_chat_by_rule(message):
+    decision = IntentPreRouter.route(message)
+
+    assert decision is not None
+    assert decision.method == "rule"
+    assert decision.intent == "chat"
+    assert decision.sources == []
+
+
+@pytest.mark.parametrize(
+    "message,sources",
+    [
+        ("Search the web for nvidia earnings", ["search"]),
+        ("Find recent papers on CRISPR delivery", ["academic_search"]),
+        ("look up clinical trials for semaglutide", ["medical_search"]),
+        ("check hacker news for rust discussions", ["social_search"]),
+    ],
+)
+def test_explicit_search_requests(message, sources):
+    decision = IntentPreRouter.route(message)
+
+    assert decision.intent == "search"
+    assert decision.sources == sources
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        "What is the capital of France?",
+        "tell me about quantum computing",
+        "yes please",
+        "hi, can you compare the last three fed rate decisions and explain what they mean for mortgages",
+    ],
+)
+def test_uncertain_messages_fall_back(message):
+    assert IntentPreRouter.route(message) is None
+
+
+def test_nearest_example_match():
+    decision = IntentPreRouter.route("What's the latest news today?")
+
+    assert decision.method == "example"
+    assert decision.intent == "search"
+    assert decision.sources == ["search"]
+
+
+def test_custom_examples_extend_index():
+    assert IntentPreRouter.route("show me the arxiv feed") is None
+
+    IntentPreRouter.set_custom_examples([("show me the arxiv feed", "search", ["academic_search"])])
+    decision = IntentPreRouter.route("show me the arxiv feed")
+
+    assert decision.method == "example"
+    assert decision.sources == ["academic_search"]
+
+
+def test_stats_track_hit_rate():
+    IntentPreRouter.route("hi")
+    IntentPreRouter.route("what can you do")
+    IntentPreRouter.route("Explain the causes of the 2008 financial crisis")
+    IntentPreRouter.route("thanks")
+
+    stats = IntentPreRouter.get_stats()
+    assert stats["requests"] == 4
+    assert stats["rule_hits"] == 2
+    assert stats["example_hits"] == 1
+    assert stats["fallbacks"] == 1
+    assert stats["hit_rate"] == 0.75
+    assert stats["hits_by_rule"] == {"greeting": 1, "thanks": 1}
+
+
+async def test_example_changes_reload_every_worker():
+    await PubSub.stop()
+    refresh = AsyncMock()
+
+    with patch.object(IntentPreRouter, "refresh_examples", refresh):
+        # This worker's admin change reloads once, not again via its own broadcast
+        await IntentPreRouter.examples_changed()
+        await asyncio.sleep(0)
+        assert refresh.await_count == 1
+
+        # A change made on another worker reloads here in the background
+        await PubSub._dispatch(ROUTER_EXAMPLES_TOPIC, {"origin": "other-worker"})
+        await IntentPreRouter._refresh_task
+        assert refresh.await_count == 2
+    await PubSub.stop()
+
+
+def test_disabled_router_always_falls_back():
+    with patch("services.intent_prerouter.config.PREROUTER_ENABLED", False):
+        assert IntentPreRouter.route("hi") is None
+
+
+async def test_analyzer_skips_llm_for_pre_routed_turn():
+    from services.nodes.multi_source_analyzer import multi_source_analyzer_node
+
+    state = {"messages": [HumanMessage(content="Thank you!")], "module_results": {}, "workflow_context": {}}
+    with patch(
+        "services.nodes.multi_source_analyzer.LLMGateway.get_structured",
+        side_effect=AssertionError("router LLM should not be called"),
+    ):
+        result = await multi_source_analyzer_node(state)
+
+    assert result["intent"] == "chat"
+    assert result["selected_sources"] == []
+    assert result["routing_analysis"]["model_used"] == "local_rule"
@@ -0,0 +1,64 @@
+"""
+Tests for the shared LLM gateway used by graph nodes.
+"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from langchain_core.messages import HumanMessage
+
+from llm_models import MultiSourceAnalysis
+from services.http_client import HttpClientPool
+from services.llm_gateway import LLMGateway
+
+
+@pytest.fixture(autouse=True)
+async def reset_pool():
+    with patch("services.llm_gateway.config.OPENAI_API_KEY", "test-key"):
+        yield
+    await HttpClientPool.aclose()
+
+
+class TestLLMGateway:
+    async def test_client_cached_per_settings(self):
+        a = LLMGateway.get("gpt-4o-mini", temperature=0.0, max_tokens=200)
+        b = LLMGateway.get("gpt-4o-mini", temperature=0, max_tokens=200)
+        c = LLMGateway.get("gpt-4o-mini", temperature=0.3, max_tokens=200)
+
+        assert a is b
+        assert a is not c
+
+    async def test_clients_share_connection_pool(self):
+        a = LLMGateway.get("gpt-4o-mini", temperature=0.0)
+        b = LLMGateway.get("gpt-4o", temperature=0.7, max_tokens=1000)
+
+        assert a.http_async_client is b.http_async_client
+
+    async def test_structured_runnable_cached(self):
+        a = LLMGateway.get_structured(MultiSourceAnalysis, model="gpt-4o-mini", temperature=0.0, max_tokens=200)
+        b = LLMGateway.get_structured(MultiSourceAnalysis, model="gpt-4o-mini", temperature=0.0, max_tokens=200)
+
+        assert a is b
+
+    async def test_cache_rebuilt_after_pool_close(self):
+        a = LLMGateway.get("gpt-4o-mini")
+        await HttpClientPool.aclose()
+
+        assert LLMGateway.get("gpt-4o-mini") is not a
+
+
+async def test_multi_source_analyzer_awaits_gateway():
+    structured = MagicMock()
+    structured.ainvoke = AsyncMock(
+        return_value=MultiSourceAnalysis(intent="search", reason="needs web", sources=["search"])
+    )
+    structured.invoke = MagicMock(side_effect=AssertionError("sync invoke must not be used"))
+
+    from services.nodes.multi_source_analyzer import multi_source_analyzer_node
+
+    state = {"messages": [HumanMessage(content="latest AI news")], "module_results": {}, "workflow_context": {}}
+    with patch("services.nodes.multi_source_analyzer.LLMGateway.get_structured", return_value=structured):
+        result = await multi_source_analyzer_node(state)
+
+    structured.ainvoke.assert_awaited_once()
+    assert result["intent"] == "search"
+    assert result["selected_sources"] == ["search"]
@@ -0,0 +1,77 @@
+"""
+Regression test: notification WebSockets must not hold a pooled DB session open.
+"""
+import threading
+from contextlib import ExitStack
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+
+from app import app
+from db import get_session
+from dependencies import get_user_id_from_token
+
+POOL_SIZE = 5
+
+
+class FakePool:
+    """Session factory that fails like an exhausted pool once POOL_SIZE sessions are open."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.open = 0
+        self.peak = 0
+
+    def __call__(self):
+        return self
+
+    async def __aenter__(self):
+        with self.lock:
+            if self.open >= POOL_SIZE:
+                raise TimeoutError("QueuePool limit reached")
+            self.open += 1
+            self.peak = max(self.peak, self.open)
+        return object()
+
+    async def __aexit__(self, *exc):
+        with self.lock:
+            self.open -= 1
+
+
+def test_many_open_sockets_do_not_exhaust_db_pool():
+    pool = FakePool()
+    user_id = uuid4()
+
+    async def pooled_session():
+        async with pool() as session:
+            yield session
+
+    app.dependency_overrides[get_session] = pooled_session
+    app.dependency_overrides[get_user_id_from_token] = lambda: user_id
+    client = TestClient(app)
+    try:
+        with patch("api.v2.notification.SessionLocal", pool), \
+             patch("api.v2.notification.resolve_ws_user", AsyncMock(return_value=str(user_id))), \
+             patch("dependencies.UserService.get_user", AsyncMock()), \
+             ExitStack() as stack:
+            sockets = [
+                stack.enter_context(client.websocket_connect("/v2/notification/ws?token=t"))
+                for _ in range(POOL_SIZE * 4)
+            ]
+            for socket in sockets:
+                assert socket.receive_json()["type"] == "connection_established"
+
+            assert pool.open == 0
+
+            # A request that needs a DB session is still served while every socket is open
+            response = client.get("/v2/notification/status")
+            assert response.status_code == 200
+            assert response.json()["user_connections"] == POOL_SIZE * 4
+
+            sockets[0].send_text("ping")
+            assert sockets[0].receive_json()["type"] == "heartbeat"
+    finally:
+        app.dependency_overrides = {}
+
+    assert pool.peak <= POOL_SIZE
@@ -0,0 +1,113 @@
+"""
+Tests and micro-benchmark for OpenAlex abstract reconstruction.
+"""
+import random
+import time
+
+import pytest
+
+from services.search import OpenAlexSearchService
+from services.nodes.evidence_summarizer import _enumerate_items
+from utils import openalex
+from utils.openalex import abstract_words, clear_abstract_cache, reconstruct_abstract
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    clear_abstract_cache()
+    yield
+    clear_abstract_cache()
+
+
+def _invert(text):
+    index = {}
+    for pos, word in enumerate(text.split()):
+        index.setdefault(word, []).append(pos)
+    return index
+
+
+def _sorted_reconstruct(index):
+    """The previous tuple-sort implementation, kept as the reference."""
+    pairs = [(pos, word) for word, positions in index.items() for pos in positions]
+    pairs.sort()
+    return " ".join(word for _, word in pairs)
+
+
+def _realistic_abstract(rng, words=260, vocab=180):
+    # Zipf-like reuse of a limited vocabulary, like real abstracts ("the", "of", "and" repeat a lot)
+    vocabulary = [f"w{i}" for i in range(vocab)]
+    weights = [1 / (i + 1) for i in range(vocab)]
+    return " ".join(rng.choices(vocabulary, weights=weights, k=words))
+
+
+def test_reconstruct_matches_word_order():
+    text = "the cat sat on the mat and the dog sat too"
+    assert reconstruct_abstract(_invert(text)) == text
+
+
+def test_reconstruct_tolerates_bad_positions_and_gaps():
+    index = {"alpha": [0], "beta": [None, 2], "gamma": [], "delta": None, "eps": [-1, 5]}
+    assert reconstruct_abstract(index) == "alpha beta eps"
+    assert reconstruct_abstract({}) == ""
+    assert reconstruct_abstract(None) == ""
+
+
+def test_sparse_positions_fall_back_to_sort():
+    assert reconstruct_abstract({"a": [0], "b": [10_000_000]}) == "a b"
+
+
+def test_first_n_words_without_full_rebuild():
+    text = " ".join(f"w{i}" for i in range(120))
+    index = _invert(text)
+
+    assert reconstruct_abstract(index, max_words=50) == " ".join(f"w{i}" for i in range(50)) + "..."
+    assert reconstruct_abstract(_invert("short abstract"), max_words=50) == "short abstract"
+    assert openalex._abstract_cache == {}  # partial builds are not memoized
+
+
+def test_memoized_per_work_id():
+    index = _invert("memo me please")
+    first = abstract_words(index, "https://openalex.org/W1")
+    second = abstract_words({"ignored": [0]}, "https://openalex.org/W1")
+
+    assert first is second
+    assert reconstruct_abstract({"ignored": [0]}, "https://openalex.org/W1", max_words=2) == "memo me..."
+
+
+def test_call_sites_share_reconstruction():
+    rng = random.Random(1)
+    text = _realistic_abstract(rng, words=80)
+    work = {"id": "https://openalex.org/W42", "title": "Paper", "abstract_inverted_index": _invert(text)}
+    service = OpenAlexSearchService()
+
+    assert service._reconstruct_abstract(work["abstract_inverted_index"], work["id"]) == text
+    formatted = service._format_results({"results": [work]})
+    assert f"Abstract: {' '.join(text.split()[:50])}..." in formatted
+    assert f"Abstract: {text}" in _enumerate_items([work])
+
+
+@pytest.mark.slow
+def test_benchmark_reconstruction():
+    """Micro-benchmark over a page of realistic-size OpenAlex abstracts."""
+    rng = random.Random(7)
+    works = [
+        {"id": f"https://openalex.org/W{i}", "abstract_inverted_index": _invert(_realistic_abstract(rng))}
+        for i in range(25)
+    ]
+    rounds = 40
+
+    def bench(fn):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for work in works:
+                fn(work)
+        return time.perf_counter() - start
+
+    baseline = bench(lambda w: _sorted_reconstruct(w["abstract_inverted_index"]))
+    clear_abstract_cache()
+    memoized = bench(lambda w: reconstruct_abstract(w["abstract_inverted_index"], w["id"]))
+
+    for work in works:
+        index = work["abstract_inverted_index"]
+        assert reconstruct_abstract(index, work["id"]) == _sorted_reconstruct(index)
+    assert memoized < baseline
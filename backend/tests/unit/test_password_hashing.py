@@ -0,0 +1,124 @@
+"""
+Tests for off-loop bcrypt hashing, its overload limit and rehash-on-login.
+"""
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import bcrypt
+import pytest
+
+from exceptions import Overloaded
+from services.auth import AuthService
+from utils import password
+
+
+async def test_hash_and_verify_run_off_loop():
+    with patch("config.PASSWORD_BCRYPT_ROUNDS", 4):
+        hashed = await password.hash_password_async("s3cret")
+
+    assert hashed.startswith("$2b$04$")
+    assert await password.verify_password_async("s3cret", hashed)
+    assert not await password.verify_password_async("wrong", hashed)
+
+
+async def test_saturated_pool_rejects_with_429():
+    release = threading.Event()
+    with patch("config.PASSWORD_HASH_WORKERS", 1), patch("config.PASSWORD_HASH_QUEUE_MAX", 1):
+        busy = [asyncio.ensure_future(password._run_bounded(release.wait, 5)) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        with pytest.raises(Overloaded) as exc_info:
+            await password.verify_password_async("s3cret", "$2b$04$invalid")
+        assert exc_info.value.status_code == 429
+
+        release.set()
+        await asyncio.gather(*busy)
+    assert password.get_stats()["in_flight"] == 0
+
+
+async def test_cancelled_caller_keeps_slot_until_job_finishes():
+    started, release = threading.Event(), threading.Event()
+
+    def job():
+        started.set()
+        release.wait(5)
+
+    before = password.get_stats()["completed"]
+    waiter = asyncio.ensure_future(password._run_bounded(job))
+    await asyncio.to_thread(started.wait, 5)
+    waiter.cancel()
+    await asyncio.gather(waiter, return_exceptions=True)
+
+    # The bcrypt job is still running on the pool, so it still counts against the limit
+    assert password.get_stats()["in_flight"] == 1
+    assert password.get_stats()["completed"] == before
+
+    release.set()
+    for _ in range(100):
+        if password.get_stats()["in_flight"] == 0:
+            break
+        await asyncio.sleep(0.01)
+    assert password.get_stats()["in_flight"] == 0
+    assert password.get_stats()["completed"] == before + 1
+
+
+async def test_login_rehashes_when_work_factor_changes():
+    old_hash = bcrypt.hashpw(b"s3cret", bcrypt.gensalt(rounds=4)).decode()
+    identity = SimpleNamespace(user_id="u1", password_hash=old_hash)
+    session = MagicMock(get=AsyncMock(return_value=SimpleNamespace(id="u1")), commit=AsyncMock())
+    service = AuthService()
+
+    with patch.object(service, "_get_identity", AsyncMock(return_value=identity)), \
+         patch("config.PASSWORD_BCRYPT_ROUNDS", 5):
+        await service.login_local(session, "a@example.com", "s3cret")
+
+        assert identity.password_hash.startswith("$2b$05$")
+        assert bcrypt.checkpw(b"s3cret", identity.password_hash.encode())
+        session.commit.assert_awaited_once()
+
+        # Already at the configured factor: no further rehash
+        await service.login_local(session, "a@example.com", "s3cret")
+        session.commit.assert_awaited_once()
+
+
+async def _max_loop_lag(work) -> float:
+    """Largest gap seen by a 5ms ticker while ``work`` runs."""
+    lag = 0.0
+    done = asyncio.Event()
+
+    async def ticker():
+        nonlocal lag
+        while not done.is_set():
+            start = time.perf_counter()
+            await asyncio.sleep(0.005)
+            lag = max(lag, time.perf_counter() - start - 0.005)
+
+    tick = asyncio.create_task(ticker())
+    await asyncio.sleep(0.01)
+    await work()
+    done.set()
+    await tick
+    return lag
+
+
+@pytest.mark.slow
+async def test_benchmark_event_loop_lag_under_concurrent_logins():
+    """Concurrent logins: inline bcrypt stalls the loop, the worker pool does not."""
+    hashed = bcrypt.hashpw(b"s3cret", bcrypt.gensalt(rounds=10)).decode()
+    logins = 6
+
+    async def inline():
+        async def login():
+            password.verify_password("s3cret", hashed)
+        await asyncio.gather(*(login() for _ in range(logins)))
+
+    async def off_loop():
+        await asyncio.gather(*(password.verify_password_async("s3cret", hashed) for _ in range(logins)))
+
+    inline_lag = await _max_loop_lag(inline)
+    off_loop_lag = await _max_loop_lag(off_loop)
+
+    assert off_loop_lag < inline_lag / 3
@@ -0,0 +1,123 @@
+"""
+Tests for the status/notification pub/sub fan-out.
+"""
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from services import status_manager
+from services.notification_manager import ConnectionManager
+from services.pubsub import PostgresBackend, PubSub, STATUS_TOPIC
+
+
+@pytest.fixture(autouse=True)
+async def memory_backend():
+    await PubSub.stop()
+    with patch("config.PUBSUB_BACKEND", "memory"):
+        await PubSub.start()
+        yield
+    await PubSub.stop()
+
+
+async def test_status_published_reaches_stream():
+    stream = status_manager.status_events("thread-ps")
+
+    await status_manager.publish_status("thread-ps", "Searching...")
+    message = await asyncio.wait_for(stream.__anext__(), timeout=1)
+
+    assert message == "Searching..."
+    await stream.aclose()
+    assert "thread-ps" not in status_manager._channels
+
+
+async def test_remote_status_only_queued_for_connected_streams():
+    await status_manager._deliver_status({"thread_id": "nobody-here", "message": "x", "origin": "other-worker"})
+    assert "nobody-here" not in status_manager._channels
+
+    channel = status_manager._get_channel("watched")
+    await status_manager._deliver_status({"thread_id": "watched", "message": "y", "origin": "other-worker"})
+    assert list(channel.messages) == ["y"]
+    status_manager._channels.pop("watched", None)
+
+
+async def test_notifications_fan_out_to_local_connections():
+    manager = ConnectionManager()
+    socket = MagicMock(send_text=AsyncMock(), accept=AsyncMock())
+    await manager.connect(socket, "user-1")
+
+    await manager.send_to_user("user-1", {"type": "new_research"})
+    await manager.send_to_user("user-2", {"type": "ignored"})
+    await manager.broadcast_to_all({"type": "system_status"})
+    await asyncio.sleep(0.01)
+
+    sent = [json.loads(call.args[0])["type"] for call in socket.send_text.await_args_list]
+    assert sent == ["new_research", "system_status"]
+    manager.disconnect(socket, "user-1")
+
+
+async def test_stalled_socket_does_not_delay_other_connections():
+    manager = ConnectionManager()
+    stalled_send = asyncio.Event()
+
+    async def hang(text):
+        await stalled_send.wait()
+
+    stalled = MagicMock(send_text=AsyncMock(side_effect=hang), accept=AsyncMock())
+    healthy = MagicMock(send_text=AsyncMock(), accept=AsyncMock())
+    await manager.connect(stalled, "user-a")
+    await manager.connect(healthy, "user-b")
+
+    with patch("config.PUBSUB_DELIVERY_TIMEOUT", 0.05):
+        await asyncio.wait_for(manager.broadcast_to_all({"type": "system_status"}), timeout=0.02)
+        await asyncio.sleep(0.01)
+        assert healthy.send_text.await_count == 1
+
+        # The stalled socket times out on its own and is dropped
+        await asyncio.sleep(0.1)
+    assert manager.get_connection_count("user-a") == 0
+    assert manager.get_connection_count("user-b") == 1
+    manager.disconnect(healthy, "user-b")
+
+
+async def test_slow_handler_does_not_block_delivery():
+    received = []
+
+    async def slow(message):
+        await asyncio.sleep(10)
+
+    async def fast(message):
+        received.append(message["value"])
+
+    unsubscribe_slow = PubSub.subscribe("test-topic", slow)
+    unsubscribe_fast = PubSub.subscribe("test-topic", fast)
+    try:
+        with patch("config.PUBSUB_DELIVERY_TIMEOUT", 0.05):
+            await asyncio.wait_for(PubSub.publish("test-topic", {"value": 1}), timeout=1)
+    finally:
+        unsubscribe_slow()
+        unsubscribe_fast()
+
+    assert received == [1]
+    assert PubSub.get_stats()["delivery_timeouts"] >= 1
+
+
+async def test_postgres_backend_dispatches_notifications_in_order():
+    dispatched = []
+
+    async def dispatch(topic, message):
+        dispatched.append((topic, message["n"]))
+
+    backend = PostgresBackend([STATUS_TOPIC])
+    backend._dispatch = dispatch
+    channel = backend.channel(STATUS_TOPIC)
+    for n in range(3):
+        backend._on_notify(None, 1, channel, json.dumps({"n": n}))
+    backend._on_notify(None, 1, "unrelated", json.dumps({"n": 99}))
+
+    task = asyncio.create_task(backend._deliver_forever())
+    await asyncio.sleep(0.01)
+    task.cancel()
+
+    assert dispatched == [(STATUS_TOPIC, 0), (STATUS_TOPIC, 1), (STATUS_TOPIC, 2)]
@@ -0,0 +1,107 @@
+"""
+Tests for the concurrent research-cycle scheduler and upstream request budgets.
+"""
+import asyncio
+import time
+
+from unittest.mock import patch
+
+from services.research_scheduler import ResearchJob, ResearchScheduler
+from services.upstream_budget import OPENALEX, TokenBucket, UpstreamBudgets
+
+
+def _job(user_id, name, log, delay=0.02, result=None, error=None):
+    async def run():
+        log.append(("start", user_id, name))
+        await asyncio.sleep(delay)
+        log.append(("end", user_id, name))
+        if error:
+            raise error
+        return result if result is not None else name
+
+    return ResearchJob(user_id=user_id, name=name, run=run)
+
+
+async def test_runs_jobs_concurrently_within_global_limit():
+    running = peak = 0
+
+    async def run():
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.05)
+        running -= 1
+        return True
+
+    jobs = [ResearchJob(user_id=f"u{i}", name=f"t{i}", run=run) for i in range(8)]
+    started = time.monotonic()
+    results = await ResearchScheduler(max_concurrency=4, max_per_user=1).run(jobs)
+
+    assert results == [True] * 8
+    assert peak == 4
+    # Two waves of 0.05s instead of eight serial jobs
+    assert time.monotonic() - started < 0.3
+
+
+async def test_round_robin_across_users_and_per_user_cap():
+    log = []
+    jobs = [_job("heavy", f"h{i}", log) for i in range(4)] + [_job("light", "l0", log)]
+
+    results = await ResearchScheduler(max_concurrency=2, max_per_user=1).run(jobs)
+
+    assert results == ["h0", "h1", "h2", "h3", "l0"]
+    starts = [(user, name) for event, user, name in log if event == "start"]
+    # The light user's only topic is not queued behind the heavy user's backlog
+    assert starts[:2] == [("heavy", "h0"), ("light", "l0")]
+    # Never two jobs of the same user at once
+    active = set()
+    for event, user, _ in log:
+        if event == "start":
+            assert user not in active
+            active.add(user)
+        else:
+            active.discard(user)
+
+
+async def test_failed_job_returns_exception_and_updates_metrics():
+    ResearchScheduler.reset_stats()
+    log = []
+    boom = RuntimeError("boom")
+    jobs = [_job("u1", "ok", log), _job("u2", "bad", log, error=boom)]
+
+    results = await ResearchScheduler(max_concurrency=2).run(jobs)
+
+    assert results[0] == "ok"
+    assert results[1] is boom
+    stats = ResearchScheduler.get_stats()
+    assert stats["queue_depth"] == 0
+    assert stats["running"] == 0
+    assert stats["completed"] == 1
+    assert stats["failed"] == 1
+    assert stats["last_cycle"]["jobs"] == 2
+    assert stats["last_cycle"]["throughput_per_minute"] > 0
+
+
+async def test_empty_batch():
+    assert await ResearchScheduler().run([]) == []
+
+
+async def test_token_bucket_delays_once_burst_is_spent():
+    bucket = TokenBucket(rpm=600)  # 10/s, burst of 100
+    bucket.tokens = 1
+
+    assert await bucket.acquire() == 0.0
+    waited = await bucket.acquire()
+
+    assert 0.05 <= waited <= 0.15
+
+
+async def test_upstream_budget_disabled_when_rpm_is_zero():
+    UpstreamBudgets.reset()
+    with patch("config.UPSTREAM_RPM_OPENALEX", 0):
+        await asyncio.gather(*(UpstreamBudgets.acquire(OPENALEX) for _ in range(50)))
+
+    stats = UpstreamBudgets.get_stats()[OPENALEX]
+    assert stats["requests"] == 50
+    assert stats["throttled"] == 0
+    UpstreamBudgets.reset()
@@ -0,0 +1,152 @@
+"""
+Tests for the search result cache used by the search services.
+"""
+import asyncio
+import time
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from langchain_core.messages import HumanMessage
+
+from services.http_client import HttpClientPool
+from services.search import HackerNewsSearchService
+from services.search_cache import SearchCache, normalize_query
+
+
+@pytest.fixture(autouse=True)
+async def cache_enabled():
+    SearchCache.clear()
+    with patch("services.search_cache.config.SEARCH_CACHE_ENABLED", True), \
+         patch("services.search_cache.config.SEARCH_CACHE_DB_ENABLED", False):
+        yield
+    SearchCache.clear()
+    await HttpClientPool.aclose()
+
+
+def _ok(text="result"):
+    return {"success": True, "content": text, "raw_results": {"results": [{"title": text}]}}
+
+
+def test_normalize_query():
+    assert normalize_query("  Latest   AI News? ") == "latest ai news"
+    assert SearchCache.make_key("Search", "Latest AI news", "week", "web") == \
+        SearchCache.make_key("Search", "latest ai news?", "week", "web")
+    assert SearchCache.make_key("Search", "latest ai news", "week", "web") != \
+        SearchCache.make_key("Search", "latest ai news", "day", "web")
+    assert SearchCache.make_key("Search", "q", None, "web") != SearchCache.make_key("Search", "q", None, "academic")
+
+
+async def test_hit_after_miss_returns_independent_copy():
+    fetch = AsyncMock(return_value=_ok())
+
+    first = await SearchCache.get_or_fetch("Social Search", "rust async", fetch, ttl=60)
+    first["raw_results"]["results"].clear()  # downstream nodes mutate results in place
+    second = await SearchCache.get_or_fetch("Social Search", "Rust  Async", fetch, ttl=60)
+
+    fetch.assert_awaited_once()
+    assert second["raw_results"]["results"] == [{"title": "result"}]
+    stats = SearchCache.get_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["by_source"]["Social Search"] == {"misses": 1, "hits": 1}
+
+
+async def test_failures_are_not_cached():
+    fetch = AsyncMock(return_value={"success": False, "error": "boom"})
+
+    await SearchCache.get_or_fetch("Search", "q", fetch, ttl=60)
+    await SearchCache.get_or_fetch("Search", "q", fetch, ttl=60)
+
+    assert fetch.await_count == 2
+
+
+async def test_stale_entry_served_while_revalidating():
+    fetch = AsyncMock(side_effect=[_ok("old"), _ok("new")])
+    await SearchCache.get_or_fetch("Search", "q", fetch, ttl=10)
+
+    key = SearchCache.make_key("Search", "q")
+    SearchCache._entries[key].fetched_at = time.time() - 15  # expired but within the stale window
+
+    stale = await SearchCache.get_or_fetch("Search", "q", fetch, ttl=10)
+    assert stale["content"] == "old"
+
+    await asyncio.sleep(0)
+    await asyncio.gather(*SearchCache._tasks)
+    fresh = await SearchCache.get_or_fetch("Search", "q", fetch, ttl=10)
+
+    assert fresh["content"] == "new"
+    assert fetch.await_count == 2
+    stats = SearchCache.get_stats()
+    assert stats["stale_hits"] == 1
+    assert stats["revalidations"] == 1
+
+
+async def test_entry_past_stale_window_is_refetched():
+    fetch = AsyncMock(side_effect=[_ok("old"), _ok("new")])
+    await SearchCache.get_or_fetch("Search", "q", fetch, ttl=10)
+    SearchCache._entries[SearchCache.make_key("Search", "q")].fetched_at = time.time() - 25
+
+    result = await SearchCache.get_or_fetch("Search", "q", fetch, ttl=10)
+
+    assert result["content"] == "new"
+
+
+async def test_lru_evicts_oldest_entry():
+    fetch = AsyncMock(side_effect=lambda: _ok())
+    with patch("services.search_cache.config.SEARCH_CACHE_MAX_ENTRIES", 2):
+        for q in ("a", "b", "a", "c"):
+            await SearchCache.get_or_fetch("Search", q, fetch, ttl=60)
+
+    assert SearchCache.make_key("Search", "a") in SearchCache._entries
+    assert SearchCache.make_key("Search", "b") not in SearchCache._entries
+
+
+async def test_disabled_cache_always_fetches():
+    fetch = AsyncMock(return_value=_ok())
+    with patch("services.search_cache.config.SEARCH_CACHE_ENABLED", False):
+        await SearchCache.get_or_fetch("Search", "q", fetch, ttl=60)
+        await SearchCache.get_or_fetch("Search", "q", fetch, ttl=60)
+
+    assert fetch.await_count == 2
+
+
+async def test_db_tier_shared_between_workers():
+    row = MagicMock(payload=_ok("from db"), fetched_at=datetime.now(timezone.utc), ttl_seconds=60)
+
+    fetch = AsyncMock(return_value=_ok())
+    with patch("services.search_cache.config.SEARCH_CACHE_DB_ENABLED", True), \
+         patch("services.search_cache.SessionLocal") as session_local:
+        session = session_local.return_value.__aenter__.return_value
+        session.scalar = AsyncMock(return_value=row)
+        result = await SearchCache.get_or_fetch("Academic Search", "crispr", fetch, ttl=60)
+
+    fetch.assert_not_awaited()
+    assert result["content"] == "from db"
+    assert SearchCache.get_stats()["db_hits"] == 1
+
+
+async def test_search_service_uses_cache():
+    calls = []
+
+    def handler(request):
+        calls.append(request.url)
+        return httpx.Response(200, json={"hits": [{"title": "Async Python", "url": "https://x", "points": 5}]})
+
+    original_init = httpx.AsyncClient.__init__
+
+    def init(self, *args, **kwargs):
+        kwargs["transport"] = httpx.MockTransport(handler)
+        kwargs.pop("http2", None)
+        original_init(self, *args, **kwargs)
+
+    state = {"messages": [HumanMessage(content="async python")], "workflow_context": {}}
+    with patch.object(httpx.AsyncClient, "__init__", init):
+        first = await HackerNewsSearchService().search(state)
+        second = await HackerNewsSearchService().search(state)
+
+    assert len(calls) == 1
+    assert first == second
+    assert second["result_count"] == 1
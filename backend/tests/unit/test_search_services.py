@@ -0,0 +1,202 @@
+"""
+Tests for the async search services and the shared HTTP transport they use.
+"""
+import asyncio
+import time
+
+import httpx
+import pytest
+from unittest.mock import patch
+
+from langchain_core.messages import HumanMessage
+
+from services.http_client import HttpClientPool
+from services.search import HackerNewsSearchService, OpenAlexSearchService, PubMedSearchService
+
+
+@pytest.fixture(autouse=True)
+async def reset_pool():
+    yield
+    await HttpClientPool.aclose()
+
+
+def _install_transport(handler):
+    """Route every pooled client through an in-memory transport."""
+    original_init = httpx.AsyncClient.__init__
+
+    def init(self, *args, **kwargs):
+        kwargs["transport"] = httpx.MockTransport(handler)
+        kwargs.pop("http2", None)
+        original_init(self, *args, **kwargs)
+
+    return patch.object(httpx.AsyncClient, "__init__", init)
+
+
+class TestHttpClientPool:
+    async def test_reuses_client_per_host(self):
+        a = HttpClientPool.get("https://api.openalex.org/works")
+        b = HttpClientPool.get("https://api.openalex.org/other?x=1")
+        c = HttpClientPool.get("https://hn.algolia.com/api/v1/search")
+
+        assert a is b
+        assert a is not c
+
+    async def test_aclose_resets_pool(self):
+        client = HttpClientPool.get("https://api.openalex.org/works")
+        await HttpClientPool.aclose()
+
+        assert client.is_closed
+        assert HttpClientPool.get("https://api.openalex.org/works") is not client
+
+
+class TestSearchServicesAsync:
+    async def test_hacker_news_search_uses_pooled_client(self):
+        def handler(request):
+            assert request.url.host == "hn.algolia.com"
+            return httpx.Response(200, json={"hits": [{"title": "Async Python", "url": "https://x", "points": 5}]})
+
+        state = {"messages": [HumanMessage(content="async python")], "workflow_context": {}}
+        with _install_transport(handler):
+            result = await HackerNewsSearchService().search(state)
+
+        assert result["success"] is True
+        assert result["result_count"] == 1
+
+    async def test_searches_run_concurrently(self):
+        """Two searches in flight together should take roughly one upstream latency, not two."""
+
+        async def slow_response(_request):
+            await asyncio.sleep(0.2)
+            return httpx.Response(200, json={"hits": [], "esearchresult": {"idlist": []}})
+
+        state = {"messages": [HumanMessage(content="query")], "workflow_context": {}}
+        with _install_transport(slow_response):
+            start = time.perf_counter()
+            results = await asyncio.gather(
+                HackerNewsSearchService().search(state),
+                PubMedSearchService().search(state),
+            )
+            elapsed = time.perf_counter() - start
+
+        assert all(r["success"] for r in results)
+        assert elapsed < 0.35
+
+    async def test_timeout_is_reported(self):
+        def handler(request):
+            raise httpx.ReadTimeout("timed out", request=request)
+
+        state = {"messages": [HumanMessage(content="query")], "workflow_context": {}}
+        with _install_transport(handler):
+            result = await PubMedSearchService().search(state)
+
+        assert result["success"] is False
+        assert "timed out" in result["error"]
+
+
+def _works(prefix, count, start=0):
+    return [
+        {"id": f"https://openalex.org/{prefix}{i}", "title": f"{prefix} {i}", "abstract_inverted_index": {"word": [0]}}
+        for i in range(start, start + count)
+    ]
+
+
+def _openalex_handler(stage_works, delays=None, seen=None):
+    """Answer /works with per-stage results; stage is read from the filter/search params."""
+    delays = delays or {}
+
+    async def handler(request):
+        params = request.url.params
+        if "search" in params:
+            stage = "general"
+        elif params["filter"].startswith("title.search"):
+            stage = "title"
+        else:
+            stage = "abstract"
+        if seen is not None:
+            seen.append(stage)
+        await asyncio.sleep(delays.get(stage, 0))
+        return httpx.Response(200, json={"results": stage_works.get(stage, [])})
+
+    return handler
+
+
+class TestOpenAlexStrategies:
+    @pytest.fixture(autouse=True)
+    def parallel_mode(self):
+        with patch("services.search.config.OPENALEX_SEARCH_MODE", "parallel"), \
+             patch("services.search.config.OPENALEX_HEDGE_DELAY", 5.0):
+            yield
+
+    async def test_title_and_abstract_run_concurrently_and_dedupe(self):
+        seen = []
+        handler = _openalex_handler(
+            {"title": _works("T", 2), "abstract": _works("T", 1) + _works("A", 2)},
+            delays={"title": 0.2, "abstract": 0.2},
+            seen=seen,
+        )
+        with _install_transport(handler):
+            start = time.perf_counter()
+            result = await OpenAlexSearchService()._search_openalex("crispr", limit=10)
+            elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.35
+        assert sorted(seen) == ["abstract", "title"]
+        assert [w["title"] for w in result["results"]] == ["T 0", "T 1", "A 0", "A 1"]
+        assert result["search_strategy"] == "parallel_multi_stage"
+
+    async def test_enough_title_results_cancel_slower_queries(self):
+        handler = _openalex_handler(
+            {"title": _works("T", 10), "abstract": _works("A", 10)},
+            delays={"title": 0.01, "abstract": 2.0},
+        )
+        with _install_transport(handler):
+            start = time.perf_counter()
+            result = await OpenAlexSearchService()._search_openalex("crispr", limit=10)
+            elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.5
+        assert all(w["title"].startswith("T") for w in result["results"])
+
+    async def test_general_query_hedges_sparse_results(self):
+        handler = _openalex_handler(
+            {"title": _works("T", 1), "abstract": _works("A", 1), "general": _works("G", 3)},
+            delays={"title": 0.05, "abstract": 0.05, "general": 0.05},
+        )
+        with patch("services.search.config.OPENALEX_HEDGE_DELAY", 0.01), _install_transport(handler):
+            result = await OpenAlexSearchService()._search_openalex("crispr", limit=10)
+
+        assert [w["title"] for w in result["results"]] == ["T 0", "A 0", "G 0", "G 1", "G 2"]
+
+    async def test_abstracts_reconstructed_only_within_limit(self):
+        handler = _openalex_handler({"title": _works("T", 15)})
+        with _install_transport(handler), \
+             patch.object(OpenAlexSearchService, "_reconstruct_abstract", return_value="word") as reconstruct:
+            result = await OpenAlexSearchService()._search_openalex("crispr", limit=10)
+
+        assert len(result["results"]) == 10
+        assert reconstruct.call_count == 10
+        assert all(w["abstract"] == "word" for w in result["results"])
+
+    async def test_failed_title_query_falls_back_to_other_stages(self):
+        async def handler(request):
+            if request.url.params.get("filter", "").startswith("title.search"):
+                return httpx.Response(500, json={})
+            return httpx.Response(200, json={"results": _works("A", 6)})
+
+        with _install_transport(handler):
+            result = await OpenAlexSearchService()._search_openalex("crispr", limit=10)
+
+        assert result["success"] is True
+        assert len(result["results"]) == 6
+
+    async def test_sequential_mode_matches_stage_order(self):
+        seen = []
+        handler = _openalex_handler(
+            {"title": _works("T", 1), "abstract": _works("A", 1), "general": _works("G", 2)}, seen=seen
+        )
+        with patch("services.search.config.OPENALEX_SEARCH_MODE", "sequential"), _install_transport(handler):
+            result = await OpenAlexSearchService()._search_openalex("crispr", limit=10)
+
+        assert seen == ["title", "abstract", "general"]
+        assert [w["title"] for w in result["results"]] == ["T 0", "A 0", "G 0", "G 1"]
+        assert result["search_strategy"] == "enhanced_multi_stage"
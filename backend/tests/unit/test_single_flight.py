@@ -0,0 +1,163 @@
+"""
+Tests for single-flight coalescing of searches and research LLM calls.
+"""
+import asyncio
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from llm_models import ResearchQualityAssessment
+from services.llm_gateway import ainvoke_structured, llm_flight
+from services.search import OpenAlexSearchService, search_flight
+from services.single_flight import SingleFlight
+
+
+async def test_concurrent_callers_share_one_execution():
+    flight = SingleFlight("test-share")
+    calls = 0
+
+    async def work():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return {"value": 1}
+
+    results = await asyncio.gather(*(flight.do("k", work) for _ in range(5)))
+
+    assert calls == 1
+    assert all(r == {"value": 1} for r in results)
+    assert flight.get_stats() == {"calls": 5, "executions": 1, "coalesced": 4, "in_flight": 0}
+
+
+async def test_share_copies_result_for_waiters():
+    flight = SingleFlight("test-copy")
+
+    async def work():
+        await asyncio.sleep(0.01)
+        return {"items": [1, 2]}
+
+    leader, follower = await asyncio.gather(
+        flight.do("k", work, share=lambda r: {"items": list(r["items"])}),
+        flight.do("k", work, share=lambda r: {"items": list(r["items"])}),
+    )
+    leader["items"].clear()
+
+    assert follower["items"] == [1, 2]
+
+
+async def test_leader_mutation_does_not_reach_waiters():
+    flight = SingleFlight("test-leader-copy")
+    copy = lambda r: {"items": list(r["items"])}
+
+    async def work():
+        await asyncio.sleep(0.01)
+        return {"items": [1, 2]}
+
+    async def leader():
+        result = await flight.do("k", work, share=copy)
+        # Filtering in place right away, before the waiter has resumed
+        result["items"].clear()
+        return result
+
+    leader_result, follower = await asyncio.gather(leader(), flight.do("k", work, share=copy))
+
+    assert leader_result["items"] == []
+    assert follower["items"] == [1, 2]
+
+
+async def test_exception_propagates_to_all_waiters_and_key_is_released():
+    flight = SingleFlight("test-error")
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("upstream down")
+
+    results = await asyncio.gather(flight.do("k", fail), flight.do("k", fail), return_exceptions=True)
+
+    assert all(isinstance(r, ValueError) for r in results)
+    assert await flight.do("k", AsyncMock(return_value="ok")) == "ok"
+
+
+async def test_cancelled_leader_does_not_cancel_shared_call():
+    flight = SingleFlight("test-cancel")
+
+    async def work():
+        await asyncio.sleep(0.05)
+        return "done"
+
+    leader = asyncio.create_task(flight.do("k", work))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(flight.do("k", work))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == "done"
+
+
+async def test_sequential_calls_are_not_coalesced():
+    flight = SingleFlight("test-sequential")
+    work = AsyncMock(return_value=1)
+
+    await flight.do("k", work)
+    await flight.do("k", work)
+
+    assert work.await_count == 2
+
+
+async def test_disabled_runs_every_call():
+    flight = SingleFlight("test-disabled")
+    work = AsyncMock(return_value=1)
+
+    with patch("services.single_flight.config.SINGLE_FLIGHT_ENABLED", False):
+        await asyncio.gather(flight.do("k", work), flight.do("k", work))
+
+    assert work.await_count == 2
+
+
+async def test_identical_searches_share_upstream_request():
+    search_flight.reset_stats()
+    upstream = AsyncMock()
+
+    async def slow_search(query, limit=10):
+        await upstream(query)
+        await asyncio.sleep(0.05)
+        return {"success": True, "results": [{"id": "W1", "title": "Paper"}], "total_count": 1}
+
+    state = {"messages": [HumanMessage(content="CRISPR delivery")], "workflow_context": {}}
+    with patch.object(OpenAlexSearchService, "_search_openalex", side_effect=slow_search):
+        results = await asyncio.gather(*(OpenAlexSearchService().search(state) for _ in range(3)))
+
+    upstream.assert_awaited_once()
+    assert all(r["result_count"] == 1 for r in results)
+    results[0]["raw_results"]["results"].clear()
+    assert results[1]["raw_results"]["results"] == [{"id": "W1", "title": "Paper"}]
+    assert search_flight.get_stats()["coalesced"] == 2
+
+
+async def test_identical_structured_prompts_share_llm_call():
+    llm_flight.reset_stats()
+    assessment = ResearchQualityAssessment(
+        overall_quality_score=0.8, recency_score=0.7, relevance_score=0.9, depth_score=0.6,
+        credibility_score=0.8, novelty_score=0.5, key_insights=["x"], findings_summary="ok",
+    )
+
+    async def ainvoke(_messages):
+        await asyncio.sleep(0.05)
+        return assessment
+
+    structured = MagicMock()
+    structured.ainvoke = AsyncMock(side_effect=ainvoke)
+    messages = [SystemMessage(content="assess this")]
+
+    with patch("services.llm_gateway.LLMGateway.get_structured", return_value=structured):
+        first, second, _ = await asyncio.gather(
+            ainvoke_structured(ResearchQualityAssessment, messages, model="gpt-4o-mini"),
+            ainvoke_structured(ResearchQualityAssessment, messages, model="gpt-4o-mini"),
+            ainvoke_structured(ResearchQualityAssessment, [SystemMessage(content="other")], model="gpt-4o-mini"),
+        )
+
+    assert structured.ainvoke.await_count == 2
+    assert llm_flight.get_stats()["coalesced"] == 1
+    assert first == second
+    assert first is not second
@@ -0,0 +1,161 @@
+"""
+Tests for the concurrent per-source review and summarization stages.
+"""
+import asyncio
+import time
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from langchain_core.messages import HumanMessage
+
+from llm_models import EvidenceSummary, RelevanceSelection
+from services.nodes.evidence_summarizer import evidence_summarizer_node
+from services.nodes.search_results_reviewer import search_results_reviewer_node
+from services.prompt_cache import PromptCache
+
+
+@pytest.fixture(autouse=True)
+def per_source_prompts():
+    # Distinct prompts per source; identical prompts would be coalesced into one call
+    with patch.object(PromptCache, "get", return_value="{source_name}"):
+        yield
+
+
+def _state():
+    def module(title):
+        return {
+            "success": True,
+            "content": f"{title} content",
+            "raw_results": {"results": [{"title": f"{title} 1"}, {"title": f"{title} 2"}]},
+        }
+
+    return {
+        "messages": [HumanMessage(content="effects of caffeine")],
+        "workflow_context": {"refined_search_query": "caffeine effects"},
+        "module_results": {
+            "academic_search": module("Paper"),
+            "social_search": module("Story"),
+            "medical_search": module("Trial"),
+        },
+    }
+
+
+def _slow_structured(result, delay=0.2):
+    async def ainvoke(_messages):
+        await asyncio.sleep(delay)
+        return result
+
+    runnable = MagicMock()
+    runnable.ainvoke = AsyncMock(side_effect=ainvoke)
+    return runnable
+
+
+def _gateway(reviewer=None, summarizer=None):
+    def get_structured(schema, *_args, **_kwargs):
+        if schema is RelevanceSelection:
+            return reviewer
+        if schema is EvidenceSummary:
+            return summarizer
+        raise AssertionError(f"unexpected schema {schema}")
+
+    return get_structured
+
+
+async def test_reviewer_runs_sources_concurrently():
+    reviewer = _slow_structured(RelevanceSelection(selected_indices=[1], reason="best match"))
+    state = _state()
+
+    with patch("services.llm_gateway.LLMGateway.get_structured", side_effect=_gateway(reviewer)):
+        start = time.perf_counter()
+        result = await search_results_reviewer_node(state)
+        elapsed = time.perf_counter() - start
+
+    assert reviewer.ainvoke.await_count == 3
+    assert elapsed < 0.45
+    for key in ("academic_search", "social_search", "medical_search"):
+        assert result["module_results"][key]["filtered_by_reviewer"] is True
+        assert len(result["module_results"][key]["raw_results"]["results"]) == 1
+
+
+async def test_reviewer_respects_concurrency_limit():
+    reviewer = _slow_structured(RelevanceSelection(selected_indices=[0], reason="ok"), delay=0.1)
+
+    with patch("services.nodes.search_results_reviewer.config.SOURCE_STAGE_MAX_CONCURRENCY", 1), \
+         patch("services.llm_gateway.LLMGateway.get_structured", side_effect=_gateway(reviewer)):
+        start = time.perf_counter()
+        await search_results_reviewer_node(_state())
+        elapsed = time.perf_counter() - start
+
+    assert elapsed >= 0.3
+
+
+async def test_reviewer_failure_marks_only_that_source():
+    async def ainvoke(messages):
+        if "Hacker News" in messages[0].content:
+            raise ValueError("bad output")
+        return RelevanceSelection(selected_indices=[0], reason="ok")
+
+    reviewer = MagicMock()
+    reviewer.ainvoke = AsyncMock(side_effect=ainvoke)
+
+    with patch("services.nodes.search_results_reviewer.PromptCache.get", return_value="{source_name}"), \
+         patch("services.llm_gateway.LLMGateway.get_structured", side_effect=_gateway(reviewer)):
+        result = await search_results_reviewer_node(_state())
+
+    assert "error" not in result
+    assert result["module_results"]["social_search"]["success"] is False
+    assert result["module_results"]["academic_search"]["filtered_by_reviewer"] is True
+    assert result["module_results"]["medical_search"]["filtered_by_reviewer"] is True
+
+
+async def test_summarizer_runs_sources_concurrently():
+    summarizer = _slow_structured(EvidenceSummary(summary_text="Summary [1]"))
+    state = _state()
+    for module in state["module_results"].values():
+        module["filtered_by_reviewer"] = True
+
+    with patch("services.llm_gateway.LLMGateway.get_structured", side_effect=_gateway(None, summarizer)):
+        start = time.perf_counter()
+        result = await evidence_summarizer_node(state)
+        elapsed = time.perf_counter() - start
+
+    assert summarizer.ainvoke.await_count == 3
+    assert elapsed < 0.55  # includes the node's 0.1s status delay
+    assert all(m["evidence_summary"] == "Summary [1]" for m in result["module_results"].values())
+
+
+async def test_pipelined_mode_summarizes_during_review():
+    reviewer = _slow_structured(RelevanceSelection(selected_indices=[0], reason="ok"), delay=0.01)
+    summarizer = _slow_structured(EvidenceSummary(summary_text="Pipelined"), delay=0.01)
+    gateway = _gateway(reviewer, summarizer)
+
+    with patch("services.nodes.search_results_reviewer.config.SOURCE_STAGE_PIPELINED", True), \
+         patch("services.llm_gateway.LLMGateway.get_structured", side_effect=gateway):
+        state = await search_results_reviewer_node(_state())
+        assert summarizer.ainvoke.await_count == 3
+
+        state = await evidence_summarizer_node(state)
+
+    # Summarizer node skips sources already handled in the pipeline
+    assert summarizer.ainvoke.await_count == 3
+    assert all(m["evidence_summary"] == "Pipelined" for m in state["module_results"].values())
+
+
+async def test_summarizer_error_reported_in_source_order():
+    async def ainvoke(messages):
+        if "Academic Papers" in messages[0].content or "PubMed" in messages[0].content:
+            raise ValueError(f"failed {messages[0].content}")
+        return EvidenceSummary(summary_text="ok")
+
+    summarizer = MagicMock()
+    summarizer.ainvoke = AsyncMock(side_effect=ainvoke)
+    state = _state()
+    for module in state["module_results"].values():
+        module["filtered_by_reviewer"] = True
+
+    with patch("services.nodes.evidence_summarizer.PromptCache.get", return_value="{source_name}"), \
+         patch("services.llm_gateway.LLMGateway.get_structured", side_effect=_gateway(None, summarizer)):
+        result = await evidence_summarizer_node(state)
+
+    assert "evidence_summarizer_node:Academic Papers" in result["error"]
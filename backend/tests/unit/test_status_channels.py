@@ -0,0 +1,81 @@
+"""
+Tests for bounded, self-expiring status channels.
+"""
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+
+from services import status_manager
+from services.pubsub import PubSub
+
+
+@pytest.fixture(autouse=True)
+async def clean_channels():
+    await PubSub.stop()
+    status_manager._channels.clear()
+    status_manager.reset_stats()
+    with patch("config.PUBSUB_BACKEND", "memory"), patch("config.STATUS_MIN_INTERVAL", 0):
+        await PubSub.start()
+        yield
+    status_manager._channels.clear()
+    status_manager._loop = None
+    await PubSub.stop()
+
+
+async def _local(thread_id, message):
+    await status_manager._deliver_status(
+        {"thread_id": thread_id, "message": message, "origin": PubSub.worker_id}
+    )
+
+
+async def test_full_channel_drops_oldest():
+    with patch("config.STATUS_CHANNEL_MAX_SIZE", 3):
+        for i in range(5):
+            await _local("t1", f"step {i}")
+
+    assert list(status_manager._channels["t1"].messages) == ["step 2", "step 3", "step 4"]
+    assert status_manager.get_stats()["dropped_updates"] == 2
+
+
+async def test_full_channel_coalesces_latest():
+    with patch("config.STATUS_CHANNEL_MAX_SIZE", 3), patch("config.STATUS_CHANNEL_OVERFLOW", "coalesce"):
+        for i in range(5):
+            await _local("t1", f"step {i}")
+
+    assert list(status_manager._channels["t1"].messages) == ["step 0", "step 1", "step 4"]
+
+
+async def test_reaper_evicts_idle_unstreamed_channels_only():
+    await _local("abandoned", "x" * 100)
+    stream = status_manager.status_events("watched")
+    await _local("watched", "hello")
+    assert await asyncio.wait_for(stream.__anext__(), timeout=1) == "hello"
+
+    stats = status_manager.get_stats()
+    assert stats["live_channels"] == 2
+    assert stats["buffered_bytes"] == 100
+
+    with patch("config.STATUS_CHANNEL_IDLE_TTL", 10):
+        evicted = status_manager.reap_idle_channels(now=time.monotonic() + 11)
+
+    assert evicted == 1
+    assert set(status_manager._channels) == {"watched"}
+    assert status_manager.get_stats()["evicted_channels"] == 1
+    await stream.aclose()
+    assert status_manager.get_stats()["live_channels"] == 0
+
+
+async def test_queue_status_uses_bounded_outbox():
+    stream = status_manager.status_events("t2")
+    status_manager.queue_status("t2", "Searching...")
+    assert await asyncio.wait_for(stream.__anext__(), timeout=1) == "Searching..."
+    await stream.aclose()
+
+    # Publisher stuck on the old outbox: the new one fills up and sheds load
+    status_manager._outbox = asyncio.Queue(maxsize=2)
+    for i in range(5):
+        status_manager.queue_status("t3", f"step {i}")
+
+    assert status_manager.get_stats()["outbox_dropped"] == 3
@@ -164,3 +164,49 @@ async def test_expansion_concurrency_guard(monkeypatch, autonomous_researcher):
 
                 # Should have processed topics (exact count depends on limit enforcement)
                 assert isinstance(results, list)
+
+
+@pytest.mark.asyncio
+async def test_expansion_children_researched_concurrently_within_semaphore(monkeypatch, autonomous_researcher):
+    """Children are researched in parallel, bounded by the shared semaphore."""
+    user_id = str(uuid.uuid4())
+    monkeypatch.setattr(app_config, "EXPLORATION_PER_ROOT_MAX", 3, raising=False)
+
+    root_topic = {
+        "topic_id": str(uuid.uuid4()),
+        "topic_name": "Root Topic",
+        "description": "desc",
+        "is_active_research": True
+    }
+
+    def _topic(name):
+        return SimpleNamespace(
+            id=uuid.uuid4(), name=name, description="Auto", is_active_research=True, is_child=True, parent_id=None
+        )
+
+    running = peak = 0
+
+    async def slow_research(uid, topic):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.05)
+        running -= 1
+        return {"success": True, "stored": True, "quality_score": 0.7}
+
+    with patch('services.autonomous_research_engine.TopicExpansionService') as TES:
+        TES.return_value.generate_candidates = AsyncMock(
+            return_value=[_make_candidate(n, 0.9) for n in ("A", "B", "C")]
+        )
+        create = AsyncMock(side_effect=[_topic("A"), _topic("B"), _topic("C")])
+        with patch.object(autonomous_researcher.topic_service, 'async_create_topic', create), \
+             patch.object(autonomous_researcher, 'run_langgraph_research', side_effect=slow_research):
+            results = await autonomous_researcher.process_expansions_for_root(
+                user_id, root_topic, semaphore=asyncio.Semaphore(2)
+            )
+
+    assert [r["topic"]["topic_name"] for r in results] == ["A", "B", "C"]
+    assert peak == 2
+    assert create.await_count == 3
+    # Per-user creation locks are released with the last child
+    assert autonomous_researcher._creation_locks == {}
@@ -15,21 +15,19 @@ async def test_generate_candidates_filters_sorts_and_dedup(monkeypatch):
     # Mock ZepManager
     zep = MagicMock()
     # Nodes and edges with varying similarity and duplicates
-    zep.search_graph = AsyncMock(side_effect=[
-        # nodes
-        [
+    zep.search_graph_all = AsyncMock(return_value={
+        "nodes": [
             {"name": "Quantum Computing", "labels": ["Tech"], "similarity": 0.9},
             {"labels": ["AI"], "similarity": 0.7},  # uses first label
             {"name": "Duplicate Topic", "similarity": 0.6},
             {"name": "Low Similarity", "similarity": 0.3},  # should be filtered out
         ],
-        # edges
-        [
+        "edges": [
             {"fact": "Quantum supremacy achieved", "similarity": 0.85},
             {"name": "AI ethics", "similarity": 0.65},
             {"fact": "Duplicate Topic", "similarity": 0.75},  # duplicate by name
         ],
-    ])
+    })
 
     # Mock ResearchManager with existing topics including a duplicate
     research = MagicMock()
@@ -46,9 +44,9 @@ async def test_generate_candidates_filters_sorts_and_dedup(monkeypatch):
 
     # Mock the LLM to return expected candidates
     from unittest.mock import patch
-    with patch("services.topic_expansion_service.ChatOpenAI") as mock_chat:
+    with patch("services.llm_gateway.LLMGateway.get_structured") as mock_chat:
         mock_structured = MagicMock()
-        mock_chat.return_value.with_structured_output.return_value = mock_structured
+        mock_chat.return_value = mock_structured
         
         class MockTopic:
             def __init__(self, name, source, confidence=0.8, similarity=None):
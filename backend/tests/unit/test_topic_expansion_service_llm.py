@@ -18,22 +18,20 @@ async def test_generate_candidates_llm_valid_json(monkeypatch):
     monkeypatch.setattr(app_config, "EXPANSION_LLM_ENABLED", True, raising=False)
 
     zep = MagicMock()
-    zep.search_graph = AsyncMock(side_effect=[
-        # initial nodes
-        [_mk_zep_node("A", 0.9), _mk_zep_node("B", 0.7)],
-        # initial edges
-        [_mk_zep_edge("B fact", 0.65)],
-    ])
+    zep.search_graph_all = AsyncMock(return_value={
+        "nodes": [_mk_zep_node("A", 0.9), _mk_zep_node("B", 0.7)],
+        "edges": [_mk_zep_edge("B fact", 0.65)],
+    })
 
     research = MagicMock()
     research.get_user_topics.return_value = {"sessions": {"s1": [{"topic_name": "Existing"}]}}
 
     svc = TopicExpansionService(zep, research)
 
-    # Mock ChatOpenAI structured output
-    with patch("services.topic_expansion_service.ChatOpenAI") as chat:
+    # Mock the gateway's structured output
+    with patch("services.llm_gateway.LLMGateway.get_structured") as chat:
         mock_structured = MagicMock()
-        chat.return_value.with_structured_output.return_value = mock_structured
+        chat.return_value = mock_structured
         # Accepted: one zep_node (A), one llm proposal (C); one rejected
         class Accepted:
             def __init__(self, name, source, rationale, sim=None, conf=0.8):
@@ -55,26 +53,6 @@ async def test_generate_candidates_llm_valid_json(monkeypatch):
         })
         mock_structured.ainvoke = AsyncMock(return_value=selection)
 
-        # LLM-only C validation via Zep (nodes preferred)
-        async def validate_query(user_id, q, scope, reranker, limit):
-            if q == "C":
-                return [_mk_zep_node("C", 0.8)]
-            return []
-        # Append to side effects for validate_llm_item
-        zep.search_graph = AsyncMock(side_effect=[
-            # initial nodes
-            [_mk_zep_node("A", 0.9), _mk_zep_node("B", 0.7)],
-            # initial edges
-            [_mk_zep_edge("B fact", 0.65)],
-            # validation for C
-            awaitable := None
-        ])
-        zep.search_graph.side_effect = [
-            [_mk_zep_node("A", 0.9), _mk_zep_node("B", 0.7)],
-            [_mk_zep_edge("B fact", 0.65)],
-            [_mk_zep_node("C", 0.8)],
-        ]
-
         out = await svc.generate_candidates("u1", {"topic_name": "Root"})
 
         names = [c.name for c in out]
@@ -91,13 +69,13 @@ async def test_generate_candidates_llm_valid_json(monkeypatch):
 async def test_generate_candidates_llm_invalid_json_fallback(monkeypatch):
     monkeypatch.setattr(app_config, "EXPANSION_LLM_ENABLED", True, raising=False)
     zep = MagicMock()
-    zep.search_graph = AsyncMock(return_value=[_mk_zep_node("A", 0.9)])
+    zep.search_graph_all = AsyncMock(return_value={"nodes": [_mk_zep_node("A", 0.9)], "edges": []})
     research = MagicMock()
     research.get_user_topics.return_value = {"sessions": {"s1": []}}
     svc = TopicExpansionService(zep, research)
 
-    with patch("services.topic_expansion_service.ChatOpenAI") as chat:
-        chat.return_value.with_structured_output.return_value.ainvoke = AsyncMock(side_effect=Exception("bad json"))
+    with patch("services.llm_gateway.LLMGateway.get_structured") as chat:
+        chat.return_value.ainvoke = AsyncMock(side_effect=Exception("bad json"))
         out = await svc.generate_candidates("u1", {"topic_name": "Root"})
         # When LLM fails, returns empty list (no bad fallbacks)
         assert out == []
@@ -109,14 +87,14 @@ async def test_generate_candidates_llm_only_validated_by_zep(monkeypatch):
     monkeypatch.setattr(app_config, "EXPANSION_MIN_SIMILARITY", 0.5, raising=False)
     zep = MagicMock()
     # initial searches
-    zep.search_graph = AsyncMock(side_effect=[[], [], [_mk_zep_node("LLM1", 0.6)], []])
+    zep.search_graph_all = AsyncMock(return_value={"nodes": [], "edges": []})
     research = MagicMock()
     research.get_user_topics.return_value = {"sessions": {"s1": []}}
     svc = TopicExpansionService(zep, research)
 
-    with patch("services.topic_expansion_service.ChatOpenAI") as chat:
+    with patch("services.llm_gateway.LLMGateway.get_structured") as chat:
         mock_structured = MagicMock()
-        chat.return_value.with_structured_output.return_value = mock_structured
+        chat.return_value = mock_structured
         class Accepted:
             def __init__(self, name, source, rationale, sim=None, conf=0.8):
                 self.name = name
@@ -142,17 +120,17 @@ async def test_generate_candidates_llm_timeout_fallback(monkeypatch):
     monkeypatch.setattr(app_config, "EXPANSION_LLM_ENABLED", True, raising=False)
     monkeypatch.setattr(app_config, "EXPANSION_LLM_TIMEOUT_SECONDS", 1, raising=False)
     zep = MagicMock()
-    zep.search_graph = AsyncMock(return_value=[_mk_zep_node("A", 0.9)])
+    zep.search_graph_all = AsyncMock(return_value={"nodes": [_mk_zep_node("A", 0.9)], "edges": []})
     research = MagicMock()
     research.get_user_topics.return_value = {"sessions": {"s1": []}}
     svc = TopicExpansionService(zep, research)
 
-    with patch("services.topic_expansion_service.ChatOpenAI") as chat:
+    with patch("services.llm_gateway.LLMGateway.get_structured") as chat:
         # Simulate hang by blocking invoke; our wait_for should timeout
         def blocking_invoke(_):
             import time as _t
             _t.sleep(2)
-        chat.return_value.with_structured_output.return_value.ainvoke = AsyncMock(side_effect=blocking_invoke)
+        chat.return_value.ainvoke = AsyncMock(side_effect=blocking_invoke)
         out = await svc.generate_candidates("u1", {"topic_name": "Root"})
         # When LLM times out/fails, returns empty list
         assert out == []
@@ -163,15 +141,15 @@ async def test_generate_candidates_llm_flag_disabled(monkeypatch):
     # Note: EXPANSION_LLM_ENABLED was removed - LLM is always used for topic expansion
     # This test now verifies that LLM is always called even when Zep returns results
     zep = MagicMock()
-    zep.search_graph = AsyncMock(return_value=[_mk_zep_node("A", 0.9)])
+    zep.search_graph_all = AsyncMock(return_value={"nodes": [_mk_zep_node("A", 0.9)], "edges": []})
     research = MagicMock()
     research.get_user_topics.return_value = {"sessions": {"s1": []}}
     svc = TopicExpansionService(zep, research)
 
     # Mock the LLM to return a result
-    with patch("services.topic_expansion_service.ChatOpenAI") as chat:
+    with patch("services.llm_gateway.LLMGateway.get_structured") as chat:
         mock_structured = MagicMock()
-        chat.return_value.with_structured_output.return_value = mock_structured
+        chat.return_value = mock_structured
         
         class Accepted:
             def __init__(self, name, source, rationale, sim=None, conf=0.8):
@@ -195,14 +173,14 @@ async def test_generate_candidates_llm_flag_disabled(monkeypatch):
 async def test_dedupe_against_existing_topics(monkeypatch):
     monkeypatch.setattr(app_config, "EXPANSION_LLM_ENABLED", True, raising=False)
     zep = MagicMock()
-    zep.search_graph = AsyncMock(return_value=[_mk_zep_node("Duplicate", 0.9)])
+    zep.search_graph_all = AsyncMock(return_value={"nodes": [_mk_zep_node("Duplicate", 0.9)], "edges": []})
     research = MagicMock()
     research.get_user_topics.return_value = {"sessions": {"s1": [{"topic_name": "duplicate"}]}}
     svc = TopicExpansionService(zep, research)
 
-    with patch("services.topic_expansion_service.ChatOpenAI") as chat:
+    with patch("services.llm_gateway.LLMGateway.get_structured") as chat:
         mock_structured = MagicMock()
-        chat.return_value.with_structured_output.return_value = mock_structured
+        chat.return_value = mock_structured
         class Accepted:
             def __init__(self, name, source, rationale, sim=None, conf=0.8):
                 self.name = name
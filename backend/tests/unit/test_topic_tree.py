@@ -0,0 +1,69 @@
+"""
+Tests for materialized topic depth/root_id and the recursive subtree query.
+"""
+import uuid
+
+from unittest.mock import AsyncMock, MagicMock, patch
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from services.autonomous_research_engine import AutonomousResearcher
+from services.topic import TopicService
+
+
+def _sql(session):
+    stmt = session.execute.call_args.args[0]
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+async def test_child_creation_derives_depth_and_root_from_parent():
+    session = AsyncMock(spec=AsyncSession)
+    session.execute.return_value = MagicMock(scalar_one_or_none=MagicMock(return_value=MagicMock()))
+
+    await TopicService()._create_topic(
+        session, uuid.uuid4(), "Child", "desc", 0.8, strict=True, is_child=True, parent_id=uuid.uuid4()
+    )
+
+    sql = _sql(session)
+    assert session.execute.await_count == 1
+    assert "(SELECT research_topics_1.depth + " in sql
+    assert "coalesce(research_topics_1.root_id, research_topics_1.id)" in sql
+
+
+async def test_root_creation_has_depth_zero_without_parent_lookup():
+    session = AsyncMock(spec=AsyncSession)
+    session.execute.return_value = MagicMock(scalar_one_or_none=MagicMock(return_value=MagicMock()))
+
+    await TopicService()._create_topic(session, uuid.uuid4(), "Root", "desc", 0.8, strict=True)
+
+    stmt = session.execute.call_args.args[0]
+    params = stmt.compile(dialect=postgresql.dialect()).params
+    assert params["depth"] == 0
+    assert params["root_id"] is None
+
+
+async def test_get_subtree_is_one_recursive_query():
+    session = AsyncMock(spec=AsyncSession)
+    session.execute.return_value = MagicMock(scalars=MagicMock(return_value=MagicMock(all=MagicMock(return_value=[]))))
+
+    await TopicService().get_subtree(session, uuid.uuid4(), uuid.uuid4(), max_levels=2)
+
+    sql = _sql(session)
+    assert session.execute.await_count == 1
+    assert "WITH RECURSIVE topic_subtree" in sql
+    assert "UNION ALL" in sql
+    assert "topic_subtree.level <" in sql
+
+
+async def test_calculate_topic_depth_reads_materialized_column():
+    researcher = AutonomousResearcher()
+    session = AsyncMock(spec=AsyncSession)
+    session.execute.return_value = MagicMock(scalar_one_or_none=MagicMock(return_value=3))
+    session_cm = MagicMock(__aenter__=AsyncMock(return_value=session), __aexit__=AsyncMock(return_value=False))
+
+    with patch("services.autonomous_research_engine.SessionLocal", return_value=session_cm):
+        depth = await researcher._calculate_topic_depth(str(uuid.uuid4()), str(uuid.uuid4()))
+
+    assert depth == 3
+    assert session.execute.await_count == 1
+    assert "research_topics.depth" in _sql(session)
@@ -0,0 +1,102 @@
+"""
+Tests for indexed triplet building and the cached per-user graph snapshot.
+"""
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from storage.zep_manager import GraphSnapshot, ZepManager
+
+
+def _node(uuid):
+    return {"uuid": uuid, "name": uuid, "created_at": "", "updated_at": ""}
+
+
+def _edge(uuid, source, target):
+    return {"uuid": uuid, "source_node_uuid": source, "target_node_uuid": target, "name": uuid}
+
+
+def _manager():
+    z = ZepManager()
+    z.enabled = True
+    z.client = object()
+    z._graph_snapshots.clear()
+    return z
+
+
+def test_create_triplets_indexes_nodes_and_keeps_isolated():
+    nodes = [_node("a"), _node("b"), _node("c")]
+    edges = [_edge("e1", "a", "b"), _edge("dangling", "a", "missing")]
+
+    triplets = ZepManager().create_triplets(edges, nodes)
+
+    assert [(t["sourceNode"]["uuid"], t["edge"]["uuid"], t["targetNode"]["uuid"]) for t in triplets] == [
+        ("a", "e1", "b"),
+        ("c", "isolated-node-c", "c"),
+    ]
+
+
+def test_neighborhood_respects_hops():
+    nodes = [_node(n) for n in "abcd"]
+    edges = [_edge("ab", "a", "b"), _edge("bc", "b", "c"), _edge("cd", "c", "d")]
+    snapshot = GraphSnapshot(nodes, edges, [])
+
+    one_nodes, one_edges = snapshot.neighborhood("b", hops=1)
+    two_nodes, two_edges = snapshot.neighborhood("b", hops=2)
+
+    assert {n["uuid"] for n in one_nodes} == {"a", "b", "c"}
+    assert {e["uuid"] for e in one_edges} == {"ab", "bc"}
+    assert {n["uuid"] for n in two_nodes} == {"a", "b", "c", "d"}
+    assert {e["uuid"] for e in two_edges} == {"ab", "bc", "cd"}
+    assert snapshot.neighborhood("unknown") == ([], [])
+
+
+@pytest.mark.asyncio
+async def test_snapshot_cached_until_invalidated(monkeypatch):
+    monkeypatch.setattr("config.ZEP_GRAPH_SNAPSHOT_TTL_SECONDS", 300, raising=False)
+    z = _manager()
+    nodes = AsyncMock(return_value=[_node("a"), _node("b")])
+    edges = AsyncMock(return_value=[_edge("e1", "a", "b")])
+
+    with patch.object(z, "get_all_nodes_by_user_id", nodes), patch.object(z, "get_all_edges_by_user_id", edges):
+        first = await z.get_graph_snapshot("u-snap")
+        second = await z.get_graph_snapshot("u-snap")
+        z.invalidate_graph_snapshot("u-snap")
+        third = await z.get_graph_snapshot("u-snap")
+
+    assert first is second
+    assert third is not first
+    assert len(third.triplets) == 1
+    assert nodes.await_count == 2
+    assert edges.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_endpoint_reuses_snapshot_across_requests_until_write(monkeypatch):
+    from types import SimpleNamespace
+
+    from api.v2.graph import fetch_graph_data
+    from schemas.graph import GraphIn
+    from services.nodes.base import zep_manager as node_zep_manager
+
+    monkeypatch.setattr("config.ZEP_GRAPH_SNAPSHOT_TTL_SECONDS", 300, raising=False)
+    z = _manager()
+    request = SimpleNamespace(state=SimpleNamespace(user_id="u-endpoint"))
+    body = GraphIn(type="user", id="u-endpoint", limit=1)
+    nodes = AsyncMock(return_value=[_node("a"), _node("b")])
+    edges = AsyncMock(return_value=[_edge("e1", "a", "b")])
+
+    with patch.object(z, "get_all_nodes_by_user_id", nodes), patch.object(z, "get_all_edges_by_user_id", edges), \
+            patch.object(z, "create_thread", AsyncMock(return_value=True)), \
+            patch.object(z, "add_message", AsyncMock(return_value=True)):
+        await fetch_graph_data(request, body)
+        await fetch_graph_data(request, body)
+        assert nodes.await_count == 1
+
+        # A write through another module's handle invalidates the endpoint's snapshot
+        await node_zep_manager.store_research_finding("u-endpoint", "topic", ["insight"], "f-1")
+        page = await fetch_graph_data(request, body)
+
+    assert nodes.await_count == 2
+    assert page.total == 1
+    assert z._graph_generations == {}
@@ -0,0 +1,129 @@
+"""
+Tests for batched Zep message ingestion and the background write queue.
+"""
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from services.zep_ingestion import ZepIngestion
+from storage.zep_manager import ZepManager
+
+
+def _manager():
+    z = ZepManager()
+    z.enabled = True
+    z.client = SimpleNamespace(thread=SimpleNamespace(add_messages=AsyncMock()))
+    return z
+
+
+@pytest.mark.asyncio
+async def test_conversation_turn_is_one_add_messages_call():
+    z = _manager()
+    z._known_threads["t-batch"] = None
+
+    assert await z.store_conversation_turn("u1", "question", "answer", "t-batch") is True
+
+    z.client.thread.add_messages.assert_awaited_once()
+    sent = z.client.thread.add_messages.call_args.kwargs["messages"]
+    assert [(m.role, m.content) for m in sent] == [("user", "question"), ("assistant", "answer")]
+
+
+@pytest.mark.asyncio
+async def test_chunks_are_packed_into_batches(monkeypatch):
+    monkeypatch.setattr("config.ZEP_ADD_MESSAGES_BATCH_SIZE", 4, raising=False)
+    z = _manager()
+    long_text = "\n\n".join("word " * 400 for _ in range(6))  # ~12k chars -> 6 chunks
+
+    assert await z.add_message("t1", long_text, "system") is True
+
+    batches = [call.kwargs["messages"] for call in z.client.thread.add_messages.call_args_list]
+    assert [len(b) for b in batches] == [4, 2]
+    contents = [m.content for b in batches for m in b]
+    assert contents[0].startswith("[Part 1/6]")
+    assert contents[-1].startswith("[Part 6/6]")
+
+
+@pytest.mark.asyncio
+async def test_ingestion_retries_until_success(monkeypatch):
+    monkeypatch.setattr("config.ZEP_INGEST_RETRY_BASE_SECONDS", 0.01, raising=False)
+    monkeypatch.setattr("config.ZEP_INGEST_MAX_RETRIES", 3, raising=False)
+    ZepIngestion.reset_stats()
+    write = AsyncMock(side_effect=[Exception("zep down"), False, True])
+
+    assert ZepIngestion.submit("t1", "turn", write) is True
+    await ZepIngestion.drain(timeout=2)
+
+    assert write.await_count == 3
+    stats = ZepIngestion.get_stats()
+    assert stats["succeeded"] == 1
+    assert stats["retried"] == 2
+    assert stats["workers"] == 0
+
+
+@pytest.mark.asyncio
+async def test_ingestion_keeps_per_key_order_and_gives_up(monkeypatch):
+    monkeypatch.setattr("config.ZEP_INGEST_RETRY_BASE_SECONDS", 0.01, raising=False)
+    monkeypatch.setattr("config.ZEP_INGEST_MAX_RETRIES", 1, raising=False)
+    ZepIngestion.reset_stats()
+    order = []
+
+    def write(n, ok=True):
+        async def run():
+            await asyncio.sleep(0.01 * (3 - n))
+            order.append(n)
+            return ok
+        return run
+
+    ZepIngestion.submit("thread", "first", write(0, ok=False))
+    ZepIngestion.submit("thread", "second", write(1))
+    ZepIngestion.submit("thread", "third", write(2))
+    await ZepIngestion.drain(timeout=2)
+
+    assert order == [0, 0, 1, 2]
+    assert ZepIngestion.get_stats()["failed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_retrying_thread_does_not_block_its_shard(monkeypatch):
+    monkeypatch.setattr("config.ZEP_INGEST_WORKERS", 1, raising=False)
+    monkeypatch.setattr("config.ZEP_INGEST_RETRY_BASE_SECONDS", 0.2, raising=False)
+    ZepIngestion.reset_stats()
+    order = []
+
+    async def flaky():
+        order.append("a")
+        return len(order) > 2
+
+    async def healthy():
+        order.append("b")
+        return True
+
+    ZepIngestion.submit("thread-a", "a", flaky)
+    ZepIngestion.submit("thread-b", "b", healthy)
+    await asyncio.sleep(0.05)
+
+    # thread-b went out while thread-a waits out its backoff
+    assert order == ["a", "b"]
+    assert ZepIngestion.get_stats()["parked_threads"] == 1
+
+    await ZepIngestion.drain(timeout=2)
+    assert order == ["a", "b", "a"]
+    assert ZepIngestion.get_stats()["succeeded"] == 2
+
+
+@pytest.mark.asyncio
+async def test_retried_turn_only_sends_unsent_batches(monkeypatch):
+    monkeypatch.setattr("config.ZEP_ADD_MESSAGES_BATCH_SIZE", 1, raising=False)
+    z = _manager()
+    z.client.thread.add_messages = AsyncMock(side_effect=[None, Exception("zep down"), None])
+    progress = {}
+    turn = [("user", "q"), ("assistant", "a")]
+
+    assert await z.add_messages("t1", turn, progress=progress) is False
+    assert await z.add_messages("t1", turn, progress=progress) is True
+
+    sent = [m.content for call in z.client.thread.add_messages.call_args_list for m in call.kwargs["messages"]]
+    assert sent == ["q", "a", "a"]
+    assert progress == {"sent": 2}
@@ -88,3 +88,66 @@ async def test_search_graph_timeout_returns_empty(monkeypatch):
     z.client = TimeoutClient()
     out = await z.search_graph("u1", "q", scope="nodes")
     assert out == []
+
+
+class CountingGraph:
+    def __init__(self, results, delay=0.0):
+        self._results = results
+        self.delay = delay
+        self.calls = 0
+
+    async def search(self, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return self._results
+
+
+def _counting_manager(delay=0.0):
+    node_obj = SimpleNamespace(name="Tesla", labels=[], uuid_="n-1", score=0.9)
+    edge_obj = SimpleNamespace(fact="Tesla makes EVs", name="makes", uuid_="e-1", score=0.8)
+    z = ZepManager()
+    z.enabled = True
+    z.client = SimpleNamespace(graph=CountingGraph([('nodes', [node_obj]), ('edges', [edge_obj])], delay))
+    z.clear_search_cache()
+    return z
+
+
+@pytest.mark.asyncio
+async def test_search_graph_all_returns_nodes_and_edges_from_one_call():
+    z = _counting_manager()
+
+    out = await z.search_graph_all("u-all", "tesla", limit=5)
+
+    assert [n["name"] for n in out["nodes"]] == ["Tesla"]
+    assert [e["fact"] for e in out["edges"]] == ["Tesla makes EVs"]
+    assert z.client.graph.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_scoped_searches_share_cached_result(monkeypatch):
+    monkeypatch.setattr("config.ZEP_SEARCH_CACHE_TTL_SECONDS", 60, raising=False)
+    z = _counting_manager(delay=0.02)
+
+    nodes, edges = await asyncio.gather(
+        z.search_graph("u-shared", "tesla", scope="nodes"),
+        z.search_graph("u-shared", "tesla", scope="edges"),
+    )
+    again = await z.search_graph("u-shared", "tesla", scope="nodes")
+
+    assert nodes == again and len(nodes) == 1
+    assert len(edges) == 1
+    assert z.client.graph.calls == 1
+    # Returned lists are copies of the cached ones
+    again.clear()
+    assert len(await z.search_graph("u-shared", "tesla", scope="nodes")) == 1
+
+
+@pytest.mark.asyncio
+async def test_search_cache_disabled_with_zero_ttl(monkeypatch):
+    monkeypatch.setattr("config.ZEP_SEARCH_CACHE_TTL_SECONDS", 0, raising=False)
+    z = _counting_manager()
+
+    await z.search_graph_all("u-nocache", "tesla")
+    await z.search_graph_all("u-nocache", "tesla")
+
+    assert z.client.graph.calls == 2
@@ -0,0 +1,62 @@
+"""
+Tests for the Zep user/thread existence registry.
+"""
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from storage.zep_manager import ZepManager
+
+
+def _manager(thread_exists=True):
+    get_user_context = AsyncMock(return_value=SimpleNamespace(context="ctx"))
+    if not thread_exists:
+        get_user_context.side_effect = [Exception("not found"), SimpleNamespace(context="ctx")]
+    client = SimpleNamespace(
+        thread=SimpleNamespace(get_user_context=get_user_context, create=AsyncMock()),
+        user=SimpleNamespace(get=AsyncMock(side_effect=Exception("not found")), add=AsyncMock()),
+    )
+    z = ZepManager()
+    z.enabled = True
+    z.client = client
+    z.forget_known_entities()
+    return z
+
+
+@pytest.mark.asyncio
+async def test_known_thread_costs_one_call_per_turn():
+    z = _manager()
+
+    assert await z.ensure_thread_and_get_context("t1", "u1") == "ctx"
+    assert await z.ensure_thread_and_get_context("t1", "u1") == "ctx"
+    assert await z.create_thread("t1", "u1") is True
+    assert await z.create_user("u1") is True
+
+    assert z.client.thread.get_user_context.await_count == 2
+    z.client.thread.create.assert_not_awaited()
+    z.client.user.get.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_new_thread_is_created_once_then_remembered():
+    z = _manager(thread_exists=False)
+
+    assert await z.ensure_thread_and_get_context("t-new", "u-new") is None
+    assert await z.ensure_thread_and_get_context("t-new", "u-new") == "ctx"
+    assert await z.create_thread("t-new", "u-new") is True
+
+    z.client.user.add.assert_awaited_once()
+    z.client.thread.create.assert_awaited_once()
+    assert z.client.thread.get_user_context.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_context_for_known_thread_forgets_it():
+    z = _manager()
+    await z.ensure_thread_and_get_context("t1", "u1")
+    z.client.thread.get_user_context.side_effect = Exception("gone")
+
+    assert await z.ensure_thread_and_get_context("t1", "u1") is None
+    assert "t1" not in z._known_threads
+    z.client.thread.create.assert_not_awaited()
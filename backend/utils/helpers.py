@@ -1,13 +1,28 @@
 """
 Utility functions used across the application.
 """
+import asyncio
 import time
-from typing import List, Optional, Dict, Any
+from typing import Awaitable, List, Optional, Dict, Any
 
 def get_current_datetime_str() -> str:
     """Return the current date and time as a formatted string."""
     return time.strftime("%Y-%m-%d %H:%M:%S %Z", time.localtime())
 
+async def gather_bounded(aws: List[Awaitable[Any]], limit: int) -> List[Any]:
+    """Await all awaitables with at most ``limit`` running at once.
+
+    Results keep the input order; exceptions are returned in place like
+    ``asyncio.gather(..., return_exceptions=True)``.
+    """
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def run(aw: Awaitable[Any]) -> Any:
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(*(run(aw) for aw in aws), return_exceptions=True)
+
 def get_last_user_message(messages: List["BaseMessage"]) -> Optional[str]:
     """
     Get the content of the last user message from a list of messages.
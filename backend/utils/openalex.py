@@ -0,0 +1,111 @@
+"""
+Helpers for OpenAlex work payloads.
+
+OpenAlex ships abstracts as an inverted index (``{"word": [positions...]}``). The
+search service, its result formatter and the evidence summarizer all need the
+text, often for the same work within one request, so reconstruction is done here
+once: positions are written straight into a preallocated list (O(n), no sort) and
+the word list is memoized per work id.
+"""
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+# Number of work abstracts kept in the memo
+ABSTRACT_CACHE_SIZE = 2048
+
+# Guard against malformed indexes with huge sparse positions
+_MAX_SPARSITY = 4
+
+_abstract_cache: "OrderedDict[str, List[str]]" = OrderedDict()
+
+
+def _place(inverted_index: Dict[str, Any], size: int) -> List[str]:
+    slots: List[Optional[str]] = [None] * size
+    for word, positions in inverted_index.items():
+        if not positions:
+            continue
+        for pos in positions:
+            if isinstance(pos, int) and 0 <= pos < size:
+                slots[pos] = word
+    return [word for word in slots if word is not None]
+
+
+def _fill_words(inverted_index: Dict[str, Any], max_words: Optional[int] = None) -> List[str]:
+    """Place every word at its positions; only positions < ``max_words`` when given."""
+    if max_words is not None:
+        # Single pass into a fixed-size window; later positions are skipped
+        return _place(inverted_index, max_words)
+
+    total = 0
+    max_pos = -1
+    for positions in inverted_index.values():
+        if not positions:
+            continue
+        for pos in positions:
+            if isinstance(pos, int) and pos >= 0:
+                total += 1
+                if pos > max_pos:
+                    max_pos = pos
+    if max_pos < 0:
+        return []
+
+    if max_pos >= total * _MAX_SPARSITY + 64:
+        # Positions far beyond the word count: fall back to a sort instead of a huge array
+        pairs = sorted(
+            (pos, word)
+            for word, positions in inverted_index.items()
+            for pos in positions or ()
+            if isinstance(pos, int) and pos >= 0
+        )
+        return [word for _, word in pairs]
+
+    return _place(inverted_index, max_pos + 1)
+
+
+def abstract_words(inverted_index: Optional[Dict[str, Any]], work_id: Optional[str] = None) -> List[str]:
+    """Return the abstract as a word list, memoized by ``work_id`` when given."""
+    if not inverted_index:
+        return []
+    if work_id:
+        words = _abstract_cache.get(work_id)
+        if words is not None:
+            _abstract_cache.move_to_end(work_id)
+            return words
+
+    words = _fill_words(inverted_index)
+
+    if work_id:
+        _abstract_cache[work_id] = words
+        if len(_abstract_cache) > ABSTRACT_CACHE_SIZE:
+            _abstract_cache.popitem(last=False)
+    return words
+
+
+def reconstruct_abstract(
+    inverted_index: Optional[Dict[str, Any]],
+    work_id: Optional[str] = None,
+    max_words: Optional[int] = None,
+) -> str:
+    """Rebuild abstract text from an OpenAlex inverted index.
+
+    With ``max_words`` only the leading words are returned (followed by "..." when
+    the abstract is longer); an abstract that is not memoized yet is then built
+    only up to that position.
+    """
+    if not inverted_index:
+        return ""
+    try:
+        if max_words is None:
+            return " ".join(abstract_words(inverted_index, work_id))
+
+        words = _abstract_cache.get(work_id) if work_id else None
+        if words is None:
+            words = _fill_words(inverted_index, max_words + 1)
+        text = " ".join(words[:max_words])
+        return text + "..." if len(words) > max_words else text
+    except Exception:
+        return ""
+
+
+def clear_abstract_cache() -> None:
+    _abstract_cache.clear()
@@ -1,9 +1,102 @@
+"""
+bcrypt password hashing.
+
+A bcrypt hash or check costs a few hundred milliseconds of CPU, so the async variants
+run it on a small dedicated thread pool (bcrypt releases the GIL) instead of the event
+loop. The pool is bounded: when ``PASSWORD_HASH_WORKERS`` threads are busy and
+``PASSWORD_HASH_QUEUE_MAX`` jobs are already waiting, callers get ``Overloaded`` (429)
+right away rather than queueing indefinitely.
+"""
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
 import bcrypt
 
+import config
+from exceptions import Overloaded
+
+_executor: Optional[ThreadPoolExecutor] = None
+_lock = threading.Lock()
+_pending = 0
+_counters: Dict[str, int] = {"completed": 0, "rejected": 0, "rehashed": 0}
+
+
 def hash_password(plain_password: str):
-    salt = bcrypt.gensalt(rounds=12)
+    salt = bcrypt.gensalt(rounds=config.PASSWORD_BCRYPT_ROUNDS)
     hashed = bcrypt.hashpw(plain_password.encode("utf-8"), salt)
     return hashed.decode("utf-8")
 
 def verify_password(plain_password: str, hashed_password: str):
     return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("utf-8"))
+
+def needs_rehash(hashed_password: str) -> bool:
+    """Whether the hash was made with a different work factor than configured."""
+    # bcrypt hashes look like $2b$12$<salt+hash>
+    try:
+        rounds = int(hashed_password.split("$")[2])
+    except (IndexError, ValueError):
+        return False
+    return rounds != config.PASSWORD_BCRYPT_ROUNDS
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=config.PASSWORD_HASH_WORKERS, thread_name_prefix="bcrypt")
+    return _executor
+
+
+def _release(future: Future) -> None:
+    # Runs when the pool job really ends, even if the awaiting request was cancelled
+    global _pending
+    with _lock:
+        _pending -= 1
+        if not future.cancelled():
+            _counters["completed"] += 1
+
+
+async def _run_bounded(fn: Callable[..., Any], *args: Any) -> Any:
+    global _pending
+    with _lock:
+        if _pending >= config.PASSWORD_HASH_WORKERS + config.PASSWORD_HASH_QUEUE_MAX:
+            _counters["rejected"] += 1
+            raise Overloaded("Too many sign-in attempts in progress, please retry shortly")
+        _pending += 1
+    try:
+        future = _get_executor().submit(fn, *args)
+    except BaseException:
+        with _lock:
+            _pending -= 1
+        raise
+    future.add_done_callback(_release)
+    return await asyncio.wrap_future(future)
+
+
+async def hash_password_async(plain_password: str) -> str:
+    """``hash_password`` on the bounded bcrypt pool."""
+    return await _run_bounded(hash_password, plain_password)
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """``verify_password`` on the bounded bcrypt pool."""
+    return await _run_bounded(verify_password, plain_password, hashed_password)
+
+
+async def rehash_if_needed(plain_password: str, hashed_password: str) -> Optional[str]:
+    """New hash for a just-verified password whose work factor is outdated, else None."""
+    if not needs_rehash(hashed_password):
+        return None
+    new_hash = await hash_password_async(plain_password)
+    _counters["rehashed"] += 1
+    return new_hash
+
+
+def get_stats() -> Dict[str, Any]:
+    return {
+        "workers": config.PASSWORD_HASH_WORKERS,
+        "queue_max": config.PASSWORD_HASH_QUEUE_MAX,
+        "rounds": config.PASSWORD_BCRYPT_ROUNDS,
+        "in_flight": _pending,
+        **_counters,
+    }